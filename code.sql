@@ -18,13 +18,25 @@ CREATE TABLE movies (
     release_date DATE,
     duration INT,
     description TEXT,
-    language VARCHAR(50)
+    language VARCHAR(50),
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
+-- Keyset pagination index for the Movies grid (newest first)
+CREATE INDEX idx_movies_release ON movies (release_date, movie_id);
+
+-- Name lookups used by the CSV importers
+CREATE INDEX idx_movies_name ON movies (movie_name);
+
+-- FULLTEXT indexes for ranked title/description search (names weigh double)
+CREATE FULLTEXT INDEX ft_movies_name ON movies (movie_name);
+CREATE FULLTEXT INDEX ft_movies_text ON movies (movie_name, description);
+
 -- Genres Table
 CREATE TABLE genres (
     genre_id INT AUTO_INCREMENT PRIMARY KEY,
-    genre_name VARCHAR(50) NOT NULL UNIQUE
+    genre_name VARCHAR(50) NOT NULL UNIQUE,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
 -- Cast Members Table (renamed from cast)
@@ -33,22 +45,32 @@ CREATE TABLE cast_members (
     name VARCHAR(100) NOT NULL,
     dob DATE,
     bio TEXT,
-    age INT
+    age INT,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
+-- FULLTEXT indexes for ranked cast name/bio search
+CREATE FULLTEXT INDEX ft_cast_name ON cast_members (name);
+CREATE FULLTEXT INDEX ft_cast_text ON cast_members (name, bio);
+CREATE INDEX idx_cast_members_name ON cast_members (name);
+
 -- Studios Table
 CREATE TABLE studios (
     studio_id INT AUTO_INCREMENT PRIMARY KEY,
     studio_name VARCHAR(100) NOT NULL,
-    country VARCHAR(50)
+    country VARCHAR(50),
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
+CREATE INDEX idx_studios_name ON studios (studio_name);
 
 -- Streaming Platforms Table
 CREATE TABLE streaming_platforms (
     platform_id INT AUTO_INCREMENT PRIMARY KEY,
     platform_name VARCHAR(100) NOT NULL,
-    subscription_type VARCHAR(50)
+    subscription_type VARCHAR(50),
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
+CREATE INDEX idx_platforms_name ON streaming_platforms (platform_name);
 
 -- Episodes Table
 CREATE TABLE episodes (
@@ -61,6 +83,8 @@ CREATE TABLE episodes (
     air_date DATE,
     FOREIGN KEY (movie_id) REFERENCES movies(movie_id) ON DELETE CASCADE
 );
+-- Importer existence check and the series episode list (migration 3)
+CREATE INDEX idx_episodes_movie_season_ep ON episodes (movie_id, season_number, episode_number);
 
 -- Reviews and Ratings Table
 CREATE TABLE reviews_ratings (
@@ -73,6 +97,8 @@ CREATE TABLE reviews_ratings (
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
     FOREIGN KEY (movie_id) REFERENCES movies(movie_id) ON DELETE CASCADE
 );
+-- A movie's reviews, newest first, without a filesort (migration 3)
+CREATE INDEX idx_reviews_movie_date ON reviews_ratings (movie_id, review_date);
 
 -- Movie-Genre Junction Table
 CREATE TABLE movie_genre (
@@ -154,6 +180,9 @@ CREATE TABLE donations (
     comment TEXT,
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
 );
+-- Latest comment per donor and the recent-donations list (migration 3)
+CREATE INDEX idx_donations_user_date ON donations (user_id, donation_date);
+CREATE INDEX idx_donations_date ON donations (donation_date);
 
 -- User Watchlists Table
 CREATE TABLE watchlists (
@@ -166,6 +195,43 @@ CREATE TABLE watchlists (
     UNIQUE KEY unique_watchlist (user_id, movie_id)
 );
 
+-- Per-user watchlist used by the app (migration 2)
+CREATE TABLE user_watchlist (
+    watchlist_id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    movie_id INT NOT NULL,
+    added_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY ux_user_movie (user_id, movie_id)
+);
+CREATE INDEX idx_user_watchlist_user_added ON user_watchlist (user_id, added_date);
+
+-- Detail-page views, one of the trending signals (migration 4)
+CREATE TABLE movie_views (
+    view_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    movie_id INT NOT NULL,
+    user_id INT NULL,
+    viewed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (movie_id) REFERENCES movies(movie_id) ON DELETE CASCADE
+);
+
+-- Time-decayed trending score per movie, relative to trending_state.epoch,
+-- refreshed incrementally by the app (refresh_trending in main.py)
+CREATE TABLE movie_trending (
+    movie_id INT PRIMARY KEY,
+    score DOUBLE NOT NULL,
+    INDEX idx_trending_score (score),
+    FOREIGN KEY (movie_id) REFERENCES movies(movie_id) ON DELETE CASCADE
+);
+
+-- Score epoch and the last review/watchlist/view ids already counted
+CREATE TABLE trending_state (
+    id TINYINT PRIMARY KEY,
+    epoch DATETIME NOT NULL,
+    last_review_id INT NOT NULL DEFAULT 0,
+    last_watchlist_id INT NOT NULL DEFAULT 0,
+    last_view_id BIGINT NOT NULL DEFAULT 0
+);
+
 CREATE TABLE ratings_audit (
     audit_id INT AUTO_INCREMENT PRIMARY KEY,
     review_id INT,
@@ -174,6 +240,68 @@ CREATE TABLE ratings_audit (
     changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Migrations from MIGRATIONS in main.py that have been applied. The app runs
+-- the missing ones at startup; all of them are safe on a schema built here.
+CREATE TABLE schema_migrations (
+    version INT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Progress of typed CSV imports, keyed by the file's SHA-256. Each committed
+-- batch updates its row in the same transaction; imports resume at byte_offset.
+CREATE TABLE import_checkpoints (
+    file_hash CHAR(64) PRIMARY KEY,
+    file_path VARCHAR(500),
+    byte_offset BIGINT NOT NULL DEFAULT 0,
+    inserted INT NOT NULL DEFAULT 0,
+    skipped INT NOT NULL DEFAULT 0,
+    failed INT NOT NULL DEFAULT 0,
+    completed TINYINT(1) NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+-- Fingerprint of each file's last completed import. Unchanged files are
+-- skipped; files that only grew import just the appended bytes.
+CREATE TABLE import_files (
+    file_path VARCHAR(500) PRIMARY KEY,
+    size BIGINT NOT NULL,
+    mtime_ns BIGINT NOT NULL,
+    sha256 CHAR(64) NOT NULL,
+    imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+-- Denormalized per-movie summary read by the list/search/detail pages.
+-- Maintained by the after_review_*, after_movie_genre_* and after_episode_* triggers.
+CREATE TABLE movie_summary (
+    movie_id INT PRIMARY KEY,
+    genres TEXT,
+    rating_count INT NOT NULL DEFAULT 0,
+    rating_sum DECIMAL(12,1) NOT NULL DEFAULT 0,
+    episode_count INT NOT NULL DEFAULT 0,
+    max_season INT,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (movie_id) REFERENCES movies(movie_id) ON DELETE CASCADE
+);
+
+-- Change stamps read by the local snapshot's incremental sync
+CREATE INDEX idx_movies_updated ON movies (updated_at);
+CREATE INDEX idx_movie_summary_updated ON movie_summary (updated_at);
+CREATE INDEX idx_cast_members_updated ON cast_members (updated_at);
+CREATE INDEX idx_studios_updated ON studios (updated_at);
+CREATE INDEX idx_streaming_platforms_updated ON streaming_platforms (updated_at);
+CREATE INDEX idx_genres_updated ON genres (updated_at);
+
+-- Catalog rows deleted upstream, written by the after_*_delete triggers below
+-- and read by the local snapshot's sync. Entries older than 30 days are pruned.
+CREATE TABLE snapshot_deletions (
+    deletion_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    table_name VARCHAR(64) NOT NULL,
+    row_id INT NOT NULL,
+    deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_snapshot_deletions_at (deleted_at)
+);
+
 -- Trigger: Inserts a welcome donation record when a new user is created
 CREATE TRIGGER after_user_insert
 AFTER INSERT ON users
@@ -195,6 +323,170 @@ BEGIN
     END IF;
 END$$
 
+-- Triggers: keep movie_summary rating totals in step with reviews_ratings
+CREATE TRIGGER after_review_insert
+AFTER INSERT ON reviews_ratings
+FOR EACH ROW
+BEGIN
+    IF NEW.rating IS NOT NULL THEN
+        INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+        UPDATE movie_summary SET rating_count = rating_count + 1, rating_sum = rating_sum + NEW.rating
+        WHERE movie_id = NEW.movie_id;
+    END IF;
+END$$
+
+CREATE TRIGGER after_review_update
+AFTER UPDATE ON reviews_ratings
+FOR EACH ROW
+BEGIN
+    IF OLD.rating IS NOT NULL THEN
+        UPDATE movie_summary SET rating_count = rating_count - 1, rating_sum = rating_sum - OLD.rating
+        WHERE movie_id = OLD.movie_id;
+    END IF;
+    IF NEW.rating IS NOT NULL THEN
+        INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+        UPDATE movie_summary SET rating_count = rating_count + 1, rating_sum = rating_sum + NEW.rating
+        WHERE movie_id = NEW.movie_id;
+    END IF;
+END$$
+
+CREATE TRIGGER after_review_delete
+AFTER DELETE ON reviews_ratings
+FOR EACH ROW
+BEGIN
+    IF OLD.rating IS NOT NULL THEN
+        UPDATE movie_summary SET rating_count = rating_count - 1, rating_sum = rating_sum - OLD.rating
+        WHERE movie_id = OLD.movie_id;
+    END IF;
+END$$
+
+-- Triggers: recompute the movie_summary genre string for the affected movie
+CREATE TRIGGER after_movie_genre_insert
+AFTER INSERT ON movie_genre
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+    UPDATE movie_summary SET genres = (
+        SELECT GROUP_CONCAT(g.genre_name ORDER BY g.genre_name)
+        FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+        WHERE mg.movie_id = NEW.movie_id
+    ) WHERE movie_id = NEW.movie_id;
+END$$
+
+CREATE TRIGGER after_movie_genre_delete
+AFTER DELETE ON movie_genre
+FOR EACH ROW
+BEGIN
+    UPDATE movie_summary SET genres = (
+        SELECT GROUP_CONCAT(g.genre_name ORDER BY g.genre_name)
+        FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+        WHERE mg.movie_id = OLD.movie_id
+    ) WHERE movie_id = OLD.movie_id;
+END$$
+
+-- Triggers: a renamed or deleted genre changes the genre string of its movies
+-- (the ON DELETE CASCADE on movie_genre does not fire after_movie_genre_delete)
+CREATE TRIGGER after_genre_update
+AFTER UPDATE ON genres
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.genre_name <=> NEW.genre_name) THEN
+        UPDATE movie_summary s SET genres = (
+            SELECT GROUP_CONCAT(g.genre_name ORDER BY g.genre_name)
+            FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+            WHERE mg.movie_id = s.movie_id
+        ) WHERE s.movie_id IN (SELECT movie_id FROM movie_genre WHERE genre_id = NEW.genre_id);
+    END IF;
+END$$
+
+CREATE TRIGGER before_genre_delete
+BEFORE DELETE ON genres
+FOR EACH ROW
+BEGIN
+    UPDATE movie_summary s SET genres = (
+        SELECT GROUP_CONCAT(g.genre_name ORDER BY g.genre_name)
+        FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+        WHERE mg.movie_id = s.movie_id AND g.genre_id <> OLD.genre_id
+    ) WHERE s.movie_id IN (SELECT movie_id FROM movie_genre WHERE genre_id = OLD.genre_id);
+END$$
+
+-- Triggers: keep movie_summary episode count / max season in step with episodes
+CREATE TRIGGER after_episode_insert
+AFTER INSERT ON episodes
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+    UPDATE movie_summary
+    SET episode_count = episode_count + 1,
+        max_season = GREATEST(IFNULL(max_season, 0), NEW.season_number)
+    WHERE movie_id = NEW.movie_id;
+END$$
+
+CREATE TRIGGER after_episode_update
+AFTER UPDATE ON episodes
+FOR EACH ROW
+BEGIN
+    IF OLD.movie_id <> NEW.movie_id OR OLD.season_number <> NEW.season_number THEN
+        INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+        UPDATE movie_summary
+        SET episode_count = (SELECT COUNT(*) FROM episodes WHERE movie_id = OLD.movie_id),
+            max_season = (SELECT MAX(season_number) FROM episodes WHERE movie_id = OLD.movie_id)
+        WHERE movie_id = OLD.movie_id;
+        UPDATE movie_summary
+        SET episode_count = (SELECT COUNT(*) FROM episodes WHERE movie_id = NEW.movie_id),
+            max_season = (SELECT MAX(season_number) FROM episodes WHERE movie_id = NEW.movie_id)
+        WHERE movie_id = NEW.movie_id;
+    END IF;
+END$$
+
+CREATE TRIGGER after_episode_delete
+AFTER DELETE ON episodes
+FOR EACH ROW
+BEGIN
+    UPDATE movie_summary
+    SET episode_count = episode_count - 1,
+        max_season = (SELECT MAX(season_number) FROM episodes WHERE movie_id = OLD.movie_id)
+    WHERE movie_id = OLD.movie_id;
+END$$
+
+-- Triggers: log deleted catalog rows for the local snapshot. The movies cascade
+-- to movie_summary fires no trigger, so after_movie_delete logs both rows.
+CREATE TRIGGER after_movie_delete
+AFTER DELETE ON movies
+FOR EACH ROW
+BEGIN
+    INSERT INTO snapshot_deletions (table_name, row_id)
+    VALUES ('movies', OLD.movie_id), ('movie_summary', OLD.movie_id);
+END$$
+
+CREATE TRIGGER after_cast_member_delete
+AFTER DELETE ON cast_members
+FOR EACH ROW
+BEGIN
+    INSERT INTO snapshot_deletions (table_name, row_id) VALUES ('cast_members', OLD.cast_id);
+END$$
+
+CREATE TRIGGER after_studio_delete
+AFTER DELETE ON studios
+FOR EACH ROW
+BEGIN
+    INSERT INTO snapshot_deletions (table_name, row_id) VALUES ('studios', OLD.studio_id);
+END$$
+
+CREATE TRIGGER after_platform_delete
+AFTER DELETE ON streaming_platforms
+FOR EACH ROW
+BEGIN
+    INSERT INTO snapshot_deletions (table_name, row_id) VALUES ('streaming_platforms', OLD.platform_id);
+END$$
+
+CREATE TRIGGER after_genre_delete
+AFTER DELETE ON genres
+FOR EACH ROW
+BEGIN
+    INSERT INTO snapshot_deletions (table_name, row_id) VALUES ('genres', OLD.genre_id);
+END$$
+
 -- Procedure: Adds a new genre if it does not already exist
 CREATE PROCEDURE add_genre(IN gen_name VARCHAR(50))
 BEGIN
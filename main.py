@@ -9,127 +9,4235 @@ GitHub: https://github.com/sankalphs/CineTrack
 License: MIT
 """
 
+import time
+_STARTUP_STARTED = time.perf_counter()
+
 import customtkinter as ctk
-from tkinter import ttk, messagebox, PhotoImage, filedialog
-import mysql.connector
-import csv
+from tkinter import ttk, messagebox, PhotoImage
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import deque, OrderedDict
+from array import array
+from functools import lru_cache
+import threading
+import weakref
+import queue
+import sys
+import io
 import re
 import os
 import datetime
+import hashlib
+import json
+import tempfile
+import bisect
+import heapq
+import math
+import random
+from decimal import Decimal
+
+_IMPORTS_DONE = time.perf_counter()
 
 # Set appearance mode and theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")    # IMDB-like effect
 
-# Database configuration - UPDATE THESE VALUES FOR YOUR SETUP
-DB_CONFIG = {
-    "host": "localhost",
-    "user": "root",
-    "password": "qwerty1234",  
-    "database": "cinetrack"
+# Database configuration - UPDATE THESE VALUES FOR YOUR SETUP
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "qwerty1234",  
+    "database": "cinetrack"
+}
+
+# Connection pool settings: pages, importers and background jobs each borrow a
+# connection for the duration of one operation, so a handful is plenty.
+DB_POOL_NAME = "cinetrack"
+DB_POOL_SIZE = 5
+
+
+# Query result cache: entries live for QUERY_CACHE_TTL seconds at most and the
+# least recently used ones are dropped beyond QUERY_CACHE_SIZE.
+QUERY_CACHE_SIZE = 512
+QUERY_CACHE_TTL = 60
+
+# Query instrumentation (QueryStats, the Performance page): latency histogram
+# bucket bounds in ms and call sites kept per query. Statements taking
+# SLOW_QUERY_MS or longer are appended to SLOW_QUERY_LOG. QUERY_STATS_DUMP,
+# when set, is written on exit (.prom for Prometheus text, otherwise JSON).
+QUERY_LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_CALL_SITES = 8
+SLOW_QUERY_MS = 200
+SLOW_QUERY_LOG = "cinetrack_slow_queries.log"
+QUERY_STATS_DUMP = None
+
+# Writes to a table also change these tables, through triggers
+# (MOVIE_SUMMARY_TRIGGERS, after_user_insert, before_rating_update) or
+# ON DELETE CASCADE foreign keys. Followed transitively on invalidation.
+WRITE_DEPENDENCIES = {
+    'users': ('donations', 'reviews_ratings', 'user_follow', 'watchlists'),
+    'movies': ('movie_summary', 'episodes', 'reviews_ratings', 'movie_genre', 'movie_cast', 'movie_studio',
+               'movie_platform', 'movie_distribution', 'contains_episodes', 'watchlists'),
+    'reviews_ratings': ('movie_summary', 'ratings_audit'),
+    'movie_genre': ('movie_summary',),
+    'episodes': ('movie_summary', 'contains_episodes'),
+    'genres': ('movie_genre',),
+    'cast_members': ('movie_cast',),
+    'studios': ('movie_studio', 'movie_distribution'),
+    'streaming_platforms': ('movie_platform', 'movie_distribution'),
+}
+
+# Stored functions called from cached queries, and the tables they read
+SQL_FUNCTION_TABLES = {
+    'total_donations': ('donations',),
+}
+
+_READ_TABLE_RE = re.compile(r"\b(?:FROM|JOIN)\s+`?(\w+)", re.IGNORECASE)
+_SQL_FUNCTION_RE = re.compile(r"\b(%s)\s*\(" % '|'.join(SQL_FUNCTION_TABLES), re.IGNORECASE)
+_WRITE_TABLE_RE = re.compile(
+    r"\s*(?:(?:INSERT|REPLACE)(?:\s+IGNORE)?\s+INTO|UPDATE(?:\s+IGNORE)?|DELETE(?:\s+IGNORE)?\s+FROM)\s+`?(\w+)",
+    re.IGNORECASE)
+_SCHEMA_CHANGE_RE = re.compile(r"\s*(?:CREATE|DROP|ALTER|TRUNCATE|RENAME|CALL|LOAD)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def read_tables(sql):
+    """Tables a SELECT depends on: those it names plus those its stored functions read."""
+    tables = {t.lower() for t in _READ_TABLE_RE.findall(sql)}
+    for fn in _SQL_FUNCTION_RE.findall(sql):
+        tables.update(SQL_FUNCTION_TABLES[fn.lower()])
+    return frozenset(tables)
+
+
+@lru_cache(maxsize=1024)
+def write_tables(sql):
+    """Tables a statement may change, following WRITE_DEPENDENCIES.
+
+    Returns None for reads and ('*',) for DDL, procedure calls and bulk
+    loads, whose effects are not worth guessing.
+    """
+    if _SCHEMA_CHANGE_RE.match(sql):
+        return ('*',)
+    m = _WRITE_TABLE_RE.match(sql)
+    if not m:
+        return None
+    tables, pending = set(), [m.group(1).lower()]
+    while pending:
+        table = pending.pop()
+        if table not in tables:
+            tables.add(table)
+            pending.extend(WRITE_DEPENDENCIES.get(table, ()))
+    return tuple(tables)
+
+
+class QueryCache:
+    """LRU + TTL cache of query results, invalidated by table.
+
+    Entries are keyed by (sql, params) and indexed by the tables the query
+    reads. invalidate(tables) drops every entry reading any of them; the
+    Database wrapper calls it when a transaction that wrote to those tables
+    commits. Each table also carries a version number so a result read
+    while a write committed is not stored (see begin/put).
+    """
+
+    def __init__(self, max_entries=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires, tables, value)
+        self._by_table = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.invalidations = 0
+        # Called with the table names after every invalidation (see LocalSnapshot)
+        self.listeners = []
+
+    def get(self, key, count=True):
+        """Return (True, value) for a live entry, else (False, None).
+
+        count=False leaves the hit/miss counters alone (e.g. for prefetch checks).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += count
+                return True, entry[2]
+            if entry is not None:
+                self._drop(key)
+            self.misses += count
+            return False, None
+
+    def begin(self, tables):
+        """Version token to pass to put() for a read about to start."""
+        with self._lock:
+            return tuple(self._versions.get(t, 0) for t in tables)
+
+    def put(self, key, value, tables, token, ttl=None):
+        with self._lock:
+            if token != tuple(self._versions.get(t, 0) for t in tables):
+                return  # a write committed while the query ran
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + (ttl or self.ttl), tables, value)
+            for t in tables:
+                self._by_table.setdefault(t, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, tables):
+        with self._lock:
+            if '*' in tables:
+                self._clear()
+            else:
+                for t in tables:
+                    self._versions[t] = self._versions.get(t, 0) + 1
+                    for key in self._by_table.pop(t, ()):
+                        if key in self._entries:
+                            self._drop(key)
+                            self.invalidations += 1
+        for listener in self.listeners:
+            listener(tables)
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self.invalidations += len(self._entries)
+        for t in list(self._by_table) + list(self._versions):
+            self._versions[t] = self._versions.get(t, 0) + 1
+        self._entries.clear()
+        self._by_table.clear()
+
+    def _drop(self, key):
+        _, tables, _ = self._entries.pop(key)
+        for t in tables:
+            keys = self._by_table.get(t)
+            if keys is not None:
+                keys.discard(key)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries),
+                    'invalidations': self.invalidations,
+                    'hit_rate': self.hits / lookups if lookups else 0.0}
+
+
+class _TrackedCursor:
+    """Cursor proxy recording which tables its statements write, and timing them."""
+
+    def __init__(self, cursor, written, stats):
+        self._cursor = cursor
+        self._written = written
+        self._stats = stats
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        tables = write_tables(operation)
+        if tables:
+            self._written.update(tables)
+        return self._timed(self._cursor.execute, operation, params, *args, **kwargs)
+
+    def executemany(self, operation, seq_params):
+        tables = write_tables(operation)
+        if tables:
+            self._written.update(tables)
+        return self._timed(self._cursor.executemany, operation, seq_params)
+
+    def _timed(self, run, operation, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = run(operation, *args, **kwargs)
+        except Exception:
+            self._stats.record(query_name(operation), time.perf_counter() - started, None, operation, failed=True)
+            raise
+        # rowcount is the rows read for buffered SELECTs, rows changed for writes, -1 if unknown
+        self._stats.record(query_name(operation), time.perf_counter() - started, self._cursor.rowcount, operation)
+        return result
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _TrackedConnection:
+    """Connection proxy that invalidates the query cache for the tables its
+    cursors wrote once they commit, and records their statements in stats."""
+
+    def __init__(self, cnx, cache, stats):
+        self._cnx = cnx
+        self._cache = cache
+        self._stats = stats
+        self._written = set()
+
+    def cursor(self, *args, **kwargs):
+        return _TrackedCursor(self._cnx.cursor(*args, **kwargs), self._written, self._stats)
+
+    def commit(self):
+        self._cnx.commit()
+        self._flush()
+
+    def rollback(self):
+        self._cnx.rollback()
+        self._written.clear()
+
+    def _flush(self):
+        if self._written:
+            self._cache.invalidate(self._written)
+            self._written.clear()
+
+    def __getattr__(self, name):
+        return getattr(self._cnx, name)
+
+
+def _fetchone(cur):
+    return cur.fetchone()
+
+
+def _fetchall(cur):
+    return cur.fetchall()
+
+
+class QueryTimings:
+    """Call counts and time spent per named query (see QUERIES).
+
+    A name's first run on a connection prepares the statement as well as
+    executing it, so those runs are kept apart from the reuses: the gap
+    between the two averages is what preparing once saves per call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}  # name -> [first runs, seconds, reuses, seconds]
+
+    def record(self, name, seconds, first):
+        with self._lock:
+            stats = self._stats.setdefault(name, [0, 0.0, 0, 0.0])
+            slot = 0 if first else 2
+            stats[slot] += 1
+            stats[slot + 1] += seconds
+
+    def snapshot(self):
+        """{name: {'prepares', 'prepare_ms', 'executes', 'execute_ms'}} with average milliseconds."""
+        with self._lock:
+            return {name: {'prepares': p, 'prepare_ms': p_s * 1000 / p if p else 0.0,
+                           'executes': e, 'execute_ms': e_s * 1000 / e if e else 0.0}
+                    for name, (p, p_s, e, e_s) in self._stats.items()}
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class PreparedStatements:
+    """QUERIES run as server-side prepared statements on one connection.
+
+    The driver prepares on a prepared cursor's first execute and reuses the
+    statement for as long as that cursor runs the same SQL, so each name gets
+    a cursor of its own, opened on first use and kept for the life of the
+    session. Results are read in full before returning.
+    """
+
+    def __init__(self, cnx, timings, stats):
+        self.cnx = cnx
+        self.session_id = cnx.connection_id
+        self.timings = timings
+        self.stats = stats
+        self._cursors = {}
+
+    def fetchall(self, name, params=None):
+        cur = self._cursors.get(name)
+        first = cur is None
+        if first:
+            cur = self._cursors[name] = self.cnx.cursor(prepared=True)
+        started = time.perf_counter()
+        try:
+            cur.execute(QUERIES[name], tuple(params or ()))
+            rows = cur.fetchall()
+        except Exception:
+            self.stats.record(name, time.perf_counter() - started, None, QUERIES[name], failed=True)
+            # the statement may not exist server-side; prepare again next time
+            self._cursors.pop(name, None)
+            try:
+                cur.close()
+            except Exception:
+                pass
+            raise
+        elapsed = time.perf_counter() - started
+        self.timings.record(name, elapsed, first)
+        self.stats.record(name, elapsed, len(rows), QUERIES[name])
+        return rows
+
+    def fetchone(self, name, params=None):
+        rows = self.fetchall(name, params)
+        return rows[0] if rows else None
+
+    def close(self):
+        for cur in self._cursors.values():
+            try:
+                cur.close()
+            except Exception:
+                pass
+        self._cursors.clear()
+
+
+def _session(cnx):
+    """The driver connection behind a _TrackedConnection and the pool's wrapper.
+
+    Pool checkouts hand out a new wrapper each time, but the connection
+    underneath (and its server session) stays the same.
+    """
+    cnx = getattr(cnx, '_cnx', cnx)
+    return getattr(cnx, '_cnx', cnx)
+
+
+# Frames skipped when looking for the code that issued a query
+_DB_LAYER_PREFIXES = ('Database.', '_TrackedCursor.', '_TrackedConnection.', 'PreparedStatements.',
+                      'QueryStats.', '_call_site', '_fetchone', '_fetchall')
+
+
+def _call_site():
+    """'qualified.function:line' of the nearest caller outside the database layer."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename == __file__:
+            qualname = getattr(code, 'co_qualname', None)
+            if qualname is None:  # before Python 3.11
+                owner = frame.f_locals.get('self')
+                qualname = f"{type(owner).__name__}.{code.co_name}" if owner is not None else code.co_name
+            if not qualname.startswith(_DB_LAYER_PREFIXES):
+                return f"{qualname}:{frame.f_lineno}"
+        frame = frame.f_back
+    return '?'
+
+
+@lru_cache(maxsize=1024)
+def query_name(sql):
+    """Stats name of a statement: its QUERIES name, else its verb and tables ('select movies+movie_summary')."""
+    for name, text in QUERIES.items():
+        if text == sql:
+            return name
+    verb = (sql.split(None, 1) or ['?'])[0].lower()
+    m = _WRITE_TABLE_RE.match(sql)
+    tables = [m.group(1).lower()] if m else sorted(read_tables(sql))
+    return f"{verb} {'+'.join(tables)}" if tables else verb
+
+
+def _prom_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class QueryStats:
+    """Latency histogram, row count and call sites per query name (see query_name).
+
+    Every statement run through a Database connection is recorded, text and
+    prepared alike. Statements that take SLOW_QUERY_MS or longer are also
+    appended to the slow-query log with their call site and SQL; parameters
+    are left out since they may hold passwords or emails.
+    """
+
+    def __init__(self, slow_ms=SLOW_QUERY_MS, slow_log=SLOW_QUERY_LOG):
+        self.slow_ms = slow_ms
+        self.slow_log = slow_log
+        self.slow_count = 0
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._stats = {}
+        self._started = time.time()
+
+    def record(self, name, seconds, rows, sql, failed=False):
+        ms = seconds * 1000
+        site = _call_site()
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = {'count': 0, 'errors': 0, 'seconds': 0.0, 'max_ms': 0.0, 'rows': 0,
+                                            'buckets': [0] * (len(QUERY_LATENCY_BUCKETS_MS) + 1), 'sites': {}}
+            stat['count'] += 1
+            stat['errors'] += failed
+            stat['seconds'] += seconds
+            stat['max_ms'] = max(stat['max_ms'], ms)
+            if rows is not None and rows > 0:
+                stat['rows'] += rows
+            stat['buckets'][bisect.bisect_left(QUERY_LATENCY_BUCKETS_MS, ms)] += 1
+            sites = stat['sites']
+            if site in sites or len(sites) < QUERY_CALL_SITES:
+                sites[site] = sites.get(site, 0) + 1
+            else:
+                sites['(other)'] = sites.get('(other)', 0) + 1
+        if self.slow_ms is not None and ms >= self.slow_ms:
+            self._log_slow(name, ms, rows, site, sql, failed)
+
+    def _log_slow(self, name, ms, rows, site, sql, failed):
+        line = (f"{datetime.datetime.now().isoformat(timespec='seconds')} {ms:.1f} ms "
+                f"{'failed' if failed else f'rows={rows}'} {name} at {site} | {' '.join(sql.split())[:1000]}\n")
+        with self._log_lock:
+            self.slow_count += 1
+            if not self.slow_log:
+                return
+            try:
+                with open(self.slow_log, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            except OSError as e:
+                print(f"⚠️ Could not write slow-query log {self.slow_log}: {e}")
+                self.slow_log = None
+
+    def snapshot(self):
+        """{name: {count, errors, total_ms, avg_ms, p50_ms, p95_ms, max_ms, rows, buckets, sites}}.
+
+        Percentiles are the upper bound of the histogram bucket they fall in
+        (the maximum for the open-ended last bucket); buckets are cumulative
+        counts keyed by upper bound in ms, sites are sorted by call count.
+        """
+        with self._lock:
+            stats = {name: dict(stat, buckets=list(stat['buckets']), sites=dict(stat['sites']))
+                     for name, stat in self._stats.items()}
+        out = {}
+        bounds = [str(b) for b in QUERY_LATENCY_BUCKETS_MS] + ['+Inf']
+        for name, stat in stats.items():
+            count = stat['count']
+            cumulative, seen = {}, 0
+            for bound, n in zip(bounds, stat['buckets']):
+                seen += n
+                cumulative[bound] = seen
+
+            def quantile(q):
+                rank = q * count
+                for bound, n in zip(QUERY_LATENCY_BUCKETS_MS, cumulative.values()):
+                    if n >= rank:
+                        return min(float(bound), stat['max_ms'])
+                return stat['max_ms']
+
+            out[name] = {'count': count, 'errors': stat['errors'], 'total_ms': stat['seconds'] * 1000,
+                         'avg_ms': stat['seconds'] * 1000 / count, 'p50_ms': quantile(0.5),
+                         'p95_ms': quantile(0.95), 'max_ms': stat['max_ms'], 'rows': stat['rows'],
+                         'buckets': cumulative,
+                         'sites': dict(sorted(stat['sites'].items(), key=lambda kv: -kv[1]))}
+        return out
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+            self._started = time.time()
+        with self._log_lock:
+            self.slow_count = 0
+
+    def to_json(self):
+        return json.dumps({'since': datetime.datetime.fromtimestamp(self._started).isoformat(timespec='seconds'),
+                           'slow_query_ms': self.slow_ms, 'slow_queries': self.slow_count,
+                           'queries': self.snapshot()}, indent=2)
+
+    def to_prometheus(self):
+        """The stats in the Prometheus text exposition format."""
+        stats = self.snapshot()
+        lines = ['# HELP cinetrack_query_duration_seconds Query latency per named query.',
+                 '# TYPE cinetrack_query_duration_seconds histogram']
+        for name, stat in stats.items():
+            label = _prom_label(name)
+            for bound, n in stat['buckets'].items():
+                le = bound if bound == '+Inf' else repr(float(bound) / 1000)
+                lines.append(f'cinetrack_query_duration_seconds_bucket{{query="{label}",le="{le}"}} {n}')
+            lines.append(f'cinetrack_query_duration_seconds_sum{{query="{label}"}} {stat["total_ms"] / 1000!r}')
+            lines.append(f'cinetrack_query_duration_seconds_count{{query="{label}"}} {stat["count"]}')
+        for metric, key, help_text in (('cinetrack_query_rows_total', 'rows', 'Rows returned or affected per named query.'),
+                                       ('cinetrack_query_errors_total', 'errors', 'Failed executions per named query.')):
+            lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} counter']
+            lines += [f'{metric}{{query="{_prom_label(name)}"}} {stat[key]}' for name, stat in stats.items()]
+        lines += ['# HELP cinetrack_slow_queries_total Queries at or above the slow-query threshold.',
+                  '# TYPE cinetrack_slow_queries_total counter', f'cinetrack_slow_queries_total {self.slow_count}']
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """Write the stats to path: Prometheus text for .prom/.txt, JSON otherwise."""
+        text = self.to_prometheus() if path.lower().endswith(('.prom', '.txt')) else self.to_json()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+class Database:
+    """Small data-access layer over a bounded MySQL connection pool.
+
+    Every operation checks a connection out of the pool, runs on its own cursor
+    and hands the connection back, so pages, imports and background work never
+    share cursor state. Connections that were dropped by the server while idle
+    are reconnected transparently when they are checked out. The driver is
+    imported and the pool opened on first use, so creating a Database (and
+    importing this module) never touches the server.
+
+    - fetchone / fetchall: read helpers, retried once on a lost connection
+    - execute: single write statement, committed immediately; returns lastrowid
+    - transaction(): context manager yielding a cursor; commits on success and
+      rolls back if the block raises
+    - cached_fetchone / cached_fetchall: reads served from `cache` (QueryCache);
+      every commit through this class invalidates the tables it wrote
+    - named_fetchone / named_fetchall: QUERIES entries run as prepared
+      statements, optionally through the cache; transaction() cursors carry the
+      same statements for their connection as `cursor.statements`
+    - stats (QueryStats): latency, rows and call sites of every statement run
+      on these connections, plus the slow-query log
+    """
+
+    # errno values for "server has gone away" / "lost connection during query"
+    _LOST_CONNECTION_ERRORS = (2006, 2013, 2055)
+    # "unknown prepared statement handler": the server dropped our statement
+    _STALE_STATEMENT_ERRORS = (1243,)
+
+    def __init__(self, config, pool_size=DB_POOL_SIZE, pool_name=DB_POOL_NAME,
+                 checkout_timeout=30, reconnect_attempts=3, reconnect_delay=1):
+        self.config = dict(config)
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_delay = reconnect_delay
+        # The pool itself raises immediately when exhausted; the semaphore makes
+        # callers wait for a free connection instead.
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self.pool_name = pool_name
+        self.pool = None
+        self._pool_lock = threading.Lock()
+        self.cache = QueryCache()
+        self.timings = QueryTimings()
+        self.stats = QueryStats()
+        # driver connection -> its PreparedStatements, dropped with the connection
+        self._statements = weakref.WeakKeyDictionary()
+        self._statements_lock = threading.Lock()
+
+    def _get_pool(self):
+        if self.pool is None:
+            with self._pool_lock:
+                if self.pool is None:
+                    from mysql.connector import pooling
+                    # No session reset on check-in: it would deallocate the prepared
+                    # statements. _release rolls back any open transaction, and the
+                    # only session state the app creates (LOAD DATA staging tables)
+                    # lives on a dedicated connection.
+                    self.pool = pooling.MySQLConnectionPool(pool_name=self.pool_name, pool_size=self.pool_size,
+                                                            pool_reset_session=False, **self.config)
+        return self.pool
+
+    def _checkout(self):
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            from mysql.connector import pooling
+            raise pooling.PoolError("Timed out waiting for a free database connection")
+        try:
+            cnx = self._get_pool().get_connection()
+            # Revive connections the server closed while they sat idle in the pool
+            cnx.ping(reconnect=True, attempts=self.reconnect_attempts, delay=self.reconnect_delay)
+            return cnx
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, cnx):
+        try:
+            if cnx.in_transaction:
+                cnx.rollback()
+        except Exception:
+            pass
+        try:
+            cnx.close()  # returns the connection to the pool
+        except Exception:
+            pass
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection for the duration of the ``with`` block."""
+        cnx = self._checkout()
+        try:
+            yield _TrackedConnection(cnx, self.cache, self.stats)
+        finally:
+            self._release(cnx)
+
+    def statements(self, cnx):
+        """The PreparedStatements of a checked-out connection."""
+        raw = _session(cnx)
+        with self._statements_lock:
+            statements = self._statements.get(raw)
+        # A reconnect (ping on checkout) starts a session without our statements
+        if statements is None or statements.session_id != raw.connection_id:
+            statements = PreparedStatements(raw, self.timings, self.stats)
+            with self._statements_lock:
+                self._statements[raw] = statements
+        return statements
+
+    @contextmanager
+    def transaction(self):
+        """Yield a buffered cursor whose statements are committed together."""
+        with self.connection() as cnx:
+            cur = cnx.cursor(buffered=True)
+            cur.statements = self.statements(cnx)
+            try:
+                yield cur
+                cnx.commit()
+            except Exception:
+                try:
+                    cnx.rollback()
+                except Exception:
+                    pass
+                raise
+            finally:
+                cur.close()
+
+    def _read(self, sql, params, fetch, name=None):
+        import mysql.connector
+        for attempt in (1, 2):
+            try:
+                with self.connection() as cnx:
+                    if name is not None:
+                        rows = self.statements(cnx).fetchall(name, params)
+                        return (rows[0] if rows else None) if fetch is _fetchone else rows
+                    cur = cnx.cursor(buffered=True)
+                    try:
+                        cur.execute(sql, params or ())
+                        return fetch(cur)
+                    finally:
+                        cur.close()
+            except mysql.connector.Error as err:
+                # Reads are safe to retry once on a fresh connection (or, for a
+                # prepared statement the server no longer knows, a fresh prepare)
+                retry = self._LOST_CONNECTION_ERRORS + (self._STALE_STATEMENT_ERRORS if name else ())
+                if attempt == 2 or getattr(err, 'errno', None) not in retry:
+                    raise
+
+    def fetchone(self, sql, params=None):
+        return self._read(sql, params, _fetchone)
+
+    def fetchall(self, sql, params=None):
+        return self._read(sql, params, _fetchall)
+
+    def _cached_read(self, sql, params, fetch, ttl, name=None):
+        key = (sql, tuple(params or ()), fetch)
+        found, value = self.cache.get(key)
+        if found:
+            return value
+        tables = read_tables(sql)
+        token = self.cache.begin(tables)
+        value = self._read(sql, params, fetch, name)
+        self.cache.put(key, value, tables, token, ttl)
+        return value
+
+    def cached_fetchone(self, sql, params=None, ttl=None):
+        """fetchone through the query cache; the result must not be mutated."""
+        return self._cached_read(sql, params, _fetchone, ttl)
+
+    def cached_fetchall(self, sql, params=None, ttl=None):
+        """fetchall through the query cache; the result must not be mutated."""
+        return self._cached_read(sql, params, _fetchall, ttl)
+
+    def named_fetchone(self, name, params=None, cached=False, ttl=None):
+        """fetchone for QUERIES[name] as a prepared statement; cached=True goes through the query cache."""
+        if cached:
+            return self._cached_read(QUERIES[name], params, _fetchone, ttl, name)
+        return self._read(QUERIES[name], params, _fetchone, name)
+
+    def named_fetchall(self, name, params=None, cached=False, ttl=None):
+        """fetchall for QUERIES[name] as a prepared statement; cached=True goes through the query cache."""
+        if cached:
+            return self._cached_read(QUERIES[name], params, _fetchall, ttl, name)
+        return self._read(QUERIES[name], params, _fetchall, name)
+
+    def cache_lookup(self, sql, params=None, count=True):
+        """(True, row) when cached_fetchone(sql, params) would not query, else (False, None)."""
+        return self.cache.get((sql, tuple(params or ()), _fetchone), count)
+
+    def execute(self, sql, params=None):
+        """Run a single write statement in its own transaction and return lastrowid."""
+        with self.transaction() as cur:
+            cur.execute(sql, params or ())
+            return cur.lastrowid
+
+    @contextmanager
+    def dedicated_connection(self, **options):
+        """Open a connection outside the pool, e.g. with extra client flags."""
+        import mysql.connector
+        cnx = mysql.connector.connect(**dict(self.config, **options))
+        try:
+            yield _TrackedConnection(cnx, self.cache, self.stats)
+        finally:
+            try:
+                cnx.close()
+            except Exception:
+                pass
+
+    def close(self):
+        """Close the idle pooled connections (called on application exit)."""
+        if self.pool is None:
+            return
+        try:
+            self.pool._remove_connections()
+        except Exception:
+            pass
+
+
+class QueryExecutor:
+    """Runs database work on a small worker pool, off the Tk main loop.
+
+    submit() returns a concurrent.futures.Future. When a callback is supplied
+    it is invoked on the UI thread: finished futures are queued by the workers
+    and drained from the Tk event loop with after(), because Tk widgets must
+    only be touched from the thread running mainloop(). Results whose owner
+    widget has been destroyed (the user navigated to another page) are dropped.
+    """
+
+    def __init__(self, root, max_workers=DB_POOL_SIZE, poll_ms=15):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cinetrack-db')
+        self._done = queue.SimpleQueue()
+        self._closed = False
+        self.root.after(self.poll_ms, self._drain)
+
+    def submit(self, fn, *args, callback=None, errback=None, owner=None, **kwargs):
+        future = self._pool.submit(fn, *args, **kwargs)
+        if callback or errback:
+            future.add_done_callback(lambda f: self._done.put((f, callback, errback, owner)))
+        return future
+
+    def _drain(self):
+        while True:
+            try:
+                future, callback, errback, owner = self._done.get_nowait()
+            except queue.Empty:
+                break
+            if future.cancelled():
+                continue
+            try:
+                if owner is not None and not owner.winfo_exists():
+                    continue
+            except Exception:
+                continue
+            err = future.exception()
+            try:
+                if err is None:
+                    if callback:
+                        callback(future.result())
+                elif errback:
+                    errback(err)
+                else:
+                    print(f"Background query failed: {err}")
+            except Exception as e:
+                print(f"Error while delivering query result: {e}")
+        if not self._closed:
+            self.root.after(self.poll_ms, self._drain)
+
+    def shutdown(self):
+        self._closed = True
+        self._pool.shutdown(wait=False)
+
+
+_WORD_RE = re.compile(r"\w+")
+
+# InnoDB's default FULLTEXT stopwords; a required (+) stopword would match nothing
+_FT_STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for',
+    'from', 'how', 'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the',
+    'this', 'to', 'was', 'what', 'when', 'where', 'who', 'will', 'with', 'und', 'www',
+))
+_FT_MIN_TOKEN = 3  # innodb_ft_min_token_size default
+
+
+def _tokens(text):
+    """Lower-cased word tokens of text (None-safe)."""
+    return _WORD_RE.findall((text or '').lower())
+
+
+class InvertedIndex:
+    """In-process inverted index, the search fallback when FULLTEXT is unavailable.
+
+    Each document is indexed as weighted fields, e.g. ((name, 2), (bio, 1)).
+    search() requires every query term, treats the last term as a prefix so
+    half-typed words still match, and ranks hits by weighted tf-idf. Safe to
+    query from worker threads while another thread adds documents.
+    """
+
+    def __init__(self):
+        self._postings = {}     # term -> {doc_id: weighted term frequency}
+        self._doc_terms = {}    # doc_id -> terms, so a document can be re-indexed
+        self._vocab = []        # sorted terms for prefix lookups
+        self._vocab_dirty = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    def add(self, doc_id, fields):
+        counts = {}
+        for text, weight in fields:
+            for term in _tokens(text):
+                counts[term] = counts.get(term, 0) + weight
+        with self._lock:
+            self._discard(doc_id)
+            for term, weight in counts.items():
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = {}
+                    self._vocab_dirty = True
+                posting[doc_id] = weight
+            self._doc_terms[doc_id] = list(counts)
+
+    def _discard(self, doc_id):
+        for term in self._doc_terms.pop(doc_id, ()):
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self._postings[term]
+                self._vocab_dirty = True
+
+    def search(self, text, limit=50):
+        """Return up to `limit` (doc_id, score) pairs, best first."""
+        terms = _tokens(text)
+        if not terms:
+            return []
+        with self._lock:
+            if self._vocab_dirty:
+                self._vocab = sorted(self._postings)
+                self._vocab_dirty = False
+            total_docs = max(len(self._doc_terms), 1)
+            scores = None
+            for i, term in enumerate(terms):
+                if i == len(terms) - 1:
+                    start = bisect.bisect_left(self._vocab, term)
+                    matches = []
+                    for candidate in self._vocab[start:]:
+                        if not candidate.startswith(term):
+                            break
+                        matches.append(candidate)
+                else:
+                    matches = [term] if term in self._postings else []
+                term_scores = {}
+                for match in matches:
+                    posting = self._postings[match]
+                    idf = math.log(1 + total_docs / len(posting))
+                    for doc_id, weight in posting.items():
+                        # several prefix expansions may hit one doc; keep the best
+                        term_scores[doc_id] = max(term_scores.get(doc_id, 0), weight * idf)
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {d: s + term_scores[d] for d, s in scores.items() if d in term_scores}
+                if not scores:
+                    return []
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+
+class SearchEngine:
+    """Ranked text search over movies (name, description) and cast (name, bio).
+
+    Uses the MySQL FULLTEXT indexes created at startup when the server has
+    them, and otherwise an InvertedIndex per table built from the database on
+    first use. Names weigh twice as much as descriptions/bios on both paths.
+    search_movies()/search_cast() return [(id, score)] best first.
+    """
+
+    FULLTEXT_INDEXES = ('ft_movies_name', 'ft_movies_text', 'ft_cast_name', 'ft_cast_text')
+
+    def __init__(self):
+        self._fulltext = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self.movies = InvertedIndex()
+        self.cast = InvertedIndex()
+        # highest ids indexed so far; sync() picks up rows inserted after them
+        self._last_movie_id = 0
+        self._last_cast_id = 0
+
+    def uses_fulltext(self):
+        if self._fulltext is None:
+            try:
+                rows = db.fetchall(
+                    "SELECT DISTINCT index_name FROM information_schema.statistics WHERE table_schema=%s AND index_type='FULLTEXT'",
+                    (DB_CONFIG.get('database'),)
+                )
+                self._fulltext = set(self.FULLTEXT_INDEXES) <= {r[0] for r in rows}
+            except Exception:
+                self._fulltext = False
+        return self._fulltext
+
+    def warm(self):
+        """Pick the backend and, without FULLTEXT, build the in-process indexes."""
+        if not self.uses_fulltext():
+            self._ensure_loaded()
+
+    def _ensure_loaded(self):
+        with self._load_lock:
+            if not self._loaded:
+                self._load_new_rows()
+                self._loaded = True
+
+    def _load_new_rows(self):
+        for movie_id, name, description in db.fetchall(
+                "SELECT movie_id, movie_name, description FROM movies WHERE movie_id > %s", (self._last_movie_id,)):
+            self.movies.add(movie_id, ((name, 2), (description, 1)))
+            self._last_movie_id = max(self._last_movie_id, movie_id)
+        for cast_id, name, bio in db.fetchall(
+                "SELECT cast_id, name, bio FROM cast_members WHERE cast_id > %s", (self._last_cast_id,)):
+            self.cast.add(cast_id, ((name, 2), (bio, 1)))
+            self._last_cast_id = max(self._last_cast_id, cast_id)
+
+    def sync(self):
+        """Index movies/cast inserted since the last load (after add-item or an import).
+
+        A no-op on the FULLTEXT path, where the server maintains the indexes.
+        """
+        with self._load_lock:
+            if self._loaded:
+                self._load_new_rows()
+
+    def search_movies(self, text, limit=200):
+        if self.uses_fulltext():
+            return self._fulltext_search('movies', 'movie_id', 'movie_name', 'description', text, limit)
+        self._ensure_loaded()
+        return self.movies.search(text, limit)
+
+    def search_cast(self, text, limit=200):
+        if self.uses_fulltext():
+            return self._fulltext_search('cast_members', 'cast_id', 'name', 'bio', text, limit)
+        self._ensure_loaded()
+        return self.cast.search(text, limit)
+
+    def _fulltext_search(self, table, id_col, name_col, text_col, text, limit):
+        terms = _tokens(text)
+        if not terms:
+            return []
+        # Every indexable term is required; the last one may be half-typed
+        required = [t for t in terms if len(t) >= _FT_MIN_TOKEN and t not in _FT_STOPWORDS]
+        if not required:
+            # only short/stop words: InnoDB cannot match them, use a name prefix scan
+            rows = db.fetchall(f"SELECT {id_col} FROM {table} WHERE {name_col} LIKE %s LIMIT %s", (f"{text.strip()}%", limit))
+            return [(r[0], 1.0) for r in rows]
+        boolean = ' '.join(f"+{t}*" if t == terms[-1] else f"+{t}" for t in required)
+        rows = db.fetchall(f"""
+            SELECT {id_col},
+                2 * MATCH({name_col}) AGAINST (%s IN BOOLEAN MODE)
+                + MATCH({name_col}, {text_col}) AGAINST (%s IN BOOLEAN MODE) AS score
+            FROM {table}
+            WHERE MATCH({name_col}, {text_col}) AGAINST (%s IN BOOLEAN MODE)
+            ORDER BY score DESC
+            LIMIT %s
+        """, (boolean, boolean, boolean, limit))
+        return [(r[0], float(r[1])) for r in rows]
+
+
+def _normalize(text):
+    return ' '.join(_tokens(text))
+
+
+def _trigrams(text):
+    """Trigrams of each word, padded so word starts and ends count too."""
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """In-memory trigram + word-prefix index over titles and cast names.
+
+    Backs the header's search-as-you-type suggestions, so it never touches
+    MySQL on a keystroke. Entries are (kind, id, label) with kind 'movie',
+    'series' or 'cast'. suggest() ranks word-prefix matches of the last typed
+    word first, then fuzzy matches by trigram similarity, which keeps small
+    typos ("godfahter") finding the right title. sync() loads rows inserted
+    since the last call, so the same call does the initial load at startup.
+    """
+
+    def __init__(self, min_similarity=0.3, max_prefix_hits=400):
+        self.min_similarity = min_similarity
+        self.max_prefix_hits = max_prefix_hits
+        self._entries = []          # idx -> (kind, id, label, trigram count)
+        self._grams = {}            # trigram -> [entry idx]
+        self._words = []            # sorted (word, entry idx) for prefix lookups
+        self._pending_words = []    # added since the last sort
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._last_movie_id = 0
+        self._last_cast_id = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, kind, item_id, label):
+        norm = _normalize(label)
+        if not norm:
+            return
+        grams = _trigrams(norm)
+        with self._lock:
+            idx = len(self._entries)
+            self._entries.append((kind, item_id, label, len(grams)))
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(idx)
+            for word in set(norm.split()):
+                self._pending_words.append((word, idx))
+
+    def sync(self):
+        """Index movies, series and cast inserted since the last sync."""
+        with self._sync_lock:
+            for movie_id, name, is_series in db.fetchall("""
+                SELECT m.movie_id, m.movie_name, IFNULL(s.episode_count, 0) > 0
+                FROM movies m
+                LEFT JOIN movie_summary s ON m.movie_id=s.movie_id
+                WHERE m.movie_id > %s
+            """, (self._last_movie_id,)):
+                self.add('series' if is_series else 'movie', movie_id, name)
+                self._last_movie_id = max(self._last_movie_id, movie_id)
+            for cast_id, name in db.fetchall("SELECT cast_id, name FROM cast_members WHERE cast_id > %s", (self._last_cast_id,)):
+                self.add('cast', cast_id, name)
+                self._last_cast_id = max(self._last_cast_id, cast_id)
+
+    def suggest(self, text, limit=8):
+        """Return up to `limit` (kind, id, label) tuples for the typed text."""
+        norm = _normalize(text)
+        if not norm:
+            return []
+        with self._lock:
+            self._merge_words()
+
+            # Word-prefix hits on the last (possibly half-typed) word
+            last = norm.split()[-1]
+            prefix_hits = set()
+            start = bisect.bisect_left(self._words, (last,))
+            for word, idx in self._words[start:]:
+                if not word.startswith(last) or len(prefix_hits) >= self.max_prefix_hits:
+                    break
+                prefix_hits.add(idx)
+
+            # Trigram similarity (Jaccard) over the whole query
+            similarity = {}
+            if len(norm) >= 3:
+                query_grams = _trigrams(norm)
+                shared = {}
+                for gram in query_grams:
+                    for idx in self._grams.get(gram, ()):
+                        shared[idx] = shared.get(idx, 0) + 1
+                for idx, count in shared.items():
+                    sim = count / (len(query_grams) + self._entries[idx][3] - count)
+                    if sim >= self.min_similarity or idx in prefix_hits:
+                        similarity[idx] = sim
+
+            scores = {idx: 1.0 + similarity.get(idx, 0.0) for idx in prefix_hits}
+            for idx, sim in similarity.items():
+                scores.setdefault(idx, sim)
+            best = heapq.nsmallest(limit, scores, key=lambda idx: (-scores[idx], len(self._entries[idx][2])))
+            return [self._entries[idx][:3] for idx in best]
+
+    def has_name(self, kind, text):
+        """True if some `kind` entry's name has a word starting with each word of text.
+
+        Names only and no fuzzy matching, unlike suggest(): this decides
+        whether a query is meant as a name at all.
+        """
+        words = _normalize(text).split()
+        if not words:
+            return False
+        with self._lock:
+            self._merge_words()
+            candidates = None
+            for w in words:
+                hits = set()
+                start = bisect.bisect_left(self._words, (w,))
+                for word, idx in self._words[start:]:
+                    if not word.startswith(w):
+                        break
+                    if self._entries[idx][0] == kind and (candidates is None or idx in candidates):
+                        hits.add(idx)
+                if not hits:
+                    return False
+                candidates = hits
+            return True
+
+    def _merge_words(self):
+        if self._pending_words:
+            self._words.extend(self._pending_words)
+            self._words.sort()
+            self._pending_words = []
+
+
+# ---------- Typed CSV import ----------
+# Rows buffered (across all tables) before the bulk importer flushes them with
+# one executemany per table.
+IMPORT_BATCH_SIZE = 1000
+
+# Files at least this large go through LOAD DATA LOCAL INFILE when the server
+# allows it; below that the staging round trip costs more than it saves.
+IMPORT_LOAD_DATA_MIN_BYTES = 20 * 1024 * 1024
+
+
+def _parse_import_date(date_str):
+    """'YYYY-MM-DD' for a full date or a bare year, otherwise None."""
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    if re.fullmatch(r"\d{4}$", date_str):
+        return date_str + "-01-01"
+    try:
+        datetime.datetime.strptime(date_str, '%Y-%m-%d')
+        return date_str
+    except:
+        return None
+
+
+def _parse_import_rating(raw_rating):
+    # normalize rating to DB DECIMAL(2,1). Accept formats: 8, 8.5, 80, 8/10, 80%, etc.
+    if raw_rating is None or str(raw_rating).strip() == '':
+        return None
+    try:
+        s = str(raw_rating).strip()
+        if '/' in s:
+            a, b = s.split('/')[:2]
+            num = float(a)
+            den = float(b) if b else 10.0
+            val = (num / den) * 10.0
+        elif s.endswith('%'):
+            val = float(s.rstrip('%')) / 10.0
+        else:
+            val = float(s)
+            if val > 10 and val <= 100:
+                val = val / 10.0
+        # clamp and round to one decimal place
+        return round(max(0.0, min(9.9, val)), 1)
+    except Exception:
+        return None
+
+
+def _field(row, *names):
+    """First non-empty value among the given columns, stripped ('' if none)."""
+    for name in names:
+        value = row.get(name)
+        if value:
+            return value.strip()
+    return ''
+
+
+def normalize_import_row(row):
+    """Map one row of a typed CSV to a (kind, values) record for BulkImporter.add().
+
+    Returns None for rows the importer counts as skipped: no type, an unknown
+    type, or a missing required column. Column aliases match the row-by-row
+    importer in CineTrackIMDB.import_all_csv_from_path.
+    """
+    typ = _field(row, 'type', 'record_type').lower()
+    if typ in ('user', 'users'):
+        username = _field(row, 'username', 'user')
+        if username:
+            return 'user', (username, _field(row, 'email') or None, _field(row, 'password') or 'changeme')
+
+    elif typ in ('movie', 'movies'):
+        title = _field(row, 'title', 'movie_name', 'name')
+        if title:
+            return 'movie', (title,
+                             _parse_import_date(row.get('release_date') or row.get('date') or row.get('year') or ''),
+                             _field(row, 'language') or None,
+                             _field(row, 'description', 'summary') or None)
+
+    elif typ in ('genre', 'genres'):
+        gname = _field(row, 'genre_name', 'name', 'genre')
+        if gname:
+            return 'genre', (gname,)
+
+    elif typ in ('cast', 'cast_member', 'cast_members'):
+        name = _field(row, 'name', 'actor')
+        if name:
+            return 'cast', (name,
+                            _parse_import_date(row.get('dob') or row.get('birthdate') or ''),
+                            _field(row, 'bio', 'biography') or None,
+                            row.get('age') or None)
+
+    elif typ in ('studio', 'studios'):
+        sname = _field(row, 'studio_name', 'name')
+        if sname:
+            return 'studio', (sname, _field(row, 'country') or None)
+
+    elif typ in ('platform', 'streaming_platform', 'streaming_platforms'):
+        pname = _field(row, 'platform_name', 'name')
+        if pname:
+            return 'platform', (pname, _field(row, 'subscription_type', 'subscription') or None)
+
+    elif typ in ('episode', 'episodes'):
+        series_title = _field(row, 'series_title', 'title', 'movie_name')
+        season_raw = _field(row, 'season', 'season_number')
+        ep_raw = _field(row, 'episode', 'episode_number')
+        try:
+            season = int(season_raw) if season_raw else 1
+        except:
+            season = 1
+        try:
+            episode_number = int(ep_raw) if ep_raw else None
+        except:
+            episode_number = None
+        if series_title:
+            return 'episode', (series_title, season,
+                               _field(row, 'episode_title', 'ep_title', 'title') or None,
+                               episode_number,
+                               _parse_import_date(row.get('release_date') or row.get('air_date') or row.get('date') or ''))
+
+    elif typ in ('review', 'reviews', 'rating', 'ratings'):
+        uname = _field(row, 'username', 'user')
+        title = _field(row, 'title', 'movie_name')
+        if uname and title:
+            return 'review', (uname, title, _parse_import_rating(row.get('rating') or ''),
+                              _field(row, 'comment', 'review') or None)
+
+    elif typ in ('movie_genre',):
+        title = _field(row, 'title', 'movie_name')
+        gname = _field(row, 'genre', 'genre_name')
+        if title and gname:
+            return 'movie_genre', (title, gname)
+
+    elif typ in ('movie_cast',):
+        title = _field(row, 'title', 'movie_name')
+        actor = _field(row, 'actor', 'name')
+        if title and actor:
+            return 'movie_cast', (title, actor, _field(row, 'role') or None,
+                                  _field(row, 'character_name', 'character') or None)
+
+    elif typ in ('movie_studio',):
+        title = _field(row, 'title', 'movie_name')
+        sname = _field(row, 'studio_name', 'studio')
+        if title and sname:
+            return 'movie_studio', (title, sname)
+
+    elif typ in ('movie_platform',):
+        title = _field(row, 'title', 'movie_name')
+        pname = _field(row, 'platform_name', 'platform')
+        if title and pname:
+            return 'movie_platform', (title, pname,
+                                      _parse_import_date(row.get('availability_date') or row.get('availability') or ''))
+
+    elif typ in ('distribution', 'movie_distribution'):
+        title = _field(row, 'title', 'movie_name')
+        sname = _field(row, 'studio_name', 'studio')
+        pname = _field(row, 'platform_name', 'platform')
+        if title and sname and pname:
+            return 'distribution', (title, sname, pname,
+                                    _parse_import_date(row.get('distribution_date') or row.get('date') or ''),
+                                    _field(row, 'territory', 'region') or 'worldwide')
+
+    elif typ in ('follow', 'user_follow'):
+        follower = _field(row, 'follower', 'follower_username', 'follower_id')
+        followed = _field(row, 'followed', 'followed_username', 'followed_id')
+        if follower and followed:
+            return 'follow', (follower, followed)
+
+    elif typ in ('donation', 'donations'):
+        uname = _field(row, 'username', 'user', 'user_id')
+        if uname:
+            return 'donation', (uname, row.get('donation_amount') or row.get('amount') or 0,
+                                _field(row, 'comment') or None)
+
+    elif typ in ('contains_episode',):
+        eid = row.get('episode_id') or row.get('episode') or ''
+        title = _field(row, 'title', 'movie_name')
+        if eid and title:
+            try:
+                return 'contains_episode', (int(eid), title)
+            except ValueError:
+                pass
+
+    return None
+
+
+def import_record_key(record):
+    """Identity of a typed record whose repeats the importers always skip."""
+    kind, values = record
+    if kind == 'movie':
+        return kind, values[0], values[1]
+    if kind in ('user', 'genre', 'cast', 'studio', 'platform'):
+        return kind, values[0]
+    return None
+
+
+def _split_genres(raw):
+    return tuple(p.strip() for p in re.split(r'[,|;]', raw) if p.strip())
+
+
+def normalize_movie_row(row):
+    """(title, release_date, language, description, genres) for import_movies_csv, or None."""
+    # flexible header names
+    title = _field(row, 'title', 'movie_name', 'name')
+    release_date = _field(row, 'release_date', 'date', 'year')
+    if not title or not release_date:
+        return None
+    # If year-only provided, convert to YYYY-01-01
+    if re.fullmatch(r"\d{4}$", release_date):
+        release_date = release_date + "-01-01"
+    return (title, release_date, _field(row, 'language') or None,
+            _field(row, 'description', 'summary') or None, _split_genres(_field(row, 'genres', 'genre')))
+
+
+def movie_record_key(record):
+    # same title + release_date is a duplicate
+    return record[:2]
+
+
+def normalize_series_row(row):
+    """(series_title, season, episode_number, episode_title, release_date, language,
+    description, genres) for import_series_csv_from_path, or None."""
+    series_title = _field(row, 'title', 'series_name', 'movie_name')
+    if not series_title:
+        return None
+    season_raw = _field(row, 'season', 'season_number')
+    ep_raw = _field(row, 'episode', 'episode_number')
+    release_date = _field(row, 'release_date', 'episode_date', 'date', 'year')
+
+    # normalize season and episode numbers
+    try:
+        season = int(season_raw) if season_raw else 1
+    except:
+        season = 1
+    try:
+        episode_number = int(ep_raw) if ep_raw else None
+    except:
+        episode_number = None
+
+    # If year-only provided, convert to YYYY-01-01
+    if release_date and re.fullmatch(r"\d{4}$", release_date):
+        release_date = release_date + "-01-01"
+    return (series_title, season, episode_number, _field(row, 'episode_title', 'ep_title') or None,
+            release_date or None, _field(row, 'language') or None,
+            _field(row, 'description', 'summary') or None, _split_genres(_field(row, 'genres', 'genre')))
+
+
+def series_record_key(record):
+    # an episode number repeated within the same series and season is a duplicate
+    return record[:3] if record[2] is not None else None
+
+
+# ---------- Parallel CSV parsing ----------
+# Size of the byte ranges handed to parser processes, and how many parsed
+# chunks may wait for the DB writer before the parsers are held back.
+IMPORT_CHUNK_BYTES = 4 * 1024 * 1024
+IMPORT_QUEUE_SIZE = 8
+IMPORT_PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+
+def _csv_byte_ranges(file_path, chunk_bytes=IMPORT_CHUNK_BYTES, start_offset=0, block_size=1 << 20):
+    """Return (header line, [(start, end), ...]) splitting a CSV on record boundaries.
+
+    A range ends only at a newline with an even number of quote characters
+    before it, so quoted fields containing line breaks never straddle two
+    ranges. One sequential pass over the bytes, counting quotes in C.
+    start_offset must itself be a record boundary (e.g. a committed
+    checkpoint offset); everything before it is left out.
+    """
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        if start_offset > f.tell():
+            f.seek(start_offset)
+        start = f.tell()
+        bounds = [start]
+        target = start + chunk_bytes
+        pos = start
+        quotes = 0
+        while target < size:
+            block = f.read(block_size)
+            if not block:
+                break
+            i = 0
+            while i < len(block) and target < size:
+                if pos + i < target:
+                    j = min(len(block), target - pos)
+                    quotes += block.count(b'"', i, j)
+                    i = j
+                    continue
+                nl = block.find(b'\n', i)
+                if nl < 0:
+                    quotes += block.count(b'"', i)
+                    i = len(block)
+                    continue
+                quotes += block.count(b'"', i, nl)
+                i = nl + 1
+                if quotes % 2 == 0:
+                    bounds.append(pos + i)
+                    target = pos + i + chunk_bytes
+            pos += len(block)
+    bounds.append(size)
+    return header, [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _parse_csv_range(file_path, fieldnames, start, end, normalize, key=None):
+    """Parse one byte range into normalized records (runs in a worker process).
+
+    Returns (records, skipped, failed, end). normalize(row) gives a record or None
+    for rows to skip; with key, records whose key repeats one seen earlier in
+    the range are dropped as skipped, so fewer duplicates reach the writer.
+    """
+    import csv
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    records = []
+    seen = set()
+    skipped = failed = 0
+    for row in csv.DictReader(io.StringIO(data.decode('utf-8'), newline=''), fieldnames=fieldnames):
+        try:
+            record = normalize(row)
+        except Exception as e:
+            failed += 1
+            print(f"Import parse error: {e}")
+            continue
+        if record is None:
+            skipped += 1
+            continue
+        if key is not None:
+            k = key(record)
+            if k is not None:
+                if k in seen:
+                    skipped += 1
+                    continue
+                seen.add(k)
+        records.append(record)
+    return records, skipped, failed, end
+
+
+def iter_csv_records(file_path, normalize, key=None, workers=IMPORT_PARSE_WORKERS,
+                     chunk_bytes=IMPORT_CHUNK_BYTES, queue_size=IMPORT_QUEUE_SIZE, start_offset=0):
+    """Yield (records, skipped, failed, end offset) per chunk of a CSV, in file order.
+
+    The file is split into byte ranges (_csv_byte_ranges) that a process pool
+    parses and normalizes; a feeder thread puts finished chunks, in order, on
+    a bounded queue that the caller -- the single DB writer -- drains. Parsing
+    therefore overlaps with inserting, and a slow writer holds the parsers
+    back instead of piling up parsed rows. normalize and key must be
+    module-level functions so they can be sent to the workers. Small files and
+    workers=1 are parsed in-process.
+    """
+    import csv
+    header, ranges = _csv_byte_ranges(file_path, chunk_bytes, start_offset)
+    fieldnames = next(csv.reader([header.decode('utf-8-sig')]), [])
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            yield _parse_csv_range(file_path, fieldnames, start, end, normalize, key)
+        return
+
+    out = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def feed():
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for start, end in ranges:
+                    if stop.is_set():
+                        break
+                    pending.append(pool.submit(_parse_csv_range, file_path, fieldnames, start, end, normalize, key))
+                    if len(pending) >= workers * 2 and not put(pending.popleft().result()):
+                        break
+                while pending and not stop.is_set():
+                    if not put(pending.popleft().result()):
+                        break
+                for future in pending:
+                    future.cancel()
+        except BaseException as e:
+            put(e)
+        put(done)
+
+    feeder = threading.Thread(target=feed, name="csv-parse-feeder", daemon=True)
+    feeder.start()
+    try:
+        while True:
+            item = out.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def file_sha256(file_path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ImportCheckpoint:
+    """Committed progress of one import, keyed by the file's SHA-256 (import_checkpoints).
+
+    offset is the first byte not yet imported; it always sits on a record
+    boundary. save() belongs in the same transaction as the batch it
+    describes, so after a crash the stored offset and counters match exactly
+    what was committed and a restart can seek straight past it.
+    """
+
+    def __init__(self, file_hash, file_path, offset=0, inserted=0, skipped=0, failed=0):
+        self.file_hash = file_hash
+        self.file_path = file_path
+        self.offset = offset
+        self.inserted, self.skipped, self.failed = inserted, skipped, failed
+
+    @classmethod
+    def resume(cls, cursor, file_path, file_hash=None, start_offset=0):
+        """Checkpoint of an unfinished import of this exact file content, or a
+        fresh one starting at start_offset."""
+        file_hash = file_hash or file_sha256(file_path)
+        cursor.execute(
+            "SELECT byte_offset, inserted, skipped, failed FROM import_checkpoints WHERE file_hash=%s AND completed=0",
+            (file_hash,))
+        row = cursor.fetchone()
+        return cls(file_hash, file_path, *row) if row else cls(file_hash, file_path, start_offset)
+
+    def counts(self):
+        return (self.inserted, self.skipped, self.failed)
+
+    def save(self, cursor, offset, counts, completed=False):
+        self.offset = offset
+        self.inserted, self.skipped, self.failed = counts
+        cursor.execute("""
+            INSERT INTO import_checkpoints (file_hash, file_path, byte_offset, inserted, skipped, failed, completed)
+            VALUES (%s,%s,%s,%s,%s,%s,%s)
+            ON DUPLICATE KEY UPDATE file_path=VALUES(file_path), byte_offset=VALUES(byte_offset),
+                inserted=VALUES(inserted), skipped=VALUES(skipped), failed=VALUES(failed),
+                completed=VALUES(completed)
+        """, (self.file_hash, self.file_path, offset, self.inserted, self.skipped, self.failed, int(completed)))
+
+
+def _prefix_and_full_sha256(file_path, prefix_len, block_size=1 << 20):
+    """(SHA-256 of the first prefix_len bytes, last byte of that prefix, SHA-256 of the file), in one pass."""
+    digest = hashlib.sha256()
+    prefix = last = None
+    done = 0
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(block_size if done >= prefix_len else min(block_size, prefix_len - done))
+            if not block:
+                break
+            digest.update(block)
+            done += len(block)
+            if done == prefix_len:
+                prefix, last = digest.copy().hexdigest(), block[-1:]
+    return prefix, last, digest.hexdigest()
+
+
+class FileFingerprint:
+    """Size, mtime and SHA-256 of an imported file, as stored in import_files.
+
+    pending_offset() compares the file on disk with the row recorded by the
+    last completed import and returns where a new import has to start:
+    - same size and mtime: None (skip; the file is not even read)
+    - same content hash: None, and the new mtime is recorded
+    - the previously imported bytes are an unchanged prefix ending in a
+      newline: the old size, so only the appended tail is imported
+    - anything else: 0, the whole file
+    """
+
+    def __init__(self, file_path):
+        self.path = os.path.abspath(file_path)
+        st = os.stat(file_path)
+        self.size = st.st_size
+        self.mtime_ns = st.st_mtime_ns
+        self._sha256 = None
+
+    @property
+    def sha256(self):
+        if self._sha256 is None:
+            self._sha256 = file_sha256(self.path)
+        return self._sha256
+
+    def pending_offset(self):
+        row = db.fetchone("SELECT size, mtime_ns, sha256 FROM import_files WHERE file_path=%s", (self.path,))
+        if row is None:
+            return 0
+        size, mtime_ns, digest = row
+        if size == self.size and mtime_ns == self.mtime_ns:
+            return None
+        if size == self.size:
+            if self.sha256 == digest:
+                self.save()
+                return None
+            return 0
+        if 0 < size < self.size:
+            prefix, last, self._sha256 = _prefix_and_full_sha256(self.path, size)
+            if prefix == digest and last == b'\n':
+                return size
+        return 0
+
+    def save(self):
+        db.execute("""
+            INSERT INTO import_files (file_path, size, mtime_ns, sha256) VALUES (%s,%s,%s,%s)
+            ON DUPLICATE KEY UPDATE size=VALUES(size), mtime_ns=VALUES(mtime_ns), sha256=VALUES(sha256)
+        """, (self.path, self.size, self.mtime_ns, self.sha256))
+
+
+class _NameRef(tuple):
+    """Stand-in for the id of a parent row that is still waiting to be flushed."""
+
+    def __new__(cls, entity, name):
+        return tuple.__new__(cls, (entity, name))
+
+
+class BulkImporter:
+    """Buffered, executemany-based writer for typed CSV rows.
+
+    Name->id maps for users, movies, genres, cast, studios and platforms (and
+    the existing link rows) are loaded once, so duplicate checks are dict
+    lookups instead of a SELECT per row. New rows are buffered per table and
+    written with one executemany per table every `batch_size` rows. Parent
+    tables flush first; their new ids are re-selected by name and then
+    substituted into the child rows that referenced them. If a batch is
+    rejected it is retried row by row so one bad row only fails itself.
+
+    inserted/skipped/failed follow the row-by-row importer's rules.
+    """
+
+    # entity -> (table, id column, name column, insert columns)
+    PARENTS = {
+        'users': ('users', 'user_id', 'username', ('username', 'email', 'password')),
+        'movies': ('movies', 'movie_id', 'movie_name', ('movie_name', 'release_date', 'language', 'description')),
+        'genres': ('genres', 'genre_id', 'genre_name', ('genre_name',)),
+        'cast': ('cast_members', 'cast_id', 'name', ('name', 'dob', 'bio', 'age')),
+        'studios': ('studios', 'studio_id', 'studio_name', ('studio_name', 'country')),
+        'platforms': ('streaming_platforms', 'platform_id', 'platform_name', ('platform_name', 'subscription_type')),
+    }
+
+    # child table -> insert columns, flushed in this order after the parents
+    CHILDREN = {
+        'episodes': ('movie_id', 'season_number', 'title', 'episode_number', 'air_date'),
+        'reviews_ratings': ('user_id', 'movie_id', 'rating', 'comment'),
+        'movie_genre': ('movie_id', 'genre_id'),
+        'movie_cast': ('movie_id', 'cast_id', 'role', 'character_name'),
+        'movie_studio': ('movie_id', 'studio_id'),
+        'movie_platform': ('movie_id', 'platform_id', 'availability_date'),
+        'movie_distribution': ('movie_id', 'studio_id', 'platform_id', 'distribution_date', 'territory'),
+        'user_follow': ('follower_id', 'followed_id'),
+        'donations': ('user_id', 'donation_amount', 'comment'),
+        'contains_episodes': ('episode_id', 'movie_id'),
+    }
+
+    # child table -> (preload query, positions of the insert values forming its key)
+    SEEN_KEYS = {
+        'episodes': ("SELECT movie_id, season_number, episode_number FROM episodes", (0, 1, 3)),
+        'movie_genre': ("SELECT movie_id, genre_id FROM movie_genre", (0, 1)),
+        'movie_cast': ("SELECT movie_id, cast_id FROM movie_cast", (0, 1)),
+        'movie_studio': ("SELECT movie_id, studio_id FROM movie_studio", (0, 1)),
+        'movie_platform': ("SELECT movie_id, platform_id FROM movie_platform", (0, 1)),
+        'user_follow': ("SELECT follower_id, followed_id FROM user_follow", (0, 1)),
+        'contains_episodes': ("SELECT episode_id, movie_id FROM contains_episodes", (0, 1)),
+    }
+
+    def __init__(self, cursor, batch_size=IMPORT_BATCH_SIZE):
+        self.cursor = cursor
+        self.batch_size = max(1, int(batch_size))
+        self.inserted = self.skipped = self.failed = 0
+        self.ids = {}
+        self.queued_names = {entity: set() for entity in self.PARENTS}
+        self.buffers = {}
+        self.pending = 0
+
+        for entity, (table, id_col, name_col, _) in self.PARENTS.items():
+            self.ids[entity] = {}
+            cursor.execute(f"SELECT {id_col}, {name_col} FROM {table} ORDER BY {id_col}")
+            for item_id, name in cursor.fetchall():
+                self.ids[entity].setdefault(name, item_id)
+        cursor.execute("SELECT email FROM users WHERE email IS NOT NULL")
+        self.emails = {r[0] for r in cursor.fetchall()}
+        cursor.execute("SELECT movie_name, release_date FROM movies WHERE release_date IS NOT NULL")
+        self.movie_dates = {(name, str(d)) for name, d in cursor.fetchall()}
+        self.seen = {}
+        for table, (sql, _) in self.SEEN_KEYS.items():
+            cursor.execute(sql)
+            self.seen[table] = {tuple(r) for r in cursor.fetchall()}
+        cursor.execute("SELECT episode_id FROM episodes")
+        self.episode_ids = {r[0] for r in cursor.fetchall()}
+        self.last_episode_id = max(self.episode_ids, default=0)
+
+    def counts(self):
+        return (self.inserted, self.skipped, self.failed)
+
+    def add(self, record):
+        """Queue one (kind, values) record from normalize_import_row()."""
+        if record is None:
+            self.skipped += 1
+            return
+        kind, values = record
+        getattr(self, '_add_' + kind)(*values)
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    # --- buffering helpers ---
+    def _queue(self, table, values, counted=1):
+        # counted=0 marks parent rows created implicitly (e.g. the user behind a
+        # review): they are written but, as in the row importer, not reported
+        self.buffers.setdefault(table, []).append((values, counted))
+        self.pending += 1
+
+    def _known(self, entity, name):
+        return name in self.ids[entity] or name in self.queued_names[entity]
+
+    def _add_parent(self, entity, values):
+        if self._known(entity, values[0]):
+            self.skipped += 1
+            return
+        self.queued_names[entity].add(values[0])
+        self._queue(entity, values)
+
+    def _parent(self, entity, name, values=None):
+        """Id for `name`, queueing a minimal parent row when it does not exist yet."""
+        item_id = self.ids[entity].get(name)
+        if item_id is not None:
+            return item_id
+        if name not in self.queued_names[entity]:
+            self.queued_names[entity].add(name)
+            width = len(self.PARENTS[entity][3])
+            self._queue(entity, values or (name,) + (None,) * (width - 1), counted=0)
+        return _NameRef(entity, name)
+
+    def _user(self, name):
+        return self._parent('users', name, (name, None, 'changeme'))
+
+    def _link(self, table, values):
+        key = values[:2]
+        if key not in self.seen[table]:
+            self.seen[table].add(key)
+            self._queue(table, values)
+        else:
+            # an existing link still counts as imported, like the row importer
+            self.inserted += 1
+
+    # --- one method per row kind ---
+    def _add_user(self, username, email, password):
+        if self._known('users', username) or (email and email in self.emails):
+            self.skipped += 1
+            return
+        if email:
+            self.emails.add(email)
+        self._add_parent('users', (username, email, password))
+
+    def _add_movie(self, title, release_date, language, description):
+        if release_date is None:
+            exists = self._known('movies', title)
+        else:
+            exists = (title, release_date) in self.movie_dates
+        if exists:
+            self.skipped += 1
+            return
+        if release_date is not None:
+            self.movie_dates.add((title, release_date))
+        self.queued_names['movies'].add(title)
+        self._queue('movies', (title, release_date, language, description))
+
+    def _add_genre(self, name):
+        self._add_parent('genres', (name,))
+
+    def _add_cast(self, name, dob, bio, age):
+        self._add_parent('cast', (name, dob, bio, age))
+
+    def _add_studio(self, name, country):
+        self._add_parent('studios', (name, country))
+
+    def _add_platform(self, name, subscription_type):
+        self._add_parent('platforms', (name, subscription_type))
+
+    def _add_episode(self, series_title, season, ep_title, episode_number, release_date):
+        movie = self._parent('movies', series_title, (series_title, release_date, None, None))
+        if episode_number is not None:
+            key = (movie, season, episode_number)
+            if key in self.seen['episodes']:
+                self.skipped += 1
+                return
+            self.seen['episodes'].add(key)
+        self._queue('episodes', (movie, season, ep_title, episode_number, release_date))
+
+    def _add_review(self, uname, title, rating, comment):
+        self._queue('reviews_ratings', (self._user(uname), self._parent('movies', title), rating, comment))
+
+    def _add_movie_genre(self, title, gname):
+        self._link('movie_genre', (self._parent('movies', title), self._parent('genres', gname)))
+
+    def _add_movie_cast(self, title, actor, role, character):
+        self._link('movie_cast', (self._parent('movies', title), self._parent('cast', actor), role, character))
+
+    def _add_movie_studio(self, title, sname):
+        self._link('movie_studio', (self._parent('movies', title), self._parent('studios', sname)))
+
+    def _add_movie_platform(self, title, pname, availability_date):
+        self._link('movie_platform', (self._parent('movies', title), self._parent('platforms', pname), availability_date))
+
+    def _add_distribution(self, title, sname, pname, distribution_date, territory):
+        self._queue('movie_distribution', (self._parent('movies', title), self._parent('studios', sname),
+                                           self._parent('platforms', pname), distribution_date, territory))
+
+    def _add_follow(self, follower, followed):
+        # support usernames or ids; prefer username
+        fid = int(follower) if follower.isdigit() else self._user(follower)
+        tid = int(followed) if followed.isdigit() else self._user(followed)
+        if fid == tid or (fid, tid) in self.seen['user_follow']:
+            self.skipped += 1
+            return
+        self.seen['user_follow'].add((fid, tid))
+        self._queue('user_follow', (fid, tid))
+
+    def _add_donation(self, uname, amount, comment):
+        self._queue('donations', (self._user(uname), amount, comment))
+
+    def _add_contains_episode(self, episode_id, title):
+        if episode_id not in self.episode_ids and self.buffers.get('episodes'):
+            # the episode may be one of this file's rows still in the buffer
+            self.flush()
+        if episode_id not in self.episode_ids:
+            # cannot link to non-existent episode, skip
+            self.skipped += 1
+            return
+        movie = self._parent('movies', title)
+        if (episode_id, movie) not in self.seen['contains_episodes']:
+            self.seen['contains_episodes'].add((episode_id, movie))
+            self._queue('contains_episodes', (episode_id, movie))
+
+    # --- writing ---
+    def flush(self):
+        """Write everything buffered: parents first, then the rows referencing them."""
+        for entity, (table, id_col, name_col, cols) in self.PARENTS.items():
+            rows = self.buffers.pop(entity, None)
+            if rows:
+                self._insert_many(table, cols, rows)
+                self._reload_ids(entity, [values[0] for values, _ in rows])
+            self.queued_names[entity].clear()
+
+        for table, cols in self.CHILDREN.items():
+            rows = self.buffers.pop(table, None)
+            if not rows:
+                continue
+            key_positions = self.SEEN_KEYS.get(table, (None, None))[1]
+            resolved = []
+            for values, counted in rows:
+                try:
+                    values = tuple(self.ids[v[0]][v[1]] if isinstance(v, _NameRef) else v for v in values)
+                except KeyError as e:
+                    # the parent row itself failed to insert
+                    self.failed += counted
+                    print(f"Import row error for {table}: missing {e}")
+                    continue
+                if key_positions:
+                    self.seen[table].add(tuple(values[i] for i in key_positions))
+                resolved.append((values, counted))
+            self._insert_many(table, cols, resolved)
+            if table == 'episodes':
+                self.cursor.execute("SELECT episode_id FROM episodes WHERE episode_id > %s", (self.last_episode_id,))
+                new_ids = [r[0] for r in self.cursor.fetchall()]
+                self.episode_ids.update(new_ids)
+                self.last_episode_id = max(new_ids, default=self.last_episode_id)
+        self.pending = 0
+
+    def _insert_many(self, table, cols, rows):
+        if not rows:
+            return
+        sql = f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join(['%s'] * len(cols))})"
+        try:
+            self.cursor.executemany(sql, [values for values, _ in rows])
+            self.inserted += sum(counted for _, counted in rows)
+            return
+        except Exception as e:
+            print(f"Bulk insert into {table} failed, retrying row by row: {e}")
+        for values, counted in rows:
+            try:
+                self.cursor.execute(sql, values)
+                self.inserted += counted
+            except Exception as e:
+                self.failed += counted
+                print(f"Import row error for {table}: {e}")
+
+    def _reload_ids(self, entity, names):
+        table, id_col, name_col, _ = self.PARENTS[entity]
+        names = list(set(names))
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            self.cursor.execute(
+                f"SELECT {id_col}, {name_col} FROM {table} WHERE {name_col} IN ({', '.join(['%s'] * len(chunk))}) ORDER BY {id_col}",
+                tuple(chunk))
+            for item_id, name in self.cursor.fetchall():
+                self.ids[entity].setdefault(name, item_id)
+
+
+def bulk_import_csv(file_path, batch_size=IMPORT_BATCH_SIZE, job=None, start_offset=0, file_hash=None):
+    """Typed-CSV import through BulkImporter; same counts as the row path.
+
+    Each parsed chunk is committed together with its import_checkpoints
+    row, so a failed, interrupted or cancelled import keeps every finished
+    chunk and the next run of the same file resumes at the first
+    uncommitted byte.
+    """
+    started = time.perf_counter()
+    rows = 0
+    with db.connection() as cnx:
+        cursor = cnx.cursor(buffered=True)
+        try:
+            checkpoint = ImportCheckpoint.resume(cursor, file_path, file_hash, start_offset)
+            if checkpoint.offset > start_offset:
+                print(f"Resuming import of {file_path} at byte {checkpoint.offset}")
+            importer = BulkImporter(cursor, batch_size)
+            importer.inserted, importer.skipped, importer.failed = checkpoint.counts()
+            # Worker processes parse and normalize; this thread is the only writer
+            for records, skipped, failed, end in iter_csv_records(file_path, normalize_import_row, import_record_key,
+                                                                  start_offset=checkpoint.offset):
+                rows += len(records) + skipped + failed
+                importer.skipped += skipped
+                importer.failed += failed
+                for record in records:
+                    try:
+                        importer.add(record)
+                    except Exception as e:
+                        importer.failed += 1
+                        print(f"Import row error: {e}")
+                importer.flush()
+                checkpoint.save(cursor, end, importer.counts())
+                cnx.commit()
+                if job is not None:
+                    job.report(end, rows, importer.counts())
+                    if job.cancelled:
+                        break
+            else:
+                checkpoint.save(cursor, os.path.getsize(file_path), importer.counts(), completed=True)
+                cnx.commit()
+        except Exception:
+            cnx.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    elapsed = max(time.perf_counter() - started, 1e-6)
+    print(f"Bulk import: {rows} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/sec)")
+    return importer.counts()
+
+
+class LocalInfileDisabled(Exception):
+    """LOAD DATA LOCAL INFILE is switched off on the client or the server."""
+
+
+def _infile_value(value):
+    # LOAD DATA's default text format: tab-separated, backslash escapes, \N is NULL
+    if value is None:
+        return '\\N'
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+class LoadDataImporter:
+    """LOAD DATA LOCAL INFILE path for very large typed CSV files.
+
+    1. The CSV is parsed in parallel by iter_csv_records(); in-file duplicates
+       are dropped the same way BulkImporter drops them and the rest is written
+       to one tab-separated staging file per target table.
+    2. The files are loaded into TEMPORARY staging tables with LOAD DATA
+       LOCAL INFILE.
+    3. One INSERT ... SELECT per table resolves names to ids and leaves out
+       rows that already exist: explicit parent rows, then implicitly created
+       parents (the user behind a review, ...), then the dependent tables.
+
+    Everything runs on one dedicated connection in one transaction. run()
+    raises LocalInfileDisabled before touching any table when the server or
+    the client does not allow LOCAL INFILE. With a job, progress is reported
+    while the staging files are written and cancelling raises ImportCancelled
+    before anything is inserted.
+
+    Throughput is printed after every run as CSV rows / wall-clock seconds,
+    measured from opening the CSV to the commit. Counts follow the other
+    import paths, except that child rows whose parent could not be inserted
+    are reported as failed in aggregate rather than one by one.
+    """
+
+    # staging table (without the stage_ prefix) -> column definitions, in file order
+    STAGES = {
+        'users': "counted TINYINT, username VARCHAR(50), email VARCHAR(100), password VARCHAR(255), INDEX (username)",
+        'movies': "counted TINYINT, title VARCHAR(200), release_date DATE, language VARCHAR(50), description TEXT, INDEX (title)",
+        'genres': "counted TINYINT, name VARCHAR(50), INDEX (name)",
+        'cast': "counted TINYINT, name VARCHAR(100), dob DATE, bio TEXT, age INT, INDEX (name)",
+        'studios': "counted TINYINT, name VARCHAR(100), country VARCHAR(50), INDEX (name)",
+        'platforms': "counted TINYINT, name VARCHAR(100), subscription_type VARCHAR(50), INDEX (name)",
+        'episodes': "title VARCHAR(200), season INT, episode_title VARCHAR(200), episode_number INT, release_date DATE",
+        'reviews': "username VARCHAR(50), title VARCHAR(200), rating DECIMAL(2,1), comment TEXT",
+        'movie_genre': "title VARCHAR(200), genre VARCHAR(50)",
+        'movie_cast': "title VARCHAR(200), actor VARCHAR(100), role VARCHAR(100), character_name VARCHAR(100)",
+        'movie_studio': "title VARCHAR(200), studio VARCHAR(100)",
+        'movie_platform': "title VARCHAR(200), platform VARCHAR(100), availability_date DATE",
+        'distribution': "title VARCHAR(200), studio VARCHAR(100), platform VARCHAR(100), distribution_date DATE, territory VARCHAR(100)",
+        'follow': "follower_id INT, follower VARCHAR(50), followed_id INT, followed VARCHAR(50)",
+        'donations': "username VARCHAR(50), amount DECIMAL(10,2), comment TEXT",
+        'contains_episode': "episode_id INT, title VARCHAR(200)",
+    }
+
+    # One row per name for tables without a unique name column
+    _MOVIE_IDS = "(SELECT movie_name AS name, MIN(movie_id) AS id FROM movies GROUP BY movie_name)"
+    _CAST_IDS = "(SELECT name, MIN(cast_id) AS id FROM cast_members GROUP BY name)"
+    _STUDIO_IDS = "(SELECT studio_name AS name, MIN(studio_id) AS id FROM studios GROUP BY studio_name)"
+    _PLATFORM_IDS = "(SELECT platform_name AS name, MIN(platform_id) AS id FROM streaming_platforms GROUP BY platform_name)"
+
+    # Parent inserts, run once for counted=1 (explicit rows) and once for counted=0
+    PARENT_INSERTS = {
+        'users': """
+            INSERT INTO users (username, email, password)
+            SELECT s.username, s.email, s.password FROM stage_users s
+            WHERE s.counted=%s
+              AND NOT EXISTS (SELECT 1 FROM users u WHERE u.username=s.username)
+              AND (s.email IS NULL OR NOT EXISTS (SELECT 1 FROM users u WHERE u.email=s.email))
+        """,
+        'movies': """
+            INSERT INTO movies (movie_name, release_date, language, description)
+            SELECT s.title, s.release_date, s.language, s.description FROM stage_movies s
+            WHERE s.counted=%s
+              AND NOT EXISTS (SELECT 1 FROM movies m WHERE m.movie_name=s.title
+                              AND (s.release_date IS NULL OR m.release_date=s.release_date))
+        """,
+        'genres': """
+            INSERT INTO genres (genre_name)
+            SELECT s.name FROM stage_genres s
+            WHERE s.counted=%s AND NOT EXISTS (SELECT 1 FROM genres g WHERE g.genre_name=s.name)
+        """,
+        'cast': """
+            INSERT INTO cast_members (name, dob, bio, age)
+            SELECT s.name, s.dob, s.bio, s.age FROM stage_cast s
+            WHERE s.counted=%s AND NOT EXISTS (SELECT 1 FROM cast_members c WHERE c.name=s.name)
+        """,
+        'studios': """
+            INSERT INTO studios (studio_name, country)
+            SELECT s.name, s.country FROM stage_studios s
+            WHERE s.counted=%s AND NOT EXISTS (SELECT 1 FROM studios t WHERE t.studio_name=s.name)
+        """,
+        'platforms': """
+            INSERT INTO streaming_platforms (platform_name, subscription_type)
+            SELECT s.name, s.subscription_type FROM stage_platforms s
+            WHERE s.counted=%s AND NOT EXISTS (SELECT 1 FROM streaming_platforms p WHERE p.platform_name=s.name)
+        """,
+    }
+
+    # Dependent inserts in dependency order: (stage, SQL, how unmatched staged
+    # rows are reported). 'linked' tables count every staged row as inserted,
+    # like the row importer does for links that already exist.
+    CHILD_INSERTS = [
+        ('episodes', f"""
+            INSERT INTO episodes (movie_id, season_number, title, episode_number, air_date)
+            SELECT m.id, s.season, s.episode_title, s.episode_number, s.release_date
+            FROM stage_episodes s JOIN {_MOVIE_IDS} m ON m.name=s.title
+            WHERE s.episode_number IS NULL OR NOT EXISTS (
+                SELECT 1 FROM episodes e
+                WHERE e.movie_id=m.id AND e.season_number=s.season AND e.episode_number=s.episode_number)
+        """, 'skipped'),
+        ('reviews', f"""
+            INSERT INTO reviews_ratings (user_id, movie_id, rating, comment)
+            SELECT u.user_id, m.id, s.rating, s.comment
+            FROM stage_reviews s
+            JOIN users u ON u.username=s.username
+            JOIN {_MOVIE_IDS} m ON m.name=s.title
+        """, 'failed'),
+        ('movie_genre', f"""
+            INSERT INTO movie_genre (movie_id, genre_id)
+            SELECT m.id, g.genre_id
+            FROM stage_movie_genre s
+            JOIN {_MOVIE_IDS} m ON m.name=s.title
+            JOIN genres g ON g.genre_name=s.genre
+            WHERE NOT EXISTS (SELECT 1 FROM movie_genre x WHERE x.movie_id=m.id AND x.genre_id=g.genre_id)
+        """, 'linked'),
+        ('movie_cast', f"""
+            INSERT INTO movie_cast (movie_id, cast_id, role, character_name)
+            SELECT m.id, c.id, s.role, s.character_name
+            FROM stage_movie_cast s
+            JOIN {_MOVIE_IDS} m ON m.name=s.title
+            JOIN {_CAST_IDS} c ON c.name=s.actor
+            WHERE NOT EXISTS (SELECT 1 FROM movie_cast x WHERE x.movie_id=m.id AND x.cast_id=c.id)
+        """, 'linked'),
+        ('movie_studio', f"""
+            INSERT INTO movie_studio (movie_id, studio_id)
+            SELECT m.id, t.id
+            FROM stage_movie_studio s
+            JOIN {_MOVIE_IDS} m ON m.name=s.title
+            JOIN {_STUDIO_IDS} t ON t.name=s.studio
+            WHERE NOT EXISTS (SELECT 1 FROM movie_studio x WHERE x.movie_id=m.id AND x.studio_id=t.id)
+        """, 'linked'),
+        ('movie_platform', f"""
+            INSERT INTO movie_platform (movie_id, platform_id, availability_date)
+            SELECT m.id, p.id, s.availability_date
+            FROM stage_movie_platform s
+            JOIN {_MOVIE_IDS} m ON m.name=s.title
+            JOIN {_PLATFORM_IDS} p ON p.name=s.platform
+            WHERE NOT EXISTS (SELECT 1 FROM movie_platform x WHERE x.movie_id=m.id AND x.platform_id=p.id)
+        """, 'linked'),
+        ('distribution', f"""
+            INSERT INTO movie_distribution (movie_id, studio_id, platform_id, distribution_date, territory)
+            SELECT m.id, t.id, p.id, s.distribution_date, s.territory
+            FROM stage_distribution s
+            JOIN {_MOVIE_IDS} m ON m.name=s.title
+            JOIN {_STUDIO_IDS} t ON t.name=s.studio
+            JOIN {_PLATFORM_IDS} p ON p.name=s.platform
+        """, 'failed'),
+        ('follow', """
+            INSERT INTO user_follow (follower_id, followed_id)
+            SELECT f.fid, f.tid FROM (
+                SELECT COALESCE(fi.user_id, fn.user_id) AS fid, COALESCE(ti.user_id, tn.user_id) AS tid
+                FROM stage_follow s
+                LEFT JOIN users fi ON fi.user_id=s.follower_id
+                LEFT JOIN users fn ON fn.username=s.follower
+                LEFT JOIN users ti ON ti.user_id=s.followed_id
+                LEFT JOIN users tn ON tn.username=s.followed
+            ) f
+            WHERE f.fid IS NOT NULL AND f.tid IS NOT NULL AND f.fid<>f.tid
+              AND NOT EXISTS (SELECT 1 FROM user_follow x WHERE x.follower_id=f.fid AND x.followed_id=f.tid)
+        """, 'skipped'),
+        ('donations', """
+            INSERT INTO donations (user_id, donation_amount, comment)
+            SELECT u.user_id, s.amount, s.comment
+            FROM stage_donations s JOIN users u ON u.username=s.username
+        """, 'failed'),
+        ('contains_episode', f"""
+            INSERT INTO contains_episodes (episode_id, movie_id)
+            SELECT s.episode_id, m.id
+            FROM stage_contains_episode s
+            JOIN episodes e ON e.episode_id=s.episode_id
+            JOIN {_MOVIE_IDS} m ON m.name=s.title
+            WHERE NOT EXISTS (SELECT 1 FROM contains_episodes x WHERE x.episode_id=s.episode_id)
+        """, 'skipped'),
+    ]
+
+    # "Loading local data is disabled" from the server / the client
+    _LOCAL_INFILE_ERRORS = (1148, 2068, 3948, 3950)
+
+    def __init__(self, database, job=None):
+        self.database = database
+        self.job = job
+        self.inserted = self.skipped = self.failed = 0
+        self.rows = 0
+        self.staged = {}
+
+    def counts(self):
+        return (self.inserted, self.skipped, self.failed)
+
+    def run(self, file_path, start_offset=0):
+        started = time.perf_counter()
+        with self.database.dedicated_connection(allow_local_infile=True) as cnx:
+            cur = cnx.cursor(buffered=True)
+            cur.execute("SELECT @@GLOBAL.local_infile")
+            if not cur.fetchone()[0]:
+                raise LocalInfileDisabled("local_infile is OFF on the server")
+            with tempfile.TemporaryDirectory(prefix='cinetrack-import-') as directory:
+                self._write_stage_files(file_path, directory, start_offset)
+                try:
+                    for stage, columns in self.STAGES.items():
+                        cur.execute(f"CREATE TEMPORARY TABLE stage_{stage} ({columns})")
+                        if self.staged.get(stage):
+                            names = [c.split()[0] for c in columns.split(', ') if not c.startswith('INDEX')]
+                            cur.execute(
+                                f"LOAD DATA LOCAL INFILE %s INTO TABLE stage_{stage} CHARACTER SET utf8mb4 ({', '.join(names)})",
+                                (os.path.join(directory, stage + '.tsv'),))
+                except Exception as err:
+                    if getattr(err, 'errno', None) in self._LOCAL_INFILE_ERRORS:
+                        raise LocalInfileDisabled(str(err))
+                    raise
+            try:
+                self._insert_parents(cur)
+                self._insert_children(cur)
+                cnx.commit()
+            except Exception:
+                cnx.rollback()
+                raise
+            finally:
+                cur.close()
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        print(f"LOAD DATA import: {self.rows} rows in {elapsed:.2f}s ({self.rows / elapsed:,.0f} rows/sec)")
+        return self.counts()
+
+    def _write_stage_files(self, file_path, directory, start_offset=0):
+        files = {}
+        seen_names = {entity: set() for entity in BulkImporter.PARENTS}
+        movie_dates = set()
+        emails = set()
+        seen = {}
+
+        def write(stage, *values):
+            if stage not in files:
+                files[stage] = open(os.path.join(directory, stage + '.tsv'), 'w', encoding='utf-8', newline='')
+            files[stage].write('\t'.join(_infile_value(v) for v in values) + '\n')
+            self.staged[stage] = self.staged.get(stage, 0) + 1
+
+        def parent(entity, name, *values):
+            # implicit parent: written once per name and never reported
+            if name not in seen_names[entity]:
+                seen_names[entity].add(name)
+                write(entity, 0, name, *values)
+
+        def first(stage, key):
+            keys = seen.setdefault(stage, set())
+            if key in keys:
+                return False
+            keys.add(key)
+            return True
+
+        try:
+            for records, skipped, failed, end in iter_csv_records(file_path, normalize_import_row, import_record_key,
+                                                                  start_offset=start_offset):
+                self.rows += len(records) + skipped + failed
+                self.skipped += skipped
+                self.failed += failed
+                if self.job is not None:
+                    if self.job.cancelled:
+                        # nothing has been written to the real tables yet
+                        raise ImportCancelled()
+                    self.job.report(end, self.rows, self.counts())
+                for kind, values in records:
+                    if kind == 'user':
+                        username, email, password = values
+                        if username in seen_names['users'] or (email and email in emails):
+                            self.skipped += 1
+                            continue
+                        seen_names['users'].add(username)
+                        if email:
+                            emails.add(email)
+                        write('users', 1, *values)
+                    elif kind == 'movie':
+                        title, release_date = values[0], values[1]
+                        if (title in seen_names['movies'] if release_date is None else (title, release_date) in movie_dates):
+                            self.skipped += 1
+                            continue
+                        seen_names['movies'].add(title)
+                        if release_date is not None:
+                            movie_dates.add((title, release_date))
+                        write('movies', 1, *values)
+                    elif kind in ('genre', 'cast', 'studio', 'platform'):
+                        entity = {'genre': 'genres', 'cast': 'cast', 'studio': 'studios', 'platform': 'platforms'}[kind]
+                        if values[0] in seen_names[entity]:
+                            self.skipped += 1
+                            continue
+                        seen_names[entity].add(values[0])
+                        write(entity, 1, *values)
+                    elif kind == 'episode':
+                        series_title, season, ep_title, episode_number, release_date = values
+                        parent('movies', series_title, release_date, None, None)
+                        if episode_number is not None and not first('episodes', (series_title, season, episode_number)):
+                            self.skipped += 1
+                            continue
+                        write('episodes', *values)
+                    elif kind == 'review':
+                        parent('users', values[0], None, 'changeme')
+                        parent('movies', values[1], None, None, None)
+                        write('reviews', *values)
+                    elif kind in ('movie_genre', 'movie_cast', 'movie_studio', 'movie_platform'):
+                        entity, width = {'movie_genre': ('genres', 0), 'movie_cast': ('cast', 3),
+                                         'movie_studio': ('studios', 1), 'movie_platform': ('platforms', 1)}[kind]
+                        parent('movies', values[0], None, None, None)
+                        parent(entity, values[1], *(None,) * width)
+                        if first(kind, values[:2]):
+                            write(kind, *values)
+                        else:
+                            # the row importer reports repeated links as inserted
+                            self.inserted += 1
+                    elif kind == 'distribution':
+                        parent('movies', values[0], None, None, None)
+                        parent('studios', values[1], None)
+                        parent('platforms', values[2], None)
+                        write('distribution', *values)
+                    elif kind == 'follow':
+                        ids = []
+                        for who in values:
+                            if who.isdigit():
+                                ids += [int(who), None]
+                            else:
+                                parent('users', who, None, 'changeme')
+                                ids += [None, who]
+                        if values[0] == values[1] or not first('follow', values):
+                            self.skipped += 1
+                            continue
+                        write('follow', *ids)
+                    elif kind == 'donation':
+                        parent('users', values[0], None, 'changeme')
+                        write('donations', *values)
+                    elif kind == 'contains_episode':
+                        parent('movies', values[1], None, None, None)
+                        if first('contains_episode', values):
+                            write('contains_episode', *values)
+        finally:
+            for f in files.values():
+                f.close()
+
+    def _run_counted(self, cur, stage, sql, params, unmatched):
+        staged = self.staged.get(stage, 0)
+        try:
+            cur.execute(sql, params)
+            matched = cur.rowcount
+        except Exception as e:
+            print(f"Import error for {stage}: {e}")
+            matched = 0
+            unmatched = 'failed'
+        if unmatched == 'linked':
+            self.inserted += staged
+            return
+        self.inserted += matched
+        if unmatched == 'skipped':
+            self.skipped += staged - matched
+        else:
+            self.failed += staged - matched
+
+    def _insert_parents(self, cur):
+        for entity, sql in self.PARENT_INSERTS.items():
+            if not self.staged.get(entity):
+                continue
+            cur.execute(f"SELECT COUNT(*) FROM stage_{entity} WHERE counted=1")
+            explicit = cur.fetchone()[0]
+            try:
+                cur.execute(sql, (1,))
+                self.inserted += cur.rowcount
+                self.skipped += explicit - cur.rowcount
+            except Exception as e:
+                print(f"Import error for {entity}: {e}")
+                self.failed += explicit
+        # implicit parents only after every explicit row, so explicit values win
+        for entity, sql in self.PARENT_INSERTS.items():
+            if self.staged.get(entity):
+                try:
+                    cur.execute(sql, (0,))
+                except Exception as e:
+                    print(f"Import error for implicit {entity}: {e}")
+
+    def _insert_children(self, cur):
+        for stage, sql, unmatched in self.CHILD_INSERTS:
+            if self.staged.get(stage):
+                self._run_counted(cur, stage, sql, (), unmatched)
+
+
+class ImportCancelled(Exception):
+    """Raised inside an import when its job was cancelled."""
+
+
+class ImportJob:
+    """Progress and cancellation state of one background import.
+
+    The importer calls report() after every chunk it writes and checks
+    `cancelled`; the UI reads snapshot() from its own polling loop, so the
+    two threads only share the few fields guarded by the lock. on_done, when
+    given, is called on the UI thread with the importer's result.
+    """
+
+    def __init__(self, title, file_path, on_done=None):
+        self.title = title
+        self.file_path = file_path
+        self.on_done = on_done
+        try:
+            self.total_bytes = os.path.getsize(file_path)
+        except OSError:
+            self.total_bytes = 0
+        self.status = 'queued'      # running, done, failed, cancelled
+        self.result = None
+        self.error = None
+        self.started = self.finished = None
+        self._bytes_done = 0
+        self._rows = 0
+        self._counts = (0, 0, 0)
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def is_finished(self):
+        return self.status in ('done', 'failed', 'cancelled')
+
+    def report(self, bytes_done, rows, counts):
+        """Record progress; bytes_done may be None when the importer cannot tell."""
+        with self._lock:
+            if bytes_done is not None:
+                self._bytes_done = bytes_done
+            self._rows = rows
+            self._counts = tuple(counts)
+
+    def snapshot(self):
+        """(fraction or None, rows/sec, ETA seconds or None, (inserted, skipped, failed))."""
+        with self._lock:
+            bytes_done, rows, counts = self._bytes_done, self._rows, self._counts
+        if self.started is None:
+            return None, 0.0, None, counts
+        elapsed = max((self.finished or time.perf_counter()) - self.started, 1e-6)
+        fraction = min(1.0, bytes_done / self.total_bytes) if self.total_bytes and bytes_done else None
+        eta = elapsed * (1 - fraction) / fraction if fraction and self.status == 'running' else None
+        return fraction, rows / elapsed, eta, counts
+
+
+class JobRegistry:
+    """Runs ImportJobs one at a time on a background thread.
+
+    Imports write the same tables, so they are queued rather than run side by
+    side; the registry keeps every job until the UI removes it, which lets
+    the progress bar show queued, running and just-finished jobs alike.
+    """
+
+    def __init__(self):
+        self._jobs = []
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="cinetrack-import", daemon=True)
+        self._thread.start()
+
+    def submit(self, job, fn, *args, **kwargs):
+        """Queue fn(*args, job=job, **kwargs) to run as `job`."""
+        with self._lock:
+            self._jobs.append(job)
+        self._queue.put((job, fn, args, kwargs))
+        return job
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs)
+
+    def active(self):
+        return [job for job in self.jobs() if not job.is_finished]
+
+    def remove(self, job):
+        with self._lock:
+            if job in self._jobs:
+                self._jobs.remove(job)
+
+    def cancel_all(self):
+        for job in self.jobs():
+            job.cancel()
+
+    def _run(self):
+        while True:
+            job, fn, args, kwargs = self._queue.get()
+            if job.cancelled:
+                job.status = 'cancelled'
+                continue
+            job.started = time.perf_counter()
+            job.status = 'running'
+            try:
+                job.result = fn(*args, job=job, **kwargs)
+                job.status = 'cancelled' if job.cancelled else 'done'
+            except ImportCancelled:
+                job.status = 'cancelled'
+            except Exception as e:
+                job.error = e
+                job.status = 'failed'
+                print(f"Import job '{job.title}' failed: {e}")
+            finally:
+                job.finished = time.perf_counter()
+
+
+# Connect to DB (lazily: the pool opens on the first query, see bootstrap_schema)
+db = Database(DB_CONFIG)
+
+
+# Triggers that keep movie_summary in step with its source tables. Rating
+# totals and episode counts are adjusted by the changed row; the genre string
+# and max season are recomputed for the one affected movie.
+MOVIE_SUMMARY_TRIGGERS = {
+    'after_review_insert': '''
+        CREATE TRIGGER after_review_insert
+        AFTER INSERT ON reviews_ratings
+        FOR EACH ROW
+        BEGIN
+            IF NEW.rating IS NOT NULL THEN
+                INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+                UPDATE movie_summary SET rating_count = rating_count + 1, rating_sum = rating_sum + NEW.rating
+                WHERE movie_id = NEW.movie_id;
+            END IF;
+        END
+    ''',
+    'after_review_update': '''
+        CREATE TRIGGER after_review_update
+        AFTER UPDATE ON reviews_ratings
+        FOR EACH ROW
+        BEGIN
+            IF OLD.rating IS NOT NULL THEN
+                UPDATE movie_summary SET rating_count = rating_count - 1, rating_sum = rating_sum - OLD.rating
+                WHERE movie_id = OLD.movie_id;
+            END IF;
+            IF NEW.rating IS NOT NULL THEN
+                INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+                UPDATE movie_summary SET rating_count = rating_count + 1, rating_sum = rating_sum + NEW.rating
+                WHERE movie_id = NEW.movie_id;
+            END IF;
+        END
+    ''',
+    'after_review_delete': '''
+        CREATE TRIGGER after_review_delete
+        AFTER DELETE ON reviews_ratings
+        FOR EACH ROW
+        BEGIN
+            IF OLD.rating IS NOT NULL THEN
+                UPDATE movie_summary SET rating_count = rating_count - 1, rating_sum = rating_sum - OLD.rating
+                WHERE movie_id = OLD.movie_id;
+            END IF;
+        END
+    ''',
+    'after_movie_genre_insert': '''
+        CREATE TRIGGER after_movie_genre_insert
+        AFTER INSERT ON movie_genre
+        FOR EACH ROW
+        BEGIN
+            INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+            UPDATE movie_summary SET genres = (
+                SELECT GROUP_CONCAT(g.genre_name ORDER BY g.genre_name)
+                FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+                WHERE mg.movie_id = NEW.movie_id
+            ) WHERE movie_id = NEW.movie_id;
+        END
+    ''',
+    'after_movie_genre_delete': '''
+        CREATE TRIGGER after_movie_genre_delete
+        AFTER DELETE ON movie_genre
+        FOR EACH ROW
+        BEGIN
+            UPDATE movie_summary SET genres = (
+                SELECT GROUP_CONCAT(g.genre_name ORDER BY g.genre_name)
+                FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+                WHERE mg.movie_id = OLD.movie_id
+            ) WHERE movie_id = OLD.movie_id;
+        END
+    ''',
+    # A renamed genre changes the genre string of every movie linked to it
+    'after_genre_update': '''
+        CREATE TRIGGER after_genre_update
+        AFTER UPDATE ON genres
+        FOR EACH ROW
+        BEGIN
+            IF NOT (OLD.genre_name <=> NEW.genre_name) THEN
+                UPDATE movie_summary s SET genres = (
+                    SELECT GROUP_CONCAT(g.genre_name ORDER BY g.genre_name)
+                    FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+                    WHERE mg.movie_id = s.movie_id
+                ) WHERE s.movie_id IN (SELECT movie_id FROM movie_genre WHERE genre_id = NEW.genre_id);
+            END IF;
+        END
+    ''',
+    # The ON DELETE CASCADE on movie_genre does not fire its delete trigger, so
+    # the links are still there to find the movies affected
+    'before_genre_delete': '''
+        CREATE TRIGGER before_genre_delete
+        BEFORE DELETE ON genres
+        FOR EACH ROW
+        BEGIN
+            UPDATE movie_summary s SET genres = (
+                SELECT GROUP_CONCAT(g.genre_name ORDER BY g.genre_name)
+                FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+                WHERE mg.movie_id = s.movie_id AND g.genre_id <> OLD.genre_id
+            ) WHERE s.movie_id IN (SELECT movie_id FROM movie_genre WHERE genre_id = OLD.genre_id);
+        END
+    ''',
+    'after_episode_insert': '''
+        CREATE TRIGGER after_episode_insert
+        AFTER INSERT ON episodes
+        FOR EACH ROW
+        BEGIN
+            INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+            UPDATE movie_summary
+            SET episode_count = episode_count + 1,
+                max_season = GREATEST(IFNULL(max_season, 0), NEW.season_number)
+            WHERE movie_id = NEW.movie_id;
+        END
+    ''',
+    'after_episode_update': '''
+        CREATE TRIGGER after_episode_update
+        AFTER UPDATE ON episodes
+        FOR EACH ROW
+        BEGIN
+            IF OLD.movie_id <> NEW.movie_id OR OLD.season_number <> NEW.season_number THEN
+                INSERT IGNORE INTO movie_summary (movie_id) VALUES (NEW.movie_id);
+                UPDATE movie_summary
+                SET episode_count = (SELECT COUNT(*) FROM episodes WHERE movie_id = OLD.movie_id),
+                    max_season = (SELECT MAX(season_number) FROM episodes WHERE movie_id = OLD.movie_id)
+                WHERE movie_id = OLD.movie_id;
+                UPDATE movie_summary
+                SET episode_count = (SELECT COUNT(*) FROM episodes WHERE movie_id = NEW.movie_id),
+                    max_season = (SELECT MAX(season_number) FROM episodes WHERE movie_id = NEW.movie_id)
+                WHERE movie_id = NEW.movie_id;
+            END IF;
+        END
+    ''',
+    'after_episode_delete': '''
+        CREATE TRIGGER after_episode_delete
+        AFTER DELETE ON episodes
+        FOR EACH ROW
+        BEGIN
+            UPDATE movie_summary
+            SET episode_count = episode_count - 1,
+                max_season = (SELECT MAX(season_number) FROM episodes WHERE movie_id = OLD.movie_id)
+            WHERE movie_id = OLD.movie_id;
+        END
+    ''',
+}
+
+
+def rebuild_movie_summary(cursor=None):
+    """Recompute every movie_summary row from scratch and return the row count.
+
+    The triggers keep the table current row by row; this is the repair path
+    for data loaded while they were missing (e.g. a restored dump). With a
+    cursor the rebuild is part of the caller's transaction (the baseline
+    migration); otherwise it runs in a transaction of its own.
+    """
+    if cursor is None:
+        with db.transaction() as cursor:
+            return rebuild_movie_summary(cursor)
+    cursor.execute('DELETE FROM movie_summary')
+    cursor.execute('''
+        INSERT INTO movie_summary (movie_id, genres, rating_count, rating_sum, episode_count, max_season)
+        SELECT m.movie_id, gs.genres, IFNULL(rs.cnt, 0), IFNULL(rs.total, 0), IFNULL(es.cnt, 0), es.max_season
+        FROM movies m
+        LEFT JOIN (
+            SELECT mg.movie_id, GROUP_CONCAT(g.genre_name ORDER BY g.genre_name) AS genres
+            FROM movie_genre mg JOIN genres g ON mg.genre_id = g.genre_id
+            GROUP BY mg.movie_id
+        ) gs ON gs.movie_id = m.movie_id
+        LEFT JOIN (
+            SELECT movie_id, COUNT(rating) AS cnt, SUM(rating) AS total
+            FROM reviews_ratings
+            GROUP BY movie_id
+        ) rs ON rs.movie_id = m.movie_id
+        LEFT JOIN (
+            SELECT movie_id, COUNT(*) AS cnt, MAX(season_number) AS max_season
+            FROM episodes
+            GROUP BY movie_id
+        ) es ON es.movie_id = m.movie_id
+    ''')
+    return cursor.rowcount
+
+
+def _table_exists(cursor, table):
+    cursor.execute("SELECT 1 FROM information_schema.tables WHERE table_schema=%s AND table_name=%s",
+                   (DB_CONFIG.get('database'), table))
+    return cursor.fetchone() is not None
+
+
+def _trigger_exists(cursor, trigger_name):
+    cursor.execute("SELECT 1 FROM information_schema.triggers WHERE trigger_schema=%s AND trigger_name=%s",
+                   (DB_CONFIG.get('database'), trigger_name))
+    return cursor.fetchone() is not None
+
+
+def _create_trigger(cursor, name, ddl):
+    if not _trigger_exists(cursor, name):
+        try:
+            cursor.execute(ddl)
+        except Exception as e:
+            # Some MySQL setups disallow trigger creation depending on privileges
+            print(f"Warning: could not create trigger {name}: {e}")
+
+
+def _create_indexes(cursor, indexes):
+    """Create each (table, index_name, ddl) whose index is missing."""
+    for table, index_name, ddl in indexes:
+        cursor.execute(
+            "SELECT 1 FROM information_schema.statistics WHERE table_schema=%s AND table_name=%s AND index_name=%s LIMIT 1",
+            (DB_CONFIG.get('database'), table, index_name)
+        )
+        if cursor.fetchone() is None:
+            try:
+                cursor.execute(ddl)
+            except Exception as e:
+                print(f"Warning: could not create index {index_name}: {e}")
+
+
+def _migration_baseline(cursor):
+    """Support tables, triggers and indexes the app used to create on every launch.
+
+    - `donations`, `ratings_audit`, `import_checkpoints` and `import_files`
+    - after_user_insert (welcome donation) and before_rating_update (audit) triggers
+    - the Movies grid keyset index, importer name indexes and FULLTEXT indexes
+    - `movie_summary` with its maintenance triggers, filled when empty
+    """
+    # Ensure donations table exists (lightweight schema)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS donations (
+            donation_id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT NOT NULL,
+            donation_amount DECIMAL(10,2) DEFAULT 0.00,
+            comment VARCHAR(255),
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB
+    ''')
+
+    # Ensure ratings_audit table exists (used by audit trigger & UI)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ratings_audit (
+            audit_id INT AUTO_INCREMENT PRIMARY KEY,
+            review_id INT,
+            old_rating INT,
+            new_rating INT,
+            changed_by INT NULL,
+            changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB
+    ''')
+
+    # Per-file import progress, written in the same transaction as each batch
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS import_checkpoints (
+            file_hash CHAR(64) PRIMARY KEY,
+            file_path VARCHAR(500),
+            byte_offset BIGINT NOT NULL DEFAULT 0,
+            inserted INT NOT NULL DEFAULT 0,
+            skipped INT NOT NULL DEFAULT 0,
+            failed INT NOT NULL DEFAULT 0,
+            completed TINYINT(1) NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB
+    ''')
+
+    # Fingerprints of completed imports, used to skip unchanged files
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS import_files (
+            file_path VARCHAR(500) PRIMARY KEY,
+            size BIGINT NOT NULL,
+            mtime_ns BIGINT NOT NULL,
+            sha256 CHAR(64) NOT NULL,
+            imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB
+    ''')
+
+    _create_trigger(cursor, 'after_user_insert', '''
+        CREATE TRIGGER after_user_insert
+        AFTER INSERT ON users
+        FOR EACH ROW
+        BEGIN
+            INSERT INTO donations (user_id, donation_amount, comment)
+            VALUES (NEW.user_id, 0.00, 'Welcome, user created!');
+        END
+    ''')
+    _create_trigger(cursor, 'before_rating_update', '''
+        CREATE TRIGGER before_rating_update
+        BEFORE UPDATE ON reviews_ratings
+        FOR EACH ROW
+        BEGIN
+            IF OLD.rating <> NEW.rating THEN
+                INSERT INTO ratings_audit (review_id, old_rating, new_rating)
+                VALUES (OLD.review_id, OLD.rating, NEW.rating);
+            END IF;
+        END
+    ''')
+
+    # Secondary indexes: keyset pagination for the Movies grid (newest
+    # first), name lookups used by the importers and the FULLTEXT
+    # indexes used by SearchEngine
+    _create_indexes(cursor, (
+        ('movies', 'idx_movies_release', 'CREATE INDEX idx_movies_release ON movies (release_date, movie_id)'),
+        ('movies', 'idx_movies_name', 'CREATE INDEX idx_movies_name ON movies (movie_name)'),
+        ('cast_members', 'idx_cast_members_name', 'CREATE INDEX idx_cast_members_name ON cast_members (name)'),
+        ('studios', 'idx_studios_name', 'CREATE INDEX idx_studios_name ON studios (studio_name)'),
+        ('streaming_platforms', 'idx_platforms_name', 'CREATE INDEX idx_platforms_name ON streaming_platforms (platform_name)'),
+        ('movies', 'ft_movies_name', 'CREATE FULLTEXT INDEX ft_movies_name ON movies (movie_name)'),
+        ('movies', 'ft_movies_text', 'CREATE FULLTEXT INDEX ft_movies_text ON movies (movie_name, description)'),
+        ('cast_members', 'ft_cast_name', 'CREATE FULLTEXT INDEX ft_cast_name ON cast_members (name)'),
+        ('cast_members', 'ft_cast_text', 'CREATE FULLTEXT INDEX ft_cast_text ON cast_members (name, bio)'),
+    ))
+
+    # Denormalized per-movie genres/rating/episode figures read by the list pages
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS movie_summary (
+            movie_id INT PRIMARY KEY,
+            genres TEXT,
+            rating_count INT NOT NULL DEFAULT 0,
+            rating_sum DECIMAL(12,1) NOT NULL DEFAULT 0,
+            episode_count INT NOT NULL DEFAULT 0,
+            max_season INT,
+            FOREIGN KEY (movie_id) REFERENCES movies(movie_id) ON DELETE CASCADE
+        ) ENGINE=InnoDB
+    ''')
+    for name, ddl in MOVIE_SUMMARY_TRIGGERS.items():
+        _create_trigger(cursor, name, ddl)
+    cursor.execute("SELECT EXISTS (SELECT 1 FROM movie_summary), EXISTS (SELECT 1 FROM movies)")
+    summary_rows, movie_rows = cursor.fetchone()
+    if movie_rows and not summary_rows:
+        rebuild_movie_summary(cursor)
+
+
+def _migration_user_watchlist(cursor):
+    """The per-user watchlist read by the Watchlist page and the detail pages."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_watchlist (
+            watchlist_id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT NOT NULL,
+            movie_id INT NOT NULL,
+            added_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE KEY ux_user_movie (user_id, movie_id)
+        ) ENGINE=InnoDB
+    ''')
+
+
+# Migration 3's index pack for the lookups in HOT_QUERIES: (table, index, DDL)
+HOT_QUERY_INDEXES = (
+    ('episodes', 'idx_episodes_movie_season_ep',
+     'CREATE INDEX idx_episodes_movie_season_ep ON episodes (movie_id, season_number, episode_number)'),
+    ('reviews_ratings', 'idx_reviews_movie_date',
+     'CREATE INDEX idx_reviews_movie_date ON reviews_ratings (movie_id, review_date)'),
+    ('donations', 'idx_donations_user_date',
+     'CREATE INDEX idx_donations_user_date ON donations (user_id, donation_date)'),
+    ('donations', 'idx_donations_date', 'CREATE INDEX idx_donations_date ON donations (donation_date)'),
+    ('user_watchlist', 'idx_user_watchlist_user_added',
+     'CREATE INDEX idx_user_watchlist_user_added ON user_watchlist (user_id, added_date)'),
+)
+
+
+def _migration_hot_query_indexes(cursor):
+    """Indexes for the hot lookups listed in HOT_QUERIES (see the README for EXPLAIN)."""
+    _create_indexes(cursor, HOT_QUERY_INDEXES)
+
+
+def _migration_trending(cursor):
+    """Detail-page view log and the decayed trending ranking (see refresh_trending)."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS movie_views (
+            view_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            movie_id INT NOT NULL,
+            user_id INT NULL,
+            viewed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (movie_id) REFERENCES movies(movie_id) ON DELETE CASCADE
+        ) ENGINE=InnoDB
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS movie_trending (
+            movie_id INT PRIMARY KEY,
+            score DOUBLE NOT NULL,
+            INDEX idx_trending_score (score),
+            FOREIGN KEY (movie_id) REFERENCES movies(movie_id) ON DELETE CASCADE
+        ) ENGINE=InnoDB
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS trending_state (
+            id TINYINT PRIMARY KEY,
+            epoch DATETIME NOT NULL,
+            last_review_id INT NOT NULL DEFAULT 0,
+            last_watchlist_id INT NOT NULL DEFAULT 0,
+            last_view_id BIGINT NOT NULL DEFAULT 0
+        ) ENGINE=InnoDB
+    ''')
+
+
+# Catalog tables copied into the local snapshot, synced by updated_at
+SNAPSHOT_SYNCED_TABLES = ('movies', 'movie_summary', 'cast_members', 'studios', 'streaming_platforms', 'genres')
+
+
+def _migration_catalog_updated_at(cursor):
+    """updated_at change stamps on the catalog tables, for LocalSnapshot's incremental sync."""
+    for table in SNAPSHOT_SYNCED_TABLES:
+        cursor.execute(
+            "SELECT 1 FROM information_schema.columns WHERE table_schema=%s AND table_name=%s AND column_name='updated_at'",
+            (DB_CONFIG.get('database'), table)
+        )
+        if cursor.fetchone() is None:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN updated_at TIMESTAMP NOT NULL "
+                           "DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")
+    _create_indexes(cursor, [
+        (table, f'idx_{table}_updated', f"CREATE INDEX idx_{table}_updated ON {table} (updated_at)")
+        for table in SNAPSHOT_SYNCED_TABLES
+    ])
+
+
+def _migration_genre_triggers(cursor):
+    """movie_summary triggers for renamed and deleted genres (new databases get them in the baseline)."""
+    for name in ('after_genre_update', 'before_genre_delete'):
+        _create_trigger(cursor, name, MOVIE_SUMMARY_TRIGGERS[name])
+
+
+# Log every deleted catalog row in snapshot_deletions, so LocalSnapshot can drop
+# it locally. movie_summary rows only go away through the movies cascade, which
+# fires no trigger, so the movies trigger logs them too.
+SNAPSHOT_DELETE_TRIGGERS = {
+    'after_movie_delete': '''
+        CREATE TRIGGER after_movie_delete
+        AFTER DELETE ON movies
+        FOR EACH ROW
+        INSERT INTO snapshot_deletions (table_name, row_id)
+        VALUES ('movies', OLD.movie_id), ('movie_summary', OLD.movie_id)
+    ''',
+    'after_cast_member_delete': '''
+        CREATE TRIGGER after_cast_member_delete
+        AFTER DELETE ON cast_members
+        FOR EACH ROW
+        INSERT INTO snapshot_deletions (table_name, row_id) VALUES ('cast_members', OLD.cast_id)
+    ''',
+    'after_studio_delete': '''
+        CREATE TRIGGER after_studio_delete
+        AFTER DELETE ON studios
+        FOR EACH ROW
+        INSERT INTO snapshot_deletions (table_name, row_id) VALUES ('studios', OLD.studio_id)
+    ''',
+    'after_platform_delete': '''
+        CREATE TRIGGER after_platform_delete
+        AFTER DELETE ON streaming_platforms
+        FOR EACH ROW
+        INSERT INTO snapshot_deletions (table_name, row_id) VALUES ('streaming_platforms', OLD.platform_id)
+    ''',
+    'after_genre_delete': '''
+        CREATE TRIGGER after_genre_delete
+        AFTER DELETE ON genres
+        FOR EACH ROW
+        INSERT INTO snapshot_deletions (table_name, row_id) VALUES ('genres', OLD.genre_id)
+    ''',
+}
+
+
+def _migration_snapshot_deletions(cursor):
+    """Deletion log read by LocalSnapshot, and the triggers that fill it."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS snapshot_deletions (
+            deletion_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            table_name VARCHAR(64) NOT NULL,
+            row_id INT NOT NULL,
+            deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_snapshot_deletions_at (deleted_at)
+        ) ENGINE=InnoDB
+    ''')
+    for name, ddl in SNAPSHOT_DELETE_TRIGGERS.items():
+        _create_trigger(cursor, name, ddl)
+
+
+# Versioned schema changes, applied in order by run_migrations. Append new
+# entries; never edit or renumber one that has shipped. Each step must be
+# idempotent because MySQL commits DDL immediately: a step that fails half way
+# is not recorded and runs again in full on the next launch.
+MIGRATIONS = [
+    (1, 'baseline', _migration_baseline),
+    (2, 'user_watchlist', _migration_user_watchlist),
+    (3, 'hot_query_indexes', _migration_hot_query_indexes),
+    (4, 'trending', _migration_trending),
+    (5, 'catalog_updated_at', _migration_catalog_updated_at),
+    (6, 'genre_triggers', _migration_genre_triggers),
+    (7, 'snapshot_deletions', _migration_snapshot_deletions),
+]
+
+
+def run_migrations():
+    """Apply pending MIGRATIONS and return the versions applied.
+
+    An up-to-date database costs a single query. Connection errors are
+    raised; a failing migration is printed, stops the run and is retried
+    on the next launch.
+    """
+    import mysql.connector
+    try:
+        current = db.fetchone("SELECT IFNULL(MAX(version), 0) FROM schema_migrations")[0]
+    except mysql.connector.Error as err:
+        if getattr(err, 'errno', None) != 1146:  # ER_NO_SUCH_TABLE
+            raise
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT PRIMARY KEY,
+                name VARCHAR(100) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB
+        ''')
+        current = 0
+    applied = []
+    for version, name, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+        try:
+            with db.transaction() as cursor:
+                migrate(cursor)
+                cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (%s,%s)", (version, name))
+        except Exception as e:
+            print(f"Warning: migration {version} ({name}) failed: {e}")
+            break
+        print(f"Applied migration {version}: {name}")
+        applied.append(version)
+    return applied
+
+
+def bootstrap_schema():
+    """Connect and bring the schema up to date (run on a worker at startup)."""
+    result = run_migrations()
+    print("✅ Database connection successful!")
+    return result
+
+
+# Hot lookups with sample parameters, checked by explain_hot_queries.
+HOT_QUERIES = {
+    'movie_by_name': ("SELECT movie_id FROM movies WHERE movie_name=%s", ('Inception',)),
+    'movies_page': ("SELECT movie_id, movie_name FROM movies WHERE (release_date, movie_id) < (%s, %s) "
+                    "ORDER BY release_date DESC, movie_id DESC LIMIT 40", ('2020-01-01', 1000000)),
+    'cast_by_name': ("SELECT cast_id FROM cast_members WHERE name=%s", ('Tom Hanks',)),
+    'genre_by_name': ("SELECT genre_id FROM genres WHERE genre_name=%s", ('Drama',)),
+    'episode_exists': ("SELECT episode_id FROM episodes WHERE movie_id=%s AND season_number=%s AND episode_number=%s",
+                       (1, 1, 1)),
+    'series_episodes': ("SELECT season_number, episode_number, title, air_date FROM episodes "
+                        "WHERE movie_id=%s ORDER BY season_number, episode_number", (1,)),
+    'movie_reviews': ("SELECT u.username, r.rating, r.comment FROM reviews_ratings r "
+                      "JOIN users u ON r.user_id = u.user_id WHERE r.movie_id=%s ORDER BY r.review_date DESC", (1,)),
+    'latest_donor_comment': ("SELECT comment FROM donations WHERE user_id=%s AND comment IS NOT NULL "
+                             "ORDER BY donation_date DESC LIMIT 1", (1,)),
+    'recent_donations': ("SELECT d.donation_amount, d.donation_date FROM donations d "
+                         "WHERE d.comment != 'Welcome, user created!' OR d.comment IS NULL "
+                         "ORDER BY d.donation_date DESC LIMIT 5", ()),
+    'followers': ("SELECT u.username FROM user_follow uf JOIN users u ON uf.follower_id=u.user_id "
+                  "WHERE uf.followed_id=%s", (1,)),
+    'user_watchlist': ("SELECT m.movie_id, m.movie_name, uw.added_date FROM user_watchlist uw "
+                       "JOIN movies m ON uw.movie_id=m.movie_id WHERE uw.user_id=%s ORDER BY uw.added_date DESC", (1,)),
+}
+
+
+_HINT_ALIAS_RE = r"\b(?:FROM|JOIN)\s+`?{table}`?(?:\s+(?!(?:WHERE|JOIN|ON|ORDER|GROUP|LIMIT)\b)(\w+))?"
+
+
+def without_hot_indexes(sql):
+    """sql with NO_INDEX hints for the HOT_QUERY_INDEXES on the tables it reads.
+
+    EXPLAIN of the result is the plan from before migration 3 without dropping
+    anything (MySQL 8.0.20+; older servers ignore the hint with a warning).
+    """
+    hints = []
+    for table, index_name, _ in HOT_QUERY_INDEXES:
+        m = re.search(_HINT_ALIAS_RE.format(table=table), sql, re.IGNORECASE)
+        if m:
+            hints.append(f"NO_INDEX({m.group(1) or table} {index_name})")
+    if not hints:
+        return sql
+    return re.sub(r"^\s*SELECT\b", lambda m: f"SELECT /*+ {' '.join(hints)} */", sql, count=1, flags=re.IGNORECASE)
+
+
+def explain_hot_queries(before=False):
+    """EXPLAIN each HOT_QUERIES entry and print its rows as a Markdown table.
+
+    Columns are query, table, access type, key, rows and Extra. before=True
+    hides migration 3's indexes (without_hot_indexes). Returns {name: rows}.
+    """
+    plans = {}
+    print("| Query | Table | Type | Key | Rows | Extra |")
+    print("|-------|-------|------|-----|------|-------|")
+    for name, (sql, params) in HOT_QUERIES.items():
+        try:
+            with db.connection() as cnx:
+                cur = cnx.cursor(dictionary=True, buffered=True)
+                cur.execute("EXPLAIN " + (without_hot_indexes(sql) if before else sql), params)
+                plans[name] = cur.fetchall()
+                cur.close()
+        except Exception as e:
+            print(f"{name}: EXPLAIN failed: {e}")
+            continue
+        for row in plans[name]:
+            print(f"| `{name}` | {row.get('table') or ''} | {row.get('type') or ''} | {row.get('key') or ''} | "
+                  f"{row.get('rows')} | {row.get('Extra') or ''} |")
+    return plans
+
+
+def benchmark_prepared_queries(repeat=200):
+    """Time each HOT_QUERIES entry that is also in QUERIES as text and as a prepared statement.
+
+    Prints the average per call for both, and the prepared statement's first
+    run (prepare + execute) from db.timings. Returns {name: (text_ms, prepared_ms)}.
+    """
+    results = {}
+    db.timings.clear()
+    for name, (sql, params) in HOT_QUERIES.items():
+        if name not in QUERIES:
+            continue
+        try:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                db.fetchall(sql, params)
+            text_ms = (time.perf_counter() - started) * 1000 / repeat
+            started = time.perf_counter()
+            for _ in range(repeat):
+                db.named_fetchall(name, params)
+            prepared_ms = (time.perf_counter() - started) * 1000 / repeat
+        except Exception as e:
+            print(f"{name}: benchmark failed: {e}")
+            continue
+        first = db.timings.snapshot().get(name, {}).get('prepare_ms', 0.0)
+        results[name] = (text_ms, prepared_ms)
+        print(f"{name:22} text {text_ms:.3f} ms | prepared {prepared_ms:.3f} ms (first run {first:.3f} ms)")
+    return results
+
+
+# --benchmark-import dataset: titles per mode (10 CSV rows each, see
+# write_benchmark_csv), plus the users, genres and cast they reference
+BENCHMARK_IMPORT_MOVIES = 20000
+BENCHMARK_IMPORT_USERS = 1000
+BENCHMARK_IMPORT_GENRES = 20
+BENCHMARK_IMPORT_CAST = 500
+
+
+def write_benchmark_csv(path, movies=BENCHMARK_IMPORT_MOVIES, tag='bench'):
+    """Write the typed CSV timed by --benchmark-import and return its row count.
+
+    Users, genres and cast come first; then every title is a movie row, two
+    movie_genre links, one movie_cast link, two reviews and four episodes.
+    All names carry `tag`, so each mode imports rows the others did not.
+    The data is generated from a fixed seed.
+    """
+    import csv
+    rng = random.Random(20240601)
+    columns = ('type', 'title', 'series_title', 'season', 'episode', 'episode_title', 'release_date',
+               'language', 'genre', 'name', 'actor', 'role', 'username', 'email', 'rating', 'comment')
+    genres = [f"{tag} genre {i}" for i in range(BENCHMARK_IMPORT_GENRES)]
+    cast = [f"{tag} actor {i}" for i in range(BENCHMARK_IMPORT_CAST)]
+    users = [f"{tag}_user_{i}" for i in range(BENCHMARK_IMPORT_USERS)]
+    rows = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+
+        def row(**values):
+            nonlocal rows
+            writer.writerow(values)
+            rows += 1
+
+        for user in users:
+            row(type='user', username=user, email=f"{user}@example.com")
+        for genre in genres:
+            row(type='genre', genre=genre)
+        for actor in cast:
+            row(type='cast', name=actor)
+        for i in range(movies):
+            title = f"{tag} title {i}"
+            released = datetime.date(1950, 1, 1) + datetime.timedelta(days=rng.randrange(27000))
+            row(type='movie', title=title, release_date=released.isoformat(),
+                language=rng.choice(('English', 'Hindi', 'French', 'Korean')))
+            for genre in rng.sample(genres, 2):
+                row(type='movie_genre', title=title, genre=genre)
+            row(type='movie_cast', title=title, actor=rng.choice(cast), role='Lead')
+            for user in rng.sample(users, 2):
+                row(type='review', title=title, username=user, rating=rng.randint(1, 10) / 2,
+                    comment="Benchmark review")
+            for episode in range(1, 5):
+                row(type='episode', series_title=title, season=1, episode=episode,
+                    episode_title=f"Episode {episode}", release_date=released.isoformat())
+    return rows
+
+
+def benchmark_imports(movies=BENCHMARK_IMPORT_MOVIES, modes=('load_data', 'bulk')):
+    """--benchmark-import: import the write_benchmark_csv dataset once per mode.
+
+    Imports into the configured database, so point DB_CONFIG at a scratch
+    schema built from code.sql. Prints the server settings and host the
+    rates depend on, then one README table row per mode: rows, file size,
+    wall-clock seconds (writing the CSV excluded) and rows/sec. Returns
+    {mode: rows_per_sec}.
+    """
+    import platform
+    version, pool, flush, infile = db.fetchone(
+        "SELECT VERSION(), @@innodb_buffer_pool_size, @@innodb_flush_log_at_trx_commit, @@GLOBAL.local_infile")
+    print(f"Server: MySQL {version}, innodb_buffer_pool_size={int(pool) >> 20} MB, "
+          f"innodb_flush_log_at_trx_commit={flush}, local_infile={infile}")
+    print(f"Host: {platform.platform()}, {os.cpu_count()} CPUs, Python {platform.python_version()}, "
+          f"{IMPORT_PARSE_WORKERS} parse workers, IMPORT_BATCH_SIZE={IMPORT_BATCH_SIZE}")
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='cinetrack-bench-') as directory:
+        for mode in modes:
+            path = os.path.join(directory, f"{mode}.csv")
+            rows = write_benchmark_csv(path, movies, tag=f"{mode}_{int(time.time())}")
+            started = time.perf_counter()
+            try:
+                if mode == 'load_data':
+                    counts = LoadDataImporter(db).run(path)
+                else:
+                    counts = bulk_import_csv(path)
+            except LocalInfileDisabled as e:
+                print(f"{mode}: skipped ({e})")
+                continue
+            elapsed = time.perf_counter() - started
+            results[mode] = rows / elapsed
+            print(f"| `{mode}` | {rows:,} | {os.path.getsize(path) / 2**20:.1f} MB | {elapsed:.1f} s | "
+                  f"{results[mode]:,.0f} | {counts} |")
+    return results
+
+# Everything the movie detail page shows apart from reviews, in one round
+# trip: the header row plus one JSON array per section (cast, platforms,
+# distribution). Served through the query cache, so any write to these
+# tables drops it. Reviews are paged separately (fetch_review_page).
+MOVIE_DETAIL_SQL = """
+    SELECT m.movie_name, m.release_date, m.description, m.language,
+        ROUND(s.rating_sum / NULLIF(s.rating_count, 0), 1), s.genres,
+        (SELECT JSON_ARRAYAGG(JSON_ARRAY(c.name, mc.character_name, c.dob))
+         FROM movie_cast mc JOIN cast_members c ON mc.cast_id = c.cast_id
+         WHERE mc.movie_id = m.movie_id),
+        (SELECT JSON_ARRAYAGG(JSON_ARRAY(sp.platform_name, sp.subscription_type, mp.availability_date))
+         FROM movie_platform mp JOIN streaming_platforms sp ON mp.platform_id = sp.platform_id
+         WHERE mp.movie_id = m.movie_id),
+        (SELECT JSON_ARRAYAGG(JSON_ARRAY(st.studio_name, dp.platform_name, md.territory, md.distribution_date))
+         FROM movie_distribution md
+         LEFT JOIN studios st ON md.studio_id = st.studio_id
+         LEFT JOIN streaming_platforms dp ON md.platform_id = dp.platform_id
+         WHERE md.movie_id = m.movie_id)
+    FROM movies m
+    LEFT JOIN movie_summary s ON m.movie_id = s.movie_id
+    WHERE m.movie_id = %s
+"""
+
+# Detail pages warmed per prefetch batch (cards in view of a grid or result list)
+DETAIL_PREFETCH_LIMIT = 24
+
+
+def _json_rows(value):
+    if value is None:
+        return []
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode('utf-8')
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _age_from_dob(dob):
+    """Whole years since dob ('YYYY-MM-DD'), as the calc_age() SQL function computes."""
+    try:
+        born = datetime.date.fromisoformat(str(dob)[:10])
+    except (TypeError, ValueError):
+        return None
+    today = datetime.date.today()
+    return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+
+
+def fetch_movie_detail(movie_id):
+    """Detail page data for one movie, or None if it does not exist.
+
+    Returns a dict with `header` (name, release date, description, language,
+    avg rating, genres) and the `cast` (name, character, age), `platforms`
+    and `distribution` rows.
+    """
+    return movie_detail_from_row(db.named_fetchone('movie_detail', (movie_id,), cached=True))
+
+
+def movie_detail_from_row(row):
+    """fetch_movie_detail's dict for a MOVIE_DETAIL_SQL row (None stays None)."""
+    if not row:
+        return None
+    return {
+        'header': row[:6],
+        'cast': [(name, character, _age_from_dob(dob)) for name, character, dob in _json_rows(row[6])],
+        'platforms': [tuple(r) for r in _json_rows(row[7])],
+        'distribution': [tuple(r) for r in _json_rows(row[8])],
+    }
+
+
+# Reviews per page on the movie detail page, and the comment length shown in
+# the list before the full text is fetched on demand
+REVIEW_PAGE_SIZE = 50
+REVIEW_PREVIEW_CHARS = 120
+# A review list row; the review_page queries in QUERIES add the keyset bounds
+REVIEW_PAGE_SQL = f"""
+    SELECT r.review_id, u.username, r.rating, LEFT(r.comment, {REVIEW_PREVIEW_CHARS}),
+        CHAR_LENGTH(r.comment) > {REVIEW_PREVIEW_CHARS}, r.review_date
+    FROM reviews_ratings r
+    JOIN users u ON r.user_id = u.user_id
+    WHERE r.movie_id=%s"""
+
+
+def fetch_review_page(movie_id, after, limit):
+    """One page of a movie's reviews, newest first (runs on a worker thread).
+
+    Keyset pagination on (review_date DESC, review_id DESC), served by
+    idx_reviews_movie_date; review_date is always set (it defaults to
+    CURRENT_TIMESTAMP). `after` is the key of the last review shown, or None.
+    Returns (rows, next_key) with rows of (review_id, username, rating,
+    comment preview, truncated, review_date); next_key is None at the end.
+    """
+    if after is None:
+        rows = db.named_fetchall('review_page', (movie_id, limit + 1))
+    else:
+        rows = db.named_fetchall('review_page_after', (movie_id, after[0], after[0], after[1], limit + 1))
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return rows, ((rows[-1][5], rows[-1][0]) if more else None)
+
+
+def fetch_review_comment(review_id):
+    row = db.named_fetchone('review_comment', (review_id,))
+    return (row[0] or '') if row else ''
+
+
+def fetch_rating_histogram(movie_id):
+    """{stars: review count} for stars 1-10, from one aggregate query."""
+    rows = db.named_fetchall('rating_histogram', (movie_id,), cached=True)
+    counts = {stars: 0 for stars in range(1, 11)}
+    for stars, n in rows:
+        stars = min(10, max(1, int(stars)))
+        counts[stars] += n
+    return counts
+
+
+# Named hot queries, run through per-connection server-side prepared
+# statements by db.named_fetchone/named_fetchall and an open transaction's
+# cursor.statements. Per-name timings are in db.timings.
+QUERIES = {
+    # importer lookups, one or more per CSV row
+    'user_by_username': "SELECT user_id FROM users WHERE username=%s",
+    'user_by_email': "SELECT user_id FROM users WHERE email=%s",
+    'movie_by_name': "SELECT movie_id FROM movies WHERE movie_name=%s",
+    'movie_by_name_date': "SELECT movie_id FROM movies WHERE movie_name=%s AND release_date=%s",
+    'movie_by_name_any_date': "SELECT movie_id FROM movies WHERE movie_name=%s AND (release_date=%s OR %s IS NULL)",
+    'genre_by_name': "SELECT genre_id FROM genres WHERE genre_name=%s",
+    'cast_by_name': "SELECT cast_id FROM cast_members WHERE name=%s",
+    'studio_by_name': "SELECT studio_id FROM studios WHERE studio_name=%s",
+    'platform_by_name': "SELECT platform_id FROM streaming_platforms WHERE platform_name=%s",
+    'episode_exists': "SELECT episode_id FROM episodes WHERE movie_id=%s AND season_number=%s AND episode_number=%s",
+    'episode_by_id': "SELECT 1 FROM episodes WHERE episode_id=%s",
+    'movie_genre_exists': "SELECT 1 FROM movie_genre WHERE movie_id=%s AND genre_id=%s",
+    'movie_cast_exists': "SELECT 1 FROM movie_cast WHERE movie_id=%s AND cast_id=%s",
+    'movie_studio_exists': "SELECT 1 FROM movie_studio WHERE movie_id=%s AND studio_id=%s",
+    'movie_platform_exists': "SELECT 1 FROM movie_platform WHERE movie_id=%s AND platform_id=%s",
+    'contains_episode_exists': "SELECT 1 FROM contains_episodes WHERE episode_id=%s AND movie_id=%s",
+    # page queries, one or more per navigation
+    'movie_detail': MOVIE_DETAIL_SQL,
+    'review_page': REVIEW_PAGE_SQL + " ORDER BY r.review_date DESC, r.review_id DESC LIMIT %s",
+    'review_page_after': REVIEW_PAGE_SQL + " AND (r.review_date < %s OR (r.review_date = %s AND r.review_id < %s))"
+                                           " ORDER BY r.review_date DESC, r.review_id DESC LIMIT %s",
+    'review_comment': "SELECT comment FROM reviews_ratings WHERE review_id=%s",
+    'rating_histogram': "SELECT ROUND(rating) AS stars, COUNT(*) FROM reviews_ratings "
+                        "WHERE movie_id=%s AND rating IS NOT NULL GROUP BY stars",
+    'series_header': "SELECT m.movie_name, m.release_date, m.description, m.language, "
+                     "ROUND(s.rating_sum / NULLIF(s.rating_count, 0), 1), s.genres "
+                     "FROM movies m LEFT JOIN movie_summary s ON m.movie_id=s.movie_id WHERE m.movie_id=%s",
+    'series_episodes': "SELECT season_number, episode_number, title, air_date FROM episodes "
+                       "WHERE movie_id=%s ORDER BY season_number, episode_number",
+    'user_watchlist': "SELECT m.movie_id, m.movie_name, uw.added_date FROM user_watchlist uw "
+                      "JOIN movies m ON uw.movie_id=m.movie_id WHERE uw.user_id=%s ORDER BY uw.added_date DESC",
+    'followers': "SELECT u.username FROM user_follow uf JOIN users u ON uf.follower_id=u.user_id WHERE uf.followed_id=%s",
+    'following': "SELECT u.username FROM user_follow uf JOIN users u ON uf.followed_id=u.user_id WHERE uf.follower_id=%s",
+}
+
+
+# Trending: every review, watchlist add and detail-page view adds its weight
+# to the movie's score, decaying with TRENDING_HALF_LIFE_HOURS. Events older
+# than TRENDING_WINDOW_DAYS are ignored. The Home page samples
+# TRENDING_SHOWN movies from the top TRENDING_POOL.
+TRENDING_WEIGHTS = {'review': 3.0, 'watchlist': 2.0, 'view': 1.0}
+TRENDING_HALF_LIFE_HOURS = 72
+TRENDING_WINDOW_DAYS = 30
+TRENDING_REBASE_DAYS = 14
+TRENDING_REFRESH_SECONDS = 300
+TRENDING_POOL = 25
+TRENDING_SHOWN = 5
+
+
+def record_movie_view(movie_id, user_id=None):
+    db.execute("INSERT INTO movie_views (movie_id, user_id) VALUES (%s,%s)", (movie_id, user_id))
+
+
+def refresh_trending():
+    """Fold events newer than the stored high-water marks into movie_trending.
+
+    Scores are kept relative to trending_state.epoch: an event at time t adds
+    weight * exp(decay * (t - epoch)). Ranking by stored score then equals
+    ranking by the decayed score at any later time, so a refresh only adds
+    the new events (found by review_id / watchlist_id / view_id above the
+    marks) instead of re-scoring every movie. Every TRENDING_REBASE_DAYS the
+    epoch moves forward and all scores are scaled down once to keep the
+    exponent small; scores that have decayed to nothing are dropped then.
+    Removed reviews or watchlist entries are not subtracted. Returns the
+    number of movies whose score changed.
+    """
+    decay = math.log(2) / TRENDING_HALF_LIFE_HOURS  # per hour
+    with db.transaction() as cursor:
+        cursor.execute("SELECT epoch, last_review_id, last_watchlist_id, last_view_id "
+                       "FROM trending_state WHERE id=1 FOR UPDATE")
+        state = cursor.fetchone()
+        if state is None:
+            cursor.execute("INSERT INTO trending_state (id, epoch) VALUES (1, NOW())")
+            cursor.execute("SELECT epoch, last_review_id, last_watchlist_id, last_view_id FROM trending_state WHERE id=1")
+            state = cursor.fetchone()
+        epoch, last_review, last_watchlist, last_view = state
+
+        cursor.execute("SELECT NOW(), TIMESTAMPDIFF(SECOND, %s, NOW()) / 3600", (epoch,))
+        now, epoch_age_hours = cursor.fetchone()
+        if epoch_age_hours >= TRENDING_REBASE_DAYS * 24:
+            cursor.execute("UPDATE movie_trending SET score = score * EXP(%s)", (-decay * float(epoch_age_hours),))
+            cursor.execute("DELETE FROM movie_trending WHERE score < 1e-6")
+            epoch = now
+
+        # Upper bounds first, so rows inserted meanwhile wait for the next refresh
+        cursor.execute("SELECT (SELECT IFNULL(MAX(review_id), 0) FROM reviews_ratings), "
+                       "(SELECT IFNULL(MAX(watchlist_id), 0) FROM user_watchlist), "
+                       "(SELECT IFNULL(MAX(view_id), 0) FROM movie_views)")
+        max_review, max_watchlist, max_view = cursor.fetchone()
+        cursor.execute("""
+            INSERT INTO movie_trending (movie_id, score)
+            SELECT e.movie_id, SUM(e.weight * EXP(%s * TIMESTAMPDIFF(SECOND, %s, e.at) / 3600))
+            FROM (
+                SELECT movie_id, review_date AS at, %s AS weight FROM reviews_ratings
+                WHERE review_id > %s AND review_id <= %s
+                UNION ALL
+                SELECT movie_id, added_date, %s FROM user_watchlist
+                WHERE watchlist_id > %s AND watchlist_id <= %s
+                UNION ALL
+                SELECT movie_id, viewed_at, %s FROM movie_views
+                WHERE view_id > %s AND view_id <= %s
+            ) e
+            JOIN movies m ON m.movie_id = e.movie_id
+            WHERE e.at >= %s - INTERVAL %s DAY
+            GROUP BY e.movie_id
+            ON DUPLICATE KEY UPDATE score = score + VALUES(score)
+        """, (decay, epoch,
+              TRENDING_WEIGHTS['review'], last_review, max_review,
+              TRENDING_WEIGHTS['watchlist'], last_watchlist, max_watchlist,
+              TRENDING_WEIGHTS['view'], last_view, max_view,
+              now, TRENDING_WINDOW_DAYS))
+        changed = cursor.rowcount
+        cursor.execute("UPDATE trending_state SET epoch=%s, last_review_id=%s, last_watchlist_id=%s, last_view_id=%s "
+                       "WHERE id=1", (epoch, max_review, max_watchlist, max_view))
+        return changed
+
+
+def fetch_trending(shown=TRENDING_SHOWN, pool=TRENDING_POOL):
+    """`shown` movies sampled from the top `pool` trending ones (movie card rows).
+
+    The top of the ranking is an index range scan on idx_trending_score and
+    is cached until the next refresh writes movie_trending. Without any
+    activity yet, the newest releases stand in.
+    """
+    rows = db.cached_fetchall("""
+        SELECT m.movie_id, m.movie_name, m.release_date, m.language, m.description
+        FROM movie_trending t JOIN movies m ON m.movie_id = t.movie_id
+        ORDER BY t.score DESC LIMIT %s
+    """, (pool,))
+    if not rows:
+        rows = db.cached_fetchall("""
+            SELECT movie_id, movie_name, release_date, language, description
+            FROM movies ORDER BY release_date DESC, movie_id DESC LIMIT %s
+        """, (pool,))
+    return random.sample(list(rows), min(shown, len(rows)))
+
+
+def prefetch_movie_details(movie_ids):
+    """Load the detail rows of movie_ids that are not cached yet (worker thread)."""
+    for movie_id in movie_ids:
+        if not db.cache_lookup(MOVIE_DETAIL_SQL, (movie_id,), count=False)[0]:
+            try:
+                db.named_fetchone('movie_detail', (movie_id,), cached=True)
+            except Exception as e:
+                print(f"Detail prefetch failed for movie {movie_id}: {e}")
+                return
+
+
+def authenticate_user(username, password):
+    """(user_id, username) when the credentials match, else None (worker thread)."""
+    r = db.fetchone("SELECT user_id, username, password FROM users WHERE username=%s", (username,))
+    if not r or not r[2] or r[2] != password:
+        return None
+    return r[0], r[1]
+
+
+def register_user(username, email, password):
+    """Create a user (worker thread).
+
+    Returns None when the username is taken, else (user_id, whether the
+    after_user_insert trigger added the welcome donation).
+    """
+    if db.fetchone("SELECT user_id FROM users WHERE username=%s", (username,)):
+        return None
+    uid = db.execute("INSERT INTO users (username, email, password) VALUES (%s,%s,%s)", (username, email, password))
+    welcome = db.fetchone("SELECT COUNT(*) FROM donations WHERE user_id=%s AND comment='Welcome, user created!'", (uid,))[0] > 0
+    return uid, welcome
+
+
+def user_donation_total(username):
+    """total_donations() for a username, or None if there is no such user (worker thread)."""
+    row = db.fetchone("SELECT user_id FROM users WHERE username=%s", (username,))
+    if not row:
+        return None
+    return db.fetchone("SELECT total_donations(%s)", (row[0],))[0] or 0.00
+
+
+# Optional local read replica of the catalog (movies, cast, studios, platforms,
+# genres and their summary/link rows). Set SNAPSHOT_PATH to None to disable.
+SNAPSHOT_PATH = "cinetrack_snapshot.sqlite3"
+SNAPSHOT_SYNC_SECONDS = 60
+# Rows whose updated_at is this close to the high-water mark are read again,
+# covering transactions that committed after a later timestamp was synced
+SNAPSHOT_OVERLAP_SECONDS = 120
+SNAPSHOT_BATCH_ROWS = 5000
+# snapshot_deletions entries are pruned after this many days; a snapshot that
+# last synced before then compares primary keys instead
+SNAPSHOT_DELETION_LOG_DAYS = 30
+
+# table -> (primary key, [(column, SQLite type)]); tables with a primary key
+# sync by updated_at, link tables (None) are re-copied when their checksum changes
+SNAPSHOT_TABLES = {
+    'movies': ('movie_id', [('movie_id', 'INTEGER PRIMARY KEY'), ('movie_name', 'TEXT COLLATE NOCASE'),
+                            ('release_date', 'TEXT'), ('language', 'TEXT')]),
+    'movie_summary': ('movie_id', [('movie_id', 'INTEGER PRIMARY KEY'), ('genres', 'TEXT'),
+                                   ('rating_count', 'INTEGER'), ('rating_sum', 'REAL'),
+                                   ('episode_count', 'INTEGER'), ('max_season', 'INTEGER')]),
+    'cast_members': ('cast_id', [('cast_id', 'INTEGER PRIMARY KEY'), ('name', 'TEXT COLLATE NOCASE'),
+                                 ('dob', 'TEXT'), ('bio', 'TEXT')]),
+    'studios': ('studio_id', [('studio_id', 'INTEGER PRIMARY KEY'), ('studio_name', 'TEXT COLLATE NOCASE'),
+                              ('country', 'TEXT')]),
+    'streaming_platforms': ('platform_id', [('platform_id', 'INTEGER PRIMARY KEY'),
+                                            ('platform_name', 'TEXT COLLATE NOCASE'), ('subscription_type', 'TEXT')]),
+    'genres': ('genre_id', [('genre_id', 'INTEGER PRIMARY KEY'), ('genre_name', 'TEXT COLLATE NOCASE')]),
+    'movie_studio': (None, [('movie_id', 'INTEGER'), ('studio_id', 'INTEGER')]),
+    'movie_platform': (None, [('movie_id', 'INTEGER'), ('platform_id', 'INTEGER')]),
 }
 
-# Connect to DB
-try:
-    conn = mysql.connector.connect(**DB_CONFIG)
-    cursor = conn.cursor(buffered=True)
-    print("✅ Database connection successful!")
-except mysql.connector.Error as err:
-    print(f"❌ Database connection failed: {err}")
-    print("Please check your database configuration in DB_CONFIG dictionary")
-    exit(1)
+_SNAPSHOT_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_movies_release ON movies (release_date, movie_id)",
+    "CREATE INDEX IF NOT EXISTS idx_cast_members_name ON cast_members (name)",
+    "CREATE INDEX IF NOT EXISTS idx_movie_studio ON movie_studio (studio_id, movie_id)",
+    "CREATE INDEX IF NOT EXISTS idx_movie_platform ON movie_platform (movie_id, platform_id)",
+)
 
 
-def _ensure_triggered_tables_and_triggers():
-    """Create minimal support tables and triggers if they don't exist.
+def _snapshot_value(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat(' ') if isinstance(value, datetime.datetime) else value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
 
-    - Creates `donations` and `ratings_audit` tables if missing (non-destructive)
-    - Creates two triggers if they are not present:
-        * after_user_insert: after inserting into `users`, add a welcome donation
-        * before_rating_update: before updating `reviews_ratings`, audit rating changes
-    This function is idempotent and safe to call on startup.
-    """
+
+def _sqlite_year(value):
     try:
-        # Ensure donations table exists (lightweight schema)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS donations (
-                donation_id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT NOT NULL,
-                donation_amount DECIMAL(10,2) DEFAULT 0.00,
-                comment VARCHAR(255),
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            ) ENGINE=InnoDB
-        ''')
+        return int(str(value)[:4]) if value else None
+    except ValueError:
+        return None
+
+
+class LocalSnapshot:
+    """SQLite copy of the catalog tables, kept in step with MySQL.
+
+    A background thread copies rows changed since each table's updated_at
+    high-water mark (migration 5 adds the column), removes the rows that
+    triggers logged in snapshot_deletions (migration 7), and re-copies the
+    small link tables when their checksum changes. Page queries on these tables go through
+    fetchall(), which runs the same SQL locally (YEAR() is provided as an
+    SQLite function) once a first full sync has completed, and falls back to
+    MySQL otherwise. Writes always go to MySQL: tables the app writes are
+    read from MySQL until the next sync has picked the change up, and if
+    MySQL is unreachable the snapshot keeps serving reads.
+    """
 
-        # Ensure ratings_audit table exists (used by audit trigger & UI)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS ratings_audit (
-                audit_id INT AUTO_INCREMENT PRIMARY KEY,
-                review_id INT,
-                old_rating INT,
-                new_rating INT,
-                changed_by INT NULL,
-                changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            ) ENGINE=InnoDB
-        ''')
+    def __init__(self, path, interval=SNAPSHOT_SYNC_SECONDS):
+        self.path = path
+        self.interval = interval
+        self.ready = False
+        # tables written since the last sync started, and those the running sync is picking up
+        self._dirty = set()
+        self._syncing = set()
+        self._dirty_lock = threading.Lock()
+        self._pruned = False
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._opened = False
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def _connect(self):
+        cnx = getattr(self._local, 'cnx', None)
+        if cnx is None:
+            import sqlite3
+            cnx = sqlite3.connect(self.path, timeout=10)
+            cnx.create_function('YEAR', 1, _sqlite_year, deterministic=True)
+            self._local.cnx = cnx
+        return cnx
+
+    def open(self):
+        """Create the local schema if needed; the snapshot is usable right
+        away when an earlier session completed a full sync."""
+        if not self.enabled or self._opened:
+            return self.ready
+        cnx = self._connect()
+        cnx.execute("PRAGMA journal_mode=WAL")
+        for table, (_, columns) in SNAPSHOT_TABLES.items():
+            cnx.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(f'{c} {t}' for c, t in columns)})")
+        for ddl in _SNAPSHOT_INDEXES:
+            cnx.execute(ddl)
+        cnx.execute("CREATE TABLE IF NOT EXISTS sync_state (name TEXT PRIMARY KEY, value TEXT)")
+        cnx.commit()
+        self._opened = True
+        self.ready = self._state(cnx, 'complete') == '1'
+        return self.ready
+
+    def start(self):
+        """Start the background sync thread (idempotent)."""
+        if not self.enabled or self._thread is not None:
+            return
+        try:
+            self.open()
+        except Exception as e:
+            print(f"Warning: local snapshot disabled: {e}")
+            self.path = None
+            return
+        self._thread = threading.Thread(target=self._run, name='cinetrack-snapshot', daemon=True)
+        self._thread.start()
 
-        # Helper to check if a trigger exists in the current schema
-        def trigger_exists(trigger_name):
-            cursor.execute(
-                "SELECT TRIGGER_NAME FROM information_schema.triggers WHERE trigger_schema=%s AND trigger_name=%s",
-                (DB_CONFIG.get('database'), trigger_name)
-            )
-            return cursor.fetchone() is not None
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def request_sync(self):
+        self._wake.set()
+
+    def mark_dirty(self, tables):
+        """Route reads of `tables` to MySQL until the next sync (QueryCache listener)."""
+        if not self.enabled:
+            return
+        touched = set(SNAPSHOT_TABLES) if '*' in tables else SNAPSHOT_TABLES.keys() & set(tables)
+        if not touched:
+            return
+        with self._dirty_lock:
+            self._dirty |= touched
+        self.request_sync()
 
-        # Create after_user_insert trigger if missing
-        if not trigger_exists('after_user_insert'):
+    def _run(self):
+        failing = False
+        while not self._stop.is_set():
             try:
-                cursor.execute('''
-                    CREATE TRIGGER after_user_insert
-                    AFTER INSERT ON users
-                    FOR EACH ROW
-                    BEGIN
-                        INSERT INTO donations (user_id, donation_amount, comment)
-                        VALUES (NEW.user_id, 0.00, 'Welcome, user created!');
-                    END
-                ''')
+                self.sync()
+                failing = False
             except Exception as e:
-                # Some MySQL setups disallow trigger creation depending on privileges
-                print(f"Warning: could not create trigger after_user_insert: {e}")
+                if not failing:
+                    print(f"Snapshot sync failed (will retry): {e}")
+                failing = True
+            self._wake.wait(self.interval)
+            self._wake.clear()
 
-        # Create before_rating_update trigger if missing
-        if not trigger_exists('before_rating_update'):
+    def sync(self):
+        """Pull every change since the last sync; returns the rows written.
+
+        The dirty set is taken over when the sync starts: those tables stay on
+        MySQL until it finishes, and tables marked meanwhile wait for the next one.
+        """
+        with self._dirty_lock:
+            self._syncing, self._dirty = self._dirty, set()
+        try:
+            cnx = self._connect()
+            written = self._sync_deletions(cnx)
+            for table, (pk, columns) in SNAPSHOT_TABLES.items():
+                names = [c for c, _ in columns]
+                if pk is None:
+                    written += self._sync_links(cnx, table, names)
+                else:
+                    written += self._sync_rows(cnx, table, pk, names)
+            cnx.execute("INSERT OR REPLACE INTO sync_state (name, value) VALUES ('complete', '1')")
+            cnx.commit()
+            self.ready = True
+        except Exception:
+            with self._dirty_lock:
+                self._dirty |= self._syncing
+            raise
+        finally:
+            with self._dirty_lock:
+                self._syncing = set()
+        return written
+
+    def _sync_deletions(self, cnx):
+        """Drop local rows deleted upstream, as logged in snapshot_deletions.
+
+        The log is re-read from SNAPSHOT_OVERLAP_SECONDS before the last mark,
+        like updated_at. The first sync, or one whose mark predates the pruned
+        part of the log, compares primary keys instead.
+        """
+        now = db.fetchone("SELECT NOW()")[0]
+        horizon = now - datetime.timedelta(days=SNAPSHOT_DELETION_LOG_DAYS)
+        if not self._pruned:
+            db.execute("DELETE FROM snapshot_deletions WHERE deleted_at < %s", (horizon,))
+            self._pruned = True
+        since = self._state(cnx, 'deletions')
+        start = None
+        if since is not None:
+            start = datetime.datetime.fromisoformat(since) - datetime.timedelta(seconds=SNAPSHOT_OVERLAP_SECONDS)
+        gone = {}
+        if start is None or start < horizon:
+            for table, (pk, _) in SNAPSHOT_TABLES.items():
+                if pk is not None:
+                    keep = {r[0] for r in db.fetchall(f"SELECT {pk} FROM {table}")}
+                    gone[table] = [i for (i,) in cnx.execute(f"SELECT {pk} FROM {table}") if i not in keep]
+        else:
+            for table, row_id in db.fetchall(
+                    "SELECT table_name, row_id FROM snapshot_deletions WHERE deleted_at >= %s", (start,)):
+                gone.setdefault(table, []).append(row_id)
+        written = 0
+        for table, ids in gone.items():
+            pk = SNAPSHOT_TABLES.get(table, (None,))[0]
+            if pk is not None and ids:
+                written += cnx.executemany(f"DELETE FROM {table} WHERE {pk}=?", [(i,) for i in ids]).rowcount
+        self._set_state(cnx, 'deletions', _snapshot_value(now))
+        cnx.commit()
+        return written
+
+    def _sync_rows(self, cnx, table, pk, names):
+        since = self._state(cnx, table)
+        if since is None:
+            after = ('1970-01-01 00:00:00', -1)
+        else:
+            start = datetime.datetime.fromisoformat(since) - datetime.timedelta(seconds=SNAPSHOT_OVERLAP_SECONDS)
+            after = (start.isoformat(' '), -1)
+        marks = ', '.join('?' * len(names))
+        written = 0
+        while True:
+            rows = db.fetchall(
+                f"SELECT {', '.join(names)}, updated_at FROM {table} "
+                f"WHERE updated_at > %s OR (updated_at = %s AND {pk} > %s) "
+                f"ORDER BY updated_at, {pk} LIMIT %s",
+                (after[0], after[0], after[1], SNAPSHOT_BATCH_ROWS))
+            if not rows:
+                break
+            cnx.executemany(f"INSERT OR REPLACE INTO {table} ({', '.join(names)}) VALUES ({marks})",
+                            [[_snapshot_value(v) for v in r[:-1]] for r in rows])
+            after = (_snapshot_value(rows[-1][-1]), rows[-1][0])
+            self._set_state(cnx, table, after[0])
+            cnx.commit()
+            written += len(rows)
+            if len(rows) < SNAPSHOT_BATCH_ROWS:
+                break
+        return written
+
+    def _sync_links(self, cnx, table, names):
+        checksum = db.fetchone(
+            f"SELECT COUNT(*), IFNULL(SUM(CRC32(CONCAT_WS(':', {', '.join(names)}))), 0) FROM {table}")
+        checksum = f"{checksum[0]}:{checksum[1]}"
+        if checksum == self._state(cnx, table):
+            return 0
+        rows = db.fetchall(f"SELECT {', '.join(names)} FROM {table}")
+        cnx.execute(f"DELETE FROM {table}")
+        cnx.executemany(f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})", rows)
+        self._set_state(cnx, table, checksum)
+        cnx.commit()
+        return len(rows)
+
+    @staticmethod
+    def _state(cnx, name):
+        row = cnx.execute("SELECT value FROM sync_state WHERE name=?", (name,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_state(cnx, name, value):
+        cnx.execute("INSERT OR REPLACE INTO sync_state (name, value) VALUES (?, ?)", (name, value))
+
+    def _usable_for(self, sql):
+        tables = read_tables(sql)
+        if not (self.enabled and self.ready and tables <= SNAPSHOT_TABLES.keys()):
+            return False
+        with self._dirty_lock:
+            return not (tables & (self._dirty | self._syncing))
+
+    def _read_local(self, sql, params):
+        cur = self._connect().execute(sql.replace('%s', '?'), [_snapshot_value(p) for p in (params or ())])
+        return cur.fetchall()
+
+    def fetchall(self, sql, params=None, cached=True):
+        """Rows for a catalog query, from the snapshot when it can answer it.
+
+        Otherwise the query goes to MySQL, through the query cache unless
+        cached=False.
+        """
+        if self._usable_for(sql):
             try:
-                cursor.execute('''
-                    CREATE TRIGGER before_rating_update
-                    BEFORE UPDATE ON reviews_ratings
-                    FOR EACH ROW
-                    BEGIN
-                        IF OLD.rating <> NEW.rating THEN
-                            INSERT INTO ratings_audit (review_id, old_rating, new_rating)
-                            VALUES (OLD.review_id, OLD.rating, NEW.rating);
-                        END IF;
-                    END
-                ''')
+                return self._read_local(sql, params)
             except Exception as e:
-                print(f"Warning: could not create trigger before_rating_update: {e}")
-
-        # Commit any successful DDL
-        conn.commit()
-    except Exception as e:
+                print(f"Snapshot read failed, using MySQL: {e}")
         try:
-            conn.rollback()
+            return db.cached_fetchall(sql, params) if cached else db.fetchall(sql, params)
         except Exception:
-            pass
-        print(f"Warning: error while ensuring triggers/tables: {e}")
+            # MySQL unreachable: a stale answer beats none
+            if self.enabled and self.ready:
+                return self._read_local(sql, params)
+            raise
+
+
+class CatalogModel:
+    """Column store for the movie/series card rows shown by the grid pages.
+
+    Each title is stored once, however many pages list it, in typed arrays:
+    ids, years, episode and season counts, float32 ratings, a language index
+    into `languages`, a genre bitset (one uint32 array per 32 genres) and the
+    UTF-8 names packed into one bytearray. Ids map to positions through an
+    open-addressed array('i') table instead of a dict. row() rebuilds the
+    tuple a card binds to only when that card comes into view.
+
+    add() and position() hold a lock, so worker threads can load titles
+    (e.g. the facet index) while the UI thread adds page results.
+    """
+
+    _EMPTY = -1
+
+    def __init__(self):
+        self.ids = array('i')
+        self.years = array('H')        # 0 = unknown
+        self.ratings = array('f')      # NaN = not rated
+        self.episodes = array('I')
+        self.seasons = array('H')      # 0 = unknown
+        self._language = array('H')    # index into self.languages
+        self.languages = [None]
+        self._language_codes = {None: 0}
+        self.genres = []
+        self._genre_codes = {}
+        self._genre_words = [array('I')]
+        self._name_start = array('I')
+        self._name_len = array('H')      # names are VARCHAR(200)
+        self._names = bytearray()
+        self._slots = array('i', [self._EMPTY]) * 64
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _probe(self, movie_id):
+        mask = len(self._slots) - 1
+        i = (movie_id * 2654435761) & mask
+        while True:
+            pos = self._slots[i]
+            if pos == self._EMPTY or self.ids[pos] == movie_id:
+                return i
+            i = (i + 1) & mask
+
+    def _grow(self):
+        self._slots = array('i', [self._EMPTY]) * (len(self._slots) * 2)
+        for pos, movie_id in enumerate(self.ids):
+            self._slots[self._probe(movie_id)] = pos
+
+    def position(self, movie_id):
+        """Position of movie_id in the columns, or None if it was never added."""
+        with self._lock:
+            pos = self._slots[self._probe(movie_id)]
+        return None if pos == self._EMPTY else pos
+
+    def add(self, rows):
+        """Store card rows and return their positions as an array('i').
+
+        Rows are (movie_id, name, year, language, genres, avg_rating) with
+        optional (episode_count, max_season) as on the TV page; a title
+        added again is updated in place.
+        """
+        with self._lock:
+            return array('i', [self._put(r) for r in rows])
+
+    def view(self, rows=()):
+        return CatalogView(self, rows)
+
+    def _put(self, r):
+        if 2 * (len(self.ids) + 1) > len(self._slots):
+            self._grow()
+        slot = self._probe(r[0])
+        pos = self._slots[slot]
+        if pos == self._EMPTY:
+            pos = len(self.ids)
+            self._slots[slot] = pos
+            self.ids.append(r[0])
+            self.years.append(0)
+            self.ratings.append(math.nan)
+            self.episodes.append(0)
+            self.seasons.append(0)
+            self._language.append(0)
+            self._name_start.append(0)
+            self._name_len.append(0)
+            for words in self._genre_words:
+                words.append(0)
+        self._set_name(pos, r[1] or '')
+        self.years[pos] = int(r[2] or 0)
+        self.ratings[pos] = math.nan if r[5] is None else float(r[5])
+        self._language[pos] = self._code(r[3])
+        self._set_genres(pos, r[4])
+        if len(r) > 7:
+            self.episodes[pos] = int(r[6] or 0)
+            self.seasons[pos] = int(r[7] or 0)
+        return pos
+
+    def _code(self, language):
+        code = self._language_codes.get(language)
+        if code is None:
+            code = self._language_codes[language] = len(self.languages)
+            self.languages.append(sys.intern(language))
+        return code
+
+    def _set_name(self, pos, name):
+        data = name.encode('utf-8')
+        start = self._name_start[pos]
+        if self._names[start:start + self._name_len[pos]] != data:
+            # a renamed title leaves its old bytes behind; renames are rare
+            self._name_start[pos] = len(self._names)
+            self._name_len[pos] = len(data)
+            self._names += data
+
+    def genre_code(self, genre):
+        """Bit number for a genre name, allocating one (and a word) if it is new."""
+        code = self._genre_codes.get(genre)
+        if code is None:
+            code = self._genre_codes[genre] = len(self.genres)
+            self.genres.append(sys.intern(genre))
+            if code >= 32 * len(self._genre_words):
+                self._genre_words.append(array('I', bytes(4 * len(self.ids))))
+        return code
+
+    def _set_genres(self, pos, text):
+        mask = 0
+        for genre in (text or '').split(','):
+            genre = genre.strip()
+            if genre:
+                mask |= 1 << self.genre_code(genre)
+        for w, words in enumerate(self._genre_words):
+            words[pos] = (mask >> (32 * w)) & 0xFFFFFFFF
+
+    def language(self, pos):
+        return self.languages[self._language[pos]]
+
+    def genre_mask(self, pos):
+        """The genre bitset of the title at pos, as an int."""
+        mask = 0
+        for w, words in enumerate(self._genre_words):
+            mask |= words[pos] << (32 * w)
+        return mask
+
+    def genre_names(self, pos):
+        mask = self.genre_mask(pos)
+        return sorted(g for code, g in enumerate(self.genres) if mask >> code & 1)
+
+    def row(self, pos):
+        """(movie_id, name, year, language, genres, avg_rating, episode_count, max_season)."""
+        start = self._name_start[pos]
+        rating = self.ratings[pos]
+        return (self.ids[pos], self._names[start:start + self._name_len[pos]].decode('utf-8'),
+                self.years[pos] or None, self.language(pos),
+                ','.join(self.genre_names(pos)) or None,
+                None if math.isnan(rating) else round(rating, 1),
+                self.episodes[pos], self.seasons[pos] or None)
+
+    def nbytes(self):
+        """Approximate memory held by the columns and the id table."""
+        arrays = [self.ids, self.years, self.ratings, self.episodes, self.seasons, self._language,
+                  self._name_start, self._name_len, self._slots] + self._genre_words
+        return sum(a.itemsize * len(a) for a in arrays) + len(self._names)
+
+
+class CatalogView:
+    """One page's ordered result list: positions into a shared CatalogModel.
+
+    Behaves like a read-only list of card rows (len, indexing, slicing) and
+    grows with extend(), so it can back a VirtualCardGrid directly.
+    """
+
+    def __init__(self, model, rows=(), positions=None):
+        self.model = model
+        self.positions = array('i') if positions is None else positions
+        self.extend(rows)
+
+    def extend(self, rows):
+        self.positions.extend(self.model.add(rows))
+
+    def __len__(self):
+        return len(self.positions)
 
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.model.row(p) for p in self.positions[index]]
+        return self.model.row(self.positions[index])
 
-# Ensure triggers/tables are present (best-effort)
-try:
-    _ensure_triggered_tables_and_triggers()
-except Exception:
-    # non-fatal: continue even if trigger creation failed
-    pass
+    def ids(self):
+        return [self.model.ids[p] for p in self.positions]
+
+
+# Tables whose writes make the Movies page facet index stale
+FACET_TABLES = frozenset({'movies', 'movie_summary', 'movie_platform', 'streaming_platforms', 'genres'})
+FACET_SORTS = ('Newest', 'Oldest', 'Top rated', 'Title A-Z')
+FACET_ADD_CHUNK = 5000
+
+_NONZERO_BYTE = re.compile(b'[^\x00]')
+
+_popcount = getattr(int, 'bit_count', None) or (lambda bits: bin(bits).count('1'))
+
+
+def _bitmap(positions, size):
+    """An int with bit p set for every p in positions."""
+    buf = bytearray((size + 7) // 8)
+    for p in positions:
+        buf[p >> 3] |= 1 << (p & 7)
+    return int.from_bytes(buf, 'little')
+
+
+class FacetIndex:
+    """Posting lists for the Movies page facets over CatalogModel positions.
+
+    Every facet value (genre, language, release year, rating to one decimal,
+    platform) maps to a bitmap: a Python int whose bit p is set when the title
+    at model position p has that value. A selection ORs the bitmaps within a
+    facet and ANDs the facets together, so filtering and the per-value counts
+    are a few big-int operations rather than a query.
+    """
+
+    def __init__(self, model, rows, platform_links):
+        self.model = model
+        # the query's release_date DESC order; added in chunks so page
+        # callbacks adding rows on the UI thread never wait long for the lock
+        self.newest = array('i')
+        for start in range(0, len(rows), FACET_ADD_CHUNK):
+            self.newest.extend(model.add(rows[start:start + FACET_ADD_CHUNK]))
+        self.built_at = time.monotonic()
+        size = len(model)
+        self.all = _bitmap(self.newest, size)
+
+        genres, languages, years, ratings = {}, {}, {}, {}
+        for p in self.newest:
+            for genre in model.genre_names(p):
+                genres.setdefault(genre, []).append(p)
+            languages.setdefault(model.language(p), []).append(p)
+            years.setdefault(model.years[p], []).append(p)
+            rating = model.ratings[p]
+            if not math.isnan(rating):
+                ratings.setdefault(round(rating * 10), []).append(p)
+        platforms = {}
+        for movie_id, platform in platform_links:
+            p = model.position(movie_id)
+            if p is not None:
+                platforms.setdefault(platform, []).append(p)
+
+        self.facets = {
+            'genre': {k: _bitmap(v, size) for k, v in sorted(genres.items())},
+            'language': {k: _bitmap(v, size) for k, v in sorted(languages.items(), key=lambda kv: -len(kv[1]))
+                         if k},
+            'platform': {k: _bitmap(v, size) for k, v in sorted(platforms.items())},
+        }
+        self._years = {k: _bitmap(v, size) for k, v in years.items() if k}
+        self._ratings = {k: _bitmap(v, size) for k, v in ratings.items()}
+        self.year_span = (min(self._years), max(self._years)) if self._years else (None, None)
+        self._orders = {'Newest': self.newest}
+        self._ranks = {}
+        self._rank('Newest')  # built here, off the UI thread, for the first toggle
+
+    @staticmethod
+    def _union(bitmaps):
+        result = 0
+        for bits in bitmaps:
+            result |= bits
+        return result
+
+    def _range(self, postings, lo, hi):
+        return self._union(bits for key, bits in postings.items()
+                           if (lo is None or key >= lo) and (hi is None or key <= hi))
+
+    def _masks(self, selection):
+        """One bitmap per active part of the selection, keyed by facet."""
+        masks = {}
+        for facet, postings in self.facets.items():
+            chosen = selection.get(facet)
+            if chosen:
+                masks[facet] = self._union(postings.get(v, 0) for v in chosen)
+        years = selection.get('year')
+        if years and years != (None, None):
+            masks['year'] = self._range(self._years, *years)
+        ratings = selection.get('rating')
+        if ratings and ratings != (None, None):
+            lo, hi = ratings
+            masks['rating'] = self._range(self._ratings, None if lo is None else round(lo * 10),
+                                          None if hi is None else round(hi * 10))
+        return masks
+
+    def match(self, selection):
+        """(bitmap of matching titles, {facet: {value: count}}).
+
+        selection maps 'genre'/'language'/'platform' to sets of values and
+        'year'/'rating' to inclusive (low, high) pairs, None meaning open.
+        A value's count applies every other facet, so it is what ticking
+        that value would add.
+        """
+        masks = self._masks(selection)
+        result = self.all
+        for bits in masks.values():
+            result &= bits
+        counts = {}
+        for facet, postings in self.facets.items():
+            base = self.all
+            for other, bits in masks.items():
+                if other != facet:
+                    base &= bits
+            counts[facet] = {v: _popcount(bits & base) for v, bits in postings.items()}
+        return result, counts
+
+    def order(self, sort):
+        """Positions in the given FACET_SORTS order (computed once per sort)."""
+        if sort not in self._orders:
+            model = self.model
+            if sort == 'Oldest':
+                dated = [p for p in self.newest if model.years[p]]
+                undated = [p for p in self.newest if not model.years[p]]
+                positions = dated[::-1] + undated
+            elif sort == 'Top rated':
+                positions = sorted(self.newest, key=lambda p: -model.ratings[p] if not math.isnan(model.ratings[p])
+                                   else math.inf)
+            else:
+                positions = sorted(self.newest, key=lambda p: model.row(p)[1].casefold())
+            self._orders[sort] = array('i', positions)
+        return self._orders[sort]
+
+    def _rank(self, sort):
+        if sort not in self._ranks:
+            rank = array('i', bytes(4 * len(self.model)))
+            for i, p in enumerate(self.order(sort)):
+                rank[p] = i
+            self._ranks[sort] = rank
+        return self._ranks[sort]
+
+    def select(self, bitmap, sort='Newest'):
+        """The positions set in bitmap, in `sort` order."""
+        order = self.order(sort)
+        if bitmap == self.all:
+            return array('i', order)
+        bits = bitmap.to_bytes((len(self.model) + 7) // 8, 'little')
+        if _popcount(bitmap) * 8 > len(order):
+            # a large share of the catalog: walk the sorted order once
+            return array('i', (p for p in order if bits[p >> 3] >> (p & 7) & 1))
+        # a few matches: pick the set bits out of the non-zero bytes, then sort them
+        rank = self._rank(sort)
+        positions = [m.start() << 3 | b for m in _NONZERO_BYTE.finditer(bits)
+                     for b in range(8) if bits[m.start()] >> b & 1]
+        return array('i', sorted(positions, key=rank.__getitem__))
+
+
+_facet_lock = threading.Lock()
+_facet_state = {'index': None, 'stale': False}
+
+
+def _facet_tables_changed(tables):
+    if '*' in tables or FACET_TABLES.intersection(tables):
+        _facet_state['stale'] = True
+
+
+def movie_facets():
+    """The Movies page FacetIndex, rebuilt after local catalog writes or
+    QUERY_CACHE_TTL seconds (runs on a worker thread; reads the snapshot)."""
+    with _facet_lock:
+        index = _facet_state['index']
+        if index is not None and not _facet_state['stale'] and time.monotonic() - index.built_at < QUERY_CACHE_TTL:
+            return index
+        _facet_state['stale'] = False
+        rows = catalog.fetchall("""
+            SELECT m.movie_id, m.movie_name, YEAR(m.release_date) as yr, m.language,
+                s.genres, ROUND(s.rating_sum / NULLIF(s.rating_count, 0), 1) as avg_rating
+            FROM movies m
+            LEFT JOIN movie_summary s ON m.movie_id=s.movie_id
+            ORDER BY m.release_date IS NULL, m.release_date DESC, m.movie_id DESC
+        """, cached=False)
+        links = catalog.fetchall("""
+            SELECT mp.movie_id, sp.platform_name
+            FROM movie_platform mp
+            JOIN streaming_platforms sp ON mp.platform_id=sp.platform_id
+        """, cached=False)
+        index = _facet_state['index'] = FacetIndex(catalog_model, rows, links)
+        return index
+
+
+def is_cast_name(text):
+    """Whether the header search text names a cast member (worker thread)."""
+    suggest_index.sync()
+    return suggest_index.has_name('cast', text)
+
+
+search_engine = SearchEngine()
+suggest_index = TrigramIndex()
+catalog = LocalSnapshot(SNAPSHOT_PATH)
+db.cache.listeners.append(catalog.mark_dirty)
+# Card rows for the Movies, TV and Search pages, each title stored once
+catalog_model = CatalogModel()
+db.cache.listeners.append(_facet_tables_changed)
 
 # Theme/Style constants
 IMDB_YELLOW = "#F5C518"
@@ -139,23 +4247,170 @@ FONT_HEADER = ("Arial Black", 22)
 FONT_SUBHEADER = ("Arial", 15, "bold")
 FONT_NORMAL = ("Arial", 13)
 
+# Header suggestions wait this long after the last keystroke before looking up
+SUGGEST_DEBOUNCE_MS = 120
+# The Search page re-runs its queries this long after the last keystroke
+SEARCH_DEBOUNCE_MS = 250
+
+
+def _sync_treeview(tree, rows, values_for):
+    """Make tree list `rows` in order, keyed by iid str(row[0]).
+
+    Rows no longer present are deleted, new ones inserted and the rest moved
+    and updated in place, so an unchanged row keeps its widget state.
+    """
+    wanted = [str(r[0]) for r in rows]
+    keep = set(wanted)
+    gone = [iid for iid in tree.get_children('') if iid not in keep]
+    if gone:
+        tree.delete(*gone)
+    for index, (iid, r) in enumerate(zip(wanted, rows)):
+        tags = ('even' if index % 2 == 0 else 'odd',)
+        if tree.exists(iid):
+            if tree.index(iid) != index:
+                tree.move(iid, '', index)
+            tree.item(iid, values=values_for(r), tags=tags)
+        else:
+            tree.insert('', index, iid=iid, values=values_for(r), tags=tags)
+
+
 def imdb_heading(master, text):
-    ctk.CTkLabel(
+    label = ctk.CTkLabel(
         master,
         text=text,
         font=FONT_HEADER,
         text_color=IMDB_YELLOW,
         bg_color=IMDB_DARK_BG
-    ).pack(anchor="w", pady=(18,3), padx=(20,0))
+    )
+    label.pack(anchor="w", pady=(18,3), padx=(20,0))
+    return label
 
 def imdb_subheading(master, text):
-    ctk.CTkLabel(
+    label = ctk.CTkLabel(
         master,
         text=text,
         font=FONT_SUBHEADER,
         text_color="white",
         bg_color=IMDB_DARK_BG
-    ).pack(anchor="w", padx=(20,0))
+    )
+    label.pack(anchor="w", padx=(20,0))
+    return label
+
+
+class VirtualCardGrid(ctk.CTkFrame):
+    """Scrollable card grid that only keeps widgets for the rows in view.
+
+    Cards sit in fixed-size cells on a canvas. A pool of card widgets large
+    enough for the visible rows plus `buffer_rows` above and below is built on
+    demand and rebound to whichever data rows scroll into view, so the widget
+    count stays flat however many rows are appended.
+
+    - build_card(parent) -> (frame, bind): creates one reusable card; bind(row)
+      points it at a new data row
+    - on_near_end(): optional, called when the view comes within `near_end_rows`
+      grid rows of the last loaded row (e.g. to fetch the next page)
+    - on_visible(rows): optional, called with the data rows bound to cards
+      whenever that set changes (e.g. to prefetch their detail pages)
+    - rows: optional row store with extend(), len() and indexing (e.g. a
+      CatalogView); a plain list by default
+    """
+
+    def __init__(self, master, build_card, cols=4, cell_width=264, cell_height=384, pad=12,
+                 buffer_rows=2, near_end_rows=2, on_near_end=None, on_visible=None, rows=None, **kwargs):
+        kwargs.setdefault('fg_color', IMDB_DARK_BG)
+        super().__init__(master, **kwargs)
+        self.build_card = build_card
+        self.cols = cols
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.pad = pad
+        self.buffer_rows = buffer_rows
+        self.near_end_rows = near_end_rows
+        self.on_near_end = on_near_end
+        self.on_visible = on_visible
+        self._visible_range = None
+        self.rows = [] if rows is None else rows
+        # bumped by set_rows so pages requested for the old rows are dropped
+        self.generation = 0
+        # each pooled card is [frame, bind, canvas window id, bound row index]
+        self._cards = []
+
+        self.canvas = ctk.CTkCanvas(self, bg=IMDB_DARK_BG, highlightthickness=0)
+        self.scrollbar = ctk.CTkScrollbar(self, orientation='vertical', command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.scrollbar.pack(side='right', fill='y')
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.canvas.bind('<Configure>', lambda e: self.refresh())
+
+    def append(self, rows):
+        """Add data rows to the end of the grid."""
+        self.rows.extend(rows)
+        self._update_scrollregion()
+        self.refresh()
+
+    def set_rows(self, rows):
+        """Replace every data row (e.g. with a filtered result) and scroll to the top."""
+        self.generation += 1
+        self.rows = rows
+        self._visible_range = None
+        for card in self._cards:
+            card[3] = None
+            self.canvas.coords(card[2], -self.cell_width, -self.cell_height)
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def _update_scrollregion(self):
+        total_rows = -(-len(self.rows) // self.cols)
+        self.canvas.configure(scrollregion=(0, 0, self.cols * self.cell_width, total_rows * self.cell_height))
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def refresh(self):
+        """Rebind pooled cards to the rows currently in (or near) the view."""
+        if not self.rows:
+            return
+        total_rows = -(-len(self.rows) // self.cols)
+        top = self.canvas.canvasy(0)
+        first_row = max(0, int(top // self.cell_height) - self.buffer_rows)
+        last_row = int((top + self.canvas.winfo_height()) // self.cell_height) + self.buffer_rows
+        last_row = min(last_row, total_rows - 1)
+        start = first_row * self.cols
+        end = min(len(self.rows), (last_row + 1) * self.cols)
+
+        # Grow the pool only as far as one screenful plus the buffers needs
+        while len(self._cards) < end - start:
+            frame, bind = self.build_card(self.canvas)
+            window = self.canvas.create_window(-self.cell_width, -self.cell_height, window=frame, anchor='nw')
+            self._cards.append([frame, bind, window, None])
+
+        # Row idx always lands in slot idx % pool, so a card that stays in view is not rebound
+        pool = len(self._cards)
+        used = set()
+        for idx in range(start, end):
+            slot = idx % pool
+            card = self._cards[slot]
+            used.add(slot)
+            if card[3] != idx:
+                card[1](self.rows[idx])
+                card[3] = idx
+                row, col = divmod(idx, self.cols)
+                self.canvas.coords(card[2], col * self.cell_width + self.pad, row * self.cell_height + self.pad)
+        # Park the spare cards outside the scroll region
+        for slot, card in enumerate(self._cards):
+            if slot not in used and card[3] is not None:
+                card[3] = None
+                self.canvas.coords(card[2], -self.cell_width, -self.cell_height)
+
+        if self.on_visible and (start, end) != self._visible_range:
+            self._visible_range = (start, end)
+            self.on_visible(self.rows[start:end])
+
+        if self.on_near_end and last_row >= total_rows - 1 - self.near_end_rows:
+            self.on_near_end()
+
 
 class CineTrackIMDB(ctk.CTk):
 
@@ -168,14 +4423,67 @@ class CineTrackIMDB(ctk.CTk):
         self.page = None
         # currently logged in user as tuple (user_id, username)
         self.current_user = None
+        # Worker pool for page queries; results come back on the UI thread
+        self.executor = QueryExecutor(self)
+        self._prefetch_after = None
+        # Search page widgets and its pending debounced run
+        self._search = None
+        self._search_after = None
+
+        # Background imports, shown in a progress bar docked at the bottom
+        self.jobs = JobRegistry()
+        self._job_rows = {}
+        self._jobs_after = None
 
         # Top header styled like IMDB and left compact nav
         self.create_header()
-        self.show_home()
+        self.jobs_bar = ctk.CTkFrame(self, fg_color=IMDB_GRAY)
+
+        # Window first: draw a placeholder home page now and connect, check
+        # the schema and load data once the main loop is running
+        self.ready_at = None
+        self.clear_page()
+        self._startup_page = self.page
+        imdb_heading(self.page, "Welcome to CineTrack")
+        self._startup_label = self._loading_label(self.page, text="Connecting to database...")
+        self.after_idle(lambda: self.executor.submit(bootstrap_schema, callback=self._backend_ready,
+                                                     errback=self._backend_failed))
+
+    def _backend_ready(self, _schema_updated):
+        self.ready_at = time.perf_counter()
+        # Detect FULLTEXT support (or build the fallback index) before the first search
+        self.executor.submit(search_engine.warm)
+        # Load the in-memory suggestion index for the header search box
+        self.executor.submit(suggest_index.sync)
+        # Keep the local catalog snapshot in step with MySQL
+        catalog.start()
+        # Keep whatever page the user already opened
+        if self.page is self._startup_page:
+            self.show_home()
+        self._refresh_trending()
 
-        # Import dataset CSV if exists
+        # Import dataset CSV if exists; it loads behind the already usable window
         if os.path.exists("cinetrack_dataset.csv"):
-            self.import_all_csv_from_path("cinetrack_dataset.csv")
+            self._start_import("Startup dataset", self.import_all_csv_from_path, "cinetrack_dataset.csv")
+
+    def _refresh_trending(self):
+        """Fold new activity into the trending ranking now and every TRENDING_REFRESH_SECONDS."""
+        self.executor.submit(refresh_trending, errback=lambda err: print(f"Trending refresh failed: {err}"))
+        self.after(TRENDING_REFRESH_SECONDS * 1000, self._refresh_trending)
+
+    def _backend_failed(self, err):
+        print(f"❌ Database connection failed: {err}")
+        print("Please check your database configuration in DB_CONFIG dictionary")
+        # Browse the last synced snapshot read-only; its sync thread keeps retrying
+        catalog.start()
+        if catalog.ready:
+            messagebox.showwarning("Database", f"Database connection failed: {err}\n\n"
+                                               "Showing the local snapshot read-only until the database is back.")
+            self.show_movies()
+            return
+        messagebox.showerror("Database", f"Database connection failed: {err}\n\n"
+                                         "Please check DB_CONFIG in main.py.")
+        self.on_closing()
 
     # ========== TOP HEADER ==========
     def create_header(self):
@@ -202,6 +4510,7 @@ class CineTrackIMDB(ctk.CTk):
             ("Watchlist", self.show_watchlist),
             ("Donations", self.show_donations),
             ("DB Stats", self.show_database_stats),
+            ("Performance", self.show_performance),
         ]
         for txt, fn in nav_items:
             btn = ctk.CTkButton(nav_frame, text=txt, corner_radius=8, font=("Arial", 12, "bold"), fg_color=IMDB_GRAY,
@@ -211,17 +4520,207 @@ class CineTrackIMDB(ctk.CTk):
         search_entry = ctk.CTkEntry(header, width=360, placeholder_text="Search movies, cast, keywords...", font=("Arial", 12))
         search_entry.pack(side="right", padx=18)
         # Pressing Enter in the header search opens the Search page and runs the query
-        search_entry.bind('<Return>', lambda e, q=search_entry: self._header_search_trigger(q.get()))
+        search_entry.bind('<Return>', lambda e, q=search_entry: (self._hide_suggestions(), self._header_search_trigger(q.get())))
+        # Live suggestions while typing (debounced; stale lookups are dropped)
+        self._suggest = {'after': None, 'generation': 0}
+        self.suggest_box = ctk.CTkFrame(self, fg_color=IMDB_GRAY, corner_radius=6)
+        self.suggest_buttons = []
+        search_entry.bind('<KeyRelease>', lambda e, q=search_entry: self._schedule_suggestions(e, q))
+        search_entry.bind('<Escape>', lambda e: self._hide_suggestions())
+        # delay so a click on a suggestion lands before the box disappears
+        search_entry.bind('<FocusOut>', lambda e: self.after(200, self._hide_suggestions))
         # Account / Login button (right) - opens a full page login/register UI
         self.account_btn = ctk.CTkButton(header, text="Account", width=120, fg_color=IMDB_GRAY, command=self.show_account_page)
         self.account_btn.pack(side="right", padx=(0,12))
 
+    def _schedule_suggestions(self, event, entry):
+        """Debounce header typing: every keystroke cancels the pending lookup."""
+        if event.keysym in ('Return', 'Escape'):
+            return
+        if self._suggest['after']:
+            self.after_cancel(self._suggest['after'])
+        self._suggest['after'] = self.after(SUGGEST_DEBOUNCE_MS, lambda: self._run_suggestions(entry))
+
+    def _run_suggestions(self, entry):
+        self._suggest['after'] = None
+        self._suggest['generation'] += 1
+        generation = self._suggest['generation']
+        text = entry.get()
+        if not text.strip():
+            self._hide_suggestions()
+            return
+
+        def show(results):
+            # a newer keystroke (or Escape) has superseded this lookup
+            if generation == self._suggest['generation']:
+                self._show_suggestions(entry, results)
+
+        self.executor.submit(suggest_index.suggest, text, callback=show)
+
+    def _show_suggestions(self, entry, results):
+        if not results:
+            self.suggest_box.place_forget()
+            return
+        icons = {'movie': '🎬', 'series': '📺', 'cast': '🙂'}
+        openers = {'movie': self.show_movie_detail, 'series': self.show_series_detail, 'cast': self.show_filmography}
+        # Reuse the same buttons for every keystroke
+        while len(self.suggest_buttons) < len(results):
+            self.suggest_buttons.append(ctk.CTkButton(self.suggest_box, text="", anchor='w', fg_color=IMDB_GRAY,
+                                                      hover_color=IMDB_DARK_BG, text_color="white", font=("Arial", 12), height=28))
+        for btn in self.suggest_buttons:
+            btn.pack_forget()
+        for btn, (kind, item_id, label) in zip(self.suggest_buttons, results):
+            def open_item(fn=openers[kind], item_id=item_id):
+                self._hide_suggestions()
+                fn(item_id)
+            btn.configure(text=f"{icons[kind]}  {label}", command=open_item)
+            btn.pack(fill='x', padx=4, pady=1)
+        self.suggest_box.place(in_=entry, relx=0, rely=1, y=4, relwidth=1)
+        self.suggest_box.lift()
+
+    def _hide_suggestions(self):
+        """Cancel any pending/in-flight lookup and close the suggestion box."""
+        if self._suggest['after']:
+            self.after_cancel(self._suggest['after'])
+            self._suggest['after'] = None
+        self._suggest['generation'] += 1
+        self.suggest_box.place_forget()
+
+    def _sync_search_indexes(self):
+        """Pick up newly inserted movies/cast in the search and suggestion indexes."""
+        self.executor.submit(search_engine.sync)
+        self.executor.submit(suggest_index.sync)
+
+    # ========== BACKGROUND IMPORTS ==========
+    def _start_import(self, title, fn, file_path, on_done=None):
+        """Queue fn(file_path, job=...) as a background import with a progress row.
+
+        on_done(counts) runs on the UI thread when the import finishes; errors
+        are reported with a messagebox instead.
+        """
+        job = self.jobs.submit(ImportJob(title, file_path, on_done), fn, file_path)
+        self._poll_jobs()
+        return job
+
+    def _job_row(self, job):
+        row = ctk.CTkFrame(self.jobs_bar, fg_color=IMDB_GRAY)
+        row.pack(fill="x", padx=12, pady=4)
+        ctk.CTkLabel(row, text=job.title, font=FONT_NORMAL, text_color=IMDB_YELLOW, width=180, anchor="w").pack(side="left")
+        bar = ctk.CTkProgressBar(row, width=320, progress_color=IMDB_YELLOW)
+        bar.set(0)
+        bar.pack(side="left", padx=8)
+        status = ctk.CTkLabel(row, text="Queued", font=FONT_NORMAL, text_color="white", anchor="w")
+        status.pack(side="left", padx=8, fill="x", expand=True)
+        cancel = ctk.CTkButton(row, text="Cancel", width=80, fg_color="#444444", command=job.cancel)
+        cancel.pack(side="right", padx=(0, 4))
+        return {'frame': row, 'bar': bar, 'status': status, 'cancel': cancel, 'handled': False}
+
+    def _poll_jobs(self):
+        """Refresh the progress rows from the job snapshots while any job is listed."""
+        if self._jobs_after is not None:
+            self.after_cancel(self._jobs_after)
+            self._jobs_after = None
+        jobs = self.jobs.jobs()
+        for job in jobs:
+            widgets = self._job_rows.get(job)
+            if widgets is None:
+                widgets = self._job_rows[job] = self._job_row(job)
+            fraction, rate, eta, (inserted, skipped, failed) = job.snapshot()
+            if job.status == 'queued':
+                text = "Queued"
+            else:
+                text = f"{rate:,.0f} rows/s"
+                if eta is not None:
+                    text += f" • ETA {int(eta) // 60}:{int(eta) % 60:02d}"
+                text += f" • Inserted {inserted} • Skipped {skipped} • Failed {failed}"
+                if job.status != 'running':
+                    text = f"{job.status.capitalize()} • {text}"
+            widgets['status'].configure(text=text, text_color="red" if job.status == 'failed' else "white")
+            if job.status == 'done':
+                widgets['bar'].set(1)
+            elif fraction is not None:
+                widgets['bar'].set(fraction)
+
+            if job.is_finished and not widgets['handled']:
+                widgets['handled'] = True
+                widgets['cancel'].configure(state="disabled")
+                if job.status == 'failed':
+                    messagebox.showerror("Import Error", f"Failed to import {job.title}: {job.error}")
+                elif job.status == 'done' and job.on_done:
+                    job.on_done(job.result)
+                self.after(5000, lambda j=job: self._dismiss_job(j))
+
+        if jobs:
+            if not self.jobs_bar.winfo_manager():
+                # pack ahead of the page frame so the page cannot squeeze the bar out
+                self.jobs_bar.pack(side="bottom", fill="x", before=self.page)
+            self._jobs_after = self.after(250, self._poll_jobs)
+        elif self.jobs_bar.winfo_manager():
+            self.jobs_bar.pack_forget()
+
+    def _dismiss_job(self, job):
+        self.jobs.remove(job)
+        widgets = self._job_rows.pop(job, None)
+        if widgets:
+            widgets['frame'].destroy()
+        self._poll_jobs()
+
     def clear_page(self):
         if self.page:
             self.page.destroy()
         self.page = ctk.CTkFrame(self, fg_color=IMDB_DARK_BG)
         self.page.pack(side="right", fill="both", expand=True)
 
+    def _prefetch_details(self, movie_ids):
+        """Warm the detail cache for movies that just came into view.
+
+        Debounced, so fast scrolling only prefetches where the view settles.
+        """
+        if self._prefetch_after is not None:
+            self.after_cancel(self._prefetch_after)
+        ids = list(movie_ids)[:DETAIL_PREFETCH_LIMIT]
+
+        def run():
+            self._prefetch_after = None
+            self.executor.submit(prefetch_movie_details, ids)
+
+        self._prefetch_after = self.after(150, run)
+
+    def _loading_label(self, master, text="Loading...", **pack_opts):
+        """Place a skeleton label that is replaced once the page data arrives."""
+        label = ctk.CTkLabel(master, text=text, font=FONT_NORMAL, text_color="#aaaaaa", bg_color=IMDB_DARK_BG)
+        label.pack(**(pack_opts or {'anchor': 'w', 'padx': 20, 'pady': 6}))
+        return label
+
+    def run_query(self, fn, *args, callback=None, loading=None, owner=None):
+        """Run fn(*args) on the query executor and hand the result to callback.
+
+        - callback(result) runs on the UI thread once the query finishes
+        - loading: optional skeleton label; destroyed on success, shows the error on failure
+        - owner: widget whose lifetime bounds the request (defaults to the current page)
+        """
+        def deliver(result):
+            if loading is not None:
+                loading.destroy()
+            if callback:
+                callback(result)
+
+        def failed(err):
+            if loading is not None:
+                loading.configure(text=f"Failed to load: {err}", text_color="red")
+            else:
+                print(f"Background query failed: {err}")
+
+        return self.executor.submit(fn, *args, callback=deliver, errback=failed, owner=owner or self.page)
+
+    def run_write(self, sql, params, callback=None, owner=None):
+        """db.execute(sql, params) on the query executor; a failure is shown in a dialog.
+
+        callback(lastrowid) runs on the UI thread once the write has committed.
+        """
+        return self.executor.submit(db.execute, sql, params, callback=callback,
+                                    errback=lambda err: messagebox.showerror('DB', f'Failed: {err}'), owner=owner or self)
+
     def _style_treeview(self, tree, heading_font=FONT_SUBHEADER, cell_font=FONT_NORMAL, rowheight=26):
         """Apply a consistent, IMDB-like style to a ttk.Treeview widget.
 
@@ -316,12 +4815,11 @@ class CineTrackIMDB(ctk.CTk):
             # just open search page
             self.show_search()
             return
-        try:
-            cursor.execute("SELECT 1 FROM cast_members WHERE name LIKE %s LIMIT 1", (f"%{q}%",))
-            found = cursor.fetchone()
-        except Exception:
-            found = None
-        self.show_search(initial_query=q, initial_cast=bool(found))
+        # Look the name up off the UI thread; the search page opens when it returns.
+        # Names only: a title mentioned in some actor's bio is still a title search.
+        self.executor.submit(is_cast_name, q,
+                             callback=lambda found: self.show_search(initial_query=q, initial_cast=found),
+                             errback=lambda err: self.show_search(initial_query=q, initial_cast=False))
 
     # ========== HOME PAGE ==========
     def show_home(self):
@@ -329,15 +4827,19 @@ class CineTrackIMDB(ctk.CTk):
         imdb_heading(self.page, "Welcome to CineTrack")
         imdb_subheading(self.page, "Your personalized movie, series, and cast database")
 
-        # Show 5 random highlighted movies
-        cursor.execute("SELECT movie_id, movie_name, release_date, language, description FROM movies ORDER BY RAND() LIMIT 5")
-        rows = cursor.fetchall()
         ctk.CTkLabel(self.page, text="Hot Trending Movies:", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20, pady=(18,7))
 
         cards = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
         cards.pack(anchor="w", padx=20)
-        for r in rows:
-            self._movie_card(cards, r)
+        loading = self._loading_label(cards, anchor="w")
+
+        def fill(rows):
+            for r in rows:
+                self._movie_card(cards, r)
+            self._prefetch_details([r[0] for r in rows])
+
+        # A few movies sampled from the top of the trending ranking
+        self.run_query(fetch_trending, callback=fill, loading=loading)
 
     # ========== AUTH / USER MANAGEMENT ==========
     def open_auth_dialog(self):
@@ -365,21 +4867,27 @@ class CineTrackIMDB(ctk.CTk):
         status_lbl = ctk.CTkLabel(frame, text="", text_color='white')
         status_lbl.grid(row=3, column=0, columnspan=2, pady=(6,0))
 
+        def failed(err):
+            status_lbl.configure(text=f'Error: {err}')
+
         def do_login():
             uname = username_e.get().strip()
             pwd = pwd_e.get().strip()
             if not uname or not pwd:
                 status_lbl.configure(text='Enter username and password')
                 return
-            cursor.execute("SELECT user_id, username, password FROM users WHERE username=%s", (uname,))
-            r = cursor.fetchone()
-            if not r or not r[2] or r[2] != pwd:
-                status_lbl.configure(text='Invalid credentials')
-                return
-            self.current_user = (r[0], r[1])
-            self.account_btn.configure(text=r[1])
-            status_lbl.configure(text='Logged in')
-            dlg.destroy()
+
+            def logged_in(user):
+                if user is None:
+                    status_lbl.configure(text='Invalid credentials')
+                    return
+                self.current_user = user
+                self.account_btn.configure(text=user[1])
+                status_lbl.configure(text='Logged in')
+                dlg.destroy()
+
+            status_lbl.configure(text='Logging in...')
+            self.executor.submit(authenticate_user, uname, pwd, callback=logged_in, errback=failed, owner=dlg)
 
         def do_register():
             uname = username_e.get().strip()
@@ -388,22 +4896,12 @@ class CineTrackIMDB(ctk.CTk):
             if not uname or not pwd:
                 status_lbl.configure(text='Enter username and password')
                 return
-            cursor.execute("SELECT user_id FROM users WHERE username=%s", (uname,))
-            if cursor.fetchone():
-                status_lbl.configure(text='Username taken')
-                return
-            try:
-                cursor.execute("INSERT INTO users (username, email, password) VALUES (%s,%s,%s)", (uname, email, pwd))
-                conn.commit()
-                
-                # Get the new user ID
-                cursor.execute("SELECT user_id FROM users WHERE username=%s", (uname,))
-                uid = cursor.fetchone()[0]
-                
-                # Verify the trigger worked by checking the welcome donation
-                cursor.execute("SELECT COUNT(*) FROM donations WHERE user_id=%s AND comment='Welcome, user created!'", (uid,))
-                welcome_donation_exists = cursor.fetchone()[0] > 0
-                
+
+            def registered(result):
+                if result is None:
+                    status_lbl.configure(text='Username taken')
+                    return
+                uid, welcome_donation_exists = result
                 self.current_user = (uid, uname)
                 self.account_btn.configure(text=uname)
                 # Show welcome message including trigger confirmation BEFORE closing dialog
@@ -421,11 +4919,9 @@ class CineTrackIMDB(ctk.CTk):
                     status_lbl.configure(text='Registered and logged in')
                 except Exception:
                     pass
-                    
-            except Exception as e:
-                conn.rollback()
-                status_lbl.configure(text=f'Error: {e}')
-                return
+
+            status_lbl.configure(text='Registering...')
+            self.executor.submit(register_user, uname, email, pwd, callback=registered, errback=failed, owner=dlg)
 
         btn_frame = ctk.CTkFrame(frame)
         btn_frame.grid(row=4, column=0, columnspan=2, pady=12)
@@ -462,15 +4958,18 @@ class CineTrackIMDB(ctk.CTk):
             if not uname or not pwd:
                 messagebox.showerror('Input', 'Enter username and password')
                 return
-            cursor.execute('SELECT user_id, username, password FROM users WHERE username=%s', (uname,))
-            r = cursor.fetchone()
-            if not r or not r[2] or r[2] != pwd:
-                messagebox.showerror('Auth', 'Invalid credentials')
-                return
-            self.current_user = (r[0], r[1])
-            self.account_btn.configure(text=r[1])
-            messagebox.showinfo('Login', 'Logged in')
-            self.show_home()
+
+            def logged_in(user):
+                if user is None:
+                    messagebox.showerror('Auth', 'Invalid credentials')
+                    return
+                self.current_user = user
+                self.account_btn.configure(text=user[1])
+                messagebox.showinfo('Login', 'Logged in')
+                self.show_home()
+
+            self.executor.submit(authenticate_user, uname, pwd, callback=logged_in,
+                                 errback=lambda err: messagebox.showerror('DB', f'Failed: {err}'), owner=login_col)
 
         ctk.CTkButton(login_col, text='Login', fg_color=IMDB_YELLOW, command=do_login_page, width=140).pack(pady=(8,6))
 
@@ -495,22 +4994,12 @@ class CineTrackIMDB(ctk.CTk):
             if not uname or not pwd:
                 messagebox.showerror('Input', 'Enter username and password')
                 return
-            cursor.execute('SELECT user_id FROM users WHERE username=%s', (uname,))
-            if cursor.fetchone():
-                messagebox.showerror('Register', 'Username already exists')
-                return
-            try:
-                cursor.execute('INSERT INTO users (username, email, password) VALUES (%s,%s,%s)', (uname, email, pwd))
-                conn.commit()
-                
-                # Get the new user ID and verify trigger worked
-                cursor.execute('SELECT user_id FROM users WHERE username=%s', (uname,))
-                uid = cursor.fetchone()[0]
-                
-                # Check if welcome donation was created by trigger
-                cursor.execute("SELECT COUNT(*) FROM donations WHERE user_id=%s AND comment='Welcome, user created!'", (uid,))
-                welcome_donation_exists = cursor.fetchone()[0] > 0
-                
+
+            def registered(result):
+                if result is None:
+                    messagebox.showerror('Register', 'Username already exists')
+                    return
+                uid, welcome_donation_exists = result
                 self.current_user = (uid, uname)
                 self.account_btn.configure(text=uname)
                 # Show welcome message before navigating away from the page
@@ -524,11 +5013,9 @@ class CineTrackIMDB(ctk.CTk):
                     self.show_home()
                 except Exception:
                     pass
-                
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror('DB', f'Failed: {e}')
-                return
+
+            self.executor.submit(register_user, uname, email, pwd, callback=registered,
+                                 errback=lambda err: messagebox.showerror('DB', f'Failed: {err}'), owner=reg_col)
 
         ctk.CTkButton(reg_col, text='Register', fg_color=IMDB_YELLOW, command=do_register_page, width=140).pack(pady=(8,6))
 
@@ -559,11 +5046,13 @@ class CineTrackIMDB(ctk.CTk):
         scr.pack(side='right', fill='y')
         tree.pack(fill='both', expand=True)
 
-        cursor.execute("SELECT user_id, username, email FROM users ORDER BY username")
-        users = cursor.fetchall()
-        for i, u in enumerate(users):
-            tag = 'even' if i%2==0 else 'odd'
-            tree.insert('', 'end', iid=str(u[0]), values=(u[1], u[2] or ''), tags=(tag,))
+        def fill(users):
+            for i, u in enumerate(users):
+                tag = 'even' if i%2==0 else 'odd'
+                tree.insert('', 'end', iid=str(u[0]), values=(u[1], u[2] or ''), tags=(tag,))
+
+        self.run_query(db.fetchall, "SELECT user_id, username, email FROM users ORDER BY username",
+                       callback=fill, loading=self._loading_label(frame))
 
         # follow/unfollow buttons
         btns = ctk.CTkFrame(self.page)
@@ -589,13 +5078,8 @@ class CineTrackIMDB(ctk.CTk):
             if target == self.current_user[0]:
                 messagebox.showinfo('Follow', 'Cannot follow yourself')
                 return
-            try:
-                cursor.execute('INSERT INTO user_follow (follower_id, followed_id) VALUES (%s,%s)', (self.current_user[0], target))
-                conn.commit()
-                messagebox.showinfo('Follow', 'Now following')
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror('DB', f'Failed: {e}')
+            self.run_write('INSERT INTO user_follow (follower_id, followed_id) VALUES (%s,%s)', (self.current_user[0], target),
+                           callback=lambda _: messagebox.showinfo('Follow', 'Now following'))
 
         def on_unfollow():
             if not self.current_user:
@@ -606,13 +5090,8 @@ class CineTrackIMDB(ctk.CTk):
                 messagebox.showinfo('Select', 'Select a user to unfollow')
                 return
             target = int(sel[0])
-            try:
-                cursor.execute('DELETE FROM user_follow WHERE follower_id=%s AND followed_id=%s', (self.current_user[0], target))
-                conn.commit()
-                messagebox.showinfo('Unfollow', 'Unfollowed')
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror('DB', f'Failed: {e}')
+            self.run_write('DELETE FROM user_follow WHERE follower_id=%s AND followed_id=%s', (self.current_user[0], target),
+                           callback=lambda _: messagebox.showinfo('Unfollow', 'Unfollowed'))
 
         ctk.CTkButton(btns, text='View Profile', fg_color=IMDB_YELLOW, command=on_view, width=140).pack(side='left', padx=6)
         ctk.CTkButton(btns, text='Follow', fg_color=IMDB_YELLOW, command=on_follow, width=140).pack(side='left', padx=6)
@@ -620,38 +5099,46 @@ class CineTrackIMDB(ctk.CTk):
 
     def show_user_profile(self, user_id):
         self.clear_page()
-        cursor.execute('SELECT username, email FROM users WHERE user_id=%s', (user_id,))
-        r = cursor.fetchone()
-        if not r:
-            imdb_heading(self.page, 'User not found')
-            return
-        imdb_heading(self.page, r[0])
-        imdb_subheading(self.page, f"Email: {r[1] or 'N/A'}")
-
-        # Get total donations using the database function
-        try:
-            cursor.execute('SELECT total_donations(%s)', (user_id,))
-            total_donations = cursor.fetchone()[0] or 0.00
-            
-            # Create donation info frame
-            donation_frame = ctk.CTkFrame(self.page, fg_color=IMDB_GRAY)
-            donation_frame.pack(anchor='w', padx=20, pady=(8,0))
-            ctk.CTkLabel(donation_frame, 
-                        text=f"💰 Total Donations: ${total_donations:.2f}", 
-                        font=FONT_SUBHEADER, 
-                        text_color=IMDB_YELLOW, 
-                        bg_color=IMDB_GRAY).pack(anchor='w', padx=12, pady=8)
-        except Exception as e:
-            print(f"Error fetching donations: {e}")
-
-        # followers / following
-        cursor.execute('SELECT u.username FROM user_follow uf JOIN users u ON uf.follower_id=u.user_id WHERE uf.followed_id=%s', (user_id,))
-        followers = [x[0] for x in cursor.fetchall()]
-        cursor.execute('SELECT u.username FROM user_follow uf JOIN users u ON uf.followed_id=u.user_id WHERE uf.follower_id=%s', (user_id,))
-        following = [x[0] for x in cursor.fetchall()]
+        heading = imdb_heading(self.page, 'Loading...')
 
-        ctk.CTkLabel(self.page, text=f"Followers ({len(followers)}): " + (', '.join(followers) if followers else 'None'), font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG).pack(anchor='w', padx=20, pady=(12,0))
-        ctk.CTkLabel(self.page, text=f"Following ({len(following)}): " + (', '.join(following) if following else 'None'), font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG).pack(anchor='w', padx=20, pady=(6,12))
+        def load():
+            profile = {'user': db.fetchone('SELECT username, email FROM users WHERE user_id=%s', (user_id,))}
+            if not profile['user']:
+                return profile
+            # Get total donations using the database function
+            try:
+                profile['total_donations'] = db.fetchone('SELECT total_donations(%s)', (user_id,))[0] or 0.00
+            except Exception as e:
+                print(f"Error fetching donations: {e}")
+            # followers / following
+            profile['followers'] = [x[0] for x in db.named_fetchall('followers', (user_id,))]
+            profile['following'] = [x[0] for x in db.named_fetchall('following', (user_id,))]
+            return profile
+
+        def fill(profile):
+            r = profile['user']
+            if not r:
+                heading.configure(text='User not found')
+                return
+            heading.configure(text=r[0])
+            imdb_subheading(self.page, f"Email: {r[1] or 'N/A'}")
+
+            if 'total_donations' in profile:
+                # Create donation info frame
+                donation_frame = ctk.CTkFrame(self.page, fg_color=IMDB_GRAY)
+                donation_frame.pack(anchor='w', padx=20, pady=(8,0))
+                ctk.CTkLabel(donation_frame, 
+                            text=f"💰 Total Donations: ${profile['total_donations']:.2f}", 
+                            font=FONT_SUBHEADER, 
+                            text_color=IMDB_YELLOW, 
+                            bg_color=IMDB_GRAY).pack(anchor='w', padx=12, pady=8)
+
+            followers = profile['followers']
+            following = profile['following']
+            ctk.CTkLabel(self.page, text=f"Followers ({len(followers)}): " + (', '.join(followers) if followers else 'None'), font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG).pack(anchor='w', padx=20, pady=(12,0))
+            ctk.CTkLabel(self.page, text=f"Following ({len(following)}): " + (', '.join(following) if following else 'None'), font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG).pack(anchor='w', padx=20, pady=(6,12))
+
+        self.run_query(load, callback=fill, loading=self._loading_label(self.page))
 
     # ========== STUDIOS ==========
     def show_studios(self):
@@ -672,11 +5159,13 @@ class CineTrackIMDB(ctk.CTk):
         scr.pack(side='right', fill='y')
         tree.pack(fill='both', expand=True)
 
-        cursor.execute('SELECT s.studio_id, s.studio_name, s.country, COUNT(ms.movie_id) FROM studios s LEFT JOIN movie_studio ms ON s.studio_id=ms.studio_id GROUP BY s.studio_id ORDER BY s.studio_name')
-        rows = cursor.fetchall()
-        for i, r in enumerate(rows):
-            tag = 'even' if i%2==0 else 'odd'
-            tree.insert('', 'end', iid=str(r[0]), values=(r[1], r[2] or '', r[3]), tags=(tag,))
+        def fill(rows):
+            for i, r in enumerate(rows):
+                tag = 'even' if i%2==0 else 'odd'
+                tree.insert('', 'end', iid=str(r[0]), values=(r[1], r[2] or '', r[3]), tags=(tag,))
+
+        self.run_query(catalog.fetchall, 'SELECT s.studio_id, s.studio_name, s.country, COUNT(ms.movie_id) FROM studios s LEFT JOIN movie_studio ms ON s.studio_id=ms.studio_id GROUP BY s.studio_id ORDER BY s.studio_name',
+                       callback=fill, loading=self._loading_label(frame))
 
         ctrl = ctk.CTkFrame(self.page)
         ctrl.pack(pady=(8,0))
@@ -687,9 +5176,8 @@ class CineTrackIMDB(ctk.CTk):
                 messagebox.showinfo('Select', 'Select a studio')
                 return
             sid = int(sel[0])
+            nm = tree.item(sel[0], 'values')[0]
             self.clear_page()
-            cursor.execute('SELECT studio_name FROM studios WHERE studio_id=%s', (sid,))
-            nm = cursor.fetchone()[0]
             imdb_heading(self.page, nm)
             imdb_subheading(self.page, 'Movies by this studio')
             tf = ctk.CTkFrame(self.page)
@@ -704,10 +5192,14 @@ class CineTrackIMDB(ctk.CTk):
             t2.configure(yscrollcommand=sc.set)
             sc.pack(side='right', fill='y')
             t2.pack(fill='both', expand=True)
-            cursor.execute('SELECT m.movie_name, YEAR(m.release_date) FROM movie_studio ms JOIN movies m ON ms.movie_id=m.movie_id WHERE ms.studio_id=%s ORDER BY m.release_date DESC', (sid,))
-            for i, mv in enumerate(cursor.fetchall()):
-                tag = 'even' if i%2==0 else 'odd'
-                t2.insert('', 'end', values=mv, tags=(tag,))
+
+            def fill_movies(movies):
+                for i, mv in enumerate(movies):
+                    tag = 'even' if i%2==0 else 'odd'
+                    t2.insert('', 'end', values=mv, tags=(tag,))
+
+            self.run_query(catalog.fetchall, 'SELECT m.movie_name, YEAR(m.release_date) FROM movie_studio ms JOIN movies m ON ms.movie_id=m.movie_id WHERE ms.studio_id=%s ORDER BY m.release_date DESC', (sid,),
+                           callback=fill_movies, loading=self._loading_label(tf))
 
         def on_add_studio():
             dlg = ctk.CTkToplevel(self)
@@ -729,15 +5221,13 @@ class CineTrackIMDB(ctk.CTk):
                 if not nm:
                     messagebox.showerror('Input', 'Enter studio name')
                     return
-                try:
-                    cursor.execute('INSERT INTO studios (studio_name, country) VALUES (%s,%s)', (nm, cnt))
-                    conn.commit()
+
+                def added(_):
                     messagebox.showinfo('Added', 'Studio added')
                     dlg.destroy()
                     self.show_studios()
-                except Exception as e:
-                    conn.rollback()
-                    messagebox.showerror('DB', f'Failed: {e}')
+
+                self.run_write('INSERT INTO studios (studio_name, country) VALUES (%s,%s)', (nm, cnt), callback=added, owner=dlg)
 
             ctk.CTkButton(fr, text='Add', fg_color=IMDB_YELLOW, command=submit).grid(row=2, column=0, columnspan=2, pady=8)
 
@@ -745,26 +5235,10 @@ class CineTrackIMDB(ctk.CTk):
         ctk.CTkButton(ctrl, text='Add Studio', fg_color=IMDB_YELLOW, command=on_add_studio, width=140).pack(side='left', padx=6)
 
     # ========== WATCHLIST ==========
-    def _ensure_watchlist_table(self):
-        try:
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_watchlist (
-                    watchlist_id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    movie_id INT NOT NULL,
-                    added_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE KEY ux_user_movie (user_id, movie_id)
-                ) ENGINE=InnoDB
-            ''')
-            conn.commit()
-        except Exception:
-            conn.rollback()
-
     def show_watchlist(self):
         if not self.current_user:
             messagebox.showerror('Auth', 'Login to view your watchlist')
             return
-        self._ensure_watchlist_table()
         self.clear_page()
         imdb_heading(self.page, f"{self.current_user[1]}'s Watchlist")
         frame = ctk.CTkFrame(self.page)
@@ -780,10 +5254,15 @@ class CineTrackIMDB(ctk.CTk):
         scr.pack(side='right', fill='y')
         tree.pack(fill='both', expand=True)
 
-        cursor.execute('SELECT m.movie_id, m.movie_name, uw.added_date FROM user_watchlist uw JOIN movies m ON uw.movie_id=m.movie_id WHERE uw.user_id=%s ORDER BY uw.added_date DESC', (self.current_user[0],))
-        for i, r in enumerate(cursor.fetchall()):
-            tag = 'even' if i%2==0 else 'odd'
-            tree.insert('', 'end', iid=str(r[0]), values=(r[1], r[2]), tags=(tag,))
+        def load(user_id):
+            return db.named_fetchall('user_watchlist', (user_id,))
+
+        def fill(rows):
+            for i, r in enumerate(rows):
+                tag = 'even' if i%2==0 else 'odd'
+                tree.insert('', 'end', iid=str(r[0]), values=(r[1], r[2]), tags=(tag,))
+
+        self.run_query(load, self.current_user[0], callback=fill, loading=self._loading_label(frame))
 
         def remove_selected():
             sel = tree.selection()
@@ -791,13 +5270,8 @@ class CineTrackIMDB(ctk.CTk):
                 messagebox.showinfo('Select', 'Select a movie to remove')
                 return
             mid = int(sel[0])
-            try:
-                cursor.execute('DELETE FROM user_watchlist WHERE user_id=%s AND movie_id=%s', (self.current_user[0], mid))
-                conn.commit()
-                self.show_watchlist()
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror('DB', f'Failed: {e}')
+            self.run_write('DELETE FROM user_watchlist WHERE user_id=%s AND movie_id=%s', (self.current_user[0], mid),
+                           callback=lambda _: self.show_watchlist(), owner=tree)
 
         btnf = ctk.CTkFrame(self.page)
         btnf.pack(pady=(8,0))
@@ -824,21 +5298,28 @@ class CineTrackIMDB(ctk.CTk):
         scr.pack(side='right', fill='y')
         tree.pack(fill='both', expand=True)
 
-        try:
-            cursor.execute('SELECT audit_id, rating_id, old_rating, new_rating, changed_by, changed_at FROM ratings_audit ORDER BY changed_at DESC')
-            for i, r in enumerate(cursor.fetchall()):
+        def fill(rows):
+            for i, r in enumerate(rows):
                 tag = 'even' if i%2==0 else 'odd'
                 tree.insert('', 'end', values=r, tags=(tag,))
-        except Exception:
-            messagebox.showerror('DB', 'ratings_audit table not available')
+
+        self.executor.submit(db.fetchall, 'SELECT audit_id, rating_id, old_rating, new_rating, changed_by, changed_at FROM ratings_audit ORDER BY changed_at DESC',
+                             callback=fill, errback=lambda err: messagebox.showerror('DB', 'ratings_audit table not available'), owner=self.page)
 
 
     # ========== MOVIES ==========
     def show_movies(self):
         self.clear_page()
         imdb_heading(self.page, "Movies Library")
+        body = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
+        body.pack(fill='both', expand=True)
+        panel = ctk.CTkScrollableFrame(body, fg_color=IMDB_GRAY, width=230)
+        panel.pack(side='left', fill='y', padx=(20, 0), pady=12)
+        right = ctk.CTkFrame(body, fg_color=IMDB_DARK_BG)
+        right.pack(side='left', fill='both', expand=True)
         # Card grid for movies (IMDB-style posters)
-        self._movie_card_grid()
+        grid, load_btn = self._movie_card_grid(right)
+        self._movie_facet_panel(panel, grid, load_btn)
 
     def import_movies_csv(self):
         """Open a CSV file and bulk-insert movies.
@@ -849,75 +5330,66 @@ class CineTrackIMDB(ctk.CTk):
         - skip movies that already exist (same title + release_date)
         - create missing genres and link them via movie_genre
         """
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(title="Select CSV file", filetypes=[("CSV files", "*.csv")])
         if not file_path:
             return
+        self._start_import("Movies CSV", self.import_movies_csv_from_path, file_path,
+                           on_done=lambda c: messagebox.showinfo("Import Complete", f"Inserted: {c[0]}\nSkipped: {c[1]}\nFailed: {c[2]}"))
 
+    def import_movies_csv_from_path(self, file_path, job=None):
+        """Worker side of import_movies_csv. Returns (inserted, skipped, failed)."""
         inserted = 0
         skipped = 0
         failed = 0
-
-        try:
-            with open(file_path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # flexible header names
-                    title = (row.get('title') or row.get('movie_name') or row.get('name') or '').strip()
-                    release_date = (row.get('release_date') or row.get('date') or row.get('year') or '').strip()
-                    language = (row.get('language') or '').strip()
-                    description = (row.get('description') or row.get('summary') or '').strip()
-                    genres_raw = (row.get('genres') or row.get('genre') or '').strip()
-
-                    if not title or not release_date:
-                        skipped += 1
-                        continue
-
-                    # If year-only provided, convert to YYYY-01-01
-                    if re.fullmatch(r"\d{4}$", release_date):
-                        release_date = release_date + "-01-01"
-
+        rows = 0
+
+        with db.transaction() as cursor:
+            # rows are parsed in worker processes; this thread only writes
+            for records, chunk_skipped, chunk_failed, end in iter_csv_records(file_path, normalize_movie_row, movie_record_key):
+                rows += len(records) + chunk_skipped + chunk_failed
+                skipped += chunk_skipped
+                failed += chunk_failed
+                for title, release_date, language, description, genres in records:
                     try:
                         # avoid duplicates (same title + release_date)
-                        cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s AND release_date=%s", (title, release_date))
-                        if cursor.fetchone():
+                        if cursor.statements.fetchone('movie_by_name_date', (title, release_date)):
                             skipped += 1
                             continue
 
                         cursor.execute(
                             "INSERT INTO movies (movie_name, release_date, language, description) VALUES (%s,%s,%s,%s)",
-                            (title, release_date, language or None, description or None)
+                            (title, release_date, language, description)
                         )
                         movie_id = cursor.lastrowid
 
                         # handle genres
-                        if genres_raw:
-                            parts = [p.strip() for p in re.split(r'[,|;]', genres_raw) if p.strip()]
-                            for g in parts:
-                                cursor.execute("SELECT genre_id FROM genres WHERE genre_name=%s", (g,))
-                                res = cursor.fetchone()
-                                if res:
-                                    gid = res[0]
-                                else:
-                                    cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (g,))
-                                    gid = cursor.lastrowid
-                                # link
-                                try:
-                                    cursor.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s,%s)", (movie_id, gid))
-                                except Exception:
-                                    # ignore duplicate links                                    python -m pip install customtkinter mysql-connector-python
-                                    pass
+                        for g in genres:
+                            res = cursor.statements.fetchone('genre_by_name', (g,))
+                            if res:
+                                gid = res[0]
+                            else:
+                                cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (g,))
+                                gid = cursor.lastrowid
+                            # link
+                            try:
+                                cursor.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s,%s)", (movie_id, gid))
+                            except Exception:
+                                # ignore duplicate links
+                                pass
 
                         inserted += 1
                     except Exception as e:
                         failed += 1
                         print("Error importing row:", e)
+                if job is not None:
+                    job.report(end, rows, (inserted, skipped, failed))
+                    if job.cancelled:
+                        # keep what was written so far
+                        break
 
-            conn.commit()
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Failed to import CSV: {e}")
-            return
-
-        messagebox.showinfo("Import Complete", f"Inserted: {inserted}\nSkipped: {skipped}\nFailed: {failed}")
+        self._sync_search_indexes()
+        return (inserted, skipped, failed)
 
     def import_all_csv(self):
         """Open a CSV file and import rows into the full database.
@@ -932,515 +5404,634 @@ class CineTrackIMDB(ctk.CTk):
         the specification printed by the function (messagebox) for expected
         column names for each type.
         """
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(title="Select full-database CSV", filetypes=[("CSV files", "*.csv")])
         if not file_path:
             return
 
-        inserted, skipped, failed = self.import_all_csv_from_path(file_path)
-        messagebox.showinfo("Import Complete", f"Inserted: {inserted}\nSkipped: {skipped}\nFailed: {failed}")
+        self._start_import("Full database CSV", self.import_all_csv_from_path, file_path,
+                           on_done=lambda c: messagebox.showinfo("Import Complete", f"Inserted: {c[0]}\nSkipped: {c[1]}\nFailed: {c[2]}"))
 
-    def import_all_csv_from_path(self, file_path):
+    def import_all_csv_from_path(self, file_path, mode=None, batch_size=IMPORT_BATCH_SIZE, job=None):
         """Helper to import a CSV where each row has a 'type' column.
 
-        Returns (inserted, skipped, failed).
+        mode picks the write path:
+        - 'load_data': LoadDataImporter (LOAD DATA LOCAL INFILE + INSERT ... SELECT),
+          falling back to 'bulk' when LOCAL INFILE is disabled
+        - 'bulk': BulkImporter, inserts batched with executemany
+        - 'row': the original one-statement-per-row path
+        None chooses 'load_data' for files of IMPORT_LOAD_DATA_MIN_BYTES or more
+        and 'bulk' otherwise. Returns (inserted, skipped, failed).
+
+        A file whose fingerprint (FileFingerprint) matches its last completed
+        import is skipped and returns (0, 0, 0); a file that only grew imports
+        just the appended rows (except in 'row' mode, which always reads the
+        whole file).
+
+        Meant to run as a background ImportJob (see _start_import): progress
+        goes to `job`, cancellation is honoured between chunks, and errors are
+        raised for the job to report rather than shown here.
         """
-        def parse_date(date_str):
-            if not date_str:
-                return None
-            date_str = date_str.strip()
-            if re.fullmatch(r"\d{4}$", date_str):
-                return date_str + "-01-01"
+        fingerprint = FileFingerprint(file_path)
+        start_offset = fingerprint.pending_offset()
+        if start_offset is None:
+            print(f"{file_path} is unchanged since its last import; skipping")
+            return (0, 0, 0)
+        if start_offset:
+            print(f"{file_path} grew since its last import; importing from byte {start_offset}")
+
+        if mode is None:
+            large = fingerprint.size - start_offset >= IMPORT_LOAD_DATA_MIN_BYTES
+            mode = 'load_data' if large else 'bulk'
+        if mode == 'load_data':
             try:
-                datetime.datetime.strptime(date_str, '%Y-%m-%d')
-                return date_str
-            except:
-                return None
-
+                counts = LoadDataImporter(db, job).run(file_path, start_offset)
+            except LocalInfileDisabled as e:
+                print(f"LOAD DATA LOCAL INFILE unavailable ({e}); using batched inserts")
+                mode = 'bulk'
+            else:
+                self._sync_search_indexes()
+        if mode == 'bulk':
+            counts = self._bulk_import_csv(file_path, batch_size, job, start_offset, fingerprint.sha256)
+        elif mode == 'row':
+            counts = self._row_import_csv(file_path, job)
+
+        if job is None or not job.cancelled:
+            fingerprint.save()
+        return counts
+
+    def _row_import_csv(self, file_path, job=None):
+        """The original one-statement-per-row typed import (mode='row')."""
+        import csv
         inserted = skipped = failed = 0
         error_rows = []
         row_num = 0
-        try:
-            with open(file_path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    row_num += 1
-                    typ = (row.get('type') or row.get('record_type') or '').strip().lower()
-                    if not typ:
-                        skipped += 1
-                        continue
-
-                    try:
-                        if typ in ('user', 'users'):
-                            username = (row.get('username') or row.get('user') or '').strip()
-                            email = (row.get('email') or '').strip() or None
-                            password = (row.get('password') or '').strip() or 'changeme'
-                            if not username:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT user_id FROM users WHERE username=%s", (username,))
-                            if cursor.fetchone():
-                                skipped += 1
-                                continue
-                            if email:
-                                cursor.execute("SELECT user_id FROM users WHERE email=%s", (email,))
-                                if cursor.fetchone():
-                                    skipped += 1
-                                    continue
-                            cursor.execute("INSERT INTO users (username, email, password) VALUES (%s,%s,%s)", (username, email, password))
-                            inserted += 1
-
-                        elif typ in ('movie', 'movies'):
-                            title = (row.get('title') or row.get('movie_name') or row.get('name') or '').strip()
-                            release_date = parse_date(row.get('release_date') or row.get('date') or row.get('year') or '')
-                            language = (row.get('language') or '').strip() or None
-                            description = (row.get('description') or row.get('summary') or '').strip() or None
-                            if not title:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s AND (release_date=%s OR %s IS NULL)", (title, release_date, release_date))
-                            if cursor.fetchone():
-                                skipped += 1
-                                continue
-                            cursor.execute("INSERT INTO movies (movie_name, release_date, language, description) VALUES (%s,%s,%s,%s)", (title, release_date, language, description))
-                            inserted += 1
-
-                        elif typ in ('genre', 'genres'):
-                            gname = (row.get('genre_name') or row.get('name') or row.get('genre') or '').strip()
-                            if not gname:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT genre_id FROM genres WHERE genre_name=%s", (gname,))
-                            if cursor.fetchone():
-                                skipped += 1
-                                continue
-                            cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (gname,))
-                            inserted += 1
+        with db.transaction() as cursor, open(file_path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                row_num += 1
+                if job is not None and row_num % 500 == 0:
+                    if job.cancelled:
+                        break
+                    job.report(None, row_num, (inserted, skipped, failed))
+                typ = (row.get('type') or row.get('record_type') or '').strip().lower()
+                if not typ:
+                    skipped += 1
+                    continue
 
-                        elif typ in ('cast', 'cast_member', 'cast_members'):
-                            name = (row.get('name') or row.get('actor') or '').strip()
-                            dob = parse_date(row.get('dob') or row.get('birthdate') or '')
-                            bio = (row.get('bio') or row.get('biography') or '').strip() or None
-                            age = row.get('age') or None
-                            if not name:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT cast_id FROM cast_members WHERE name=%s", (name,))
-                            if cursor.fetchone():
+                try:
+                    if typ in ('user', 'users'):
+                        username = (row.get('username') or row.get('user') or '').strip()
+                        email = (row.get('email') or '').strip() or None
+                        password = (row.get('password') or '').strip() or 'changeme'
+                        if not username:
+                            skipped += 1
+                            continue
+                        if cursor.statements.fetchone('user_by_username', (username,)):
+                            skipped += 1
+                            continue
+                        if email:
+                            if cursor.statements.fetchone('user_by_email', (email,)):
                                 skipped += 1
                                 continue
-                            cursor.execute("INSERT INTO cast_members (name, dob, bio, age) VALUES (%s,%s,%s,%s)", (name, dob, bio, age))
-                            inserted += 1
+                        cursor.execute("INSERT INTO users (username, email, password) VALUES (%s,%s,%s)", (username, email, password))
+                        inserted += 1
 
-                        elif typ in ('studio', 'studios'):
-                            sname = (row.get('studio_name') or row.get('name') or '').strip()
-                            country = (row.get('country') or '').strip() or None
-                            if not sname:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT studio_id FROM studios WHERE studio_name=%s", (sname,))
-                            if cursor.fetchone():
-                                skipped += 1
-                                continue
-                            cursor.execute("INSERT INTO studios (studio_name, country) VALUES (%s,%s)", (sname, country))
-                            inserted += 1
+                    elif typ in ('movie', 'movies'):
+                        title = (row.get('title') or row.get('movie_name') or row.get('name') or '').strip()
+                        release_date = _parse_import_date(row.get('release_date') or row.get('date') or row.get('year') or '')
+                        language = (row.get('language') or '').strip() or None
+                        description = (row.get('description') or row.get('summary') or '').strip() or None
+                        if not title:
+                            skipped += 1
+                            continue
+                        if cursor.statements.fetchone('movie_by_name_any_date', (title, release_date, release_date)):
+                            skipped += 1
+                            continue
+                        cursor.execute("INSERT INTO movies (movie_name, release_date, language, description) VALUES (%s,%s,%s,%s)", (title, release_date, language, description))
+                        inserted += 1
 
-                        elif typ in ('platform', 'streaming_platform', 'streaming_platforms'):
-                            pname = (row.get('platform_name') or row.get('name') or '').strip()
-                            sub = (row.get('subscription_type') or row.get('subscription') or '').strip() or None
-                            if not pname:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT platform_id FROM streaming_platforms WHERE platform_name=%s", (pname,))
-                            if cursor.fetchone():
-                                skipped += 1
-                                continue
-                            cursor.execute("INSERT INTO streaming_platforms (platform_name, subscription_type) VALUES (%s,%s)", (pname, sub))
-                            inserted += 1
+                    elif typ in ('genre', 'genres'):
+                        gname = (row.get('genre_name') or row.get('name') or row.get('genre') or '').strip()
+                        if not gname:
+                            skipped += 1
+                            continue
+                        if cursor.statements.fetchone('genre_by_name', (gname,)):
+                            skipped += 1
+                            continue
+                        cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (gname,))
+                        inserted += 1
 
-                        elif typ in ('episode', 'episodes'):
-                            series_title = (row.get('series_title') or row.get('title') or row.get('movie_name') or '').strip()
-                            season_raw = (row.get('season') or row.get('season_number') or '').strip()
-                            ep_raw = (row.get('episode') or row.get('episode_number') or '').strip()
-                            ep_title = (row.get('episode_title') or row.get('episode_title') or row.get('ep_title') or row.get('title') or '').strip() or None
-                            release_date = parse_date(row.get('release_date') or row.get('air_date') or row.get('date') or '')
-                            try:
-                                season = int(season_raw) if season_raw else 1
-                            except:
-                                season = 1
-                            try:
-                                episode_number = int(ep_raw) if ep_raw else None
-                            except:
-                                episode_number = None
-                            if not series_title:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (series_title,))
-                            res = cursor.fetchone()
-                            if res:
-                                movie_id = res[0]
-                            else:
-                                cursor.execute("INSERT INTO movies (movie_name, release_date) VALUES (%s,%s)", (series_title, release_date))
-                                movie_id = cursor.lastrowid
+                    elif typ in ('cast', 'cast_member', 'cast_members'):
+                        name = (row.get('name') or row.get('actor') or '').strip()
+                        dob = _parse_import_date(row.get('dob') or row.get('birthdate') or '')
+                        bio = (row.get('bio') or row.get('biography') or '').strip() or None
+                        age = row.get('age') or None
+                        if not name:
+                            skipped += 1
+                            continue
+                        if cursor.statements.fetchone('cast_by_name', (name,)):
+                            skipped += 1
+                            continue
+                        cursor.execute("INSERT INTO cast_members (name, dob, bio, age) VALUES (%s,%s,%s,%s)", (name, dob, bio, age))
+                        inserted += 1
 
-                            if episode_number is not None:
-                                cursor.execute("SELECT episode_id FROM episodes WHERE movie_id=%s AND season_number=%s AND episode_number=%s", (movie_id, season, episode_number))
-                                if cursor.fetchone():
-                                    skipped += 1
-                                    continue
+                    elif typ in ('studio', 'studios'):
+                        sname = (row.get('studio_name') or row.get('name') or '').strip()
+                        country = (row.get('country') or '').strip() or None
+                        if not sname:
+                            skipped += 1
+                            continue
+                        if cursor.statements.fetchone('studio_by_name', (sname,)):
+                            skipped += 1
+                            continue
+                        cursor.execute("INSERT INTO studios (studio_name, country) VALUES (%s,%s)", (sname, country))
+                        inserted += 1
 
-                            # use column names compatible with the rest of the app
-                            cursor.execute("INSERT INTO episodes (movie_id, season_number, episode_title, episode_number, release_date) VALUES (%s,%s,%s,%s,%s)", (movie_id, season, ep_title or None, episode_number, release_date or None))
-                            inserted += 1
+                    elif typ in ('platform', 'streaming_platform', 'streaming_platforms'):
+                        pname = (row.get('platform_name') or row.get('name') or '').strip()
+                        sub = (row.get('subscription_type') or row.get('subscription') or '').strip() or None
+                        if not pname:
+                            skipped += 1
+                            continue
+                        if cursor.statements.fetchone('platform_by_name', (pname,)):
+                            skipped += 1
+                            continue
+                        cursor.execute("INSERT INTO streaming_platforms (platform_name, subscription_type) VALUES (%s,%s)", (pname, sub))
+                        inserted += 1
 
-                        elif typ in ('review', 'reviews', 'rating', 'ratings'):
-                            uname = (row.get('username') or row.get('user') or '').strip()
-                            title = (row.get('title') or row.get('movie_name') or '').strip()
-                            raw_rating = row.get('rating') or ''
-                            # normalize rating to DB DECIMAL(2,1). Accept formats: 8, 8.5, 80, 8/10, 80%, etc.
-                            rating = None
-                            if raw_rating is not None and str(raw_rating).strip() != '':
-                                try:
-                                    s = str(raw_rating).strip()
-                                    if '/' in s:
-                                        a, b = s.split('/')[:2]
-                                        num = float(a)
-                                        den = float(b) if b else 10.0
-                                        val = (num / den) * 10.0
-                                    elif s.endswith('%'):
-                                        val = float(s.rstrip('%')) / 10.0
-                                    else:
-                                        val = float(s)
-                                        if val > 10 and val <= 100:
-                                            val = val / 10.0
-                                    # clamp and round to one decimal place
-                                    val = round(max(0.0, min(9.9, val)), 1)
-                                    rating = val
-                                except Exception:
-                                    rating = None
-                            comment = (row.get('comment') or row.get('review') or '').strip() or None
-                            if not uname or not title:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT user_id FROM users WHERE username=%s", (uname,))
-                            ures = cursor.fetchone()
-                            if not ures:
-                                # create minimal user
-                                cursor.execute("INSERT INTO users (username, password) VALUES (%s,%s)", (uname, 'changeme'))
-                                uid = cursor.lastrowid
-                            else:
-                                uid = ures[0]
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (title,))
-                            mres = cursor.fetchone()
-                            if not mres:
-                                cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
-                                mid = cursor.lastrowid
-                            else:
-                                mid = mres[0]
-                            cursor.execute("INSERT INTO reviews_ratings (user_id, movie_id, rating, comment) VALUES (%s,%s,%s,%s)", (uid, mid, rating, comment))
-                            inserted += 1
+                    elif typ in ('episode', 'episodes'):
+                        series_title = (row.get('series_title') or row.get('title') or row.get('movie_name') or '').strip()
+                        season_raw = (row.get('season') or row.get('season_number') or '').strip()
+                        ep_raw = (row.get('episode') or row.get('episode_number') or '').strip()
+                        ep_title = (row.get('episode_title') or row.get('episode_title') or row.get('ep_title') or row.get('title') or '').strip() or None
+                        release_date = _parse_import_date(row.get('release_date') or row.get('air_date') or row.get('date') or '')
+                        try:
+                            season = int(season_raw) if season_raw else 1
+                        except:
+                            season = 1
+                        try:
+                            episode_number = int(ep_raw) if ep_raw else None
+                        except:
+                            episode_number = None
+                        if not series_title:
+                            skipped += 1
+                            continue
+                        res = cursor.statements.fetchone('movie_by_name', (series_title,))
+                        if res:
+                            movie_id = res[0]
+                        else:
+                            cursor.execute("INSERT INTO movies (movie_name, release_date) VALUES (%s,%s)", (series_title, release_date))
+                            movie_id = cursor.lastrowid
 
-                        elif typ in ('movie_genre',):
-                            title = (row.get('title') or row.get('movie_name') or '').strip()
-                            gname = (row.get('genre') or row.get('genre_name') or '').strip()
-                            if not title or not gname:
+                        if episode_number is not None:
+                            if cursor.statements.fetchone('episode_exists', (movie_id, season, episode_number)):
                                 skipped += 1
                                 continue
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (title,))
-                            mres = cursor.fetchone()
-                            if not mres:
-                                cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
-                                mid = cursor.lastrowid
-                            else:
-                                mid = mres[0]
-                            cursor.execute("SELECT genre_id FROM genres WHERE genre_name=%s", (gname,))
-                            gres = cursor.fetchone()
-                            if not gres:
-                                cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (gname,))
-                                gid = cursor.lastrowid
-                            else:
-                                gid = gres[0]
-                            # avoid duplicate junction inserts
-                            cursor.execute("SELECT 1 FROM movie_genre WHERE movie_id=%s AND genre_id=%s", (mid, gid))
-                            if not cursor.fetchone():
-                                cursor.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s,%s)", (mid, gid))
-                            inserted += 1
 
-                        elif typ in ('movie_cast',):
-                            title = (row.get('title') or row.get('movie_name') or '').strip()
-                            actor = (row.get('actor') or row.get('name') or '').strip()
-                            role = (row.get('role') or '').strip() or None
-                            char = (row.get('character_name') or row.get('character') or '').strip() or None
-                            if not title or not actor:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (title,))
-                            mres = cursor.fetchone()
-                            if not mres:
-                                cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
-                                mid = cursor.lastrowid
-                            else:
-                                mid = mres[0]
-                            cursor.execute("SELECT cast_id FROM cast_members WHERE name=%s", (actor,))
-                            cres = cursor.fetchone()
-                            if not cres:
-                                cursor.execute("INSERT INTO cast_members (name) VALUES (%s)", (actor,))
-                                cid = cursor.lastrowid
-                            else:
-                                cid = cres[0]
-                            # avoid duplicate movie_cast
-                            cursor.execute("SELECT 1 FROM movie_cast WHERE movie_id=%s AND cast_id=%s", (mid, cid))
-                            if not cursor.fetchone():
-                                cursor.execute("INSERT INTO movie_cast (movie_id, cast_id, role, character_name) VALUES (%s,%s,%s,%s)", (mid, cid, role, char))
-                            inserted += 1
+                        # use column names compatible with the rest of the app
+                        cursor.execute("INSERT INTO episodes (movie_id, season_number, title, episode_number, air_date) VALUES (%s,%s,%s,%s,%s)", (movie_id, season, ep_title or None, episode_number, release_date or None))
+                        inserted += 1
 
-                        elif typ in ('movie_studio',):
-                            title = (row.get('title') or row.get('movie_name') or '').strip()
-                            sname = (row.get('studio_name') or row.get('studio') or '').strip()
-                            if not title or not sname:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (title,))
-                            mres = cursor.fetchone()
-                            if not mres:
-                                cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
-                                mid = cursor.lastrowid
-                            else:
-                                mid = mres[0]
-                            cursor.execute("SELECT studio_id FROM studios WHERE studio_name=%s", (sname,))
-                            sres = cursor.fetchone()
-                            if not sres:
-                                cursor.execute("INSERT INTO studios (studio_name) VALUES (%s)", (sname,))
-                                sid = cursor.lastrowid
-                            else:
-                                sid = sres[0]
-                            cursor.execute("SELECT 1 FROM movie_studio WHERE movie_id=%s AND studio_id=%s", (mid, sid))
-                            if not cursor.fetchone():
-                                cursor.execute("INSERT INTO movie_studio (movie_id, studio_id) VALUES (%s,%s)", (mid, sid))
-                            inserted += 1
+                    elif typ in ('review', 'reviews', 'rating', 'ratings'):
+                        uname = (row.get('username') or row.get('user') or '').strip()
+                        title = (row.get('title') or row.get('movie_name') or '').strip()
+                        rating = _parse_import_rating(row.get('rating') or '')
+                        comment = (row.get('comment') or row.get('review') or '').strip() or None
+                        if not uname or not title:
+                            skipped += 1
+                            continue
+                        ures = cursor.statements.fetchone('user_by_username', (uname,))
+                        if not ures:
+                            # create minimal user
+                            cursor.execute("INSERT INTO users (username, password) VALUES (%s,%s)", (uname, 'changeme'))
+                            uid = cursor.lastrowid
+                        else:
+                            uid = ures[0]
+                        mres = cursor.statements.fetchone('movie_by_name', (title,))
+                        if not mres:
+                            cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
+                            mid = cursor.lastrowid
+                        else:
+                            mid = mres[0]
+                        cursor.execute("INSERT INTO reviews_ratings (user_id, movie_id, rating, comment) VALUES (%s,%s,%s,%s)", (uid, mid, rating, comment))
+                        inserted += 1
 
-                        elif typ in ('movie_platform',):
-                            title = (row.get('title') or row.get('movie_name') or '').strip()
-                            pname = (row.get('platform_name') or row.get('platform') or '').strip()
-                            avail = parse_date(row.get('availability_date') or row.get('availability') or '')
-                            if not title or not pname:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (title,))
-                            mres = cursor.fetchone()
-                            if not mres:
-                                cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
-                                mid = cursor.lastrowid
-                            else:
-                                mid = mres[0]
-                            cursor.execute("SELECT platform_id FROM streaming_platforms WHERE platform_name=%s", (pname,))
-                            pres = cursor.fetchone()
-                            if not pres:
-                                cursor.execute("INSERT INTO streaming_platforms (platform_name) VALUES (%s)", (pname,))
-                                pid = cursor.lastrowid
-                            else:
-                                pid = pres[0]
-                            cursor.execute("SELECT 1 FROM movie_platform WHERE movie_id=%s AND platform_id=%s", (mid, pid))
-                            if not cursor.fetchone():
-                                cursor.execute("INSERT INTO movie_platform (movie_id, platform_id, availability_date) VALUES (%s,%s,%s)", (mid, pid, avail))
-                            inserted += 1
+                    elif typ in ('movie_genre',):
+                        title = (row.get('title') or row.get('movie_name') or '').strip()
+                        gname = (row.get('genre') or row.get('genre_name') or '').strip()
+                        if not title or not gname:
+                            skipped += 1
+                            continue
+                        mres = cursor.statements.fetchone('movie_by_name', (title,))
+                        if not mres:
+                            cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
+                            mid = cursor.lastrowid
+                        else:
+                            mid = mres[0]
+                        gres = cursor.statements.fetchone('genre_by_name', (gname,))
+                        if not gres:
+                            cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (gname,))
+                            gid = cursor.lastrowid
+                        else:
+                            gid = gres[0]
+                        # avoid duplicate junction inserts
+                        if not cursor.statements.fetchone('movie_genre_exists', (mid, gid)):
+                            cursor.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s,%s)", (mid, gid))
+                        inserted += 1
 
-                        elif typ in ('distribution', 'movie_distribution'):
-                            title = (row.get('title') or row.get('movie_name') or '').strip()
-                            sname = (row.get('studio_name') or row.get('studio') or '').strip()
-                            pname = (row.get('platform_name') or row.get('platform') or '').strip()
-                            dist_date = parse_date(row.get('distribution_date') or row.get('date') or '')
-                            territory = (row.get('territory') or row.get('region') or '').strip() or 'worldwide'
-                            if not title or not sname or not pname:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (title,))
-                            mres = cursor.fetchone()
-                            if not mres:
-                                cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
-                                mid = cursor.lastrowid
-                            else:
-                                mid = mres[0]
-                            cursor.execute("SELECT studio_id FROM studios WHERE studio_name=%s", (sname,))
-                            sres = cursor.fetchone()
-                            if not sres:
-                                cursor.execute("INSERT INTO studios (studio_name) VALUES (%s)", (sname,))
-                                sid = cursor.lastrowid
-                            else:
-                                sid = sres[0]
-                            cursor.execute("SELECT platform_id FROM streaming_platforms WHERE platform_name=%s", (pname,))
-                            pres = cursor.fetchone()
-                            if not pres:
-                                cursor.execute("INSERT INTO streaming_platforms (platform_name) VALUES (%s)", (pname,))
-                                pid = cursor.lastrowid
-                            else:
-                                pid = pres[0]
-                            cursor.execute("INSERT INTO movie_distribution (movie_id, studio_id, platform_id, distribution_date, territory) VALUES (%s,%s,%s,%s,%s)", (mid, sid, pid, dist_date, territory))
-                            inserted += 1
+                    elif typ in ('movie_cast',):
+                        title = (row.get('title') or row.get('movie_name') or '').strip()
+                        actor = (row.get('actor') or row.get('name') or '').strip()
+                        role = (row.get('role') or '').strip() or None
+                        char = (row.get('character_name') or row.get('character') or '').strip() or None
+                        if not title or not actor:
+                            skipped += 1
+                            continue
+                        mres = cursor.statements.fetchone('movie_by_name', (title,))
+                        if not mres:
+                            cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
+                            mid = cursor.lastrowid
+                        else:
+                            mid = mres[0]
+                        cres = cursor.statements.fetchone('cast_by_name', (actor,))
+                        if not cres:
+                            cursor.execute("INSERT INTO cast_members (name) VALUES (%s)", (actor,))
+                            cid = cursor.lastrowid
+                        else:
+                            cid = cres[0]
+                        # avoid duplicate movie_cast
+                        if not cursor.statements.fetchone('movie_cast_exists', (mid, cid)):
+                            cursor.execute("INSERT INTO movie_cast (movie_id, cast_id, role, character_name) VALUES (%s,%s,%s,%s)", (mid, cid, role, char))
+                        inserted += 1
 
-                        elif typ in ('follow', 'user_follow'):
-                            follower = (row.get('follower') or row.get('follower_username') or row.get('follower_id') or '').strip()
-                            followed = (row.get('followed') or row.get('followed_username') or row.get('followed_id') or '').strip()
-                            if not follower or not followed:
-                                skipped += 1
-                                continue
-                            # support usernames or ids; prefer username
-                            def resolve_user(val):
-                                if val.isdigit():
-                                    return int(val)
-                                cursor.execute("SELECT user_id FROM users WHERE username=%s", (val,))
-                                r = cursor.fetchone()
-                                if r:
-                                    return r[0]
-                                cursor.execute("INSERT INTO users (username, password) VALUES (%s,%s)", (val, 'changeme'))
-                                return cursor.lastrowid
-                            fid = resolve_user(follower)
-                            tid = resolve_user(followed)
-                            if fid == tid:
-                                skipped += 1
-                                continue
-                            try:
-                                cursor.execute("INSERT INTO user_follow (follower_id, followed_id) VALUES (%s,%s)", (fid, tid))
-                                inserted += 1
-                            except Exception:
-                                skipped += 1
+                    elif typ in ('movie_studio',):
+                        title = (row.get('title') or row.get('movie_name') or '').strip()
+                        sname = (row.get('studio_name') or row.get('studio') or '').strip()
+                        if not title or not sname:
+                            skipped += 1
+                            continue
+                        mres = cursor.statements.fetchone('movie_by_name', (title,))
+                        if not mres:
+                            cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
+                            mid = cursor.lastrowid
+                        else:
+                            mid = mres[0]
+                        sres = cursor.statements.fetchone('studio_by_name', (sname,))
+                        if not sres:
+                            cursor.execute("INSERT INTO studios (studio_name) VALUES (%s)", (sname,))
+                            sid = cursor.lastrowid
+                        else:
+                            sid = sres[0]
+                        if not cursor.statements.fetchone('movie_studio_exists', (mid, sid)):
+                            cursor.execute("INSERT INTO movie_studio (movie_id, studio_id) VALUES (%s,%s)", (mid, sid))
+                        inserted += 1
 
-                        elif typ in ('donation', 'donations'):
-                            uname = (row.get('username') or row.get('user') or row.get('user_id') or '').strip()
-                            amount = row.get('donation_amount') or row.get('amount') or 0
-                            comment = (row.get('comment') or '').strip() or None
-                            if not uname:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT user_id FROM users WHERE username=%s", (uname,))
-                            r = cursor.fetchone()
-                            if not r:
-                                cursor.execute("INSERT INTO users (username, password) VALUES (%s,%s)", (uname, 'changeme'))
-                                uid = cursor.lastrowid
-                            else:
-                                uid = r[0]
-                            cursor.execute("INSERT INTO donations (user_id, donation_amount, comment) VALUES (%s,%s,%s)", (uid, amount, comment))
+                    elif typ in ('movie_platform',):
+                        title = (row.get('title') or row.get('movie_name') or '').strip()
+                        pname = (row.get('platform_name') or row.get('platform') or '').strip()
+                        avail = _parse_import_date(row.get('availability_date') or row.get('availability') or '')
+                        if not title or not pname:
+                            skipped += 1
+                            continue
+                        mres = cursor.statements.fetchone('movie_by_name', (title,))
+                        if not mres:
+                            cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
+                            mid = cursor.lastrowid
+                        else:
+                            mid = mres[0]
+                        pres = cursor.statements.fetchone('platform_by_name', (pname,))
+                        if not pres:
+                            cursor.execute("INSERT INTO streaming_platforms (platform_name) VALUES (%s)", (pname,))
+                            pid = cursor.lastrowid
+                        else:
+                            pid = pres[0]
+                        if not cursor.statements.fetchone('movie_platform_exists', (mid, pid)):
+                            cursor.execute("INSERT INTO movie_platform (movie_id, platform_id, availability_date) VALUES (%s,%s,%s)", (mid, pid, avail))
+                        inserted += 1
+
+                    elif typ in ('distribution', 'movie_distribution'):
+                        title = (row.get('title') or row.get('movie_name') or '').strip()
+                        sname = (row.get('studio_name') or row.get('studio') or '').strip()
+                        pname = (row.get('platform_name') or row.get('platform') or '').strip()
+                        dist_date = _parse_import_date(row.get('distribution_date') or row.get('date') or '')
+                        territory = (row.get('territory') or row.get('region') or '').strip() or 'worldwide'
+                        if not title or not sname or not pname:
+                            skipped += 1
+                            continue
+                        mres = cursor.statements.fetchone('movie_by_name', (title,))
+                        if not mres:
+                            cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
+                            mid = cursor.lastrowid
+                        else:
+                            mid = mres[0]
+                        sres = cursor.statements.fetchone('studio_by_name', (sname,))
+                        if not sres:
+                            cursor.execute("INSERT INTO studios (studio_name) VALUES (%s)", (sname,))
+                            sid = cursor.lastrowid
+                        else:
+                            sid = sres[0]
+                        pres = cursor.statements.fetchone('platform_by_name', (pname,))
+                        if not pres:
+                            cursor.execute("INSERT INTO streaming_platforms (platform_name) VALUES (%s)", (pname,))
+                            pid = cursor.lastrowid
+                        else:
+                            pid = pres[0]
+                        cursor.execute("INSERT INTO movie_distribution (movie_id, studio_id, platform_id, distribution_date, territory) VALUES (%s,%s,%s,%s,%s)", (mid, sid, pid, dist_date, territory))
+                        inserted += 1
+
+                    elif typ in ('follow', 'user_follow'):
+                        follower = (row.get('follower') or row.get('follower_username') or row.get('follower_id') or '').strip()
+                        followed = (row.get('followed') or row.get('followed_username') or row.get('followed_id') or '').strip()
+                        if not follower or not followed:
+                            skipped += 1
+                            continue
+                        # support usernames or ids; prefer username
+                        def resolve_user(val):
+                            if val.isdigit():
+                                return int(val)
+                            r = cursor.statements.fetchone('user_by_username', (val,))
+                            if r:
+                                return r[0]
+                            cursor.execute("INSERT INTO users (username, password) VALUES (%s,%s)", (val, 'changeme'))
+                            return cursor.lastrowid
+                        fid = resolve_user(follower)
+                        tid = resolve_user(followed)
+                        if fid == tid:
+                            skipped += 1
+                            continue
+                        try:
+                            cursor.execute("INSERT INTO user_follow (follower_id, followed_id) VALUES (%s,%s)", (fid, tid))
                             inserted += 1
+                        except Exception:
+                            skipped += 1
 
-                        elif typ in ('contains_episode',):
-                            eid = row.get('episode_id') or row.get('episode') or ''
-                            title = (row.get('title') or row.get('movie_name') or '').strip()
-                            if not eid or not title:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (title,))
-                            mres = cursor.fetchone()
-                            if not mres:
-                                cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
-                                mid = cursor.lastrowid
-                            else:
-                                mid = mres[0]
-                            # ensure episode exists
-                            try:
-                                eid_int = int(eid)
-                            except:
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT 1 FROM episodes WHERE episode_id=%s", (eid_int,))
-                            if not cursor.fetchone():
-                                # cannot link to non-existent episode, skip
-                                skipped += 1
-                                continue
-                            cursor.execute("SELECT 1 FROM contains_episodes WHERE episode_id=%s AND movie_id=%s", (eid_int, mid))
-                            if not cursor.fetchone():
-                                cursor.execute("INSERT INTO contains_episodes (episode_id, movie_id) VALUES (%s,%s)", (eid_int, mid))
-                                inserted += 1
+                    elif typ in ('donation', 'donations'):
+                        uname = (row.get('username') or row.get('user') or row.get('user_id') or '').strip()
+                        amount = row.get('donation_amount') or row.get('amount') or 0
+                        comment = (row.get('comment') or '').strip() or None
+                        if not uname:
+                            skipped += 1
+                            continue
+                        r = cursor.statements.fetchone('user_by_username', (uname,))
+                        if not r:
+                            cursor.execute("INSERT INTO users (username, password) VALUES (%s,%s)", (uname, 'changeme'))
+                            uid = cursor.lastrowid
+                        else:
+                            uid = r[0]
+                        cursor.execute("INSERT INTO donations (user_id, donation_amount, comment) VALUES (%s,%s,%s)", (uid, amount, comment))
+                        inserted += 1
 
+                    elif typ in ('contains_episode',):
+                        eid = row.get('episode_id') or row.get('episode') or ''
+                        title = (row.get('title') or row.get('movie_name') or '').strip()
+                        if not eid or not title:
+                            skipped += 1
+                            continue
+                        mres = cursor.statements.fetchone('movie_by_name', (title,))
+                        if not mres:
+                            cursor.execute("INSERT INTO movies (movie_name) VALUES (%s)", (title,))
+                            mid = cursor.lastrowid
                         else:
-                            # unknown type
+                            mid = mres[0]
+                        # ensure episode exists
+                        try:
+                            eid_int = int(eid)
+                        except:
+                            skipped += 1
+                            continue
+                        if not cursor.statements.fetchone('episode_by_id', (eid_int,)):
+                            # cannot link to non-existent episode, skip
                             skipped += 1
+                            continue
+                        if not cursor.statements.fetchone('contains_episode_exists', (eid_int, mid)):
+                            cursor.execute("INSERT INTO contains_episodes (episode_id, movie_id) VALUES (%s,%s)", (eid_int, mid))
+                            inserted += 1
 
-                    except Exception as e:
-                        failed += 1
-                        print(f"Import row error for type '{typ}': {e}")
-                        # Optionally print the row: print(row)
+                    else:
+                        # unknown type
+                        skipped += 1
 
-            conn.commit()
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Failed to import CSV: {e}")
-            return (0, 0, 1)
+                except Exception as e:
+                    failed += 1
+                    print(f"Import row error for type '{typ}': {e}")
+                    # Optionally print the row: print(row)
 
+        self._sync_search_indexes()
         return (inserted, skipped, failed)
 
-    def _movie_card_grid(self):
-        # Scrollable canvas for grid
-        grid_frame = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
-        grid_frame.pack(fill='both', expand=True, padx=20, pady=12)
-
-        canvas = ctk.CTkCanvas(grid_frame, bg=IMDB_DARK_BG, highlightthickness=0)
-        scrollbar = ctk.CTkScrollbar(grid_frame, orientation='vertical', command=canvas.yview)
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side='right', fill='y')
-        canvas.pack(side='left', fill='both', expand=True)
-
-        inner = ctk.CTkFrame(canvas, fg_color=IMDB_DARK_BG)
-        # create_window requires a tk widget; get underlying tk widget
-        canvas.create_window((0,0), window=inner, anchor='nw')
-
-        # Query movies
-        cursor.execute("""
-            SELECT m.movie_id, m.movie_name, YEAR(m.release_date) as yr, m.language,
-                GROUP_CONCAT(DISTINCT g.genre_name) as genres,
-                ROUND(AVG(r.rating),1) as avg_rating
-            FROM movies m
-            LEFT JOIN movie_genre mg ON m.movie_id=mg.movie_id
-            LEFT JOIN genres g ON mg.genre_id=g.genre_id
-            LEFT JOIN reviews_ratings r ON m.movie_id=r.movie_id
-            GROUP BY m.movie_id
-            ORDER BY m.release_date DESC
-        """)
-        rows = cursor.fetchall()
-
-        # Use batched rendering to avoid creating all widgets at once
-        def render_movie_card(idx, r, parent):
-            cid = r[0]
-            title = r[1]
-            year = r[2]
-            lang = r[3]
-            genres = r[4] or ''
-            rating = r[5] or 'N/A'
-
-            cols = 4
-            padx = 12
-            pady = 12
+    def _bulk_import_csv(self, file_path, batch_size=IMPORT_BATCH_SIZE, job=None, start_offset=0, file_hash=None):
+        """bulk_import_csv, then refresh the search indexes."""
+        counts = bulk_import_csv(file_path, batch_size, job, start_offset, file_hash)
+        self._sync_search_indexes()
+        return counts
+
+    def _movie_card_grid(self, parent=None):
+        """Paged Movies card grid in parent (the page by default); returns (grid, load_btn)."""
+        parent = parent or self.page
+        # Virtualized grid: only the cards in view exist, rebound as the canvas scrolls
+        def build_movie_card(parent):
             card = ctk.CTkFrame(parent, fg_color=IMDB_GRAY, corner_radius=10, width=240, height=360)
-            card.grid(row=idx//cols, column=idx%cols, padx=padx, pady=pady)
+            card.pack_propagate(False)
             poster = ctk.CTkLabel(card, text="", bg_color=IMDB_GRAY)
             poster.pack(pady=(8,2))
-            ctk.CTkLabel(card, text=title, font=("Arial Black", 12), text_color=IMDB_YELLOW, wraplength=220).pack()
-            ctk.CTkLabel(card, text=f"{year} • {lang or ''}", font=FONT_NORMAL, text_color="white").pack()
-            ctk.CTkLabel(card, text=genres, font=("Arial", 10, "italic"), text_color="#cccccc", wraplength=220).pack(pady=(4,8))
-            ctk.CTkLabel(card, text=f"Rating: {rating}", font=FONT_SUBHEADER, text_color=IMDB_YELLOW).pack()
-            ctk.CTkButton(card, text="Details", fg_color=IMDB_YELLOW, command=lambda mid=cid: self.show_movie_detail(mid), width=160).pack(pady=(10,8))
-
-        # Use a manual "Load more" button that loads items in batches of 20
-        render_next, has_more = self._create_scroll_batch(canvas, inner, rows, render_movie_card, batch_size=20)
-
-        controls = ctk.CTkFrame(grid_frame, fg_color=IMDB_DARK_BG)
-        controls.pack(fill='x', pady=(6,12))
-        load_btn = ctk.CTkButton(controls, text="Load more", fg_color=IMDB_YELLOW, width=140)
+            title_lbl = ctk.CTkLabel(card, text="", font=("Arial Black", 12), text_color=IMDB_YELLOW, wraplength=220)
+            title_lbl.pack()
+            meta_lbl = ctk.CTkLabel(card, text="", font=FONT_NORMAL, text_color="white")
+            meta_lbl.pack()
+            genres_lbl = ctk.CTkLabel(card, text="", font=("Arial", 10, "italic"), text_color="#cccccc", wraplength=220)
+            genres_lbl.pack(pady=(4,8))
+            rating_lbl = ctk.CTkLabel(card, text="", font=FONT_SUBHEADER, text_color=IMDB_YELLOW)
+            rating_lbl.pack()
+            details_btn = ctk.CTkButton(card, text="Details", fg_color=IMDB_YELLOW, width=160)
+            details_btn.pack(pady=(10,8))
+
+            def bind(r):
+                title_lbl.configure(text=r[1])
+                meta_lbl.configure(text=f"{r[2]} • {r[3] or ''}")
+                genres_lbl.configure(text=r[4] or '')
+                rating_lbl.configure(text=f"Rating: {r[5] or 'N/A'}")
+                details_btn.configure(command=lambda mid=r[0]: self.show_movie_detail(mid))
+
+            return card, bind
+
+        grid = VirtualCardGrid(parent, build_movie_card, cols=4, cell_width=264, cell_height=384,
+                               on_visible=lambda rows: self._prefetch_details([r[0] for r in rows]),
+                               rows=catalog_model.view())
+        grid.pack(fill='both', expand=True, padx=20, pady=12)
+
+        controls = ctk.CTkFrame(parent, fg_color=IMDB_DARK_BG)
+        controls.pack(fill='x', pady=(0,12))
+        load_btn = ctk.CTkButton(controls, text="Loading...", state="disabled", fg_color=IMDB_YELLOW, width=140)
         load_btn.pack(anchor='center')
 
+        def on_loaded(more):
+            if more:
+                load_btn.configure(state='normal', text='Load more')
+            else:
+                load_btn.configure(state='disabled', text='All loaded')
+
+        # Pages of 20 are fetched from the server on "Load more" or when scrolling near the end
+        load_next, _ = self._page_into_grid(grid, self._fetch_movie_page, 20, on_loaded=on_loaded)
+
         def on_load_clicked():
-            try:
-                more = render_next()
-                if not more:
-                    load_btn.configure(state='disabled', text='All loaded')
-            except Exception:
-                # disable on unexpected error to avoid infinite clicks
-                load_btn.configure(state='disabled')
+            load_btn.configure(state='disabled', text='Loading...')
+            if not load_next():
+                load_btn.configure(state='disabled', text='All loaded')
 
         load_btn.configure(command=on_load_clicked)
-        # If initial render already loaded everything, disable immediately
-        try:
-            if not has_more():
-                load_btn.configure(state='disabled', text='All loaded')
-        except Exception:
-            pass
+        return grid, load_btn
+
+    def _movie_facet_panel(self, panel, grid, load_btn):
+        """Facet filters and sort order for the Movies grid, applied in memory.
+
+        The FacetIndex loads in the background while the grid pages in from the
+        server as usual. The first facet change switches the grid to the index's
+        results; every later change re-filters the bitmaps without a query.
+        """
+        loading = self._loading_label(panel, text="Loading filters...")
+        selection = {'genre': set(), 'language': set(), 'platform': set()}
+        state = {'index': None, 'after': None}
+        boxes = {}  # facet -> {value: (checkbox, variable)}
+        sort_var = ctk.StringVar(value=FACET_SORTS[0])
+
+        def number(entry, cast):
+            try:
+                return cast(entry.get().strip())
+            except ValueError:
+                return None
+
+        def apply():
+            state['after'] = None
+            index = state['index']
+            if index is None or not panel.winfo_exists():
+                return
+            selection['year'] = (number(year_from, int), number(year_to, int))
+            selection['rating'] = (number(rating_min, float), number(rating_max, float))
+            bitmap, counts = index.match(selection)
+            # leave server paging for the in-memory result
+            grid.on_near_end = None
+            grid.set_rows(CatalogView(catalog_model, positions=index.select(bitmap, sort_var.get())))
+            load_btn.configure(state='disabled', text='All loaded')
+            count_lbl.configure(text=f"{_popcount(bitmap):,} titles")
+            for facet, values in counts.items():
+                for value, n in values.items():
+                    boxes[facet][value][0].configure(text=f"{value} ({n:,})")
+
+        def schedule(_event=None):
+            # debounce typing in the range fields
+            if state['after'] is not None:
+                self.after_cancel(state['after'])
+            state['after'] = self.after(150, apply)
+
+        def toggle(facet, value, var):
+            if var.get():
+                selection[facet].add(value)
+            else:
+                selection[facet].discard(value)
+            apply()
+
+        def clear():
+            for facet in selection.values():
+                if isinstance(facet, set):
+                    facet.clear()
+            for values in boxes.values():
+                for _, var in values.values():
+                    var.set(0)
+            for entry in (year_from, year_to, rating_min, rating_max):
+                entry.delete(0, 'end')
+            sort_var.set(FACET_SORTS[0])
+            apply()
+
+        ctk.CTkLabel(panel, text="Sort by", font=FONT_SUBHEADER, text_color=IMDB_YELLOW).pack(anchor='w', padx=8, pady=(8, 2))
+        ctk.CTkOptionMenu(panel, values=list(FACET_SORTS), variable=sort_var, width=200,
+                          command=lambda _: apply()).pack(anchor='w', padx=8)
+        count_lbl = ctk.CTkLabel(panel, text="", font=FONT_NORMAL, text_color="white")
+        count_lbl.pack(anchor='w', padx=8, pady=(6, 0))
+
+        ranges = ctk.CTkFrame(panel, fg_color=IMDB_GRAY)
+        ranges.pack(anchor='w', padx=8, pady=(8, 0))
+        ctk.CTkLabel(ranges, text="Year", font=FONT_NORMAL, text_color=IMDB_YELLOW).grid(row=0, column=0, sticky='w')
+        year_from = ctk.CTkEntry(ranges, width=70, placeholder_text="from")
+        year_from.grid(row=0, column=1, padx=4, pady=2)
+        year_to = ctk.CTkEntry(ranges, width=70, placeholder_text="to")
+        year_to.grid(row=0, column=2, pady=2)
+        ctk.CTkLabel(ranges, text="Rating", font=FONT_NORMAL, text_color=IMDB_YELLOW).grid(row=1, column=0, sticky='w')
+        rating_min = ctk.CTkEntry(ranges, width=70, placeholder_text="min")
+        rating_min.grid(row=1, column=1, padx=4, pady=2)
+        rating_max = ctk.CTkEntry(ranges, width=70, placeholder_text="max")
+        rating_max.grid(row=1, column=2, pady=2)
+        for entry in (year_from, year_to, rating_min, rating_max):
+            entry.bind('<KeyRelease>', schedule)
+        ctk.CTkButton(panel, text="Clear filters", fg_color=IMDB_YELLOW, width=200, command=clear).pack(anchor='w', padx=8, pady=8)
+
+        def build(index):
+            state['index'] = index
+            low, high = index.year_span
+            if low is not None:
+                year_from.configure(placeholder_text=str(low))
+                year_to.configure(placeholder_text=str(high))
+            _, counts = index.match(selection)
+            for facet, title in (('genre', "Genres"), ('language', "Languages"), ('platform', "Platforms")):
+                if not counts[facet]:
+                    continue
+                ctk.CTkLabel(panel, text=title, font=FONT_SUBHEADER, text_color=IMDB_YELLOW).pack(anchor='w', padx=8, pady=(10, 2))
+                boxes[facet] = {}
+                for value, n in counts[facet].items():
+                    var = ctk.IntVar(value=0)
+                    box = ctk.CTkCheckBox(panel, text=f"{value} ({n:,})", variable=var, font=FONT_NORMAL,
+                                          command=lambda f=facet, v=value, var=var: toggle(f, v, var))
+                    box.pack(anchor='w', padx=12, pady=1)
+                    boxes[facet][value] = (box, var)
+            count_lbl.configure(text=f"{_popcount(index.all):,} titles")
+
+        self.run_query(movie_facets, callback=build, loading=loading, owner=panel)
+
+    def _fetch_movie_page(self, after, limit):
+        """Fetch one page of the Movies grid, newest first (runs on a worker thread).
+
+        Keyset pagination on (release_date DESC, movie_id DESC): `after` is the
+        (release_date, movie_id) key of the last card shown, or None for the first
+        page. Undated movies sort last and are paged by movie_id alone once the
+        dated ones run out. Returns (rows, next_key); next_key is None at the end.
+        """
+        # One extra key tells us whether another page exists
+        want = limit + 1
+        keys = []
+        if after is None or after[0] is not None:
+            sql = "SELECT movie_id, release_date FROM movies WHERE release_date IS NOT NULL"
+            params = []
+            if after is not None:
+                sql += " AND (release_date < %s OR (release_date = %s AND movie_id < %s))"
+                params += [after[0], after[0], after[1]]
+            sql += " ORDER BY release_date DESC, movie_id DESC LIMIT %s"
+            keys = catalog.fetchall(sql, params + [want], cached=False)
+        if len(keys) < want:
+            sql = "SELECT movie_id, release_date FROM movies WHERE release_date IS NULL"
+            params = []
+            if after is not None and after[0] is None:
+                sql += " AND movie_id < %s"
+                params.append(after[1])
+            sql += " ORDER BY movie_id DESC LIMIT %s"
+            keys = list(keys) + catalog.fetchall(sql, params + [want - len(keys)], cached=False)
+        if not keys:
+            return [], None
+
+        more = len(keys) > limit
+        keys = keys[:limit]
+        ids = [k[0] for k in keys]
+        # Genres/ratings for this page only, from the trigger-maintained summary
+        marks = ', '.join(['%s'] * len(ids))
+        by_id = {r[0]: r for r in catalog.fetchall(f"""
+            SELECT m.movie_id, m.movie_name, YEAR(m.release_date) as yr, m.language,
+                s.genres, ROUND(s.rating_sum / NULLIF(s.rating_count, 0), 1) as avg_rating
+            FROM movies m
+            LEFT JOIN movie_summary s ON m.movie_id=s.movie_id
+            WHERE m.movie_id IN ({marks})
+        """, ids, cached=False)}
+        rows = [by_id[i] for i in ids if i in by_id]
+        last_id, last_date = keys[-1]
+        return rows, ((last_date, last_id) if more else None)
 
     # ========== MOVIE CARD ==========
     def _movie_card(self, master, movie_row):
@@ -1455,72 +6046,118 @@ class CineTrackIMDB(ctk.CTk):
         ctk.CTkLabel(card, text=f"{year} • {movie_row[3]}", font=FONT_NORMAL, text_color="white").pack()
         ctk.CTkLabel(card, text=movie_row[4] or "", font=("Arial Italic", 11), text_color="#aaaaaa", wraplength=230).pack(pady=(2,8))
 
-    def _create_scroll_batch(self, canvas, inner_frame, items, render_fn, batch_size=100, threshold=200):
-        """Render items in explicit batches and return a loader function.
+    def _page_into_treeview(self, tree, scrollbar, fetch_page, page_size, insert_rows, near_end=0.9):
+        """Feed a Treeview page by page as it scrolls and return load_next.
+
+        fetch_page(after, limit) -> (rows, next_key) runs on the query executor
+        and insert_rows(rows) adds a page on the UI thread. The first page is
+        requested right away; later ones when the view's bottom edge passes
+        `near_end` of the loaded rows.
+        """
+        state = {'after': None, 'done': False, 'busy': False}
 
-        This helper no longer auto-loads on scroll. Instead it renders the first
-        batch immediately and returns a tuple (render_next_batch, has_more_fn).
+        def on_page(result):
+            rows, next_key = result
+            state['busy'] = False
+            state['after'] = next_key
+            state['done'] = next_key is None
+            insert_rows(rows)
 
-        - render_next_batch(): when called, renders the next batch and returns
-          True if more items remain after the render, False if everything is loaded.
-        - has_more_fn(): returns True if more items remain to be loaded.
+        def on_error(err):
+            state['busy'] = False
+            print(f"Failed to load page: {err}")
 
-        canvas: the scrolling canvas widget
-        inner_frame: the frame that holds item widgets
-        items: list of data rows
-        render_fn: function(idx, item, parent) -> creates UI for one item
-        batch_size: how many items to create per click
+        def load_next():
+            if state['done']:
+                return False
+            if not state['busy']:
+                state['busy'] = True
+                self.executor.submit(fetch_page, state['after'], page_size,
+                                     callback=on_page, errback=on_error, owner=tree)
+            return True
+
+        def on_yscroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) >= near_end:
+                load_next()
+
+        tree.configure(yscrollcommand=on_yscroll)
+        load_next()
+        return load_next
+
+    def _page_into_grid(self, grid, fetch_page, page_size, on_loaded=None):
+        """Feed a VirtualCardGrid from a page fetcher and return (load_next, has_more).
+
+        fetch_page(after, limit) -> (rows, next_key) runs on the query executor.
+        - load_next(): requests the page after the last key; returns False once
+          the fetcher has reported no next key
+        - on_loaded(more) runs on the UI thread after each page is appended
+        The grid's on_near_end hook is wired to load_next, so scrolling close to
+        the end fetches the next page as well.
         """
-        total = len(items)
-        state = {'next_idx': 0}
-
-        def render_next_batch():
-            start = state['next_idx']
-            if start >= total:
+        state = {'after': None, 'done': False, 'busy': False}
+
+        def on_page(result, generation):
+            state['busy'] = False
+            if generation != grid.generation:
+                return  # the grid's rows were replaced while this page loaded
+            rows, next_key = result
+            state['after'] = next_key
+            state['done'] = next_key is None
+            grid.append(rows)
+            if on_loaded:
+                on_loaded(not state['done'])
+
+        def on_error(err):
+            # leave the pager where it was so the next click/scroll retries
+            state['busy'] = False
+            print(f"Failed to load page: {err}")
+            if on_loaded:
+                on_loaded(True)
+
+        def load_next():
+            if state['done']:
                 return False
-            end = min(total, start + batch_size)
-            for i in range(start, end):
-                render_fn(i, items[i], inner_frame)
-            state['next_idx'] = end
-            inner_frame.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox('all'))
-            return state['next_idx'] < total
+            if not state['busy']:
+                state['busy'] = True
+                self.executor.submit(fetch_page, state['after'], page_size,
+                                     callback=lambda result, gen=grid.generation: on_page(result, gen),
+                                     errback=on_error, owner=grid)
+            return True
 
         def has_more():
-            return state['next_idx'] < total
-
-        # initial batch
-        render_next_batch()
+            return not state['done']
 
-        # keep automatic scrollregion updates but do not auto-load more items
-        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        def near_end():
+            if grid.rows:
+                load_next()
 
-        return render_next_batch, has_more
+        grid.on_near_end = near_end
+        # first page
+        load_next()
+        return load_next, has_more
 
     def show_movie_detail(self, movie_id):
         self.clear_page()
-        # Get full details
-        cursor.execute("""
-            SELECT m.movie_name, m.release_date, m.description, m.language,
-                ROUND(AVG(r.rating),1),
-                GROUP_CONCAT(DISTINCT g.genre_name)
-            FROM movies m
-            LEFT JOIN reviews_ratings r ON m.movie_id=r.movie_id
-            LEFT JOIN movie_genre mg ON m.movie_id=mg.movie_id
-            LEFT JOIN genres g ON mg.genre_id=g.genre_id
-            WHERE m.movie_id=%s
-            GROUP BY m.movie_id
-        """, (movie_id,))
-        row = cursor.fetchone()
-        if not row:
-            imdb_heading(self.page, "Movie not found!")
-            return
-        imdb_heading(self.page, row[0])
-        imdb_subheading(self.page, f"Released: {row[1]} • {row[3] or ''}")
-        ctk.CTkLabel(self.page, text=row[2] or "(No summary available)", wraplength=750, font=FONT_NORMAL, text_color="white", anchor="w", bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20)
-
-        ctk.CTkLabel(self.page, text="Genres: " + (row[5] or ""), font=FONT_NORMAL, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20)
-        ctk.CTkLabel(self.page, text="Avg Rating: " + (str(row[4]) if row[4] else "N/A"), font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20)
+        # Page skeleton first; one batched query (fetch_movie_detail) fills every section
+        movie = {'name': ''}
+        heading = imdb_heading(self.page, "Loading...")
+        subheading = imdb_subheading(self.page, "")
+        desc_lbl = ctk.CTkLabel(self.page, text="", wraplength=750, font=FONT_NORMAL, text_color="white", anchor="w", bg_color=IMDB_DARK_BG)
+        desc_lbl.pack(anchor="w", padx=20)
+
+        genres_lbl = ctk.CTkLabel(self.page, text="Genres: ", font=FONT_NORMAL, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG)
+        genres_lbl.pack(anchor="w", padx=20)
+        rating_lbl = ctk.CTkLabel(self.page, text="Avg Rating: ", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG)
+        rating_lbl.pack(anchor="w", padx=20)
+
+        def fill_header(row):
+            movie['name'] = row[0]
+            heading.configure(text=row[0])
+            subheading.configure(text=f"Released: {row[1]} • {row[3] or ''}")
+            desc_lbl.configure(text=row[2] or "(No summary available)")
+            genres_lbl.configure(text="Genres: " + (row[5] or ""))
+            rating_lbl.configure(text="Avg Rating: " + (str(row[4]) if row[4] else "N/A"))
 
         # Cast table
         ctk.CTkLabel(self.page, text="Cast:", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20, pady=(20,4))
@@ -1537,14 +6174,11 @@ class CineTrackIMDB(ctk.CTk):
         tree.configure(yscrollcommand=tree_scroll.set)
         tree_scroll.pack(side='right', fill='y')
         tree.pack(anchor="w", fill='both', expand=True)
-        cursor.execute("""
-            SELECT c.name, mc.character_name, calc_age(c.dob) FROM movie_cast mc
-            JOIN cast_members c ON mc.cast_id = c.cast_id
-            WHERE mc.movie_id=%s
-        """, (movie_id,))
-        for i, cr in enumerate(cursor.fetchall()):
-            tag = 'even' if i % 2 == 0 else 'odd'
-            tree.insert('', 'end', values=cr, tags=(tag,))
+
+        def fill_cast(rows):
+            for i, cr in enumerate(rows):
+                tag = 'even' if i % 2 == 0 else 'odd'
+                tree.insert('', 'end', values=(cr[0], cr[1] or '', '' if cr[2] is None else cr[2]), tags=(tag,))
 
         # Reviews table
         ctk.CTkLabel(self.page, text="User Reviews:", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20, pady=(32,4))
@@ -1565,7 +6199,7 @@ class CineTrackIMDB(ctk.CTk):
             dlg.title("Add Comment")
             dlg.geometry("480x300")
 
-            ctk.CTkLabel(dlg, text=f"Add comment for: {row[0]}", font=FONT_SUBHEADER, text_color=IMDB_YELLOW).pack(pady=(12,6))
+            ctk.CTkLabel(dlg, text=f"Add comment for: {movie['name']}", font=FONT_SUBHEADER, text_color=IMDB_YELLOW).pack(pady=(12,6))
             frm = ctk.CTkFrame(dlg)
             frm.pack(padx=12, pady=6, fill='both', expand=True)
 
@@ -1611,26 +6245,23 @@ class CineTrackIMDB(ctk.CTk):
                         # any other unexpected error, fallback to empty
                         comment = ''
 
-                try:
-                    cursor.execute("INSERT INTO reviews_ratings (user_id, movie_id, rating, comment, review_date) VALUES (%s,%s,%s,%s,NOW())",
-                                   (self.current_user[0], movie_id, rating, comment))
-                    conn.commit()
-                except Exception as e:
+                def saved(review_id):
+                    # insert into treeview at top
                     try:
-                        conn.rollback()
+                        preview = comment[:REVIEW_PREVIEW_CHARS]
+                        insert_review(0, (review_id, self.current_user[1], rating, preview,
+                                          len(comment) > REVIEW_PREVIEW_CHARS, datetime.datetime.now()), 'even')
+                        load_histogram()
                     except Exception:
                         pass
-                    status_lbl.configure(text=f'Failed to save: {e}')
-                    return
 
-                # insert into treeview at top
-                try:
-                    rtree.insert('', 0, values=(self.current_user[1], rating, comment), tags=('even',))
-                except Exception:
-                    pass
+                    messagebox.showinfo('Success', 'Comment added')
+                    dlg.destroy()
 
-                messagebox.showinfo('Success', 'Comment added')
-                dlg.destroy()
+                status_lbl.configure(text='Saving...')
+                self.executor.submit(db.execute, "INSERT INTO reviews_ratings (user_id, movie_id, rating, comment, review_date) VALUES (%s,%s,%s,%s,NOW())",
+                                     (self.current_user[0], movie_id, rating, comment), callback=saved,
+                                     errback=lambda err: status_lbl.configure(text=f'Failed to save: {err}'), owner=dlg)
 
             submit_btn = ctk.CTkButton(frm, text='Submit', fg_color=IMDB_YELLOW, command=do_submit)
             submit_btn.grid(row=3, column=0, columnspan=2, pady=(8,0))
@@ -1638,25 +6269,85 @@ class CineTrackIMDB(ctk.CTk):
         add_btn = ctk.CTkButton(btn_row, text='Add comment', fg_color=IMDB_YELLOW, command=open_comment_dialog, width=140)
         add_btn.pack(side='left', padx=(0,8))
 
-        rev_cols = ("User", "Rating", "Comment")
+        ctk.CTkLabel(btn_row, text="Double-click a review to read the full comment", font=("Arial", 10, "italic"),
+                     text_color="#aaaaaa", bg_color=IMDB_DARK_BG).pack(side='left', padx=(8,0))
+
+        # Rating histogram: one GROUP BY over the movie's reviews
+        hist_frame = ctk.CTkFrame(review_frame, fg_color=IMDB_DARK_BG)
+        hist_frame.pack(anchor='w', fill='x', pady=(0,8))
+
+        def fill_histogram(counts):
+            for child in hist_frame.winfo_children():
+                child.destroy()
+            total = sum(counts.values())
+            ctk.CTkLabel(hist_frame, text=f"{total} rated review{'s' if total != 1 else ''}", font=FONT_NORMAL,
+                         text_color='white', bg_color=IMDB_DARK_BG).grid(row=0, column=0, columnspan=3, sticky='w')
+            peak = max(counts.values()) or 1
+            for i, stars in enumerate(range(10, 0, -1), start=1):
+                ctk.CTkLabel(hist_frame, text=f"{stars:>2}★", font=("Arial", 10), text_color=IMDB_YELLOW,
+                             bg_color=IMDB_DARK_BG).grid(row=i, column=0, sticky='e', padx=(0,6))
+                bar = ctk.CTkProgressBar(hist_frame, width=240, height=8, progress_color=IMDB_YELLOW)
+                bar.set(counts[stars] / peak)
+                bar.grid(row=i, column=1, sticky='w')
+                ctk.CTkLabel(hist_frame, text=str(counts[stars]), font=("Arial", 10), text_color='white',
+                             bg_color=IMDB_DARK_BG).grid(row=i, column=2, sticky='w', padx=(6,0))
+
+        def load_histogram():
+            self.run_query(fetch_rating_histogram, movie_id, callback=fill_histogram, owner=hist_frame)
+
+        load_histogram()
+
+        rev_cols = ("User", "Rating", "Comment", "Date")
         rtree = ttk.Treeview(review_frame, columns=rev_cols, show="headings", height=8)
         for col in rev_cols:
             rtree.heading(col, text=col)
-            rtree.column(col, anchor="center", width=220)
+            rtree.column(col, anchor="center", width=360 if col == "Comment" else 140)
         self._style_treeview(rtree, heading_font=("Arial", 11, "bold"), cell_font=("Arial", 10), rowheight=28)
         rtree_scroll = ttk.Scrollbar(review_frame, orient='vertical', command=rtree.yview)
-        rtree.configure(yscrollcommand=rtree_scroll.set)
         rtree_scroll.pack(side='right', fill='y')
         rtree.pack(anchor="w", fill='both', expand=True)
-        cursor.execute("""
-            SELECT u.username, r.rating, r.comment FROM reviews_ratings r
-            JOIN users u ON r.user_id = u.user_id
-            WHERE r.movie_id=%s
-            ORDER BY r.review_date DESC
-        """, (movie_id,))
-        for i, rv in enumerate(cursor.fetchall()):
-            tag = 'even' if i % 2 == 0 else 'odd'
-            rtree.insert('', 'end', values=rv, tags=(tag,))
+
+        # review_id -> whether the list shows only the start of the comment
+        truncated = {}
+
+        def insert_review(index, rv, tag):
+            review_id, username, rating, preview, cut, review_date = rv
+            truncated[review_id] = bool(cut)
+            text = (preview or '') + ('…' if cut else '')
+            rtree.insert('', index, iid=str(review_id), tags=(tag,),
+                         values=(username, '' if rating is None else rating, text, str(review_date or '')[:16]))
+
+        def fill_reviews(rows):
+            start = len(rtree.get_children())
+            for i, rv in enumerate(rows, start):
+                # a review added here already sits at the top
+                if not rtree.exists(str(rv[0])):
+                    insert_review('end', rv, 'even' if i % 2 == 0 else 'odd')
+
+        self._page_into_treeview(rtree, rtree_scroll, lambda after, limit: fetch_review_page(movie_id, after, limit),
+                                 REVIEW_PAGE_SIZE, fill_reviews)
+
+        def show_full_comment(comment, username):
+            dlg = ctk.CTkToplevel(self)
+            dlg.title(f"Review by {username}")
+            dlg.geometry("520x320")
+            box = ctk.CTkTextbox(dlg, wrap='word')
+            box.pack(fill='both', expand=True, padx=12, pady=12)
+            box.insert('1.0', comment or '(no comment)')
+            box.configure(state='disabled')
+
+        def on_review_open(event):
+            iid = rtree.identify_row(event.y)
+            if not iid:
+                return
+            username, _, text = rtree.item(iid, 'values')[:3]
+            if not truncated.get(int(iid)):
+                show_full_comment(text, username)
+                return
+            self.run_query(fetch_review_comment, int(iid),
+                           callback=lambda comment: show_full_comment(comment, username), owner=rtree)
+
+        rtree.bind('<Double-1>', on_review_open)
 
         # Streaming platforms
         ctk.CTkLabel(self.page, text="Available On:", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor='w', padx=20, pady=(18,4))
@@ -1672,18 +6363,11 @@ class CineTrackIMDB(ctk.CTk):
         ptre.configure(yscrollcommand=pscroll.set)
         pscroll.pack(side='right', fill='y')
         ptre.pack(anchor='w', fill='x')
-        try:
-            cursor.execute('''
-                SELECT sp.platform_name, sp.subscription_type, mp.availability_date
-                FROM movie_platform mp
-                JOIN streaming_platforms sp ON mp.platform_id=sp.platform_id
-                WHERE mp.movie_id=%s
-            ''', (movie_id,))
-            for i, pr in enumerate(cursor.fetchall()):
+
+        def fill_platforms(rows):
+            for i, pr in enumerate(rows):
                 tag = 'even' if i%2==0 else 'odd'
-                ptre.insert('', 'end', values=(pr[0], pr[1] or '', pr[2]), tags=(tag,))
-        except Exception:
-            pass
+                ptre.insert('', 'end', values=(pr[0], pr[1] or '', pr[2] or ''), tags=(tag,))
 
         # Distribution territories
         ctk.CTkLabel(self.page, text='Distribution:', font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor='w', padx=20, pady=(12,4))
@@ -1699,19 +6383,31 @@ class CineTrackIMDB(ctk.CTk):
         dtree.configure(yscrollcommand=dscroll.set)
         dscroll.pack(side='right', fill='y')
         dtree.pack(anchor='w', fill='x')
-        try:
-            cursor.execute('''
-                SELECT s.studio_name, sp.platform_name, md.territory, md.distribution_date
-                FROM movie_distribution md
-                LEFT JOIN studios s ON md.studio_id=s.studio_id
-                LEFT JOIN streaming_platforms sp ON md.platform_id=sp.platform_id
-                WHERE md.movie_id=%s
-            ''', (movie_id,))
-            for i, dr in enumerate(cursor.fetchall()):
+
+        def fill_distribution(rows):
+            for i, dr in enumerate(rows):
                 tag = 'even' if i%2==0 else 'odd'
                 dtree.insert('', 'end', values=(dr[0] or '', dr[1] or '', dr[2] or '', dr[3] or ''), tags=(tag,))
-        except Exception:
-            pass
+
+        def fill(detail):
+            if not detail:
+                for child in self.page.winfo_children():
+                    child.destroy()
+                imdb_heading(self.page, "Movie not found!")
+                return
+            fill_header(detail['header'])
+            fill_cast(detail['cast'])
+            fill_platforms(detail['platforms'])
+            fill_distribution(detail['distribution'])
+
+        self.executor.submit(record_movie_view, movie_id, self.current_user[0] if self.current_user else None)
+
+        # Prefetched (or recently viewed) movies render without waiting on a worker
+        hit, row = db.cache_lookup(MOVIE_DETAIL_SQL, (movie_id,), count=False)
+        if hit:
+            fill(movie_detail_from_row(row))
+        else:
+            self.run_query(fetch_movie_detail, movie_id, callback=fill, owner=self.page)
 
         # Watchlist action
         wf = ctk.CTkFrame(self.page)
@@ -1720,97 +6416,62 @@ class CineTrackIMDB(ctk.CTk):
             if not self.current_user:
                 messagebox.showerror('Auth', 'Login to add to watchlist')
                 return
-            try:
-                self._ensure_watchlist_table()
-                cursor.execute('INSERT INTO user_watchlist (user_id, movie_id) VALUES (%s,%s)', (self.current_user[0], movie_id))
-                conn.commit()
-                messagebox.showinfo('Added', 'Added to your watchlist')
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror('DB', f'Failed: {e}')
+            self.run_write('INSERT INTO user_watchlist (user_id, movie_id) VALUES (%s,%s)', (self.current_user[0], movie_id),
+                           callback=lambda _: messagebox.showinfo('Added', 'Added to your watchlist'))
 
         def remove_watchlist():
             if not self.current_user:
                 messagebox.showerror('Auth', 'Login to remove from watchlist')
                 return
-            try:
-                cursor.execute('DELETE FROM user_watchlist WHERE user_id=%s AND movie_id=%s', (self.current_user[0], movie_id))
-                conn.commit()
-                messagebox.showinfo('Removed', 'Removed from your watchlist')
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror('DB', f'Failed: {e}')
+            self.run_write('DELETE FROM user_watchlist WHERE user_id=%s AND movie_id=%s', (self.current_user[0], movie_id),
+                           callback=lambda _: messagebox.showinfo('Removed', 'Removed from your watchlist'))
 
         ctk.CTkButton(wf, text='Add to Watchlist', fg_color=IMDB_YELLOW, command=add_watchlist, width=160).pack(side='left', padx=6)
         ctk.CTkButton(wf, text='Remove from Watchlist', fg_color=IMDB_YELLOW, command=remove_watchlist, width=200).pack(side='left', padx=6)
 
     # ========== CAST ==========
     def show_cast(self):
-        """Show cast members using the same batched/grid rendering as movies.
+        """Show cast members using the same virtualized card grid as movies.
 
-        This renders cast in a card grid and provides a "Load more" button to
-        progressively render items (to avoid creating all widgets at once).
+        Only the cards in view are created; they are rebound to other people
+        as the grid scrolls, so the whole list can be shown without paging.
         """
         self.clear_page()
         imdb_heading(self.page, "Cast & Crew")
         ctk.CTkLabel(self.page, text="Browse All", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20, pady=5)
 
-        grid_frame = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
-        grid_frame.pack(fill='both', expand=True, padx=20, pady=12)
-
-        canvas = ctk.CTkCanvas(grid_frame, bg=IMDB_DARK_BG, highlightthickness=0)
-        scrollbar = ctk.CTkScrollbar(grid_frame, orientation='vertical', command=canvas.yview)
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side='right', fill='y')
-        canvas.pack(side='left', fill='both', expand=True)
-
-        inner = ctk.CTkFrame(canvas, fg_color=IMDB_DARK_BG)
-        canvas.create_window((0,0), window=inner, anchor='nw')
-
-        # Query cast members
-        cursor.execute("SELECT cast_id, name, dob, bio FROM cast_members ORDER BY name")
-        rows = cursor.fetchall()
-
-        def render_person_card(idx, r, parent):
-            pid = r[0]
-            name = r[1]
-            dob = r[2]
-            bio = r[3] or ''
-
-            cols = 4
-            padx = 12
-            pady = 12
+        # Virtualized grid: only the cards in view exist, rebound as the canvas scrolls
+        def build_person_card(parent):
             card = ctk.CTkFrame(parent, fg_color=IMDB_GRAY, corner_radius=10, width=220, height=260)
-            card.grid(row=idx//cols, column=idx%cols, padx=padx, pady=pady)
+            card.pack_propagate(False)
             photo = ctk.CTkLabel(card, text="🙂", font=("Arial", 34), text_color=IMDB_YELLOW, bg_color=IMDB_GRAY)
             photo.pack(pady=(8,2))
-            ctk.CTkLabel(card, text=name, font=("Arial Black", 12), text_color=IMDB_YELLOW, wraplength=200).pack()
-            age_text = self.calc_age(dob) if dob else ''
-            ctk.CTkLabel(card, text=f"Age: {age_text}", font=FONT_NORMAL, text_color="white").pack()
-            ctk.CTkLabel(card, text=(bio[:110] + '...') if len(bio) > 110 else bio, font=("Arial", 10, "italic"), text_color="#cccccc", wraplength=200).pack(pady=(6,8))
-            ctk.CTkButton(card, text="Filmography", fg_color=IMDB_YELLOW, command=lambda pid=pid: self.show_filmography(pid), width=140).pack(pady=(6,8))
+            name_lbl = ctk.CTkLabel(card, text="", font=("Arial Black", 12), text_color=IMDB_YELLOW, wraplength=200)
+            name_lbl.pack()
+            age_lbl = ctk.CTkLabel(card, text="", font=FONT_NORMAL, text_color="white")
+            age_lbl.pack()
+            bio_lbl = ctk.CTkLabel(card, text="", font=("Arial", 10, "italic"), text_color="#cccccc", wraplength=200)
+            bio_lbl.pack(pady=(6,8))
+            film_btn = ctk.CTkButton(card, text="Filmography", fg_color=IMDB_YELLOW, width=140)
+            film_btn.pack(pady=(6,8))
+
+            def bind(r):
+                dob = r[2]
+                bio = r[3] or ''
+                name_lbl.configure(text=r[1])
+                age_lbl.configure(text=f"Age: {self.calc_age(dob) if dob else ''}")
+                bio_lbl.configure(text=(bio[:110] + '...') if len(bio) > 110 else bio)
+                film_btn.configure(command=lambda pid=r[0]: self.show_filmography(pid))
+
+            return card, bind
+
+        loading = self._loading_label(self.page)
+        grid = VirtualCardGrid(self.page, build_person_card, cols=4, cell_width=244, cell_height=284)
+        grid.pack(fill='both', expand=True, padx=20, pady=12)
 
-        render_next, has_more = self._create_scroll_batch(canvas, inner, rows, render_person_card, batch_size=20)
-
-        controls = ctk.CTkFrame(grid_frame, fg_color=IMDB_DARK_BG)
-        controls.pack(fill='x', pady=(6,12))
-        load_btn = ctk.CTkButton(controls, text="Load more", fg_color=IMDB_YELLOW, width=140)
-        load_btn.pack(anchor='center')
-
-        def on_load_clicked():
-            try:
-                more = render_next()
-                if not more:
-                    load_btn.configure(state='disabled', text='All loaded')
-            except Exception:
-                load_btn.configure(state='disabled')
-
-        load_btn.configure(command=on_load_clicked)
-        try:
-            if not has_more():
-                load_btn.configure(state='disabled', text='All loaded')
-        except Exception:
-            pass
+        # Query cast members
+        self.run_query(catalog.fetchall, "SELECT cast_id, name, dob, bio FROM cast_members ORDER BY name",
+                       callback=grid.append, loading=loading)
 
     def _person_card(self, master, pid, name, dob, bio):
         card = ctk.CTkFrame(master, fg_color=IMDB_GRAY, corner_radius=12)
@@ -1851,16 +6512,19 @@ class CineTrackIMDB(ctk.CTk):
         tree.configure(yscrollcommand=tree_scroll.set)
         tree_scroll.pack(side='right', fill='y')
         tree.pack(fill="both", expand=True)
-        cursor.execute("""
+
+        def fill(rows):
+            for i, row in enumerate(rows):
+                tag = 'even' if i % 2 == 0 else 'odd'
+                tree.insert('', 'end', values=(row[0], row[1], row[2]), tags=(tag,))
+
+        self.run_query(db.fetchall, """
             SELECT m.movie_name, mc.role, m.release_date
             FROM movie_cast mc
             JOIN movies m ON mc.movie_id = m.movie_id
             WHERE mc.cast_id=%s
             ORDER BY m.release_date DESC
-        """, (pid,))
-        for i, row in enumerate(cursor.fetchall()):
-            tag = 'even' if i % 2 == 0 else 'odd'
-            tree.insert('', 'end', values=(row[0], row[1], row[2]), tags=(tag,))
+        """, (pid,), callback=fill, loading=self._loading_label(table_frame))
 
     # ========== SERIES/TV ==========
     def show_series(self):
@@ -1869,128 +6533,94 @@ class CineTrackIMDB(ctk.CTk):
         imdb_heading(self.page, "TV & Web Series")
         imdb_subheading(self.page, "Browse all series")
 
-        grid_frame = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
-        grid_frame.pack(fill='both', expand=True, padx=20, pady=12)
-
-        canvas = ctk.CTkCanvas(grid_frame, bg=IMDB_DARK_BG, highlightthickness=0)
-        scrollbar = ctk.CTkScrollbar(grid_frame, orientation='vertical', command=canvas.yview)
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side='right', fill='y')
-        canvas.pack(side='left', fill='both', expand=True)
-
-        inner = ctk.CTkFrame(canvas, fg_color=IMDB_DARK_BG)
-        canvas.create_window((0,0), window=inner, anchor='nw')
-
-        # Query series (movies that have episodes). Include some extra metadata for cards.
-        cursor.execute("""
-            SELECT m.movie_id, m.movie_name, YEAR(m.release_date) as yr, m.language,
-                GROUP_CONCAT(DISTINCT g.genre_name) as genres,
-                ROUND(AVG(r.rating),1) as avg_rating, COUNT(e.episode_id) as ep_count,
-                MAX(e.season_number) as seasons
-            FROM movies m
-            JOIN episodes e ON m.movie_id = e.movie_id
-            LEFT JOIN movie_genre mg ON m.movie_id=mg.movie_id
-            LEFT JOIN genres g ON mg.genre_id=g.genre_id
-            LEFT JOIN reviews_ratings r ON m.movie_id=r.movie_id
-            GROUP BY m.movie_id
-            HAVING COUNT(e.episode_id) > 0
-            ORDER BY m.release_date DESC
-        """)
-        rows = cursor.fetchall()
-
-        def render_series_card(idx, r, parent):
-            sid = r[0]
-            title = r[1]
-            year = r[2]
-            lang = r[3]
-            genres = r[4] or ''
-            rating = r[5] or 'N/A'
-            ep_count = r[6] or 0
-            seasons = r[7] or 1
-
-            cols = 4
-            padx = 12
-            pady = 12
-            card = ctk.CTkFrame(parent, fg_color=IMDB_GRAY, corner_radius=10, width=240, height=360)
-            card.grid(row=idx//cols, column=idx%cols, padx=padx, pady=pady)
+        # Virtualized grid: only the cards in view exist, rebound as the canvas scrolls
+        def build_series_card(parent):
+            card = ctk.CTkFrame(parent, fg_color=IMDB_GRAY, corner_radius=10, width=240, height=380)
+            card.pack_propagate(False)
             poster = ctk.CTkLabel(card, text="📺", bg_color=IMDB_GRAY)
-            poster.pack(pady=(8,2))
-            ctk.CTkLabel(card, text=title, font=("Arial Black", 12), text_color=IMDB_YELLOW, wraplength=220).pack()
-            ctk.CTkLabel(card, text=f"{year} • {lang or ''}", font=FONT_NORMAL, text_color="white").pack()
-            ctk.CTkLabel(card, text=f"Seasons: {seasons} • Episodes: {ep_count}", font=("Arial", 10, "italic"), text_color="#cccccc").pack(pady=(4,4))
-            ctk.CTkLabel(card, text=genres, font=("Arial", 10, "italic"), text_color="#cccccc", wraplength=220).pack()
-            ctk.CTkLabel(card, text=f"Rating: {rating}", font=FONT_SUBHEADER, text_color=IMDB_YELLOW).pack()
-            ctk.CTkButton(card, text="Details", fg_color=IMDB_YELLOW, command=lambda mid=sid: self.show_series_detail(mid), width=160).pack(pady=(10,8))
-
-        render_next, has_more = self._create_scroll_batch(canvas, inner, rows, render_series_card, batch_size=20)
-
-        controls = ctk.CTkFrame(grid_frame, fg_color=IMDB_DARK_BG)
-        controls.pack(fill='x', pady=(6,12))
-        load_btn = ctk.CTkButton(controls, text="Load more", fg_color=IMDB_YELLOW, width=140)
-        load_btn.pack(anchor='center')
-
-        def on_load_clicked():
-            try:
-                more = render_next()
-                if not more:
-                    load_btn.configure(state='disabled', text='All loaded')
-            except Exception:
-                load_btn.configure(state='disabled')
+            poster.pack(pady=(8,2))
+            title_lbl = ctk.CTkLabel(card, text="", font=("Arial Black", 12), text_color=IMDB_YELLOW, wraplength=220)
+            title_lbl.pack()
+            meta_lbl = ctk.CTkLabel(card, text="", font=FONT_NORMAL, text_color="white")
+            meta_lbl.pack()
+            episodes_lbl = ctk.CTkLabel(card, text="", font=("Arial", 10, "italic"), text_color="#cccccc")
+            episodes_lbl.pack(pady=(4,4))
+            genres_lbl = ctk.CTkLabel(card, text="", font=("Arial", 10, "italic"), text_color="#cccccc", wraplength=220)
+            genres_lbl.pack()
+            rating_lbl = ctk.CTkLabel(card, text="", font=FONT_SUBHEADER, text_color=IMDB_YELLOW)
+            rating_lbl.pack()
+            details_btn = ctk.CTkButton(card, text="Details", fg_color=IMDB_YELLOW, width=160)
+            details_btn.pack(pady=(10,8))
+
+            def bind(r):
+                title_lbl.configure(text=r[1])
+                meta_lbl.configure(text=f"{r[2]} • {r[3] or ''}")
+                episodes_lbl.configure(text=f"Seasons: {r[7] or 1} • Episodes: {r[6] or 0}")
+                genres_lbl.configure(text=r[4] or '')
+                rating_lbl.configure(text=f"Rating: {r[5] or 'N/A'}")
+                details_btn.configure(command=lambda mid=r[0]: self.show_series_detail(mid))
+
+            return card, bind
+
+        loading = self._loading_label(self.page)
+        grid = VirtualCardGrid(self.page, build_series_card, cols=4, cell_width=264, cell_height=404,
+                               rows=catalog_model.view())
+        grid.pack(fill='both', expand=True, padx=20, pady=12)
 
-        load_btn.configure(command=on_load_clicked)
-        try:
-            if not has_more():
-                load_btn.configure(state='disabled', text='All loaded')
-        except Exception:
-            pass
+        # Query series (movies that have episodes). Include some extra metadata for cards.
+        self.run_query(catalog.fetchall, """
+            SELECT m.movie_id, m.movie_name, YEAR(m.release_date) as yr, m.language,
+                s.genres, ROUND(s.rating_sum / NULLIF(s.rating_count, 0), 1) as avg_rating,
+                s.episode_count as ep_count, s.max_season as seasons
+            FROM movies m
+            JOIN movie_summary s ON m.movie_id = s.movie_id
+            WHERE s.episode_count > 0
+            ORDER BY m.release_date DESC
+        """, callback=grid.append, loading=loading)
 
     def show_series_detail(self, series_id):
         """Display series-level detail and episode list (seasons/episodes)."""
         self.clear_page()
-        cursor.execute("""
-            SELECT m.movie_name, m.release_date, m.description, m.language,
-                ROUND(AVG(r.rating),1), GROUP_CONCAT(DISTINCT g.genre_name)
-            FROM movies m
-            LEFT JOIN reviews_ratings r ON m.movie_id=r.movie_id
-            LEFT JOIN movie_genre mg ON m.movie_id=mg.movie_id
-            LEFT JOIN genres g ON mg.genre_id=g.genre_id
-            WHERE m.movie_id=%s
-            GROUP BY m.movie_id
-        """, (series_id,))
-        row = cursor.fetchone()
-        if not row:
-            imdb_heading(self.page, "Series not found!")
-            return
-        imdb_heading(self.page, row[0])
-        imdb_subheading(self.page, f"Started: {row[1]} • {row[3] or ''}")
-        ctk.CTkLabel(self.page, text=row[2] or "(No summary available)", wraplength=850, font=FONT_NORMAL, text_color="white", anchor="w", bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20)
-        ctk.CTkLabel(self.page, text="Genres: " + (row[5] or ""), font=FONT_NORMAL, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20, pady=(6,0))
-        ctk.CTkLabel(self.page, text="Avg Rating: " + (str(row[4]) if row[4] else "N/A"), font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20, pady=(0,12))
-
-        # Episodes table grouped by season
-        ctk.CTkLabel(self.page, text="Episodes:", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20)
-        ep_frame = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
-        ep_frame.pack(fill='both', padx=20, pady=(6,12))
-        cols = ("Season", "Episode", "Title", "Air Date")
-        tree = ttk.Treeview(ep_frame, columns=cols, show="headings", height=18)
-        for col in cols:
-            tree.heading(col, text=col)
-            tree.column(col, anchor="center", width=180)
-        self._style_treeview(tree, heading_font=("Arial", 11, "bold"), cell_font=("Arial", 10), rowheight=26)
-        ep_scroll = ttk.Scrollbar(ep_frame, orient='vertical', command=tree.yview)
-        tree.configure(yscrollcommand=ep_scroll.set)
-        ep_scroll.pack(side='right', fill='y')
-        tree.pack(fill='both', expand=True)
+        heading = imdb_heading(self.page, "Loading...")
+
+        def load(sid):
+            row = db.named_fetchone('series_header', (sid,))
+            if not row:
+                return None, []
+            episodes = db.named_fetchall('series_episodes', (sid,))
+            return row, episodes
+
+        def fill(result):
+            row, episodes = result
+            if not row:
+                heading.configure(text="Series not found!")
+                return
+            heading.configure(text=row[0])
+            imdb_subheading(self.page, f"Started: {row[1]} • {row[3] or ''}")
+            ctk.CTkLabel(self.page, text=row[2] or "(No summary available)", wraplength=850, font=FONT_NORMAL, text_color="white", anchor="w", bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20)
+            ctk.CTkLabel(self.page, text="Genres: " + (row[5] or ""), font=FONT_NORMAL, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20, pady=(6,0))
+            ctk.CTkLabel(self.page, text="Avg Rating: " + (str(row[4]) if row[4] else "N/A"), font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20, pady=(0,12))
+
+            # Episodes table grouped by season
+            ctk.CTkLabel(self.page, text="Episodes:", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor="w", padx=20)
+            ep_frame = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
+            ep_frame.pack(fill='both', padx=20, pady=(6,12))
+            cols = ("Season", "Episode", "Title", "Air Date")
+            tree = ttk.Treeview(ep_frame, columns=cols, show="headings", height=18)
+            for col in cols:
+                tree.heading(col, text=col)
+                tree.column(col, anchor="center", width=180)
+            self._style_treeview(tree, heading_font=("Arial", 11, "bold"), cell_font=("Arial", 10), rowheight=26)
+            ep_scroll = ttk.Scrollbar(ep_frame, orient='vertical', command=tree.yview)
+            tree.configure(yscrollcommand=ep_scroll.set)
+            ep_scroll.pack(side='right', fill='y')
+            tree.pack(fill='both', expand=True)
+
+            for i, er in enumerate(episodes):
+                tag = 'even' if i % 2 == 0 else 'odd'
+                tree.insert('', 'end', values=er, tags=(tag,))
 
-        cursor.execute("""
-            SELECT season_number, episode_number, title, air_date
-            FROM episodes
-            WHERE movie_id=%s
-            ORDER BY season_number, episode_number
-        """, (series_id,))
-        for i, er in enumerate(cursor.fetchall()):
-            tag = 'even' if i % 2 == 0 else 'odd'
-            tree.insert('', 'end', values=er, tags=(tag,))
+        self.run_query(load, series_id, callback=fill, loading=self._loading_label(self.page))
 
     # ========== ADD MOVIE / SERIES (No login required) ==========
     def show_add_item(self):
@@ -2028,17 +6658,16 @@ class CineTrackIMDB(ctk.CTk):
 
         # Genres dropdown populated from DB with an option to add a new genre
         ctk.CTkLabel(form, text='Genre:').grid(row=5, column=0, sticky='w')
-        # fetch genres
-        genres = []
-        try:
-            cursor.execute('SELECT genre_name FROM genres ORDER BY genre_name')
-            genres = [r[0] for r in cursor.fetchall() if r and r[0]]
-        except Exception:
-            genres = []
-        genre_values = ['(none)'] + genres + ['Add New...']
         genre_var = ctk.StringVar(value='(none)')
-        genre_menu = ctk.CTkOptionMenu(form, values=genre_values, variable=genre_var, width=260)
+        genre_menu = ctk.CTkOptionMenu(form, values=['(none)', 'Add New...'], variable=genre_var, width=260)
         genre_menu.grid(row=5, column=1, pady=6, sticky='w')
+
+        # fetch genres in the background; the menu starts with just the fixed options
+        def fill_genres(rows):
+            genres = [r[0] for r in rows if r and r[0]]
+            genre_menu.configure(values=['(none)'] + genres + ['Add New...'])
+
+        self.run_query(catalog.fetchall, 'SELECT genre_name FROM genres ORDER BY genre_name', callback=fill_genres, owner=genre_menu)
         new_genre_e = ctk.CTkEntry(form, width=260)
         # initially hidden
         new_genre_e.grid(row=5, column=2, padx=8, sticky='w')
@@ -2124,106 +6753,99 @@ class CineTrackIMDB(ctk.CTk):
             typ = type_var.get()
 
             try:
-                # Insert or reuse movie/series row
-                cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s AND (release_date=%s OR %s IS NULL)", (title, rdate, rdate))
-                res = cursor.fetchone()
-                if res:
-                    movie_id = res[0]
-                else:
-                    cursor.execute("INSERT INTO movies (movie_name, release_date, language, description) VALUES (%s,%s,%s,%s)", (title, rdate, lang, desc))
-                    movie_id = cursor.lastrowid
-
-                # Handle genres
-                if genres_raw:
-                    parts = [p.strip() for p in re.split(r'[,|;]', genres_raw) if p.strip()]
-                    for g in parts:
-                        cursor.execute("SELECT genre_id FROM genres WHERE genre_name=%s", (g,))
-                        gres = cursor.fetchone()
-                        if gres:
-                            gid = gres[0]
+                with db.transaction() as cursor:
+                    # Insert or reuse movie/series row
+                    res = cursor.statements.fetchone('movie_by_name_any_date', (title, rdate, rdate))
+                    if res:
+                        movie_id = res[0]
+                    else:
+                        cursor.execute("INSERT INTO movies (movie_name, release_date, language, description) VALUES (%s,%s,%s,%s)", (title, rdate, lang, desc))
+                        movie_id = cursor.lastrowid
+
+                    # Handle genres
+                    if genres_raw:
+                        parts = [p.strip() for p in re.split(r'[,|;]', genres_raw) if p.strip()]
+                        for g in parts:
+                            gres = cursor.statements.fetchone('genre_by_name', (g,))
+                            if gres:
+                                gid = gres[0]
+                            else:
+                                cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (g,))
+                                gid = cursor.lastrowid
+                            try:
+                                cursor.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s,%s)", (movie_id, gid))
+                            except Exception:
+                                pass
+
+                    # Handle cast: create cast_members and movie_cast
+                    if cast_raw:
+                        cast_parts = [c.strip() for c in re.split(r'[,|;]', cast_raw) if c.strip()]
+                        for actor in cast_parts:
+                            cres = cursor.statements.fetchone('cast_by_name', (actor,))
+                            if cres:
+                                cid = cres[0]
+                            else:
+                                cursor.execute("INSERT INTO cast_members (name) VALUES (%s)", (actor,))
+                                cid = cursor.lastrowid
+                            # avoid duplicate movie_cast
+                            if not cursor.statements.fetchone('movie_cast_exists', (movie_id, cid)):
+                                cursor.execute("INSERT INTO movie_cast (movie_id, cast_id) VALUES (%s,%s)", (movie_id, cid))
+
+                    # Handle distribution: create studios/platforms and insert into movie_distribution and movie_platform
+                    # Normalize distribution date
+                    if distdate_raw and re.fullmatch(r"\d{4}$", distdate_raw):
+                        distdate_norm = distdate_raw + "-01-01"
+                    else:
+                        distdate_norm = distdate_raw or None
+                    if studio_raw:
+                        sres = cursor.statements.fetchone('studio_by_name', (studio_raw,))
+                        if sres:
+                            sid = sres[0]
                         else:
-                            cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (g,))
-                            gid = cursor.lastrowid
+                            cursor.execute("INSERT INTO studios (studio_name) VALUES (%s)", (studio_raw,))
+                            sid = cursor.lastrowid
+                        # movie_studio junction
+                        if not cursor.statements.fetchone('movie_studio_exists', (movie_id, sid)):
+                            cursor.execute("INSERT INTO movie_studio (movie_id, studio_id) VALUES (%s,%s)", (movie_id, sid))
+                        # distribution table if territory/platform/date provided
                         try:
-                            cursor.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s,%s)", (movie_id, gid))
+                            cursor.execute("INSERT INTO movie_distribution (movie_id, studio_id, platform_id, territory, distribution_date) VALUES (%s,%s,%s,%s,%s)", (movie_id, sid, None, territory_raw or None, distdate_norm))
                         except Exception:
                             pass
-
-                # Handle cast: create cast_members and movie_cast
-                if cast_raw:
-                    cast_parts = [c.strip() for c in re.split(r'[,|;]', cast_raw) if c.strip()]
-                    for actor in cast_parts:
-                        cursor.execute("SELECT cast_id FROM cast_members WHERE name=%s", (actor,))
-                        cres = cursor.fetchone()
-                        if cres:
-                            cid = cres[0]
+                    if platform_raw:
+                        pres = cursor.statements.fetchone('platform_by_name', (platform_raw,))
+                        if pres:
+                            pid = pres[0]
                         else:
-                            cursor.execute("INSERT INTO cast_members (name) VALUES (%s)", (actor,))
-                            cid = cursor.lastrowid
-                        # avoid duplicate movie_cast
-                        cursor.execute("SELECT 1 FROM movie_cast WHERE movie_id=%s AND cast_id=%s", (movie_id, cid))
-                        if not cursor.fetchone():
-                            cursor.execute("INSERT INTO movie_cast (movie_id, cast_id) VALUES (%s,%s)", (movie_id, cid))
-
-                # Handle distribution: create studios/platforms and insert into movie_distribution and movie_platform
-                # Normalize distribution date
-                if distdate_raw and re.fullmatch(r"\d{4}$", distdate_raw):
-                    distdate_norm = distdate_raw + "-01-01"
-                else:
-                    distdate_norm = distdate_raw or None
-                if studio_raw:
-                    cursor.execute("SELECT studio_id FROM studios WHERE studio_name=%s", (studio_raw,))
-                    sres = cursor.fetchone()
-                    if sres:
-                        sid = sres[0]
-                    else:
-                        cursor.execute("INSERT INTO studios (studio_name) VALUES (%s)", (studio_raw,))
-                        sid = cursor.lastrowid
-                    # movie_studio junction
-                    cursor.execute("SELECT 1 FROM movie_studio WHERE movie_id=%s AND studio_id=%s", (movie_id, sid))
-                    if not cursor.fetchone():
-                        cursor.execute("INSERT INTO movie_studio (movie_id, studio_id) VALUES (%s,%s)", (movie_id, sid))
-                    # distribution table if territory/platform/date provided
-                    try:
-                        cursor.execute("INSERT INTO movie_distribution (movie_id, studio_id, platform_id, territory, distribution_date) VALUES (%s,%s,%s,%s,%s)", (movie_id, sid, None, territory_raw or None, distdate_norm))
-                    except Exception:
-                        pass
-                if platform_raw:
-                    cursor.execute("SELECT platform_id FROM streaming_platforms WHERE platform_name=%s", (platform_raw,))
-                    pres = cursor.fetchone()
-                    if pres:
-                        pid = pres[0]
-                    else:
-                        cursor.execute("INSERT INTO streaming_platforms (platform_name) VALUES (%s)", (platform_raw,))
-                        pid = cursor.lastrowid
-                    cursor.execute("SELECT 1 FROM movie_platform WHERE movie_id=%s AND platform_id=%s", (movie_id, pid))
-                    if not cursor.fetchone():
-                        cursor.execute("INSERT INTO movie_platform (movie_id, platform_id) VALUES (%s,%s)", (movie_id, pid))
-                    try:
-                        cursor.execute("INSERT INTO movie_distribution (movie_id, studio_id, platform_id, territory, distribution_date) VALUES (%s,%s,%s,%s,%s)", (movie_id, None, pid, territory_raw or None, distdate_norm))
-                    except Exception:
-                        pass
-
-                # If series, optionally insert an episode
-                if typ == 'series':
-                    try:
-                        season = int(season_e.get().strip()) if season_e.get().strip() else 1
-                    except:
-                        season = 1
-                    try:
-                        epnum = int(epnum_e.get().strip()) if epnum_e.get().strip() else None
-                    except:
-                        epnum = None
-                    eptitle = eptitle_e.get().strip() or None
-                    if epnum is not None:
-                        cursor.execute("SELECT episode_id FROM episodes WHERE movie_id=%s AND season_number=%s AND episode_number=%s", (movie_id, season, epnum))
-                        if cursor.fetchone():
-                            # already exists
+                            cursor.execute("INSERT INTO streaming_platforms (platform_name) VALUES (%s)", (platform_raw,))
+                            pid = cursor.lastrowid
+                        if not cursor.statements.fetchone('movie_platform_exists', (movie_id, pid)):
+                            cursor.execute("INSERT INTO movie_platform (movie_id, platform_id) VALUES (%s,%s)", (movie_id, pid))
+                        try:
+                            cursor.execute("INSERT INTO movie_distribution (movie_id, studio_id, platform_id, territory, distribution_date) VALUES (%s,%s,%s,%s,%s)", (movie_id, None, pid, territory_raw or None, distdate_norm))
+                        except Exception:
                             pass
-                        else:
-                            cursor.execute("INSERT INTO episodes (movie_id, episode_number, season_number, title, air_date) VALUES (%s,%s,%s,%s,%s)", (movie_id, epnum, season, eptitle, rdate))
 
-                conn.commit()
+                    # If series, optionally insert an episode
+                    if typ == 'series':
+                        try:
+                            season = int(season_e.get().strip()) if season_e.get().strip() else 1
+                        except:
+                            season = 1
+                        try:
+                            epnum = int(epnum_e.get().strip()) if epnum_e.get().strip() else None
+                        except:
+                            epnum = None
+                        eptitle = eptitle_e.get().strip() or None
+                        if epnum is not None:
+                            if cursor.statements.fetchone('episode_exists', (movie_id, season, epnum)):
+                                # already exists
+                                pass
+                            else:
+                                cursor.execute("INSERT INTO episodes (movie_id, episode_number, season_number, title, air_date) VALUES (%s,%s,%s,%s,%s)", (movie_id, epnum, season, eptitle, rdate))
+
+                # make the new title/cast searchable right away
+                self._sync_search_indexes()
                 messagebox.showinfo('Success', f'{typ.title()} added successfully')
                 # clear form
                 title_e.delete(0, 'end')
@@ -2241,7 +6863,6 @@ class CineTrackIMDB(ctk.CTk):
                 distdate_e.delete(0, 'end')
                 status_lbl.configure(text='')
             except Exception as e:
-                conn.rollback()
                 status_lbl.configure(text=f'Error: {e}')
 
         btns = ctk.CTkFrame(form)
@@ -2277,26 +6898,15 @@ class CineTrackIMDB(ctk.CTk):
             if not self.current_user:
                 messagebox.showerror('Auth', 'Login to add to watchlist')
                 return
-            try:
-                self._ensure_watchlist_table()
-                cursor.execute('INSERT INTO user_watchlist (user_id, movie_id) VALUES (%s,%s)', (self.current_user[0], series_id))
-                conn.commit()
-                messagebox.showinfo('Added', 'Added to your watchlist')
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror('DB', f'Failed: {e}')
+            self.run_write('INSERT INTO user_watchlist (user_id, movie_id) VALUES (%s,%s)', (self.current_user[0], series_id),
+                           callback=lambda _: messagebox.showinfo('Added', 'Added to your watchlist'))
 
         def remove_watchlist_series():
             if not self.current_user:
                 messagebox.showerror('Auth', 'Login to remove from watchlist')
                 return
-            try:
-                cursor.execute('DELETE FROM user_watchlist WHERE user_id=%s AND movie_id=%s', (self.current_user[0], series_id))
-                conn.commit()
-                messagebox.showinfo('Removed', 'Removed from your watchlist')
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror('DB', f'Failed: {e}')
+            self.run_write('DELETE FROM user_watchlist WHERE user_id=%s AND movie_id=%s', (self.current_user[0], series_id),
+                           callback=lambda _: messagebox.showinfo('Removed', 'Removed from your watchlist'))
 
         ctk.CTkButton(wf, text='Add to Watchlist', fg_color=IMDB_YELLOW, command=add_watchlist_series, width=160).pack(side='left', padx=6)
         ctk.CTkButton(wf, text='Remove from Watchlist', fg_color=IMDB_YELLOW, command=remove_watchlist_series, width=200).pack(side='left', padx=6)
@@ -2317,114 +6927,92 @@ class CineTrackIMDB(ctk.CTk):
         Each row represents a single episode. If the parent series (movie) doesn't exist it will be created.
         Episodes that already exist (same movie_id + season + episode_number) are skipped.
         """
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(title="Select Series CSV file", filetypes=[("CSV files", "*.csv")])
         if not file_path:
             return
-        inserted, skipped, failed = self.import_series_csv_from_path(file_path)
-        messagebox.showinfo("Import Complete", f"Inserted episodes: {inserted}\nSkipped: {skipped}\nFailed: {failed}")
+        self._start_import("Series CSV", self.import_series_csv_from_path, file_path,
+                           on_done=lambda c: messagebox.showinfo("Import Complete", f"Inserted episodes: {c[0]}\nSkipped: {c[1]}\nFailed: {c[2]}"))
 
-    def import_series_csv_from_path(self, file_path):
+    def import_series_csv_from_path(self, file_path, job=None):
         """Helper to import a series CSV from a given file path. Returns (inserted, skipped, failed)."""
         inserted = 0
         skipped = 0
         failed = 0
-        try:
-            with open(file_path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    series_title = (row.get('title') or row.get('series_name') or row.get('movie_name') or '').strip()
-                    season_raw = (row.get('season') or row.get('season_number') or '').strip()
-                    ep_raw = (row.get('episode') or row.get('episode_number') or '').strip()
-                    ep_title = (row.get('episode_title') or row.get('ep_title') or '').strip()
-                    release_date = (row.get('release_date') or row.get('episode_date') or row.get('date') or row.get('year') or '').strip()
-                    language = (row.get('language') or '').strip()
-                    description = (row.get('description') or row.get('summary') or '').strip()
-                    genres_raw = (row.get('genres') or row.get('genre') or '').strip()
-
-                    if not series_title:
-                        skipped += 1
-                        continue
-
-                    # normalize season and episode numbers
-                    try:
-                        season = int(season_raw) if season_raw else 1
-                    except:
-                        season = 1
-                    try:
-                        episode_number = int(ep_raw) if ep_raw else None
-                    except:
-                        episode_number = None
-
-                    # If year-only provided, convert to YYYY-01-01
-                    if release_date and re.fullmatch(r"\d{4}$", release_date):
-                        release_date = release_date + "-01-01"
-
+        rows = 0
+        with db.transaction() as cursor:
+            # rows are parsed in worker processes; this thread only writes
+            for records, chunk_skipped, chunk_failed, end in iter_csv_records(file_path, normalize_series_row, series_record_key):
+                rows += len(records) + chunk_skipped + chunk_failed
+                skipped += chunk_skipped
+                failed += chunk_failed
+                for series_title, season, episode_number, ep_title, release_date, language, description, genres in records:
                     try:
                         # ensure parent series exists as a movie row
-                        cursor.execute("SELECT movie_id FROM movies WHERE movie_name=%s", (series_title,))
-                        res = cursor.fetchone()
+                        res = cursor.statements.fetchone('movie_by_name', (series_title,))
                         if res:
                             movie_id = res[0]
                         else:
                             cursor.execute("INSERT INTO movies (movie_name, release_date, language, description) VALUES (%s,%s,%s,%s)",
-                                           (series_title, release_date or None, language or None, description or None))
+                                           (series_title, release_date, language, description))
                             movie_id = cursor.lastrowid
 
                         # skip if episode number exists
                         if episode_number is not None:
-                            cursor.execute("SELECT episode_id FROM episodes WHERE movie_id=%s AND season_number=%s AND episode_number=%s",
-                                           (movie_id, season, episode_number))
-                            if cursor.fetchone():
+                            if cursor.statements.fetchone('episode_exists', (movie_id, season, episode_number)):
                                 skipped += 1
                                 continue
 
                         # insert episode (DB schema uses columns: title, air_date, episode_number, season_number)
                         cursor.execute("INSERT INTO episodes (movie_id, episode_number, season_number, title, air_date) VALUES (%s,%s,%s,%s,%s)",
-                                       (movie_id, episode_number, season, ep_title or None, release_date or None))
+                                       (movie_id, episode_number, season, ep_title, release_date))
 
                         # handle genres at series level
-                        if genres_raw:
-                            parts = [p.strip() for p in re.split(r'[,|;]', genres_raw) if p.strip()]
-                            for g in parts:
-                                cursor.execute("SELECT genre_id FROM genres WHERE genre_name=%s", (g,))
-                                gres = cursor.fetchone()
-                                if gres:
-                                    gid = gres[0]
-                                else:
-                                    cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (g,))
-                                    gid = cursor.lastrowid
-                                try:
-                                    cursor.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s,%s)", (movie_id, gid))
-                                except Exception:
-                                    pass
+                        for g in genres:
+                            gres = cursor.statements.fetchone('genre_by_name', (g,))
+                            if gres:
+                                gid = gres[0]
+                            else:
+                                cursor.execute("INSERT INTO genres (genre_name) VALUES (%s)", (g,))
+                                gid = cursor.lastrowid
+                            try:
+                                cursor.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s,%s)", (movie_id, gid))
+                            except Exception:
+                                pass
 
                         inserted += 1
                     except Exception as e:
                         failed += 1
                         print("Error importing series row:", e)
+                if job is not None:
+                    job.report(end, rows, (inserted, skipped, failed))
+                    if job.cancelled:
+                        # keep what was written so far
+                        break
 
-            conn.commit()
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Failed to import Series CSV: {e}")
-            return (0, 0, 1)
-
+        self._sync_search_indexes()
         return (inserted, skipped, failed)
 
     def import_examples_series(self):
         """Import the two example CSVs present in the workspace and show a combined summary."""
         paths = [r"d:\\Coading\\comprehensive_tv_episodes_india_us_1975_2025.csv",
                  r"d:\\Coading\\streaming_series_episodes_netflix_prime_hbo_disney.csv"]
-        total_inserted = total_skipped = total_failed = 0
+        totals = [0, 0, 0]
+        pending = [p for p in paths if os.path.exists(p)]
         for p in paths:
-            if not os.path.exists(p):
+            if p not in pending:
                 messagebox.showwarning("File missing", f"File not found: {p}")
-                continue
-            ins, sk, fa = self.import_series_csv_from_path(p)
-            total_inserted += ins
-            total_skipped += sk
-            total_failed += fa
 
-        messagebox.showinfo("Example Import Complete", f"Inserted episodes: {total_inserted}\nSkipped: {total_skipped}\nFailed: {total_failed}")
+        def done(counts):
+            # one job per file; summarize once the last of them finishes
+            for i, n in enumerate(counts):
+                totals[i] += n
+            pending.pop()
+            if not pending:
+                messagebox.showinfo("Example Import Complete", f"Inserted episodes: {totals[0]}\nSkipped: {totals[1]}\nFailed: {totals[2]}")
+
+        for p in list(pending):
+            self._start_import(os.path.basename(p), self.import_series_csv_from_path, p, on_done=done)
 
     # ========== SEARCH ==========
     def show_search(self, initial_query=None, initial_cast=False):
@@ -2445,12 +7033,29 @@ class CineTrackIMDB(ctk.CTk):
         search_year.grid(row=0, column=2, padx=6)
         search_cast = ctk.CTkEntry(search_frame, width=150, placeholder_text="Cast Name", font=FONT_NORMAL)
         search_cast.grid(row=0, column=3, padx=6)
-        search_button = ctk.CTkButton(search_frame, text="Search", fg_color=IMDB_YELLOW, font=FONT_SUBHEADER, command=lambda: self._run_search(search_title.get(), search_genre.get(), search_year.get(), search_cast.get(), search_platform.get()))
+
+        fields = (search_title, search_genre, search_year, search_cast, search_platform)
+
+        def run_now(_event=None):
+            self._run_search(*(f.get() for f in fields))
+
+        def run_later(_event=None):
+            # Typing re-searches once the user pauses; unchanged inputs cost nothing
+            if self._search_after is not None:
+                self.after_cancel(self._search_after)
+            self._search_after = self.after(SEARCH_DEBOUNCE_MS, run_now)
+
+        search_button = ctk.CTkButton(search_frame, text="Search", fg_color=IMDB_YELLOW, font=FONT_SUBHEADER, command=run_now)
         search_button.grid(row=0, column=5, padx=8)
 
-        # Bind Enter to the search fields to perform the search
-        for ent in (search_title, search_genre, search_year, search_cast, search_platform):
-            ent.bind('<Return>', lambda e, st=search_title, sg=search_genre, sy=search_year, sc=search_cast, sp=search_platform: self._run_search(st.get(), sg.get(), sy.get(), sc.get(), sp.get()))
+        # Enter searches at once, any other key after the debounce
+        for ent in fields:
+            ent.bind('<Return>', run_now)
+            ent.bind('<KeyRelease>', run_later, add='+')
+
+        self.search_results = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
+        self.search_results.pack(fill="both", padx=13, pady=8, expand=True)
+        self._search = self._build_search_results(self.search_results)
 
         # If `initial_query` provided (from header), pre-fill title and run search
         if initial_query:
@@ -2458,19 +7063,14 @@ class CineTrackIMDB(ctk.CTk):
                 search_title.insert(0, initial_query)
                 if initial_cast:
                     search_cast.insert(0, initial_query)
-                self._run_search(search_title.get(), search_genre.get(), search_year.get(), search_cast.get(), search_platform.get())
+                run_now()
             except Exception:
                 pass
 
-        self.search_results = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
-        self.search_results.pack(fill="both", padx=13, pady=8, expand=True)
-
-    def _run_search(self, title, genre, year, cast, platform=None):
-        # Clear prev
-        for child in self.search_results.winfo_children():
-            child.destroy()
+    def _build_search_results(self, master):
+        """Create the result widgets once; _run_search updates them in place."""
         # Layout two columns: left for Cast results, right for Movies/TV
-        container = ctk.CTkFrame(self.search_results, fg_color=IMDB_DARK_BG)
+        container = ctk.CTkFrame(master, fg_color=IMDB_DARK_BG)
         container.pack(fill='both', expand=True)
         left = ctk.CTkFrame(container, fg_color=IMDB_DARK_BG)
         right = ctk.CTkFrame(container, fg_color=IMDB_DARK_BG)
@@ -2479,6 +7079,8 @@ class CineTrackIMDB(ctk.CTk):
 
         # Cast panel
         ctk.CTkLabel(left, text='Cast Results', font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor='w', padx=6, pady=(6,4))
+        cast_status = ctk.CTkLabel(left, text='', font=FONT_NORMAL, text_color="#aaaaaa", bg_color=IMDB_DARK_BG)
+        cast_status.pack(anchor='w', padx=6)
         cast_tree = ttk.Treeview(left, columns=('Name','Age','Bio'), show='headings', height=18)
         for col in ('Name','Age','Bio'):
             cast_tree.heading(col, text=col)
@@ -2494,106 +7096,162 @@ class CineTrackIMDB(ctk.CTk):
         except Exception:
             pass
 
-        # Movies/TV panel
+        # Movies/TV panel: a two-column virtual grid, so new results rebind cards instead of rebuilding them
         ctk.CTkLabel(right, text='Movies & TV Results', font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor='w', padx=6, pady=(6,4))
-        movies_canvas = ctk.CTkFrame(right, fg_color=IMDB_DARK_BG)
-        movies_canvas.pack(fill='both', expand=True)
-
-        # If a cast name is provided, populate cast results
-        if cast:
-            query = "SELECT cast_id, name, dob, bio FROM cast_members WHERE name LIKE %s"
-            params = [f"%{cast}%"]
-            cursor.execute(query, params)
-            for i, r in enumerate(cursor.fetchall()):
-                age = self.calc_age(r[2]) if r[2] else ''
-                tag = 'even' if i%2==0 else 'odd'
-                cast_tree.insert('', 'end', values=(r[1], age, (r[3] or '')[:200]), tags=(tag,))
+        movie_status = ctk.CTkLabel(right, text='', font=FONT_NORMAL, text_color="#aaaaaa", bg_color=IMDB_DARK_BG)
+        movie_status.pack(anchor='w', padx=6)
+
+        def build_result_card(parent):
+            card = ctk.CTkFrame(parent, fg_color=IMDB_GRAY, corner_radius=10, width=420, height=140)
+            card.pack_propagate(False)
+            title_lbl = ctk.CTkLabel(card, text="", font=("Arial Black", 12), text_color=IMDB_YELLOW, wraplength=360)
+            title_lbl.pack(anchor='w', padx=8)
+            meta_lbl = ctk.CTkLabel(card, text="", font=FONT_NORMAL, text_color="white")
+            meta_lbl.pack(anchor='w', padx=8)
+            genres_lbl = ctk.CTkLabel(card, text="", font=("Arial", 10, "italic"), text_color="#cccccc", wraplength=360)
+            genres_lbl.pack(anchor='w', padx=8)
+            btnframe = ctk.CTkFrame(card, fg_color=IMDB_GRAY)
+            btnframe.pack(anchor='e', pady=(6,8), padx=8)
+            details_btn = ctk.CTkButton(btnframe, text="Details", fg_color=IMDB_YELLOW, width=100)
+            details_btn.pack(side='left', padx=6)
+            watch_btn = ctk.CTkButton(btnframe, text="Add Watchlist", fg_color=IMDB_YELLOW, width=120)
+            watch_btn.pack(side='left', padx=6)
+
+            def bind(r):
+                title_lbl.configure(text=r[1])
+                meta_lbl.configure(text=f"{r[2]} • {r[3] or ''}")
+                genres_lbl.configure(text=r[4] or '')
+                details_btn.configure(command=lambda mid=r[0]: self.show_movie_detail(mid))
+                watch_btn.configure(command=lambda mid=r[0]: self._add_to_watchlist(mid))
+
+            return card, bind
 
-        # Always search movies/TV as well (use title/genre/year/platform filters)
+        grid = VirtualCardGrid(right, build_result_card, cols=2, cell_width=444, cell_height=164,
+                               on_visible=lambda rows: self._prefetch_details([r[0] for r in rows]),
+                               rows=catalog_model.view())
+        grid.pack(fill='both', expand=True)
+
+        return {'container': container, 'cast_tree': cast_tree, 'grid': grid,
+                'status': {'cast': cast_status, 'movies': movie_status},
+                'inputs': {}, 'futures': {}, 'generation': {'cast': 0, 'movies': 0}}
+
+    def _run_search(self, title, genre, year, cast, platform=None):
+        """Re-run only the searches whose inputs changed and patch their results in place.
+
+        The cast list depends on the cast field alone and the movie cards on the
+        other four. A newer run supersedes one in flight: its future is
+        cancelled if it has not started yet, and its result is ignored if it has.
+        """
+        panel = self._search
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+            self._search_after = None
+        if panel is None or not panel['container'].winfo_exists():
+            return
+
+        inputs = {
+            'cast': (cast.strip(),),
+            'movies': (title.strip(), genre.strip(), year.strip(), (platform or '').strip()),
+        }
+        apply = {'cast': self._apply_cast_results, 'movies': self._apply_movie_results}
+        fetch = {'cast': self._search_cast_rows, 'movies': self._search_movie_rows}
+        for kind, args in inputs.items():
+            if panel['inputs'].get(kind) == args:
+                continue
+            panel['inputs'][kind] = args
+            panel['generation'][kind] += 1
+            pending = panel['futures'].pop(kind, None)
+            if pending is not None:
+                pending.cancel()
+            status = panel['status'][kind]
+            if kind == 'cast' and not args[0]:
+                apply[kind](panel, [])
+                continue
+            status.configure(text="Searching...", text_color="#aaaaaa")
+
+            def deliver(rows, kind=kind, generation=panel['generation'][kind]):
+                if generation == panel['generation'][kind]:
+                    panel['futures'].pop(kind, None)
+                    apply[kind](panel, rows)
+
+            def failed(err, kind=kind, status=status, generation=panel['generation'][kind]):
+                if generation == panel['generation'][kind]:
+                    status.configure(text=f"Search failed: {err}", text_color="red")
+
+            panel['futures'][kind] = self.executor.submit(fetch[kind], *args, callback=deliver, errback=failed,
+                                                          owner=panel['container'])
+
+    def _apply_cast_results(self, panel, rows):
+        def values(r):
+            return (r[1], self.calc_age(r[2]) if r[2] else '', (r[3] or '')[:200])
+
+        _sync_treeview(panel['cast_tree'], rows, values)
+        panel['status']['cast'].configure(text=f"{len(rows)} found" if panel['inputs']['cast'][0] else '',
+                                          text_color="#aaaaaa")
+
+    def _apply_movie_results(self, panel, rows):
+        grid = panel['grid']
+        view = catalog_model.view(rows)
+        # Same titles in the same order: the bound cards are already right
+        if view.positions != grid.rows.positions:
+            grid.set_rows(view)
+        panel['status']['movies'].configure(text=f"{len(rows)} found", text_color="#aaaaaa")
+
+    def _search_cast_rows(self, text):
+        """Cast rows matching text, best match first (runs on a worker thread)."""
+        ids = [cid for cid, _ in search_engine.search_cast(text)]
+        if not ids:
+            return []
+        marks = ', '.join(['%s'] * len(ids))
+        by_id = {r[0]: r for r in catalog.fetchall(f"SELECT cast_id, name, dob, bio FROM cast_members WHERE cast_id IN ({marks})", ids, cached=False)}
+        return [by_id[i] for i in ids if i in by_id]
+
+    def _search_movie_rows(self, title, genre, year, platform=None):
+        """Movie rows for the search filters (runs on a worker thread).
+
+        The title goes through search_engine, so results come back ranked by
+        relevance; genre/year/platform then narrow that id list in SQL.
+        """
         query = """
             SELECT m.movie_id, m.movie_name, YEAR(m.release_date) as yr, m.language,
-                GROUP_CONCAT(DISTINCT g.genre_name) as genres,
-                ROUND(AVG(r.rating),1) as avg_rating
+                s.genres, ROUND(s.rating_sum / NULLIF(s.rating_count, 0), 1) as avg_rating
             FROM movies m
-            LEFT JOIN movie_genre mg ON m.movie_id=mg.movie_id
-            LEFT JOIN genres g ON mg.genre_id=g.genre_id
-            LEFT JOIN reviews_ratings r ON m.movie_id=r.movie_id
-            LEFT JOIN movie_platform mp ON m.movie_id=mp.movie_id
-            LEFT JOIN streaming_platforms sp ON mp.platform_id=sp.platform_id
+            LEFT JOIN movie_summary s ON m.movie_id=s.movie_id
             WHERE 1=1
         """
         params = []
+        ids = None
         if title:
-            query += " AND m.movie_name LIKE %s "
-            params.append(f"%{title}%")
+            ids = [mid for mid, _ in search_engine.search_movies(title)]
+            if not ids:
+                return []
+            query += f" AND m.movie_id IN ({', '.join(['%s'] * len(ids))}) "
+            params += ids
         if genre:
-            query += " AND g.genre_name LIKE %s "
+            query += " AND s.genres LIKE %s "
             params.append(f"%{genre}%")
         if year:
             query += " AND YEAR(m.release_date)=%s "
-            params.append(year)
+            params.append(int(year) if str(year).strip().isdigit() else year)
         if platform:
-            query += " AND sp.platform_name LIKE %s "
+            query += """ AND EXISTS (
+                SELECT 1 FROM movie_platform mp
+                JOIN streaming_platforms sp ON mp.platform_id=sp.platform_id
+                WHERE mp.movie_id=m.movie_id AND sp.platform_name LIKE %s) """
             params.append(f"%{platform}%")
-        query += " GROUP BY m.movie_id "
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-
-        def render_movie_card(idx, r, parent):
-            cid = r[0]
-            title = r[1]
-            year = r[2]
-            lang = r[3]
-            genres = r[4] or ''
-            rating = r[5] or 'N/A'
-
-            cols = 2
-            padx = 12
-            pady = 12
-            card = ctk.CTkFrame(parent, fg_color=IMDB_GRAY, corner_radius=10, width=420, height=120)
-            card.grid(row=idx//cols, column=idx%cols, padx=padx, pady=pady)
-            ctk.CTkLabel(card, text=title, font=("Arial Black", 12), text_color=IMDB_YELLOW, wraplength=360).pack(anchor='w', padx=8)
-            ctk.CTkLabel(card, text=f"{year} • {lang or ''}", font=FONT_NORMAL, text_color="white").pack(anchor='w', padx=8)
-            ctk.CTkLabel(card, text=genres, font=("Arial", 10, "italic"), text_color="#cccccc", wraplength=360).pack(anchor='w', padx=8)
-            btnframe = ctk.CTkFrame(card, fg_color=IMDB_GRAY)
-            btnframe.pack(anchor='e', pady=(6,8), padx=8)
-            ctk.CTkButton(btnframe, text="Details", fg_color=IMDB_YELLOW, command=lambda mid=cid: self.show_movie_detail(mid), width=100).pack(side='left', padx=6)
-            ctk.CTkButton(btnframe, text="Add Watchlist", fg_color=IMDB_YELLOW, command=lambda mid=cid: self._add_to_watchlist(mid), width=120).pack(side='left', padx=6)
-
-        render_next, has_more = self._create_scroll_batch(movies_canvas, movies_canvas, rows, render_movie_card, batch_size=8)
-
-        controls = ctk.CTkFrame(right, fg_color=IMDB_DARK_BG)
-        controls.pack(fill='x', pady=(6,12))
-        load_btn = ctk.CTkButton(controls, text="Load more", fg_color=IMDB_YELLOW, width=140)
-        load_btn.pack(anchor='center')
-
-        def on_load_clicked():
-            try:
-                more = render_next()
-                if not more:
-                    load_btn.configure(state='disabled', text='All loaded')
-            except Exception:
-                load_btn.configure(state='disabled')
-
-        load_btn.configure(command=on_load_clicked)
-        try:
-            if not has_more():
-                load_btn.configure(state='disabled', text='All loaded')
-        except Exception:
-            pass
+        rows = catalog.fetchall(query, params, cached=False)
+        if ids is None:
+            return rows
+        # keep the relevance order from the search engine
+        by_id = {r[0]: r for r in rows}
+        return [by_id[i] for i in ids if i in by_id]
 
     def _add_to_watchlist(self, movie_id):
         if not self.current_user:
             messagebox.showerror('Auth','Login to add')
             return
-        try:
-            self._ensure_watchlist_table()
-            cursor.execute('INSERT INTO user_watchlist (user_id, movie_id) VALUES (%s,%s)', (self.current_user[0], movie_id))
-            conn.commit()
-            messagebox.showinfo('Added','Movie added to your watchlist')
-        except Exception as e:
-            conn.rollback()
-            messagebox.showerror('DB', f'Failed: {e}')
+        self.run_write('INSERT INTO user_watchlist (user_id, movie_id) VALUES (%s,%s)', (self.current_user[0], movie_id),
+                       callback=lambda _: messagebox.showinfo('Added', 'Movie added to your watchlist'))
 
     def show_donations(self):
         """Display donations summary, top donors and a small form to add donations."""
@@ -2616,19 +7274,12 @@ class CineTrackIMDB(ctk.CTk):
         summary_frame = ctk.CTkFrame(scrollable_frame, fg_color=IMDB_DARK_BG)
         summary_frame.pack(anchor="w", padx=20, pady=(8,6), fill='x')
 
-        cursor.execute("SELECT IFNULL(SUM(donation_amount),0) FROM donations")
-        total = cursor.fetchone()[0] or 0.0
-        total_label = ctk.CTkLabel(summary_frame, text=f"Total Donations: ${total:.2f}", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG)
+        total_label = ctk.CTkLabel(summary_frame, text="Total Donations: Loading...", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG)
         total_label.pack(anchor='w')
         
         # Show trigger statistics
-        cursor.execute("SELECT COUNT(*) FROM donations WHERE comment='Welcome, user created!'")
-        welcome_count = cursor.fetchone()[0] or 0
-        cursor.execute("SELECT COUNT(*) FROM users")
-        total_users = cursor.fetchone()[0] or 0
-        
         trigger_stats = ctk.CTkLabel(summary_frame, 
-                                   text=f"🎯 Auto-Welcome Donations: {welcome_count} (Trigger Success Rate: {(welcome_count/max(total_users,1)*100):.1f}%)", 
+                                   text="", 
                                    font=FONT_NORMAL, 
                                    text_color='lightgray', 
                                    bg_color=IMDB_DARK_BG)
@@ -2654,43 +7305,13 @@ class CineTrackIMDB(ctk.CTk):
         donors_scroll.pack(side='right', fill='y')
         tree.pack(fill='both', expand=True, pady=(6,0))
 
-        # Fetch total, latest donation date, and the most recent non-null comment for each user
-        cursor.execute(
-            """
-            SELECT u.username,
-                   IFNULL(SUM(d.donation_amount),0) AS total,
-                   MAX(d.donation_date) AS last_date,
-                   (
-                       SELECT d2.comment
-                       FROM donations d2
-                       WHERE d2.user_id = u.user_id AND d2.comment IS NOT NULL
-                       ORDER BY d2.donation_date DESC
-                       LIMIT 1
-                   ) AS recent_comment
-            FROM donations d
-            JOIN users u ON d.user_id = u.user_id
-            GROUP BY u.user_id
-            ORDER BY total DESC
-            LIMIT 50
-            """
-        )
-        rows = cursor.fetchall()
-        for i, r in enumerate(rows):
-            tag = 'even' if i % 2 == 0 else 'odd'
-            recent_comment = r[3] or ''
-            tree.insert('', 'end', values=(r[0], f"{r[1]:.2f}", r[2], recent_comment), tags=(tag,))
-
-        # Get users list for lookup and donation form
-        cursor.execute("SELECT username FROM users ORDER BY username")
-        users = [r[0] for r in cursor.fetchall()]
-        
         # User Donation Lookup section (using total_donations function)
         lookup_frame = ctk.CTkFrame(scrollable_frame, fg_color=IMDB_DARK_BG)
         lookup_frame.pack(anchor='w', padx=20, pady=(8,6), fill='x')
         ctk.CTkLabel(lookup_frame, text="🔍 Check User's Total Donations", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).grid(row=0, column=0, columnspan=3, sticky='w', pady=(0,6))
         
         ttk.Label(lookup_frame, text="Username:").grid(row=1, column=0, sticky='w', padx=(0,6))
-        lookup_username_cb = ttk.Combobox(lookup_frame, values=users, width=25)
+        lookup_username_cb = ttk.Combobox(lookup_frame, values=[], width=25)
         lookup_username_cb.grid(row=1, column=1, sticky='w', padx=(0,6))
         
         lookup_result_lbl = ctk.CTkLabel(lookup_frame, text="", font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG)
@@ -2702,24 +7323,18 @@ class CineTrackIMDB(ctk.CTk):
                 lookup_result_lbl.configure(text="Please select a username")
                 return
             
-            try:
-                # Get user ID
-                cursor.execute("SELECT user_id FROM users WHERE username=%s", (selected_username,))
-                user_result = cursor.fetchone()
-                if not user_result:
-                    lookup_result_lbl.configure(text="User not found")
+
+            def show_total(total):
+                if total is None:
+                    lookup_result_lbl.configure(text="User not found", text_color='white')
                     return
-                
-                user_id = user_result[0]
-                
-                # Use the total_donations database function
-                cursor.execute("SELECT total_donations(%s)", (user_id,))
-                total = cursor.fetchone()[0] or 0.00
-                
                 lookup_result_lbl.configure(text=f"💰 Total: ${total:.2f}", text_color=IMDB_YELLOW)
-                
-            except Exception as e:
-                lookup_result_lbl.configure(text=f"Error: {e}", text_color='red')
+
+            # Uses the total_donations database function
+            lookup_result_lbl.configure(text="Looking up...", text_color='white')
+            self.executor.submit(user_donation_total, selected_username, callback=show_total,
+                                 errback=lambda err: lookup_result_lbl.configure(text=f"Error: {err}", text_color='red'),
+                                 owner=lookup_result_lbl)
         
         ctk.CTkButton(lookup_frame, text="Check Total", fg_color=IMDB_YELLOW, command=lookup_user_donations, width=100).grid(row=2, column=0, columnspan=2, pady=(6,0))
 
@@ -2728,40 +7343,16 @@ class CineTrackIMDB(ctk.CTk):
         recent_frame.pack(anchor='w', padx=20, pady=(6,8), fill='x')
         ctk.CTkLabel(recent_frame, text="💫 Recent Donations", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).pack(anchor='w', padx=8, pady=(6,4))
         
-        # Get recent donations (excluding welcome donations)
-        cursor.execute("""
-            SELECT u.username, d.donation_amount, d.donation_date, d.comment
-            FROM donations d
-            JOIN users u ON d.user_id = u.user_id
-            WHERE d.comment != 'Welcome, user created!' OR d.comment IS NULL
-            ORDER BY d.donation_date DESC
-            LIMIT 5
-        """)
-        recent_donations = cursor.fetchall()
-        
-        if recent_donations:
-            for username, amount, date, comment in recent_donations:
-                recent_text = f"• {username}: ${amount:.2f}"
-                if comment and comment != 'Welcome, user created!':
-                    recent_text += f" - \"{comment}\""
-                recent_text += f" ({date.strftime('%Y-%m-%d %H:%M')})"
-                
-                ctk.CTkLabel(recent_frame, text=recent_text, 
-                           font=FONT_NORMAL, text_color='lightgray', 
-                           bg_color=IMDB_DARK_BG).pack(anchor='w', padx=16, pady=1)
-        else:
-            ctk.CTkLabel(recent_frame, text="• No recent donations found", 
-                       font=FONT_NORMAL, text_color='lightgray', 
-                       bg_color=IMDB_DARK_BG).pack(anchor='w', padx=16, pady=4)
+        recent_loading = self._loading_label(recent_frame, anchor='w', padx=16, pady=4)
 
         # Donation form
         form_frame = ctk.CTkFrame(scrollable_frame, fg_color=IMDB_DARK_BG)
         form_frame.pack(anchor='w', padx=20, pady=(8,12), fill='x')
         ctk.CTkLabel(form_frame, text="💝 Make a Donation", font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_DARK_BG).grid(row=0, column=0, columnspan=4, sticky='w', pady=(0,6))
 
-        # Username selector (combobox) - already have users list from above
+        # Username selector (combobox) - values are filled once the users list arrives
         ttk.Label(form_frame, text="User:").grid(row=1, column=0, sticky='w', padx=(0,6))
-        username_cb = ttk.Combobox(form_frame, values=users, width=30)
+        username_cb = ttk.Combobox(form_frame, values=[], width=30)
         username_cb.grid(row=1, column=1, columnspan=2, sticky='w', padx=(0,6))
         # If a user is logged in, auto-select them and disable the combobox so
         # donations are always performed as the authenticated user.
@@ -2836,70 +7427,103 @@ class CineTrackIMDB(ctk.CTk):
 
             uid = self.current_user[0]
 
-            try:
-                cursor.execute("INSERT INTO donations (user_id, donation_amount, comment) VALUES (%s,%s,%s)", (uid, amt, comment))
-                conn.commit()
-                
+            def saved(_):
+                donate_btn.configure(state='normal')
                 # Show success with amount
                 if comment:
                     messagebox.showinfo("Thank You! 🎉", f"Your donation of ${amt:.2f} has been recorded successfully!\n\nComment: '{comment}'\n\nThank you for supporting CineTrack!")
                 else:
                     messagebox.showinfo("Thank You! 🎉", f"Your donation of ${amt:.2f} has been recorded successfully!\n\nThank you for supporting CineTrack!")
-                
-            except Exception as e:
-                conn.rollback()
-                messagebox.showerror("Database Error", f"Failed to save donation: {str(e)}")
-                return
 
-            # Clear form
-            amount_entry.delete(0, 'end')
-            comment_entry.delete(0, 'end')
-
-            # Refresh totals and donor list with complete data including comments
-            cursor.execute("SELECT IFNULL(SUM(donation_amount),0) FROM donations")
-            new_total = cursor.fetchone()[0] or 0.0
-            total_label.configure(text=f"Total Donations: ${new_total:.2f}")
-
-            # Update trigger stats
-            cursor.execute("SELECT COUNT(*) FROM donations WHERE comment='Welcome, user created!'")
-            welcome_count = cursor.fetchone()[0] or 0
-            cursor.execute("SELECT COUNT(*) FROM users")
-            total_users = cursor.fetchone()[0] or 0
-            trigger_stats.configure(text=f"🎯 Auto-Welcome Donations: {welcome_count} (Trigger Success Rate: {(welcome_count/max(total_users,1)*100):.1f}%)")
+                # Clear form
+                amount_entry.delete(0, 'end')
+                comment_entry.delete(0, 'end')
+
+                # Refresh totals and donor list with complete data including comments
+                self.run_query(load_summary, callback=fill_summary, owner=tree)
+
+            def save_failed(err):
+                donate_btn.configure(state='normal')
+                messagebox.showerror("Database Error", f"Failed to save donation: {err}")
+
+            donate_btn.configure(state='disabled')
+            self.executor.submit(db.execute, "INSERT INTO donations (user_id, donation_amount, comment) VALUES (%s,%s,%s)",
+                                 (uid, amt, comment), callback=saved, errback=save_failed, owner=donate_btn)
+
+        donate_btn.configure(command=submit_donation)
 
-            # Refresh donor list
+        def load_summary():
+            """Totals, trigger stats and top donors (runs on a worker thread)."""
+            return {
+                'total': db.fetchone("SELECT IFNULL(SUM(donation_amount),0) FROM donations")[0] or 0.0,
+                'welcome_count': db.fetchone("SELECT COUNT(*) FROM donations WHERE comment='Welcome, user created!'")[0] or 0,
+                'total_users': db.fetchone("SELECT COUNT(*) FROM users")[0] or 0,
+                # total, latest donation date, and the most recent non-null comment for each user
+                'donors': db.fetchall(
+                    """
+                    SELECT u.username,
+                           IFNULL(SUM(d.donation_amount),0) AS total,
+                           MAX(d.donation_date) AS last_date,
+                           (
+                               SELECT d2.comment
+                               FROM donations d2
+                               WHERE d2.user_id = u.user_id AND d2.comment IS NOT NULL
+                               ORDER BY d2.donation_date DESC
+                               LIMIT 1
+                           ) AS recent_comment
+                    FROM donations d
+                    JOIN users u ON d.user_id = u.user_id
+                    GROUP BY u.user_id
+                    ORDER BY total DESC
+                    LIMIT 50
+                    """
+                ),
+            }
+
+        def fill_summary(data):
+            total_label.configure(text=f"Total Donations: ${data['total']:.2f}")
+            welcome_count, total_users = data['welcome_count'], data['total_users']
+            trigger_stats.configure(text=f"🎯 Auto-Welcome Donations: {welcome_count} (Trigger Success Rate: {(welcome_count/max(total_users,1)*100):.1f}%)")
             for iid in tree.get_children():
                 tree.delete(iid)
-            cursor.execute(
-                """
-                SELECT u.username,
-                       IFNULL(SUM(d.donation_amount),0) AS total,
-                       MAX(d.donation_date) AS last_date,
-                       (
-                           SELECT d2.comment
-                           FROM donations d2
-                           WHERE d2.user_id = u.user_id AND d2.comment IS NOT NULL
-                           ORDER BY d2.donation_date DESC
-                           LIMIT 1
-                       ) AS recent_comment
-                FROM donations d
-                JOIN users u ON d.user_id = u.user_id
-                GROUP BY u.user_id
-                ORDER BY total DESC
-                LIMIT 50
-                """
-            )
-            rows = cursor.fetchall()
-            for i, r in enumerate(rows):
+            for i, r in enumerate(data['donors']):
                 tag = 'even' if i % 2 == 0 else 'odd'
                 recent_comment = r[3] or ''
-                tree.insert('', 'end', values=(r[0], f"${r[1]:.2f}", r[2], recent_comment), tags=(tag,))
-                tree.insert('', 'end', values=(r[0], f"{r[1]:.2f}", r[2]), tags=(tag,))
-
-            amount_entry.delete(0, 'end')
-            comment_entry.delete(0, 'end')
+                tree.insert('', 'end', values=(r[0], f"{r[1]:.2f}", r[2], recent_comment), tags=(tag,))
+
+        def fill_users(rows):
+            # Users list for lookup and donation form
+            users = [r[0] for r in rows]
+            lookup_username_cb.configure(values=users)
+            username_cb.configure(values=users)
+
+        def fill_recent(recent_donations):
+            if recent_donations:
+                for username, amount, date, comment in recent_donations:
+                    recent_text = f"• {username}: ${amount:.2f}"
+                    if comment and comment != 'Welcome, user created!':
+                        recent_text += f" - \"{comment}\""
+                    recent_text += f" ({date.strftime('%Y-%m-%d %H:%M')})"
+                    
+                    ctk.CTkLabel(recent_frame, text=recent_text, 
+                               font=FONT_NORMAL, text_color='lightgray', 
+                               bg_color=IMDB_DARK_BG).pack(anchor='w', padx=16, pady=1)
+            else:
+                ctk.CTkLabel(recent_frame, text="• No recent donations found", 
+                           font=FONT_NORMAL, text_color='lightgray', 
+                           bg_color=IMDB_DARK_BG).pack(anchor='w', padx=16, pady=4)
 
-        donate_btn.configure(command=submit_donation)
+        self.run_query(load_summary, callback=fill_summary)
+        self.run_query(db.fetchall, "SELECT username FROM users ORDER BY username", callback=fill_users)
+        # Recent donations (excluding welcome donations)
+        self.run_query(db.fetchall, """
+            SELECT u.username, d.donation_amount, d.donation_date, d.comment
+            FROM donations d
+            JOIN users u ON d.user_id = u.user_id
+            WHERE d.comment != 'Welcome, user created!' OR d.comment IS NULL
+            ORDER BY d.donation_date DESC
+            LIMIT 5
+        """, callback=fill_recent, loading=recent_loading)
 
     def show_database_stats(self):
         """Display database statistics showcasing the trigger and function features."""
@@ -2918,27 +7542,7 @@ class CineTrackIMDB(ctk.CTk):
         ctk.CTkLabel(trigger_section, text="🎯 Database Trigger: after_user_insert", 
                     font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_GRAY).pack(anchor='w', padx=12, pady=(8,4))
         
-        # Get trigger statistics
-        cursor.execute("SELECT COUNT(*) FROM users")
-        total_users = cursor.fetchone()[0] or 0
-        
-        cursor.execute("SELECT COUNT(*) FROM donations WHERE comment='Welcome, user created!'")
-        welcome_donations = cursor.fetchone()[0] or 0
-        
-        success_rate = (welcome_donations / max(total_users, 1)) * 100
-        
-        ctk.CTkLabel(trigger_section, 
-                    text=f"• Total Users: {total_users}", 
-                    font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
-        
-        ctk.CTkLabel(trigger_section, 
-                    text=f"• Welcome Donations Created: {welcome_donations}", 
-                    font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
-        
-        ctk.CTkLabel(trigger_section, 
-                    text=f"• Trigger Success Rate: {success_rate:.1f}%", 
-                    font=FONT_NORMAL, text_color=IMDB_YELLOW if success_rate >= 95 else 'orange', 
-                    bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=(2,8))
+        trigger_loading = self._loading_label(trigger_section, anchor='w', padx=24, pady=(2,8))
 
         # Function Demonstration Section
         function_section = ctk.CTkFrame(stats_frame, fg_color=IMDB_GRAY)
@@ -2947,29 +7551,10 @@ class CineTrackIMDB(ctk.CTk):
         ctk.CTkLabel(function_section, text="🔧 Database Function: total_donations(uid)", 
                     font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_GRAY).pack(anchor='w', padx=12, pady=(8,4))
 
-        # Top donors using the function
-        cursor.execute("""
-            SELECT u.username, u.user_id, total_donations(u.user_id) as total
-            FROM users u
-            WHERE total_donations(u.user_id) > 0
-            ORDER BY total DESC
-            LIMIT 5
-        """)
-        top_donors = cursor.fetchall()
-
-        if top_donors:
-            ctk.CTkLabel(function_section, 
-                        text="• Top 5 Donors (calculated using total_donations function):", 
-                        font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
-            
-            for i, (username, uid, total) in enumerate(top_donors, 1):
-                ctk.CTkLabel(function_section, 
-                            text=f"  {i}. {username}: ${total:.2f}", 
-                            font=FONT_NORMAL, text_color='lightgray', bg_color=IMDB_GRAY).pack(anchor='w', padx=36, pady=1)
-        else:
-            ctk.CTkLabel(function_section, 
-                        text="• No donations found (function returns 0.00 for all users)", 
-                        font=FONT_NORMAL, text_color='lightgray', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
+        # Top donors using the function (filled in once the stats arrive)
+        donors_body = ctk.CTkFrame(function_section, fg_color=IMDB_GRAY)
+        donors_body.pack(fill='x')
+        donors_loading = self._loading_label(donors_body, anchor='w', padx=24, pady=2)
 
         # Function test area
         test_frame = ctk.CTkFrame(function_section, fg_color=IMDB_DARK_BG)
@@ -2978,12 +7563,8 @@ class CineTrackIMDB(ctk.CTk):
         ctk.CTkLabel(test_frame, text="Test total_donations() function:", 
                     font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG).grid(row=0, column=0, sticky='w', pady=(4,2))
 
-        # Get all users for testing
-        cursor.execute("SELECT user_id, username FROM users ORDER BY username")
-        all_users = cursor.fetchall()
-        user_options = [f"{username} (ID: {uid})" for uid, username in all_users]
-
-        test_user_cb = ttk.Combobox(test_frame, values=user_options, width=30)
+        # All users for testing are filled in with the rest of the stats
+        test_user_cb = ttk.Combobox(test_frame, values=[], width=30)
         test_user_cb.grid(row=1, column=0, sticky='w', padx=(0,6))
 
         test_result_lbl = ctk.CTkLabel(test_frame, text="", font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG)
@@ -2998,11 +7579,18 @@ class CineTrackIMDB(ctk.CTk):
             # Extract user ID from selection
             try:
                 uid = int(selection.split("ID: ")[1].split(")")[0])
-                cursor.execute("SELECT total_donations(%s)", (uid,))
-                result = cursor.fetchone()[0] or 0.00
-                test_result_lbl.configure(text=f"Function result: ${result:.2f}", text_color=IMDB_YELLOW)
             except Exception as e:
                 test_result_lbl.configure(text=f"Error: {e}", text_color='red')
+                return
+
+            def show_result(row):
+                result = row[0] or 0.00
+                test_result_lbl.configure(text=f"Function result: ${result:.2f}", text_color=IMDB_YELLOW)
+
+            test_result_lbl.configure(text="Running...", text_color='white')
+            self.executor.submit(db.fetchone, "SELECT total_donations(%s)", (uid,), callback=show_result,
+                                 errback=lambda err: test_result_lbl.configure(text=f"Error: {err}", text_color='red'),
+                                 owner=test_result_lbl)
 
         ctk.CTkButton(test_frame, text="Test Function", fg_color=IMDB_YELLOW, command=test_function, width=120).grid(row=2, column=0, pady=(6,4))
 
@@ -3013,26 +7601,296 @@ class CineTrackIMDB(ctk.CTk):
         ctk.CTkLabel(overall_section, text="📊 Overall Database Statistics", 
                     font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_GRAY).pack(anchor='w', padx=12, pady=(8,4))
 
-        # Calculate various stats
-        cursor.execute("SELECT COUNT(*) FROM movies")
-        total_movies = cursor.fetchone()[0] or 0
-        
-        cursor.execute("SELECT COUNT(*) FROM donations")
-        total_donations_count = cursor.fetchone()[0] or 0
-        
-        cursor.execute("SELECT IFNULL(SUM(donation_amount), 0) FROM donations")
-        total_donation_amount = cursor.fetchone()[0] or 0.00
+        overall_loading = self._loading_label(overall_section, anchor='w', padx=24, pady=(2,8))
+
+        # Summary table maintenance
+        summary_section = ctk.CTkFrame(stats_frame, fg_color=IMDB_GRAY)
+        summary_section.pack(fill='x', padx=12, pady=(0,12))
+
+        ctk.CTkLabel(summary_section, text="🧮 Summary Table: movie_summary", 
+                    font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_GRAY).pack(anchor='w', padx=12, pady=(8,4))
+        ctk.CTkLabel(summary_section, 
+                    text="• Genres, rating totals and episode counts per movie, kept current by triggers", 
+                    font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
+
+        summary_row = ctk.CTkFrame(summary_section, fg_color=IMDB_GRAY)
+        summary_row.pack(anchor='w', padx=24, pady=(4,10))
+        rebuild_status = ctk.CTkLabel(summary_row, text="", font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY)
+
+        def on_rebuilt(count):
+            rebuild_btn.configure(state='normal')
+            rebuild_status.configure(text=f"Rebuilt {count} rows", text_color=IMDB_YELLOW)
+
+        def on_rebuild_failed(err):
+            rebuild_btn.configure(state='normal')
+            rebuild_status.configure(text=f"Rebuild failed: {err}", text_color='red')
+
+        def rebuild_summary():
+            rebuild_btn.configure(state='disabled')
+            rebuild_status.configure(text="Rebuilding...", text_color='white')
+            self.executor.submit(rebuild_movie_summary, callback=on_rebuilt, errback=on_rebuild_failed, owner=rebuild_status)
+
+        rebuild_btn = ctk.CTkButton(summary_row, text="Rebuild Summary", fg_color=IMDB_YELLOW, command=rebuild_summary, width=140)
+        rebuild_btn.pack(side='left')
+        rebuild_status.pack(side='left', padx=(12,0))
+
+        # Query cache counters (read before this page's own queries run)
+        cache_section = ctk.CTkFrame(stats_frame, fg_color=IMDB_GRAY)
+        cache_section.pack(fill='x', padx=12, pady=(0,12))
+
+        ctk.CTkLabel(cache_section, text="⚡ Query Cache",
+                    font=FONT_SUBHEADER, text_color=IMDB_YELLOW, bg_color=IMDB_GRAY).pack(anchor='w', padx=12, pady=(8,4))
+        cache_lbl = ctk.CTkLabel(cache_section, text="", font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY)
+        cache_lbl.pack(anchor='w', padx=24, pady=2)
+
+        def show_cache_stats():
+            s = db.cache.stats()
+            cache_lbl.configure(text=f"• Hits: {s['hits']} | Misses: {s['misses']} | Hit rate: {s['hit_rate']*100:.1f}% | "
+                                     f"Entries: {s['entries']} | Invalidated: {s['invalidations']}")
+
+        def clear_cache():
+            db.cache.clear()
+            show_cache_stats()
+
+        show_cache_stats()
+        ctk.CTkButton(cache_section, text="Clear Cache", fg_color=IMDB_YELLOW, command=clear_cache, width=140).pack(anchor='w', padx=24, pady=(4,10))
+
+        def load():
+            """Collect every figure on this page in one worker-thread call."""
+            return {
+                'total_users': db.cached_fetchone("SELECT COUNT(*) FROM users")[0] or 0,
+                'welcome_donations': db.cached_fetchone("SELECT COUNT(*) FROM donations WHERE comment='Welcome, user created!'")[0] or 0,
+                'top_donors': db.cached_fetchall("""
+                    SELECT u.username, u.user_id, total_donations(u.user_id) as total
+                    FROM users u
+                    WHERE total_donations(u.user_id) > 0
+                    ORDER BY total DESC
+                    LIMIT 5
+                """),
+                'all_users': db.cached_fetchall("SELECT user_id, username FROM users ORDER BY username"),
+                'total_movies': db.cached_fetchone("SELECT COUNT(*) FROM movies")[0] or 0,
+                'total_donations_count': db.cached_fetchone("SELECT COUNT(*) FROM donations")[0] or 0,
+                'total_donation_amount': db.cached_fetchone("SELECT IFNULL(SUM(donation_amount), 0) FROM donations")[0] or 0.00,
+            }
+
+        def fill(stats):
+            # Trigger statistics
+            trigger_loading.destroy()
+            donors_loading.destroy()
+            overall_loading.destroy()
+            total_users = stats['total_users']
+            welcome_donations = stats['welcome_donations']
+            success_rate = (welcome_donations / max(total_users, 1)) * 100
+
+            ctk.CTkLabel(trigger_section, 
+                        text=f"• Total Users: {total_users}", 
+                        font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
+            
+            ctk.CTkLabel(trigger_section, 
+                        text=f"• Welcome Donations Created: {welcome_donations}", 
+                        font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
+            
+            ctk.CTkLabel(trigger_section, 
+                        text=f"• Trigger Success Rate: {success_rate:.1f}%", 
+                        font=FONT_NORMAL, text_color=IMDB_YELLOW if success_rate >= 95 else 'orange', 
+                        bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=(2,8))
+
+            # Top donors
+            top_donors = stats['top_donors']
+            if top_donors:
+                ctk.CTkLabel(donors_body, 
+                            text="• Top 5 Donors (calculated using total_donations function):", 
+                            font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
+                
+                for i, (username, uid, total) in enumerate(top_donors, 1):
+                    ctk.CTkLabel(donors_body, 
+                                text=f"  {i}. {username}: ${total:.2f}", 
+                                font=FONT_NORMAL, text_color='lightgray', bg_color=IMDB_GRAY).pack(anchor='w', padx=36, pady=1)
+            else:
+                ctk.CTkLabel(donors_body, 
+                            text="• No donations found (function returns 0.00 for all users)", 
+                            font=FONT_NORMAL, text_color='lightgray', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=2)
+
+            test_user_cb.configure(values=[f"{username} (ID: {uid})" for uid, username in stats['all_users']])
+
+            stats_text = f"• Movies: {stats['total_movies']} | Users: {total_users} | Donations: {stats['total_donations_count']} | Total Amount: ${stats['total_donation_amount']:.2f}"
+            ctk.CTkLabel(overall_section, text=stats_text, 
+                        font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=(2,8))
+
+        def failed(err):
+            for lbl in (trigger_loading, donors_loading, overall_loading):
+                lbl.configure(text=f"Failed to load: {err}", text_color="red")
+
+        self.executor.submit(load, callback=fill, errback=failed, owner=self.page)
+
+    # ========== PERFORMANCE ==========
+    def show_performance(self, refresh_ms=2000):
+        """Per-query latency, rows and call sites from db.stats, refreshed while the page is open."""
+        self.clear_page()
+        imdb_heading(self.page, "Query Performance")
+        imdb_subheading(self.page, "Latency, rows and call sites per query since start (or the last reset)")
+
+        controls = ctk.CTkFrame(self.page, fg_color=IMDB_DARK_BG)
+        controls.pack(fill='x', padx=20, pady=(8,0))
+        summary_lbl = ctk.CTkLabel(self.page, text="", font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG)
+        summary_lbl.pack(anchor='w', padx=24, pady=(6,0))
+
+        frame = ctk.CTkFrame(self.page)
+        frame.pack(fill='both', padx=20, pady=12, expand=True)
+        cols = ('Query', 'Calls', 'Errors', 'Total ms', 'Avg ms', 'p50 ms', 'p95 ms', 'Max ms', 'Rows',
+                'Prepare ms', 'Reuse ms')
+        tree = ttk.Treeview(frame, columns=cols, show='headings', height=16)
+        for c in cols:
+            tree.heading(c, text=c)
+            tree.column(c, anchor='center', width=90)
+        tree.column('Query', anchor='w', width=300)
+        self._style_treeview(tree)
+        scr = ttk.Scrollbar(frame, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scr.set)
+        scr.pack(side='right', fill='y')
+        tree.pack(fill='both', expand=True)
+
+        sites_lbl = ctk.CTkLabel(self.page, text="Select a query to see where it is called from",
+                                 font=FONT_NORMAL, text_color='white', bg_color=IMDB_DARK_BG, justify='left')
+        sites_lbl.pack(anchor='w', padx=24, pady=(0,12))
+        state = {'stats': {}, 'timings': {}}
+
+        def values_for(row):
+            name, s = row
+            t = state['timings'].get(name)
+            prepared = (f"{t['prepare_ms']:.2f}", f"{t['execute_ms']:.2f}") if t else ('', '')
+            return (name, s['count'], s['errors'], f"{s['total_ms']:.1f}", f"{s['avg_ms']:.2f}", f"{s['p50_ms']:.1f}",
+                    f"{s['p95_ms']:.1f}", f"{s['max_ms']:.1f}", s['rows']) + prepared
+
+        def show_sites(event=None):
+            s = state['stats'].get(tree.selection()[0]) if tree.selection() else None
+            if s is None:
+                return
+            sites_lbl.configure(text=f"{tree.selection()[0]} is called from:\n" +
+                                "\n".join(f"  • {site} ({n}×)" for site, n in s['sites'].items()))
+
+        def refresh():
+            stats = state['stats'] = db.stats.snapshot()
+            state['timings'] = db.timings.snapshot()
+            rows = sorted(stats.items(), key=lambda kv: -kv[1]['total_ms'])
+            _sync_treeview(tree, rows, values_for)
+            calls = sum(s['count'] for s in stats.values())
+            total_ms = sum(s['total_ms'] for s in stats.values())
+            log = db.stats.slow_log or 'not written'
+            summary_lbl.configure(text=f"• {calls} statements, {total_ms:.0f} ms in total | {len(stats)} queries | "
+                                       f"Slow (≥ {db.stats.slow_ms} ms): {db.stats.slow_count}, log: {log}")
+            show_sites()
+
+        def tick():
+            if tree.winfo_exists():
+                refresh()
+                tree.after(refresh_ms, tick)
+
+        def set_threshold():
+            try:
+                db.stats.slow_ms = max(0.0, float(threshold.get()))
+            except ValueError:
+                messagebox.showerror('Performance', 'The slow-query threshold must be a number of milliseconds')
+                return
+            refresh()
+
+        def reset():
+            db.stats.clear()
+            db.timings.clear()
+            tree.delete(*tree.get_children(''))
+            sites_lbl.configure(text="Select a query to see where it is called from")
+            refresh()
+
+        def export(kind):
+            from tkinter import filedialog
+            ext, label = ('.prom', 'Prometheus text') if kind == 'prom' else ('.json', 'JSON')
+            path = filedialog.asksaveasfilename(title="Export query stats", defaultextension=ext,
+                                                initialfile=f"cinetrack_query_stats{ext}",
+                                                filetypes=[(label, f"*{ext}")])
+            if not path:
+                return
+            try:
+                db.stats.dump(path)
+            except OSError as e:
+                messagebox.showerror('Performance', f'Could not write {path}: {e}')
+
+        ctk.CTkLabel(controls, text="Slow query ≥ (ms):", font=FONT_NORMAL, text_color='white',
+                     bg_color=IMDB_DARK_BG).pack(side='left', padx=(4,6))
+        threshold = ctk.CTkEntry(controls, width=80)
+        threshold.insert(0, str(db.stats.slow_ms))
+        threshold.pack(side='left')
+        threshold.bind('<Return>', lambda e: set_threshold())
+        ctk.CTkButton(controls, text="Set", fg_color=IMDB_YELLOW, command=set_threshold, width=60).pack(side='left', padx=6)
+        for text, command in (("Export Prometheus", lambda: export('prom')), ("Export JSON", lambda: export('json')),
+                              ("Reset", reset), ("Refresh", refresh)):
+            ctk.CTkButton(controls, text=text, fg_color=IMDB_YELLOW, command=command, width=140).pack(side='right', padx=6)
+        tree.bind('<<TreeviewSelect>>', show_sites)
+        tick()
 
-        stats_text = f"• Movies: {total_movies} | Users: {total_users} | Donations: {total_donations_count} | Total Amount: ${total_donation_amount:.2f}"
-        ctk.CTkLabel(overall_section, text=stats_text, 
-                    font=FONT_NORMAL, text_color='white', bg_color=IMDB_GRAY).pack(anchor='w', padx=24, pady=(2,8))
 
     def on_closing(self):
-        cursor.close()
-        conn.close()
+        # Chunks already committed stay; the bulk importer resumes from its checkpoint
+        self.jobs.cancel_all()
+        self.executor.shutdown()
+        catalog.stop()
+        if QUERY_STATS_DUMP:
+            try:
+                db.stats.dump(QUERY_STATS_DUMP)
+            except OSError as e:
+                print(f"⚠️ Could not write query stats to {QUERY_STATS_DUMP}: {e}")
+        db.close()
         self.destroy()
 
+STARTUP_TARGET_MS = 300
+
+
+def benchmark_startup(app):
+    """--benchmark-startup: print cold-start timings, then close the app.
+
+    Times are from the start of this module's imports: the imports alone,
+    the first drawn window, and the database being connected with the schema
+    checked (CineTrackIMDB.ready_at).
+    """
+    app.update()
+    window_at = time.perf_counter()
+
+    def ms(t):
+        return (t - _STARTUP_STARTED) * 1000
+
+    def report():
+        if app.ready_at is None:
+            app.after(10, report)
+            return
+        verdict = "ok" if ms(window_at) <= STARTUP_TARGET_MS else "over target"
+        import platform
+        print(f"Host: {platform.platform()}, {os.cpu_count()} CPUs, Python {platform.python_version()}, "
+              f"customtkinter {ctk.__version__}")
+        print(f"Startup: imports {ms(_IMPORTS_DONE):.0f} ms | window {ms(window_at):.0f} ms "
+              f"({verdict}, target {STARTUP_TARGET_MS} ms) | database ready {ms(app.ready_at):.0f} ms")
+        app.on_closing()
+
+    report()
+
+
 if __name__ == "__main__":
+    if "--explain-hot-queries" in sys.argv:
+        run_migrations()
+        print("Before migration 3 (its indexes hidden with NO_INDEX hints):")
+        explain_hot_queries(before=True)
+        print("\nAfter migration 3:")
+        explain_hot_queries()
+        sys.exit(0)
+    if "--benchmark-prepared" in sys.argv:
+        run_migrations()
+        benchmark_prepared_queries()
+        sys.exit(0)
+    if "--benchmark-import" in sys.argv:
+        run_migrations()
+        args = sys.argv[sys.argv.index("--benchmark-import") + 1:]
+        benchmark_imports(int(args[0]) if args and args[0].isdigit() else BENCHMARK_IMPORT_MOVIES)
+        sys.exit(0)
     app = CineTrackIMDB()
     app.protocol("WM_DELETE_WINDOW", app.on_closing)
+    if "--benchmark-startup" in sys.argv:
+        benchmark_startup(app)
     app.mainloop()
@@ -0,0 +1,85 @@
+"""Shared test setup: makes main.py importable from the repository root and
+provides a freshly built CineTrack database for tests that need MySQL.
+
+Database tests connect to localhost as root/testpassword (the CI service) and
+own the cinetrack_test database; override with CINETRACK_TEST_DB_HOST,
+CINETRACK_TEST_DB_PORT, CINETRACK_TEST_DB_USER, CINETRACK_TEST_DB_PASSWORD and
+CINETRACK_TEST_DB_NAME. They are skipped when no server is reachable.
+"""
+import os
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def schema_statements(path=os.path.join(ROOT, 'code.sql')):
+    """Statements of code.sql without its CREATE DATABASE / USE lines.
+
+    Triggers, procedures and functions run until the line ending in $$;
+    everything else ends at the first line ending in a semicolon.
+    """
+    statements, lines, routine = [], [], False
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+            if not lines:
+                if not stripped or stripped.startswith('--'):
+                    continue
+                if re.match(r'(CREATE\s+DATABASE|USE)\b', stripped, re.I):
+                    continue
+                routine = bool(re.match(r'CREATE\s+(TRIGGER|PROCEDURE|FUNCTION)\b', stripped, re.I))
+            lines.append(line)
+            if stripped.endswith('$$') if routine else stripped.endswith(';'):
+                statements.append(''.join(lines).strip().rstrip('$').strip().rstrip(';'))
+                lines = []
+    return statements
+
+
+@pytest.fixture(scope="session")
+def mysql_config():
+    connector = pytest.importorskip("mysql.connector")
+    config = {
+        "host": os.environ.get("CINETRACK_TEST_DB_HOST", "localhost"),
+        "port": int(os.environ.get("CINETRACK_TEST_DB_PORT", "3306")),
+        "user": os.environ.get("CINETRACK_TEST_DB_USER", "root"),
+        "password": os.environ.get("CINETRACK_TEST_DB_PASSWORD", "testpassword"),
+    }
+    try:
+        connector.connect(**config).close()
+    except connector.Error as e:
+        pytest.skip(f"MySQL server not reachable: {e}")
+    return dict(config, database=os.environ.get("CINETRACK_TEST_DB_NAME", "cinetrack_test"))
+
+
+@pytest.fixture
+def cinetrack_db(mysql_config, monkeypatch):
+    """main.db pointed at an empty, fully migrated copy of the code.sql schema."""
+    pytest.importorskip("customtkinter")
+    import mysql.connector
+    import main
+
+    server = {k: v for k, v in mysql_config.items() if k != 'database'}
+    name = mysql_config['database']
+    cnx = mysql.connector.connect(**server)
+    try:
+        cursor = cnx.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS `{name}`")
+        cursor.execute(f"CREATE DATABASE `{name}`")
+        cursor.execute(f"USE `{name}`")
+        for statement in schema_statements():
+            cursor.execute(statement)
+        cnx.commit()
+        cursor.close()
+    finally:
+        cnx.close()
+
+    database = main.Database(mysql_config, pool_size=2, pool_name="cinetrack_test")
+    monkeypatch.setattr(main, "DB_CONFIG", mysql_config)
+    monkeypatch.setattr(main, "db", database)
+    main.run_migrations()
+    yield database
+    database.close()
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+
+def write_csv(tmp_path, text, name="series.csv"):
+    path = tmp_path / name
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+def test_normalize_series_row_reads_aliases_and_defaults():
+    row = {"series_name": " Dark ", "season_number": "x", "episode_number": "3",
+           "ep_title": "Past and Present", "date": "2017", "summary": "Time travel", "genre": "Drama| Sci-Fi;"}
+    assert main.normalize_series_row(row) == (
+        "Dark", 1, 3, "Past and Present", "2017-01-01", None, "Time travel", ("Drama", "Sci-Fi"))
+
+
+def test_normalize_series_row_skips_rows_without_a_title():
+    assert main.normalize_series_row({"title": "  ", "season": "1", "episode": "1"}) is None
+
+
+def test_series_record_key_ignores_unnumbered_episodes():
+    numbered = main.normalize_series_row({"title": "Dark", "season": "2", "episode": "1"})
+    unnumbered = main.normalize_series_row({"title": "Dark", "season": "2", "episode": ""})
+    assert main.series_record_key(numbered) == ("Dark", 2, 1)
+    assert main.series_record_key(unnumbered) is None
+
+
+def test_iter_csv_records_drops_repeats_and_counts_skipped_rows(tmp_path):
+    path = write_csv(tmp_path, "title,season,episode,episode_title\n"
+                               "Dark,1,1,Secrets\n"
+                               ",1,2,No series\n"
+                               "Dark,1,1,Secrets again\n"
+                               "Dark,1,2,Lies\n")
+    chunks = list(main.iter_csv_records(path, main.normalize_series_row, main.series_record_key, workers=1))
+    assert len(chunks) == 1
+    records, skipped, failed, end = chunks[0]
+    assert [r[3] for r in records] == ["Secrets", "Lies"]
+    assert (skipped, failed, end) == (2, 0, os.path.getsize(path))
+
+
+def test_iter_csv_records_never_splits_a_quoted_field(tmp_path):
+    rows = "".join(f'Show {i},1,{i},"Part one\nof {i}, ""quoted"""\n' for i in range(40))
+    path = write_csv(tmp_path, "title,season,episode,episode_title\n" + rows)
+
+    chunks = list(main.iter_csv_records(path, main.normalize_series_row, workers=1, chunk_bytes=64))
+    assert len(chunks) > 1
+    ends = [end for _, _, _, end in chunks]
+    assert ends == sorted(ends) and ends[-1] == os.path.getsize(path)
+    titles = [r[3] for records, _, _, _ in chunks for r in records]
+    assert titles == [f'Part one\nof {i}, "quoted"' for i in range(40)]
+
+
+def test_iter_csv_records_parallel_matches_in_process(tmp_path):
+    rows = "".join(f"Show {i % 7},{i % 3 + 1},{i},Episode {i}\n" for i in range(500))
+    path = write_csv(tmp_path, "title,season,episode,episode_title\n" + rows)
+
+    def flatten(workers):
+        chunks = main.iter_csv_records(path, main.normalize_series_row, workers=workers, chunk_bytes=512)
+        return [r for records, _, _, _ in chunks for r in records]
+
+    assert flatten(2) == flatten(1)
+
+
+def test_iter_csv_records_resumes_at_start_offset(tmp_path):
+    header = "title,season,episode,episode_title\n"
+    first = "Dark,1,1,Secrets\n"
+    path = write_csv(tmp_path, header + first + "Dark,1,2,Lies\n")
+
+    offset = len((header + first).encode("utf-8"))
+    chunks = list(main.iter_csv_records(path, main.normalize_series_row, workers=1, start_offset=offset))
+    assert [r[3] for records, _, _, _ in chunks for r in records] == ["Lies"]
+
+
+def test_benchmark_dataset_is_fully_importable(tmp_path):
+    path = str(tmp_path / "bench.csv")
+    rows = main.write_benchmark_csv(path, movies=50, tag="t")
+
+    chunks = list(main.iter_csv_records(path, main.normalize_import_row, main.import_record_key, workers=1))
+    records = [r for batch, _, _, _ in chunks for r in batch]
+    assert rows == 50 * 10 + main.BENCHMARK_IMPORT_USERS + main.BENCHMARK_IMPORT_GENRES + main.BENCHMARK_IMPORT_CAST
+    assert len(records) == rows and sum(skipped + failed for _, skipped, failed, _ in chunks) == 0
+    assert {kind for kind, _ in records} == {'user', 'genre', 'cast', 'movie', 'movie_genre', 'movie_cast',
+                                             'review', 'episode'}
@@ -0,0 +1,113 @@
+import math
+import random
+
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+GENRES = ["Action", "Comedy", "Drama", "Horror", "Sci-Fi"]
+LANGUAGES = ["English", "French", "Hindi", None]
+PLATFORMS = ["Netflix", "Prime", "Hulu"]
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    rng = random.Random(7)
+    rows, links = [], []
+    for movie_id in rng.sample(range(1, 5000), 400):
+        genres = ",".join(sorted(rng.sample(GENRES, rng.randint(0, 3)))) or None
+        rating = rng.choice([None, round(rng.uniform(1, 10), 1)])
+        year = rng.choice([None] + list(range(1990, 2025)))
+        rows.append((movie_id, f"{rng.choice('abcXYZ')}movie {movie_id}", year, rng.choice(LANGUAGES), genres, rating))
+        links += [(movie_id, p) for p in rng.sample(PLATFORMS, rng.randint(0, 2))]
+    links.append((99999, "Netflix"))  # a link to a title the index does not hold
+    index = main.FacetIndex(main.CatalogModel(), rows, links)
+    return index, rows, links
+
+
+def values(row, links):
+    movie_id, _, year, language, genres, rating = row
+    return {
+        'genre': set(genres.split(",")) if genres else set(),
+        'language': {language} - {None},
+        'platform': {p for m, p in links if m == movie_id},
+        'year': year,
+        'rating': rating,
+    }
+
+
+def within(value, bounds, scale=1):
+    lo, hi = bounds
+    return value is not None and (lo is None or round(value * scale) >= round(lo * scale)) \
+        and (hi is None or round(value * scale) <= round(hi * scale))
+
+
+def brute_match(rows, links, selection, skip=None):
+    matched = []
+    for row in rows:
+        v = values(row, links)
+        ok = all(v[f] & chosen for f, chosen in selection.items()
+                 if f in ('genre', 'language', 'platform') and chosen and f != skip)
+        if selection.get('year', (None, None)) != (None, None):
+            ok = ok and within(v['year'], selection['year'])
+        if selection.get('rating', (None, None)) != (None, None):
+            ok = ok and within(v['rating'], selection['rating'], 10)
+        if ok:
+            matched.append(row)
+    return matched
+
+
+def brute_order(rows, sort):
+    if sort == 'Newest':
+        return list(rows)
+    if sort == 'Oldest':
+        return [r for r in rows if r[2]][::-1] + [r for r in rows if not r[2]]
+    if sort == 'Top rated':
+        return sorted(rows, key=lambda r: -r[5] if r[5] is not None else math.inf)
+    return sorted(rows, key=lambda r: r[1].casefold())
+
+
+SELECTIONS = [
+    {},
+    {'genre': {'Drama'}},
+    {'genre': {'Drama', 'Horror'}, 'language': {'French'}},
+    {'platform': {'Netflix'}, 'year': (2000, 2010)},
+    {'rating': (7.5, None), 'language': {'English', 'Hindi'}},
+    {'genre': {'Sci-Fi'}, 'platform': {'Prime', 'Hulu'}, 'year': (None, 2005), 'rating': (None, 4.2)},
+    {'genre': {'No such genre'}},
+]
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+@pytest.mark.parametrize("sort", main.FACET_SORTS)
+def test_select_matches_brute_force_filter_and_order(catalog, selection, sort):
+    index, rows, links = catalog
+    bitmap, _ = index.match(selection)
+    ids = [index.model.ids[p] for p in index.select(bitmap, sort)]
+    expected = [r[0] for r in brute_order(brute_match(rows, links, selection), sort)]
+    if sort == 'Top rated':
+        # ties may come in either order; compare the ratings and the members
+        rating = {r[0]: r[5] for r in rows}
+        assert [rating[i] for i in ids] == [rating[i] for i in expected] and set(ids) == set(expected)
+    else:
+        assert ids == expected
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_counts_apply_every_other_facet(catalog, selection):
+    index, rows, links = catalog
+    _, counts = index.match(selection)
+    for facet, postings in counts.items():
+        base = brute_match(rows, links, selection, skip=facet)
+        for value, count in postings.items():
+            assert count == sum(value in values(r, links)[facet] for r in base), (facet, value)
+
+
+def test_facet_values_and_year_span(catalog):
+    index, rows, _ = catalog
+    assert list(index.facets['genre']) == GENRES
+    assert set(index.facets['language']) == {"English", "French", "Hindi"}
+    assert set(index.facets['platform']) == set(PLATFORMS)
+    years = [r[2] for r in rows if r[2]]
+    assert index.year_span == (min(years), max(years))
@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+
+def test_without_hot_indexes_hints_the_alias_each_query_uses():
+    sql, _ = main.HOT_QUERIES['movie_reviews']
+    assert main.without_hot_indexes(sql).startswith("SELECT /*+ NO_INDEX(r idx_reviews_movie_date) */ ")
+
+    sql, _ = main.HOT_QUERIES['episode_exists']
+    assert "NO_INDEX(episodes idx_episodes_movie_season_ep)" in main.without_hot_indexes(sql)
+
+
+def test_without_hot_indexes_leaves_other_lookups_alone():
+    for name in ('movie_by_name', 'cast_by_name', 'genre_by_name', 'followers'):
+        sql, _ = main.HOT_QUERIES[name]
+        assert main.without_hot_indexes(sql) == sql
@@ -0,0 +1,62 @@
+import functools
+
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+EPISODES_CSV = "type,series_title,season,episode,episode_title,air_date\n" + "".join(
+    f"episode,Dark,{i // 10 + 1},{i % 10 + 1},Episode {i},2017-12-01\n" for i in range(26))
+
+
+class CancelAfterFirstChunk:
+    def __init__(self):
+        self.cancelled = False
+        self.reports = []
+
+    def report(self, end, rows, counts):
+        self.reports.append((end, counts))
+        self.cancelled = True
+
+
+def bulk_import(path, job=None):
+    return main.bulk_import_csv(str(path), job=job)
+
+
+def test_checkpoint_round_trip(cinetrack_db, tmp_path):
+    path = tmp_path / "dark.csv"
+    path.write_text(EPISODES_CSV, encoding="utf-8")
+
+    with cinetrack_db.transaction() as cursor:
+        fresh = main.ImportCheckpoint.resume(cursor, str(path), start_offset=7)
+        assert (fresh.offset, fresh.counts()) == (7, (0, 0, 0))
+        fresh.save(cursor, 120, (5, 1, 2))
+
+    with cinetrack_db.transaction() as cursor:
+        resumed = main.ImportCheckpoint.resume(cursor, str(path))
+        assert (resumed.file_hash, resumed.offset, resumed.counts()) == (fresh.file_hash, 120, (5, 1, 2))
+        resumed.save(cursor, path.stat().st_size, (9, 1, 2), completed=True)
+
+    with cinetrack_db.transaction() as cursor:
+        # a completed import starts over instead of resuming
+        assert main.ImportCheckpoint.resume(cursor, str(path)).offset == 0
+
+
+def test_interrupted_import_resumes_after_last_committed_chunk(cinetrack_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "iter_csv_records", functools.partial(main.iter_csv_records, workers=1, chunk_bytes=256))
+    path = tmp_path / "dark.csv"
+    path.write_text(EPISODES_CSV, encoding="utf-8")
+
+    job = CancelAfterFirstChunk()
+    first_counts = bulk_import(path, job)
+    (end, counts), = job.reports
+    assert 0 < end < path.stat().st_size and counts == first_counts
+    assert cinetrack_db.fetchone(
+        "SELECT byte_offset, inserted, completed FROM import_checkpoints") == (end, first_counts[0], 0)
+    assert cinetrack_db.fetchone("SELECT COUNT(*) FROM episodes")[0] == first_counts[0]
+
+    inserted, skipped, failed = bulk_import(path)
+
+    assert (inserted, skipped, failed) == (26, 0, 0)
+    assert cinetrack_db.fetchone("SELECT COUNT(*) FROM episodes")[0] == 26
+    assert cinetrack_db.fetchone("SELECT byte_offset, completed FROM import_checkpoints") == (path.stat().st_size, 1)
@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+MOVIES_PAGE_SQL = "SELECT m.movie_id, m.movie_name FROM movies m ORDER BY m.movie_id"
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    snapshot = main.LocalSnapshot(str(tmp_path / "snapshot.sqlite3"))
+    snapshot.open()
+    return snapshot
+
+
+def test_only_writes_to_snapshot_tables_wake_the_sync(snapshot):
+    snapshot.mark_dirty(('donations', 'users'))
+    assert not snapshot._wake.is_set() and not snapshot._dirty
+
+    snapshot.mark_dirty(('donations', 'movies'))
+    assert snapshot._wake.is_set() and snapshot._dirty == {'movies'}
+
+
+def test_marks_made_during_a_sync_survive_it(snapshot, monkeypatch):
+    snapshot.ready = True
+    snapshot.mark_dirty(('movies',))
+    seen = {}
+
+    def sync_deletions(cnx):
+        # a write commits while the sync is running
+        seen['usable'] = snapshot._usable_for(MOVIES_PAGE_SQL)
+        snapshot.mark_dirty(('genres',))
+        return 0
+
+    monkeypatch.setattr(snapshot, "_sync_deletions", sync_deletions)
+    monkeypatch.setattr(snapshot, "_sync_rows", lambda *args: 0)
+    monkeypatch.setattr(snapshot, "_sync_links", lambda *args: 0)
+    snapshot.sync()
+
+    assert seen['usable'] is False  # still on MySQL until the sync finishes
+    assert snapshot._dirty == {'genres'}
+    assert snapshot._usable_for(MOVIES_PAGE_SQL)
+
+
+def test_failed_sync_keeps_its_tables_dirty(snapshot, monkeypatch):
+    snapshot.mark_dirty(('movies',))
+
+    def fail(cnx):
+        raise RuntimeError("MySQL went away")
+
+    monkeypatch.setattr(snapshot, "_sync_deletions", fail)
+    with pytest.raises(RuntimeError):
+        snapshot.sync()
+    assert snapshot._dirty == {'movies'} and not snapshot._syncing
+
+
+def test_deletions_are_synced_when_row_counts_match(cinetrack_db, snapshot):
+    for name in ("Heat", "Ronin"):
+        cinetrack_db.execute("INSERT INTO movies (movie_name) VALUES (%s)", (name,))
+    snapshot.sync()
+
+    # one delete and one insert leave the count unchanged
+    cinetrack_db.execute("DELETE FROM movies WHERE movie_name='Heat'")
+    cinetrack_db.execute("INSERT INTO movies (movie_name) VALUES ('Collateral')")
+    snapshot.sync()
+
+    assert [name for _, name in snapshot._read_local(MOVIES_PAGE_SQL, ())] == ["Ronin", "Collateral"]
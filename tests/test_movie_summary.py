@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+
+def test_baseline_migration_backfills_movie_summary_in_the_migration_transaction(cinetrack_db, monkeypatch):
+    movie_id = cinetrack_db.execute("INSERT INTO movies (movie_name) VALUES ('Heat')")
+    genre_id = cinetrack_db.execute("INSERT INTO genres (genre_name) VALUES ('Crime')")
+    cinetrack_db.execute("INSERT INTO movie_genre (movie_id, genre_id) VALUES (%s, %s)", (movie_id, genre_id))
+    cinetrack_db.execute("DELETE FROM movie_summary")  # e.g. data restored without the triggers
+
+    def second_transaction():
+        raise AssertionError("the backfill must use the migration's cursor")
+
+    with cinetrack_db.transaction() as cursor, monkeypatch.context() as patch:
+        patch.setattr(cinetrack_db, "transaction", second_transaction)
+        main._migration_baseline(cursor)
+
+    assert cinetrack_db.fetchall("SELECT movie_id, genres FROM movie_summary") == [(movie_id, 'Crime')]
+
+
+def test_rebuild_without_a_cursor_commits_on_its_own(cinetrack_db):
+    cinetrack_db.execute("INSERT INTO movies (movie_name) VALUES ('Ronin')")
+    cinetrack_db.execute("DELETE FROM movie_summary")
+
+    assert main.rebuild_movie_summary() == 1
+    assert cinetrack_db.fetchone("SELECT COUNT(*) FROM movie_summary")[0] == 1
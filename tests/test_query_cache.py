@@ -0,0 +1,89 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+MOVIES_SQL = "SELECT m.movie_name FROM movies m JOIN movie_genre mg ON mg.movie_id = m.movie_id"
+USERS_SQL = "SELECT username FROM users WHERE user_id=%s"
+
+
+def cached(cache, sql, params=(), value="v", ttl=None):
+    """Store value for (sql, params) the way Database.cached_fetch* does."""
+    tables = main.read_tables(sql)
+    cache.put((sql, params), value, tables, cache.begin(tables), ttl=ttl)
+    return (sql, params)
+
+
+def test_hit_after_put_and_miss_otherwise():
+    cache = main.QueryCache()
+    key = cached(cache, MOVIES_SQL, value=["Heat"])
+    assert cache.get(key) == (True, ["Heat"])
+    assert cache.get((MOVIES_SQL, (1,))) == (False, None)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_invalidate_drops_only_entries_reading_the_written_tables():
+    cache = main.QueryCache()
+    movies = cached(cache, MOVIES_SQL)
+    users = cached(cache, USERS_SQL, (1,))
+
+    cache.invalidate(main.write_tables("INSERT INTO movie_genre (movie_id, genre_id) VALUES (1, 2)"))
+
+    assert cache.get(movies) == (False, None)
+    assert cache.get(users) == (True, "v")
+
+
+def test_writes_follow_trigger_and_cascade_dependencies():
+    cache = main.QueryCache()
+    key = cached(cache, "SELECT genres FROM movie_summary WHERE movie_id=%s", (1,))
+    # genre renames reach movie_summary through movie_genre's triggers
+    cache.invalidate(main.write_tables("UPDATE genres SET genre_name='Sci-Fi' WHERE genre_id=3"))
+    assert cache.get(key) == (False, None)
+
+
+def test_schema_changes_clear_everything():
+    cache = main.QueryCache()
+    keys = [cached(cache, MOVIES_SQL), cached(cache, USERS_SQL, (1,))]
+    assert main.write_tables("ALTER TABLE movies ADD COLUMN x INT") == ('*',)
+    cache.invalidate(('*',))
+    assert [cache.get(k) for k in keys] == [(False, None)] * 2
+
+
+def test_result_read_across_a_commit_is_not_stored():
+    cache = main.QueryCache()
+    tables = main.read_tables(MOVIES_SQL)
+    token = cache.begin(tables)
+    cache.invalidate(('movies',))  # a write commits while the SELECT runs
+    cache.put((MOVIES_SQL, ()), "stale", tables, token)
+    assert cache.get((MOVIES_SQL, ())) == (False, None)
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(main.time, "monotonic", lambda: now[0])
+    cache = main.QueryCache(ttl=60)
+    short = cached(cache, USERS_SQL, (1,), ttl=5)
+    default = cached(cache, USERS_SQL, (2,))
+
+    now[0] += 10
+    assert cache.get(short) == (False, None)
+    assert cache.get(default) == (True, "v")
+    now[0] += 60
+    assert cache.get(default) == (False, None)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = main.QueryCache(max_entries=2)
+    first, second = cached(cache, USERS_SQL, (1,)), cached(cache, USERS_SQL, (2,))
+    cache.get(first)
+    third = cached(cache, USERS_SQL, (3,))
+    assert [cache.get(k)[0] for k in (first, second, third)] == [True, False, True]
+
+
+def test_listeners_hear_every_invalidation():
+    cache = main.QueryCache()
+    heard = []
+    cache.listeners.append(heard.append)
+    cache.invalidate(('users',))
+    cache.invalidate(('*',))
+    assert heard == [('users',), ('*',)]
@@ -0,0 +1,69 @@
+
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+SERIES_CSV = """type,title,series_title,season,episode,episode_title,air_date,language
+movie,Dark,,,,,2017-12-01,German
+episode,,Dark,1,1,Secrets,2017-12-01,
+episode,,Dark,1,2,Lies,2017-12-01,
+episode,,Dark,2,1,Beginnings and Endings,2019-06-21,
+episode,,Dark,1,2,Lies again,2017-12-01,
+"""
+
+
+DARK_EPISODES = [
+    (1, 1, "Secrets", "2017-12-01"),
+    (1, 2, "Lies", "2017-12-01"),
+    (2, 1, "Beginnings and Endings", "2019-06-21"),
+]
+
+
+def dark_episodes(database):
+    rows = database.fetchall("""
+        SELECT e.season_number, e.episode_number, e.title, e.air_date
+        FROM episodes e JOIN movies m ON m.movie_id = e.movie_id
+        WHERE m.movie_name = 'Dark'
+        ORDER BY e.season_number, e.episode_number
+    """)
+    return [(season, number, title, str(air_date)) for season, number, title, air_date in rows]
+
+
+def bulk_import(path, **kwargs):
+    return main.bulk_import_csv(str(path), **kwargs)
+
+
+def test_bulk_import_writes_episode_titles_and_air_dates(cinetrack_db, tmp_path):
+    path = tmp_path / "dark.csv"
+    path.write_text(SERIES_CSV, encoding="utf-8")
+
+    inserted, skipped, failed = bulk_import(path, batch_size=2)
+
+    assert (inserted, skipped, failed) == (4, 1, 0)
+    assert dark_episodes(cinetrack_db) == DARK_EPISODES
+
+
+def test_load_data_import_writes_episode_titles_and_air_dates(cinetrack_db, tmp_path):
+    path = tmp_path / "dark.csv"
+    path.write_text(SERIES_CSV, encoding="utf-8")
+
+    try:
+        _, _, failed = main.LoadDataImporter(cinetrack_db).run(str(path))
+    except main.LocalInfileDisabled as e:
+        pytest.skip(f"LOAD DATA LOCAL INFILE unavailable: {e}")
+
+    assert failed == 0
+    assert dark_episodes(cinetrack_db) == DARK_EPISODES
+
+
+def test_reimporting_a_series_adds_only_new_episodes(cinetrack_db, tmp_path):
+    path = tmp_path / "dark.csv"
+    path.write_text(SERIES_CSV, encoding="utf-8")
+    bulk_import(path)
+
+    path.write_text(SERIES_CSV + "episode,,Dark,2,2,Lost and Found,2019-06-21,\n", encoding="utf-8")
+    inserted, _, failed = bulk_import(path)
+
+    assert (inserted, failed) == (1, 0)
+    assert cinetrack_db.fetchone("SELECT COUNT(*) FROM episodes")[0] == 4
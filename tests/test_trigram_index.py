@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+import main  # noqa: E402
+
+
+@pytest.fixture
+def index():
+    index = main.TrigramIndex()
+    for item_id, label in enumerate(["The Godfather", "The Godfather Part II", "Godzilla", "Gods of Egypt",
+                                      "Good Will Hunting", "Casino"], start=1):
+        index.add('movie', item_id, label)
+    index.add('cast', 101, "Tom Hanks")
+    index.add('cast', 102, "Christopher Nolan")
+    return index
+
+
+def labels(results):
+    return [label for _, _, label in results]
+
+
+def test_prefix_matches_rank_first_and_shorter_labels_win_ties(index):
+    results = labels(index.suggest("godf"))
+    assert results[:2] == ["The Godfather", "The Godfather Part II"]
+
+
+def test_prefix_uses_the_last_typed_word(index):
+    assert labels(index.suggest("the god", limit=2)) == ["The Godfather", "The Godfather Part II"]
+
+
+def test_typo_still_finds_the_title_by_trigram_similarity(index):
+    assert labels(index.suggest("godfahter"))[0] == "The Godfather"
+
+
+def test_unrelated_text_finds_nothing(index):
+    assert index.suggest("zzzz") == []
+    assert index.suggest("   ") == []
+
+
+def test_limit_and_entry_shape(index):
+    results = index.suggest("go", limit=3)
+    assert len(results) == 3
+    assert all(kind == 'movie' for kind, _, _ in results)
+    assert index.suggest("hanks") == [('cast', 101, "Tom Hanks")]
+
+
+def test_has_name_matches_word_prefixes_of_one_name_only(index):
+    assert index.has_name('cast', "tom ha")
+    assert index.has_name('cast', "nolan chris")
+    assert not index.has_name('cast', "tom nolan")      # words from two different people
+    assert not index.has_name('cast', "godfather")     # a title, not a name
+    assert not index.has_name('cast', "hnaks")         # no fuzzy matching
+    assert index.has_name('movie', "godfather")